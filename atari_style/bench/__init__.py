@@ -0,0 +1,51 @@
+"""Performance benchmark suite with baseline regression gating.
+
+Usage:
+    python -m atari_style.bench                 # Run and compare with baselines/bench/
+    python -m atari_style.bench --save-baseline # Record a new baseline
+    python -m atari_style.bench renderer -o results.json
+
+Benchmarks time hot paths (terminal and headless rendering, screensaver
+animations, GL composites, ffmpeg and GIF encoding, gallery scans) with
+perf_counter after a warmup, and fail when the compared statistic
+(``--metric``, default the fastest call, ``min``) slows down beyond the
+configured threshold.
+
+Benchmarks without a baseline entry are reported but not gated. The
+checked-in baseline is recorded on a machine without ffmpeg or an OpenGL
+context, where the ``ffmpeg.*`` and ``gl.composite.*`` cases skip; run
+``--save-baseline ffmpeg gl.composite`` on a machine that has them to
+gate those too.
+"""
+
+from .runner import (
+    BENCHMARKS,
+    BenchmarkCase,
+    BenchmarkResult,
+    Comparison,
+    SkipBenchmark,
+    benchmark,
+    compare,
+    load_results,
+    run_case,
+    run_suite,
+    save_results,
+    select,
+    time_operation,
+)
+
+__all__ = [
+    'BENCHMARKS',
+    'BenchmarkCase',
+    'BenchmarkResult',
+    'Comparison',
+    'SkipBenchmark',
+    'benchmark',
+    'compare',
+    'load_results',
+    'run_case',
+    'run_suite',
+    'save_results',
+    'select',
+    'time_operation',
+]
@@ -0,0 +1,14 @@
+"""CLI entry point for the benchmark suite.
+
+Usage:
+    python -m atari_style.bench
+    python -m atari_style.bench --list
+    python -m atari_style.bench renderer --quick
+"""
+
+import sys
+
+from .cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
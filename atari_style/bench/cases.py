@@ -0,0 +1,341 @@
+"""Built-in benchmark cases.
+
+Each case builds its fixture before ``yield``-ing the operation to time.
+Cases needing optional pieces (OpenGL context, ffmpeg, a terminal
+library) raise SkipBenchmark when those are unavailable.
+"""
+
+import math
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from .runner import SkipBenchmark, benchmark
+
+
+TERMINAL_SIZES = ((80, 24), (120, 40), (200, 60))
+
+# Characters and colors used to fill benchmark frames
+FILL_CHARS = '█▓▒░·*+o#@'
+FILL_COLORS = ('cyan', 'magenta', 'yellow', 'green', 'red', 'blue', 'white', None)
+
+
+def fill_buffer(renderer) -> None:
+    """Draw a deterministic, busy pattern covering the whole buffer."""
+    for y in range(renderer.height):
+        for x in range(renderer.width):
+            i = (x * 7 + y * 13) % 97
+            if i % 5 == 0:
+                continue  # Leave some blank cells, like real frames
+            renderer.set_pixel(x, y, FILL_CHARS[i % len(FILL_CHARS)], FILL_COLORS[i % len(FILL_COLORS)])
+
+
+def _headless_renderer(cols: int, rows: int):
+    try:
+        from ..core.headless_renderer import HeadlessRenderer
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    return HeadlessRenderer(width=cols, height=rows)
+
+
+# -- Terminal renderer --------------------------------------------------------
+
+def _terminal_renderer(cols: int, rows: int):
+    """A Renderer with a fixed size that emits real escape sequences."""
+    try:
+        from blessed import Terminal
+        from ..core.renderer import Renderer
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    renderer = Renderer()
+    renderer.term = Terminal(kind='xterm-256color', force_styling=True)
+    renderer.width = cols
+    renderer.height = rows
+    renderer.buffer = [[' ' for _ in range(cols)] for _ in range(rows)]
+    renderer.color_buffer = [[None for _ in range(cols)] for _ in range(rows)]
+    return renderer
+
+
+for _cols, _rows in TERMINAL_SIZES:
+    @benchmark(f'renderer.render.{_cols}x{_rows}', cols=_cols, rows=_rows)
+    def renderer_render(cols: int, rows: int):
+        """Renderer.render of a full frame (terminal output discarded)."""
+        renderer = _terminal_renderer(cols, rows)
+        fill_buffer(renderer)
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            yield renderer.render
+
+
+# -- Headless renderer --------------------------------------------------------
+
+for _cols, _rows in TERMINAL_SIZES[:2]:
+    @benchmark(f'headless.to_image.{_cols}x{_rows}', cols=_cols, rows=_rows)
+    def headless_to_image(cols: int, rows: int):
+        """HeadlessRenderer.to_image of a full frame, redrawn from scratch."""
+        renderer = _headless_renderer(cols, rows)
+        fill_buffer(renderer)
+
+        def run():
+            renderer.invalidate()
+            renderer.to_image()
+        yield run
+
+    @benchmark(f'headless.to_image.incremental.{_cols}x{_rows}', cols=_cols, rows=_rows)
+    def headless_to_image_incremental(cols: int, rows: int):
+        """HeadlessRenderer.to_image of a full frame with one changed text line."""
+        renderer = _headless_renderer(cols, rows)
+        fill_buffer(renderer)
+        renderer.to_image()
+        frame = [0]
+
+        def run():
+            frame[0] += 1
+            renderer.draw_text(2, rows // 2, f'frame {frame[0]:06d}', 'yellow')
+            renderer.to_image()
+        yield run
+
+
+# -- Screensaver animations ---------------------------------------------------
+
+# Same set and order as ScreenSaver.animations: (slug, class name)
+SCREENSAVER_ANIMATIONS = (
+    ('lissajous', 'LissajousCurve'),
+    ('spiral', 'SpiralAnimation'),
+    ('circle_wave', 'CircleWaveAnimation'),
+    ('plasma', 'PlasmaAnimation'),
+    ('mandelbrot', 'MandelbrotZoomer'),
+    ('fluid_lattice', 'FluidLattice'),
+    ('particle_swarm', 'ParticleSwarm'),
+    ('tunnel', 'TunnelVision'),
+    ('plasma_lissajous', 'PlasmaLissajous'),
+    ('flux_spiral', 'FluxSpiral'),
+    ('lissajous_plasma', 'LissajousPlasma'),
+)
+
+
+def _make_animation(slug: str, cols: int = 80, rows: int = 24):
+    renderer = _headless_renderer(cols, rows)
+    try:
+        from ..demos.visualizers import screensaver
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    animation = getattr(screensaver, dict(SCREENSAVER_ANIMATIONS)[slug])(renderer)
+    # Advance past start-up so the animation is in a typical state
+    for _ in range(30):
+        animation.update(1 / 30)
+    return renderer, animation
+
+
+for _slug, _ in SCREENSAVER_ANIMATIONS:
+    @benchmark(f'screensaver.{_slug}.draw', slug=_slug)
+    def screensaver_draw(slug: str):
+        """One ScreenSaver animation's draw() at 80x24."""
+        renderer, animation = _make_animation(slug)
+
+        def op():
+            renderer.clear_buffer()
+            animation.draw(animation.t)
+        yield op
+
+    @benchmark(f'screensaver.{_slug}.update', slug=_slug)
+    def screensaver_update(slug: str):
+        """One ScreenSaver animation's update() at 80x24."""
+        _, animation = _make_animation(slug)
+        yield lambda: animation.update(1 / 60)
+
+
+for _cols, _rows in ((80, 24), (160, 48)):
+    @benchmark(f'fluid_lattice.step.{_cols}x{_rows}', cols=_cols, rows=_rows)
+    def fluid_lattice_step(cols: int, rows: int):
+        """FluidLattice simulation step (80x24 and 160x48 lattices)."""
+        _, lattice = _make_animation('fluid_lattice', cols, rows)
+        yield lambda: lattice.update(1 / 30)
+
+
+# -- GL composites ------------------------------------------------------------
+
+GL_SIZE = (320, 240)
+GL_COMPOSITES = ('plasma_lissajous', 'flux_spiral', 'lissajous_plasma')
+
+
+def _composite_manager():
+    try:
+        from ..core.gl.composites import CompositeManager
+        manager = CompositeManager(*GL_SIZE)
+        manager._get_renderer()
+    except (ImportError, RuntimeError) as e:
+        raise SkipBenchmark(f"OpenGL unavailable: {e}")
+    return manager
+
+
+for _name in GL_COMPOSITES:
+    for _preset in (None, 'terminal'):
+        _suffix = f'.{_preset}' if _preset else ''
+
+        @benchmark(f'gl.composite.{_name}{_suffix}', threshold=0.5, composite=_name, preset=_preset)
+        def gl_composite(composite: str, preset):
+            """CompositeManager.render_frame, optionally with an ASCII post pass."""
+            manager = _composite_manager()
+            frame = [0]
+
+            def op():
+                frame[0] += 1
+                manager.render_frame(composite, frame[0] / 30.0, ascii_preset=preset)
+            try:
+                yield op
+            finally:
+                if manager._renderer is not None:
+                    manager._renderer.release()
+
+
+# -- FFmpeg encoder -----------------------------------------------------------
+
+ENCODE_FRAMES = 30
+ENCODE_SIZE = (320, 180)
+
+
+def _frames_dir():
+    """Temp directory with a short sequence of PNG frames."""
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    from ..core.video_base import FFmpegEncoder
+    encoder = FFmpegEncoder()
+    if not encoder.is_available():
+        raise SkipBenchmark("ffmpeg not found")
+
+    temp_dir = tempfile.mkdtemp(prefix='atari_bench_')
+    width, height = ENCODE_SIZE
+    for i in range(ENCODE_FRAMES):
+        img = Image.new('RGB', ENCODE_SIZE, (20, 20, 30))
+        draw = ImageDraw.Draw(img)
+        cx = width / 2 + math.cos(i / 5) * width / 3
+        cy = height / 2 + math.sin(i / 3) * height / 3
+        draw.ellipse([cx - 20, cy - 20, cx + 20, cy + 20], fill=(0, 200, 255))
+        img.save(os.path.join(temp_dir, f'frame_{i:05d}.png'))
+    return encoder, temp_dir
+
+
+@benchmark('ffmpeg.encode_video', threshold=0.5)
+def ffmpeg_encode_video():
+    """FFmpegEncoder.encode_video of 30 small PNG frames."""
+    encoder, temp_dir = _frames_dir()
+    output = os.path.join(temp_dir, 'out.mp4')
+    try:
+        yield lambda: encoder.encode_video(temp_dir, output, 30, preset='ultrafast')
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@benchmark('ffmpeg.encode_gif', threshold=0.5)
+def ffmpeg_encode_gif():
+    """FFmpegEncoder.encode_gif (palette pass + encode) of 30 frames."""
+    encoder, temp_dir = _frames_dir()
+    output = os.path.join(temp_dir, 'out.gif')
+    try:
+        yield lambda: encoder.encode_gif(temp_dir, output, 15, scale=240)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+# -- GIF encoder --------------------------------------------------------------
+
+@benchmark('gif.encode.terminal', threshold=0.5)
+def gif_encode_terminal():
+    """GifWriter delta encoding of 30 headless frames (no ffmpeg)."""
+    try:
+        from ..core.gif_encoder import GifPalette, write_gif
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    renderer = _headless_renderer(80, 24)
+    frames = []
+    for i in range(ENCODE_FRAMES):
+        renderer.clear_buffer()
+        renderer.draw_box(i % 60, 4 + i % 12, 12, 6, '█', 'cyan')
+        renderer.draw_text(2, 1, f'frame {i:03d}', 'yellow')
+        frames.append(renderer.to_image())
+    palette = GifPalette.for_renderer(renderer)
+    temp_dir = tempfile.mkdtemp(prefix='atari_bench_')
+    output = os.path.join(temp_dir, 'out.gif')
+    try:
+        yield lambda: write_gif(frames, output, palette, fps=15)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+@benchmark('gif.encode.terminal.cold', threshold=0.5)
+def gif_encode_terminal_cold():
+    """Palette build plus GIF encoding as in a fresh process (empty lookup cache)."""
+    try:
+        from ..core import gif_encoder
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    renderer = _headless_renderer(80, 24)
+    frames = []
+    for i in range(ENCODE_FRAMES):
+        renderer.clear_buffer()
+        renderer.draw_box(i % 60, 4 + i % 12, 12, 6, '█', 'cyan')
+        renderer.draw_text(2, 1, f'frame {i:03d}', 'yellow')
+        frames.append(renderer.to_image())
+    temp_dir = tempfile.mkdtemp(prefix='atari_bench_')
+    output = os.path.join(temp_dir, 'out.gif')
+
+    def op():
+        gif_encoder._nearest_lut.cache_clear()
+        palette = gif_encoder.GifPalette.for_renderer(renderer)
+        gif_encoder.write_gif(frames, output, palette, fps=15)
+
+    try:
+        yield op
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+# -- Preview gallery ----------------------------------------------------------
+
+GALLERY_FILES = 500
+
+
+def _media_tree() -> Path:
+    """Temp tree with small images and storyboards in nested folders."""
+    try:
+        from PIL import Image
+    except ImportError as e:
+        raise SkipBenchmark(str(e))
+    root = Path(tempfile.mkdtemp(prefix='atari_bench_gallery_'))
+    pixel = Image.new('RGB', (16, 9), (255, 0, 0))
+    for i in range(GALLERY_FILES):
+        folder = root / f'batch{i % 10}'
+        folder.mkdir(exist_ok=True)
+        if i % 5 == 0:
+            (folder / f'story{i}.json').write_text('{"title": "bench", "keyframes": []}')
+        else:
+            pixel.save(folder / f'frame{i}.png')
+    return root
+
+
+@benchmark('gallery.scan.cold')
+def gallery_scan_cold():
+    """Gallery.scan of 500 files with an empty index (every file probed)."""
+    from ..preview.gallery import Gallery
+    root = _media_tree()
+    try:
+        yield lambda: Gallery(directories=[root], cache_ttl=0).scan(force=True)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+@benchmark('gallery.scan.warm')
+def gallery_scan_warm():
+    """Gallery.scan of 500 unchanged files (stat + index lookups only)."""
+    from ..preview.gallery import Gallery
+    root = _media_tree()
+    try:
+        gallery = Gallery(directories=[root], cache_ttl=0)
+        gallery.scan()
+        yield lambda: gallery.scan(force=True)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
@@ -0,0 +1,164 @@
+"""Command-line interface for the benchmark suite."""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from . import cases  # noqa: F401  (registers the built-in benchmarks)
+from .runner import (
+    DEFAULT_BASELINE,
+    DEFAULT_METRIC,
+    DEFAULT_MIN_TIME,
+    DEFAULT_THRESHOLD,
+    DEFAULT_WARMUP,
+    METRICS,
+    BenchmarkResult,
+    Comparison,
+    best_of,
+    calibrate,
+    compare,
+    load_document,
+    merge_results,
+    run_case,
+    run_suite,
+    save_results,
+    select,
+)
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    if result.status != 'ok':
+        return f"  {result.name:<40} {result.status.upper():>10}  {result.reason}"
+    return (
+        f"  {result.name:<40} {result.median_ms:10.3f}ms  "
+        f"p95 {result.p95_ms:9.3f}ms  n={result.samples}"
+    )
+
+
+def _format_comparison(c: Comparison) -> str:
+    if c.baseline_ms is None:
+        return f"  {c.name:<40} {c.current_ms:10.3f}ms  (no baseline)"
+    marker = 'REGRESSION' if c.regressed else 'ok'
+    return (
+        f"  {c.name:<40} {c.current_ms:10.3f}ms  vs {c.baseline_ms:9.3f}ms  "
+        f"{c.change * 100:+7.1f}%  (limit +{c.threshold * 100:.0f}%)  {marker}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        prog='python -m atari_style.bench',
+        description='Run performance benchmarks and compare with a stored baseline',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                              # Run everything, compare with baselines/bench/baseline.json
+  %(prog)s renderer screensaver.plasma  # Only matching benchmarks (substring or glob)
+  %(prog)s --quick -o results.json      # Short timing budget, save results
+  %(prog)s --save-baseline              # Record the current machine's baseline
+  %(prog)s --list
+
+Exit codes: 0 = no regressions, 1 = regression or benchmark error
+""")
+    parser.add_argument('patterns', nargs='*', help='Benchmark name filters (substring or glob)')
+    parser.add_argument('--list', action='store_true', help='List benchmarks and exit')
+    parser.add_argument('-o', '--output', type=Path, help='Write results JSON to this path')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help=f'Baseline JSON (default: {DEFAULT_BASELINE})')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Merge these results into the baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Allowed slowdown as a fraction (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--metric', choices=METRICS, default=DEFAULT_METRIC,
+                        help=f'Statistic compared with the baseline (default: {DEFAULT_METRIC})')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP,
+                        help=f'Untimed warmup calls per benchmark (default: {DEFAULT_WARMUP})')
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help=f'Seconds of sampling per benchmark (default: {DEFAULT_MIN_TIME})')
+    parser.add_argument('--no-normalize', action='store_true',
+                        help='Compare raw times without scaling by the calibration loop')
+    parser.add_argument('--retries', type=int, default=2,
+                        help='Re-run regressed benchmarks up to N times to rule out noise (default: 2)')
+    parser.add_argument('--quick', action='store_true',
+                        help='Short run: 1 warmup call and 0.2s per benchmark')
+
+    args = parser.parse_args(argv)
+
+    selected = select(args.patterns)
+    if args.list:
+        for case in selected:
+            print(f"  {case.name:<40} {case.description}")
+        return 0
+    if not selected:
+        print("No benchmarks match", ' '.join(args.patterns), file=sys.stderr)
+        return 1
+
+    warmup, min_time = (1, 0.2) if args.quick else (args.warmup, args.min_time)
+    calibration = calibrate()
+    print(f"Running {len(selected)} benchmarks (warmup {warmup}, {min_time}s each)...")
+    results = run_suite(selected, progress=lambda r: print(_format_result(r), flush=True),
+                        warmup=warmup, min_time=min_time)
+    # Average with a second measurement in case machine speed drifted mid-run
+    calibration = (calibration + calibrate()) / 2
+
+    errors = [r for r in results if r.status == 'error']
+
+    def finish(failed: bool) -> int:
+        if args.output:
+            save_results(results, args.output, calibration)
+            print(f"\nResults written to: {args.output}")
+        return 1 if failed else 0
+
+    if args.save_baseline:
+        merge_results(results, args.baseline, calibration)
+        print(f"\nBaseline updated: {args.baseline}")
+        return finish(bool(errors))
+
+    try:
+        document = load_document(args.baseline)
+    except FileNotFoundError:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return finish(bool(errors))
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return finish(True)
+
+    scale = 1.0
+    base_calibration = document.get('environment', {}).get('calibration_ms')
+    if base_calibration and not args.no_normalize:
+        scale = calibration / base_calibration
+
+    baseline = document.get('results', {})
+    comparisons = compare(results, baseline, args.threshold, args.metric, scale)
+    for attempt in range(args.retries):
+        suspects = {c.name for c in comparisons if c.regressed}
+        if not suspects:
+            break
+        print(f"\nConfirming {len(suspects)} possible regression(s) (retry {attempt + 1}/{args.retries})...")
+        by_name = {r.name: r for r in results}
+        for case in selected:
+            if case.name in suspects:
+                rerun = run_case(case, warmup=warmup, min_time=min_time)
+                print(_format_result(rerun), flush=True)
+                by_name[case.name] = best_of(by_name[case.name], rerun, args.metric)
+        results = [by_name[r.name] for r in results]
+        comparisons = compare(results, baseline, args.threshold, args.metric, scale)
+
+    print(f"\nCompared with {args.baseline} ({args.metric}, machine speed factor {scale:.2f}):")
+    for c in comparisons:
+        print(_format_comparison(c))
+
+    regressions = [c for c in comparisons if c.regressed]
+    ungated = [c for c in comparisons if c.baseline_ms is None]
+    if ungated:
+        print(f"\n! {len(ungated)} benchmark(s) have no baseline and are not gated "
+              "(record them with --save-baseline)")
+    if regressions:
+        print(f"\n✗ {len(regressions)} benchmark(s) regressed beyond threshold")
+    if errors:
+        print(f"✗ {len(errors)} benchmark(s) failed")
+    if not (regressions or errors):
+        print("\n✓ No regressions")
+    return finish(bool(regressions or errors))
@@ -0,0 +1,388 @@
+"""Benchmark registry, timing loop and baseline comparison.
+
+Benchmarks are generator functions registered with @benchmark. Setup
+code runs before the ``yield``, which hands the runner the zero-argument
+operation to time; cleanup runs after it. Raising SkipBenchmark during
+setup marks the case as skipped (missing ffmpeg, no GL context, ...).
+"""
+
+import fnmatch
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+RESULTS_VERSION = 1
+
+DEFAULT_BASELINE = Path('baselines') / 'bench' / 'baseline.json'
+
+# Allowed slowdown before a benchmark counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Statistic compared against the baseline. The minimum is the least
+# sensitive to scheduler and frequency noise on shared machines.
+METRICS = ('min', 'median', 'mean', 'p95')
+DEFAULT_METRIC = 'min'
+
+# Changes smaller than this are treated as timer noise
+MIN_DELTA_MS = 0.02
+
+DEFAULT_WARMUP = 3
+DEFAULT_MIN_TIME = 1.0
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_MAX_SAMPLES = 1000
+
+
+class SkipBenchmark(Exception):
+    """Raised during setup when a benchmark cannot run here."""
+
+
+@dataclass
+class BenchmarkCase:
+    """A registered benchmark."""
+    name: str
+    func: Callable[..., Iterator[Callable[[], Any]]]
+    group: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    threshold: Optional[float] = None  # Overrides the suite threshold
+    description: str = ''
+
+    @contextmanager
+    def operation(self) -> Iterator[Callable[[], Any]]:
+        """Run setup, hand out the timed operation, then clean up."""
+        yield from self.func(**self.params)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing statistics for one benchmark (times in milliseconds)."""
+    name: str
+    group: str
+    status: str = 'ok'  # 'ok', 'skipped' or 'error'
+    reason: str = ''
+    samples: int = 0
+    mean_ms: float = 0.0
+    median_ms: float = 0.0
+    p95_ms: float = 0.0
+    min_ms: float = 0.0
+    max_ms: float = 0.0
+    stdev_ms: float = 0.0
+    threshold: Optional[float] = None
+
+    @classmethod
+    def from_samples(cls, case: BenchmarkCase, samples: List[float]) -> 'BenchmarkResult':
+        """Summarize per-call times given in seconds."""
+        ms = sorted(s * 1000.0 for s in samples)
+        p95_index = min(len(ms) - 1, int(math.ceil(0.95 * len(ms))) - 1)
+        return cls(
+            name=case.name,
+            group=case.group,
+            samples=len(ms),
+            mean_ms=round(statistics.fmean(ms), 5),
+            median_ms=round(statistics.median(ms), 5),
+            p95_ms=round(ms[p95_index], 5),
+            min_ms=round(ms[0], 5),
+            max_ms=round(ms[-1], 5),
+            stdev_ms=round(statistics.stdev(ms), 5) if len(ms) > 1 else 0.0,
+            threshold=case.threshold,
+        )
+
+
+@dataclass
+class Comparison:
+    """A benchmark result compared with its baseline."""
+    name: str
+    current_ms: float
+    baseline_ms: Optional[float]
+    threshold: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change (0.1 = 10% slower)."""
+        if not self.baseline_ms:
+            return None
+        return (self.current_ms - self.baseline_ms) / self.baseline_ms
+
+    @property
+    def regressed(self) -> bool:
+        """True if slower than the baseline beyond threshold and noise."""
+        if self.baseline_ms is None:
+            return False
+        if self.current_ms - self.baseline_ms < MIN_DELTA_MS:
+            return False
+        return self.current_ms > self.baseline_ms * (1.0 + self.threshold)
+
+
+BENCHMARKS: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(
+    name: str,
+    group: Optional[str] = None,
+    threshold: Optional[float] = None,
+    **params,
+) -> Callable:
+    """Register a generator function as a benchmark.
+
+    May be stacked to register one function under several names with
+    different keyword parameters.
+
+    Args:
+        name: Unique dotted benchmark name
+        group: Group for filtering (default: first name component)
+        threshold: Per-benchmark regression threshold
+        **params: Keyword arguments passed to the function
+    """
+    def decorator(func):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        doc = (func.__doc__ or '').strip().splitlines()
+        BENCHMARKS[name] = BenchmarkCase(
+            name=name,
+            func=func,
+            group=group or name.split('.')[0],
+            params=params,
+            threshold=threshold,
+            description=doc[0] if doc else '',
+        )
+        return func
+    return decorator
+
+
+def select(patterns: Optional[List[str]] = None) -> List[BenchmarkCase]:
+    """Registered benchmarks matching any glob pattern (all if none given).
+
+    A pattern without wildcards matches as a substring.
+    """
+    cases = [BENCHMARKS[name] for name in sorted(BENCHMARKS)]
+    if not patterns:
+        return cases
+    globs = [p if any(c in p for c in '*?[') else f'*{p}*' for p in patterns]
+    return [c for c in cases if any(fnmatch.fnmatchcase(c.name, g) for g in globs)]
+
+
+def time_operation(
+    op: Callable[[], Any],
+    warmup: int = DEFAULT_WARMUP,
+    min_time: float = DEFAULT_MIN_TIME,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    clock: Callable[[], float] = time.perf_counter,
+) -> List[float]:
+    """Call ``op`` repeatedly and return per-call durations in seconds.
+
+    Runs ``warmup`` untimed calls, then samples until both ``min_time``
+    seconds and ``min_samples`` calls have elapsed (or ``max_samples``).
+    """
+    for _ in range(warmup):
+        op()
+
+    samples: List[float] = []
+    deadline = clock() + min_time
+    while len(samples) < max_samples:
+        start = clock()
+        op()
+        end = clock()
+        samples.append(end - start)
+        if len(samples) >= min_samples and end >= deadline:
+            break
+    return samples
+
+
+def run_case(case: BenchmarkCase, **timing) -> BenchmarkResult:
+    """Run one benchmark, converting skips and failures into results."""
+    try:
+        with case.operation() as op:
+            samples = time_operation(op, **timing)
+    except SkipBenchmark as e:
+        return BenchmarkResult(name=case.name, group=case.group, status='skipped', reason=str(e))
+    except Exception as e:
+        return BenchmarkResult(
+            name=case.name, group=case.group, status='error',
+            reason=f"{type(e).__name__}: {e}",
+        )
+    return BenchmarkResult.from_samples(case, samples)
+
+
+def best_of(a: BenchmarkResult, b: BenchmarkResult, metric: str = DEFAULT_METRIC) -> BenchmarkResult:
+    """The faster of two results for the same benchmark by ``metric``."""
+    if b.status != 'ok':
+        return a
+    if a.status != 'ok':
+        return b
+    field_name = f'{metric}_ms'
+    return b if getattr(b, field_name) < getattr(a, field_name) else a
+
+
+def run_suite(
+    cases: List[BenchmarkCase],
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+    **timing,
+) -> List[BenchmarkResult]:
+    """Run benchmarks in order, reporting each result to ``progress``."""
+    results = []
+    for case in cases:
+        result = run_case(case, **timing)
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+
+def calibrate(repeats: int = 15, clock: Callable[[], float] = time.perf_counter) -> float:
+    """Time a fixed pure-Python workload; returns the fastest run in ms.
+
+    Stored with every results file so comparisons can be scaled by the
+    machine's current speed (CPU frequency scaling, noisy neighbours, a
+    different fleet machine) rather than flagging it as a regression.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = clock()
+        total = 0
+        for i in range(100_000):
+            total += (i * i) % 7
+        chars = ''.join(chr(65 + (i % 26)) for i in range(20_000))
+        best = min(best, clock() - start)
+    del total, chars
+    return round(best * 1000.0, 5)
+
+
+def environment_info(calibration_ms: Optional[float] = None) -> Dict[str, Any]:
+    """Machine details stored alongside results."""
+    return {
+        'calibration_ms': calibration_ms if calibration_ms is not None else calibrate(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def results_to_dict(
+    results: List[BenchmarkResult],
+    calibration_ms: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Serializable results document."""
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_info(calibration_ms),
+        'results': {r.name: asdict(r) for r in results},
+    }
+
+
+def save_results(
+    results: List[BenchmarkResult],
+    path: Path,
+    calibration_ms: Optional[float] = None,
+) -> Path:
+    """Write results as JSON (atomically, creating parent directories)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(results_to_dict(results, calibration_ms), f, indent=2, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_document(path: Path) -> Dict[str, Any]:
+    """Load a complete results or baseline document.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not a results document
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get('version') != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results file: {path}")
+    return data
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load a results or baseline file, returning name -> result dict."""
+    return load_document(path).get('results', {})
+
+
+def merge_results(
+    results: List[BenchmarkResult],
+    path: Path,
+    calibration_ms: Optional[float] = None,
+) -> Path:
+    """Update a baseline with new results, keeping entries not re-run.
+
+    New times are rescaled to the existing baseline's calibration so that
+    entries recorded in different runs stay comparable with each other.
+    """
+    merged: Dict[str, BenchmarkResult] = {}
+    scale = 1.0
+    try:
+        document = load_document(path)
+    except FileNotFoundError:
+        document = {}
+    for name, data in document.get('results', {}).items():
+        merged[name] = BenchmarkResult(**data)
+    base_calibration = document.get('environment', {}).get('calibration_ms')
+    if merged and base_calibration and calibration_ms:
+        scale = base_calibration / calibration_ms
+        calibration_ms = base_calibration
+    for r in results:
+        if r.status == 'ok':
+            if scale != 1.0:
+                r = replace(r, **{f'{m}_ms': round(getattr(r, f'{m}_ms') * scale, 5)
+                                  for m in ('mean', 'median', 'p95', 'min', 'max', 'stdev')})
+            merged[r.name] = r
+    return save_results([merged[name] for name in sorted(merged)], path, calibration_ms)
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = DEFAULT_METRIC,
+    scale: float = 1.0,
+) -> List[Comparison]:
+    """Compare one statistic of successful results with the baseline.
+
+    Args:
+        results: Results of this run
+        baseline: name -> result dict from load_results()
+        threshold: Default allowed slowdown (cases may override)
+        metric: One of METRICS
+        scale: Factor applied to baseline times, e.g. the ratio of this
+            machine's calibration time to the baseline's
+
+    Raises:
+        ValueError: If metric is not one of METRICS
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Available: {', '.join(METRICS)}")
+    field_name = f'{metric}_ms'
+    comparisons = []
+    for r in results:
+        if r.status != 'ok':
+            continue
+        base = baseline.get(r.name)
+        base_ms = base.get(field_name) if base and base.get('status', 'ok') == 'ok' else None
+        if base_ms is not None:
+            base_ms *= scale
+        comparisons.append(Comparison(
+            name=r.name,
+            current_ms=getattr(r, field_name),
+            baseline_ms=base_ms,
+            threshold=r.threshold if r.threshold is not None else threshold,
+        ))
+    return comparisons
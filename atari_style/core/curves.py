@@ -0,0 +1,98 @@
+"""Cached Lissajous curve sampling and cell de-duplication.
+
+Lissajous demos draw the same curve many times per frame (once per
+motion-trail step) and again every frame. The angle grid depends only
+on the point count and the scaled phase vectors only on (points, a, b),
+so they are computed once and cached; each frame then evaluates every
+trail step with one broadcast sin per axis.
+
+Dense curves land many samples on the same character cell. last_writes()
+keeps only the final write to each cell, which is all a canvas ends up
+showing, so the per-cell Python loop runs once per visible cell rather
+than once per sample.
+
+Usage:
+    from atari_style.core import curves
+
+    times = t - np.arange(trail_length) * 0.02
+    x, y = curves.lissajous(points, a, b, delta, times)
+    sx = (cx + x * scale_x).astype(np.int64)
+    sy = (cy + y * scale_y).astype(np.int64)
+    for i in curves.last_writes(sx, sy, width, height):
+        ...
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+
+@lru_cache(maxsize=16)
+def curve_fraction(points: int) -> np.ndarray:
+    """``i / points`` for each sample, i.e. the position along the curve."""
+    fraction = np.arange(points) / points
+    fraction.setflags(write=False)
+    return fraction
+
+
+@lru_cache(maxsize=16)
+def angle_grid(points: int) -> np.ndarray:
+    """Sample angles ``(i / points) * 2 * pi`` around one full period."""
+    angles = curve_fraction(points) * 2 * np.pi
+    angles.setflags(write=False)
+    return angles
+
+
+@lru_cache(maxsize=64)
+def _phase_vectors(points: int, a: float, b: float) -> Tuple[np.ndarray, np.ndarray]:
+    angles = angle_grid(points)
+    a_angles, b_angles = a * angles, b * angles
+    a_angles.setflags(write=False)
+    b_angles.setflags(write=False)
+    return a_angles, b_angles
+
+
+def lissajous(points: int, a: float, b: float, delta: float, t,
+              y_rate: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample ``x = sin(a*angle + t)``, ``y = sin(b*angle + delta + t*y_rate)``.
+
+    Args:
+        points: Samples per curve
+        a, b: X and Y frequencies
+        delta: Phase offset
+        t: Time, or a 1-D array of times (one row per trail step)
+        y_rate: How fast the Y phase drifts relative to X
+
+    Returns:
+        (x, y) arrays of shape (points,) for a scalar ``t`` or
+        (len(t), points) for an array of times.
+    """
+    a_angles, b_angles = _phase_vectors(points, a, b)
+    t = np.asarray(t, dtype=np.float64)
+    if t.ndim:
+        t = t[:, None]
+    x = np.sin(a_angles + t)
+    y = np.sin((b_angles + delta) + t * y_rate)
+    return x, y
+
+
+def last_writes(xs: np.ndarray, ys: np.ndarray, width: int, height: int) -> np.ndarray:
+    """Indices of the writes that stay visible after drawing in order.
+
+    ``xs``/``ys`` are cell coordinates in drawing order (any shape; they
+    are flattened row-major). Off-screen writes are dropped and, for each
+    cell hit more than once, only the last write is kept.
+
+    Returns:
+        Ascending flat indices into ``xs``/``ys``.
+    """
+    xs = np.asarray(xs).ravel()
+    ys = np.asarray(ys).ravel()
+    on_screen = np.flatnonzero((xs >= 0) & (xs < width) & (ys >= 0) & (ys < height))
+    cells = ys[on_screen] * width + xs[on_screen]
+    # Scatter write positions into a per-cell table; the largest position
+    # hitting a cell is its last write
+    last = np.full(width * height, -1, dtype=np.int64)
+    np.maximum.at(last, cells, np.arange(len(cells)))
+    return on_screen[np.sort(last[last >= 0])]
@@ -19,7 +19,7 @@ import argparse
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, TYPE_CHECKING
+from typing import Optional, Callable, Dict, Any, Iterator, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PIL import Image
@@ -27,7 +27,10 @@ if TYPE_CHECKING:
 from .scripted_input import ScriptedInputHandler, InputScript
 from .headless_renderer import HeadlessRenderer, HeadlessRendererFactory
 from .overlay import OverlayManager
+from .profiler import FrameProfiler, profiled
+from . import render3d
 from .video_base import FFmpegEncoder
+from .gif_encoder import GifPalette, GifWriter
 
 
 # Registry of demos that support video export
@@ -457,8 +460,6 @@ class PlatonicSolidsDemo:
     def __init__(self, renderer: HeadlessRenderer, input_handler: ScriptedInputHandler):
         self.renderer = renderer
         self.input_handler = input_handler
-        import math
-        self.math = math
 
         # Build solids data (must be done in __init__ to call static methods)
         self.solids = {
@@ -503,29 +504,6 @@ class PlatonicSolidsDemo:
         self.last_button_time = 0
         self.time = 0
 
-    def _rotate_point(self, p, rx, ry, rz):
-        """Rotate a 3D point."""
-        x, y, z = p
-        # Rotate X
-        cos_rx, sin_rx = self.math.cos(rx), self.math.sin(rx)
-        y, z = y * cos_rx - z * sin_rx, y * sin_rx + z * cos_rx
-        # Rotate Y
-        cos_ry, sin_ry = self.math.cos(ry), self.math.sin(ry)
-        x, z = x * cos_ry + z * sin_ry, -x * sin_ry + z * cos_ry
-        # Rotate Z
-        cos_rz, sin_rz = self.math.cos(rz), self.math.sin(rz)
-        x, y = x * cos_rz - y * sin_rz, x * sin_rz + y * cos_rz
-        return (x, y, z)
-
-    def _project(self, p, width, height):
-        """Project 3D to 2D."""
-        x, y, z = p
-        # fov=200, distance=5 matches original implementation
-        factor = 200 / (z + 5)
-        sx = int(x * factor * self.zoom + width / 2)
-        sy = int(y * factor * self.zoom * 0.5 + height / 2)
-        return sx, sy
-
     def draw(self):
         """Render the platonic solid."""
         self.renderer.clear_buffer()
@@ -562,60 +540,25 @@ class PlatonicSolidsDemo:
         self.renderer.draw_text((width - len(solid_name)) // 2, 1, solid_name.upper(), 'bright_cyan')
         self.renderer.draw_text((width - len(info)) // 2, 2, info, 'yellow')
 
-        # Transform and project vertices
-        projected = []
-        for v in vertices:
-            rv = self._rotate_point(v, self.rotation_x, self.rotation_y, self.rotation_z)
-            projected.append(self._project(rv, width, height))
+        # Transform and project all vertices at once
+        # (fov=200, distance=5 matches the interactive viewer)
+        rotation = render3d.rotation_matrix(self.rotation_x, self.rotation_y, self.rotation_z)
+        points = render3d.transform(vertices, rotation)
+        sx, sy = render3d.project(points, 200, 5, width / 2, height / 2,
+                                  aspect=0.5, scale=self.zoom)
 
         # Draw edges
-        for e in edges:
-            if e[0] < len(projected) and e[1] < len(projected):
-                x1, y1 = projected[e[0]]
-                x2, y2 = projected[e[1]]
-                self._draw_line(x1, y1, x2, y2, 'green')
+        render3d.draw_edges(self.renderer, sx, sy, edges, 'green')
 
         # Draw vertices
-        for sx, sy in projected:
-            if 0 <= sx < width and 0 <= sy < height:
-                self.renderer.set_pixel(sx, sy, '●', 'bright_white')
+        for x, y in zip(sx.tolist(), sy.tolist()):
+            self.renderer.set_pixel(x, y, '●', 'bright_white')
 
         # Controls hint
         self.renderer.draw_text(2, height - 2, "BTN0: Next solid  Joystick: Rotate", 'cyan')
 
         self.time += 1/30
 
-    def _draw_line(self, x1, y1, x2, y2, color):
-        """Draw a line using Bresenham's algorithm."""
-        dx = abs(x2 - x1)
-        dy = abs(y2 - y1)
-        sx = 1 if x1 < x2 else -1
-        sy = 1 if y1 < y2 else -1
-        err = dx - dy
-
-        while True:
-            if 0 <= x1 < self.renderer.width and 0 <= y1 < self.renderer.height:
-                # Choose line character based on direction (matches original)
-                if abs(dx) > abs(dy):
-                    char = '─'
-                elif abs(dy) > abs(dx):
-                    char = '│'
-                elif (sx > 0 and sy > 0) or (sx < 0 and sy < 0):
-                    char = '\\'
-                else:
-                    char = '/'
-                self.renderer.set_pixel(x1, y1, char, color)
-
-            if x1 == x2 and y1 == y2:
-                break
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x1 += sx
-            if e2 < dx:
-                err += dx
-                y1 += sy
-
 
 def create_platonic_solids(renderer: HeadlessRenderer, input_handler: ScriptedInputHandler):
     """Factory for PlatonicSolidsDemo."""
@@ -625,6 +568,19 @@ def create_platonic_solids(renderer: HeadlessRenderer, input_handler: ScriptedIn
 register_demo('platonic_solids', create_platonic_solids, 'Interactive 3D Platonic solids viewer')
 
 
+def gif_frame_selection(total_frames: int, source_fps: float, gif_fps: float) -> Set[int]:
+    """Source frames nearest to each GIF frame time.
+
+    Only these frames need rasterizing when the GIF runs at a lower frame
+    rate than the script.
+    """
+    if gif_fps >= source_fps:
+        return set(range(total_frames))
+    gif_frames = int(total_frames * gif_fps / source_fps + 0.5)
+    keep = {round(k * source_fps / gif_fps) for k in range(gif_frames)}
+    return {frame for frame in keep if frame < total_frames}
+
+
 class DemoVideoExporter:
     """Exports terminal demos to video using scripted input."""
 
@@ -645,6 +601,7 @@ class DemoVideoExporter:
         gif_fps: Optional[int] = None,
         gif_scale: Optional[int] = None,
         overlay_manager: Optional[OverlayManager] = None,
+        profiler: Optional[FrameProfiler] = None,
     ):
         """Initialize exporter.
 
@@ -660,6 +617,7 @@ class DemoVideoExporter:
             gif_fps: GIF frame rate (default: 15)
             gif_scale: GIF max width in pixels (default: 480)
             overlay_manager: Optional OverlayManager for frame/timestamp overlays
+            profiler: Optional FrameProfiler timing each exported frame
         """
         if demo_name not in DEMO_REGISTRY:
             available = ', '.join(DEMO_REGISTRY.keys())
@@ -693,64 +651,56 @@ class DemoVideoExporter:
         # Overlay manager (optional)
         self.overlay_manager = overlay_manager
 
+        # Frame profiler (optional)
+        self.profiler = profiler
+        if profiler is not None:
+            profiler.attach(self.demo)
+
+        # Held frames (same cells as the previous output frame) are not
+        # rasterized again; the previous frame's duration is extended
+        self.frames_reused = 0
+        self._last_key = None
+
     def export(self, progress_callback: Optional[Callable[[int, int], None]] = None):
         """Export demo to video.
 
+        GIFs are encoded in-process against the renderer's fixed palette;
+        MP4s go through ffmpeg. Either way, frames whose cells match the
+        previous frame are stored once with a longer duration.
+
         Args:
             progress_callback: Optional callback(current_frame, total_frames)
         """
+        if self.gif_mode:
+            self._export_gif(progress_callback)
+            return
+
         if not self.encoder.is_available():
             raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
 
-        total_frames = self.input_handler.get_frame_count()
-        frame_time = 1.0 / self.script.fps
-
         # Create temp directory for frames
         temp_dir = tempfile.mkdtemp(prefix='atari_demo_')
 
         try:
-            # Start script playback
-            self.input_handler.start()
-
-            # Render each frame
-            for frame_num in range(total_frames):
-                # Update input handler time
-                self.input_handler.current_time = frame_num * frame_time
-
-                # Render frame
-                self.demo.draw()
-
-                # Render overlays (after demo, so they appear on top)
-                if self.overlay_manager:
-                    self.overlay_manager.render(
-                        self.renderer,
-                        frame=frame_num + 1,  # 1-indexed for display
-                        total_frames=total_frames,
-                        fps=self.script.fps,
-                        demo_name=self.demo_name,
-                    )
-
-                # Save frame
-                frame_path = os.path.join(temp_dir, f'frame_{frame_num:05d}.png')
+            holds = []  # Source frames each saved frame stays on screen
+            for _ in self._render_frames(progress_callback):
+                if self._is_repeat():
+                    holds[-1] += 1
+                    continue
+                frame_path = os.path.join(temp_dir, f'frame_{len(holds):05d}.png')
                 self.renderer.save_frame(frame_path)
-
-                if progress_callback:
-                    progress_callback(frame_num + 1, total_frames)
+                holds.append(1)
 
             # Encode output using shared encoder
-            if self.gif_mode:
-                success = self.encoder.encode_gif(
-                    temp_dir,
-                    self.output_path,
-                    self.gif_fps,
-                    scale=self.gif_scale,
-                )
-            else:
-                success = self.encoder.encode_video(
-                    temp_dir,
-                    self.output_path,
-                    self.script.fps,
-                )
+            durations = None
+            if self.frames_reused:
+                durations = [count / self.script.fps for count in holds]
+            success = self.encoder.encode_video(
+                temp_dir,
+                self.output_path,
+                self.script.fps,
+                durations=durations,
+            )
 
             if not success:
                 raise RuntimeError("ffmpeg encoding failed")
@@ -759,6 +709,80 @@ class DemoVideoExporter:
             # Cleanup temp directory
             shutil.rmtree(temp_dir, ignore_errors=True)
 
+    def _export_gif(self, progress_callback: Optional[Callable[[int, int], None]] = None):
+        """Stream the frames sampled at gif_fps straight into a GifWriter."""
+        total_frames = self.input_handler.get_frame_count()
+        keep = gif_frame_selection(total_frames, self.script.fps, self.gif_fps)
+        palette = GifPalette.for_renderer(self.renderer)
+        fps = min(self.gif_fps, self.script.fps)
+
+        with GifWriter(self.output_path, palette, fps=fps, scale=self.gif_scale) as gif:
+            for _ in self._render_frames(progress_callback, keep):
+                if self._is_repeat():
+                    gif.extend()
+                else:
+                    gif.add_frame(self.renderer.to_image())
+
+    def _is_repeat(self) -> bool:
+        """True if the cells drawn match the previous output frame."""
+        key = self.renderer.frame_key()
+        if key == self._last_key:
+            self.frames_reused += 1
+            return True
+        self._last_key = key
+        return False
+
+    def _render_frames(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        keep: Optional[Set[int]] = None,
+    ) -> Iterator[int]:
+        """Play the script, drawing every frame.
+
+        Yields the frame number once the frame (and its overlays) is drawn,
+        for frames in ``keep`` (all frames if None). The demo still draws
+        every frame so its animation state advances as it would live.
+        """
+        total_frames = self.input_handler.get_frame_count()
+        frame_time = 1.0 / self.script.fps
+
+        self.frames_reused = 0
+        self._last_key = None
+
+        # Start script playback
+        self.input_handler.start()
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame()
+
+        for frame_num in range(total_frames):
+            # Update input handler time
+            with profiled(profiler, 'input'):
+                self.input_handler.current_time = frame_num * frame_time
+
+            # Render frame
+            self.demo.draw()
+
+            # Render overlays (after demo, so they appear on top)
+            if self.overlay_manager:
+                self.overlay_manager.render(
+                    self.renderer,
+                    frame=frame_num + 1,  # 1-indexed for display
+                    total_frames=total_frames,
+                    fps=self.script.fps,
+                    demo_name=self.demo_name,
+                    profiler=profiler,
+                )
+
+            if keep is None or frame_num in keep:
+                yield frame_num
+
+            if profiler is not None:
+                profiler.end_frame()
+
+            if progress_callback:
+                progress_callback(frame_num + 1, total_frames)
+
     def preview_frame(self, time: float) -> 'Image.Image':
         """Render a single frame at the given time.
 
@@ -786,9 +810,10 @@ Examples:
   %(prog)s joystick_test scripts/demos/joystick-demo.json --preview
   %(prog)s joystick_test scripts/demos/joystick-demo.json --overlay frame,timestamp
   %(prog)s joystick_test scripts/demos/joystick-demo.json --overlay frame --overlay-position top-left
+  %(prog)s joystick_test scripts/demos/joystick-demo.json --profile frame-trace.json
   %(prog)s --list
 
-Overlay types: frame, timestamp, fps, demo
+Overlay types: frame, timestamp, fps, demo, profiler
 Positions: top-left, top-right, bottom-left, bottom-right
 
 Available demos:
@@ -815,10 +840,14 @@ Available demos:
 
     # Overlay options
     parser.add_argument('--overlay', type=str, default=None,
-                        help='Comma-separated overlay types: frame, timestamp, fps, demo')
+                        help='Comma-separated overlay types: frame, timestamp, fps, demo, profiler')
     parser.add_argument('--overlay-position', type=str, default=None,
                         help='Overlay position: top-left, top-right, bottom-left, bottom-right')
 
+    # Profiling
+    parser.add_argument('--profile', type=str, default=None, metavar='TRACE',
+                        help='Profile each frame and write a Chrome trace JSON to TRACE')
+
     args = parser.parse_args()
 
     if args.list:
@@ -844,6 +873,11 @@ Available demos:
             overlay_manager = OverlayManager()
             overlay_manager.add_from_string(args.overlay, args.overlay_position)
 
+        # The 'profiler' overlay needs a profiler even without a trace file
+        profiler = None
+        if args.profile or (args.overlay and 'profiler' in args.overlay):
+            profiler = FrameProfiler(trace=bool(args.profile), hud=False)
+
         exporter = DemoVideoExporter(
             demo_name=args.demo,
             script_path=args.script,
@@ -856,6 +890,7 @@ Available demos:
             gif_fps=args.gif_fps,
             gif_scale=args.gif_scale,
             overlay_manager=overlay_manager,
+            profiler=profiler,
         )
 
         if args.preview:
@@ -888,6 +923,14 @@ Available demos:
 
         print()
         print(f"✓ {output_type.capitalize()} exported to: {output_path}")
+        if exporter.frames_reused:
+            print(f"Held frames reused: {exporter.frames_reused}")
+
+        if args.profile:
+            profiler.export_trace(args.profile)
+            print(f"Frame trace written to: {args.profile}")
+            for name, stats in profiler.summary().items():
+                print(f"  {name:<8} p50 {stats['p50']:7.2f}ms  p95 {stats['p95']:7.2f}ms  p99 {stats['p99']:7.2f}ms")
 
     except FileNotFoundError as e:
         print(f"Error: File not found: {e}", file=sys.stderr)
@@ -0,0 +1,227 @@
+"""Render-once, encode-many video export.
+
+Publishing one animation to several platforms used to mean rendering it
+once per format. FanoutEncoder instead takes each frame once, at a master
+resolution large enough for every output, and streams the raw pixels into
+one ffmpeg process per output. Each process applies its own
+scale/crop/pad (and frame rate) filter, so all outputs encode side by side
+from a single render.
+
+Usage:
+    from atari_style.core.fanout_encoder import FanoutEncoder, OutputSpec, master_size
+    from atari_style.core.video_base import PresetManager
+
+    outputs = [
+        OutputSpec.from_format('out_1080p.mp4', PresetManager.get_preset('youtube_1080p')),
+        OutputSpec.from_format('out_short.mp4', PresetManager.get_preset('youtube_shorts')),
+        OutputSpec('preview.gif', 480, 270, fps=15),
+    ]
+    width, height = master_size(outputs)
+    with FanoutEncoder((width, height), 30, outputs) as fanout:
+        for frame in frames:  # PIL images at width x height
+            fanout.write(frame)
+    print(fanout.results)
+"""
+
+import os
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from .video_base import VideoFormat
+
+FIT_MODES = ('crop', 'pad', 'scale')
+
+
+@dataclass
+class OutputSpec:
+    """One encoded output of a fan-out export."""
+    path: str
+    width: int
+    height: int
+    fps: int = 30
+    crf: int = 23
+    fit: str = 'crop'  # crop (fill, trim edges), pad (letterbox) or scale (stretch)
+    max_duration: Optional[float] = None  # Stop this output early (platform limit)
+
+    def __post_init__(self):
+        if self.fit not in FIT_MODES:
+            raise ValueError(f"Unknown fit '{self.fit}'. Available: {', '.join(FIT_MODES)}")
+
+    @classmethod
+    def from_format(cls, path: str, fmt: VideoFormat, fit: str = 'crop') -> 'OutputSpec':
+        """Output matching a VideoFormat preset."""
+        return cls(path, fmt.width, fmt.height, fmt.fps, fmt.crf, fit, fmt.max_duration)
+
+    @property
+    def is_gif(self) -> bool:
+        """True if this output is an animated GIF."""
+        return self.path.lower().endswith('.gif')
+
+
+def master_size(outputs: Sequence[OutputSpec]) -> Tuple[int, int]:
+    """Smallest render size every output can be cut from without upscaling.
+
+    The widest and tallest outputs set the width and height, so a
+    landscape and a vertical output share a square-ish master that each
+    crops to its own aspect ratio.
+    """
+    if not outputs:
+        raise ValueError("No outputs given")
+    width = max(spec.width for spec in outputs)
+    height = max(spec.height for spec in outputs)
+    return width + width % 2, height + height % 2
+
+
+def fit_filter(source: Tuple[int, int], spec: OutputSpec, source_fps: int) -> str:
+    """ffmpeg filter chain mapping a source frame onto an output.
+
+    Args:
+        source: (width, height) of the frames written
+        spec: Output to produce
+        source_fps: Frame rate of the frames written
+
+    Returns:
+        Comma-separated filter chain ('null' if nothing to do)
+    """
+    filters = []
+    if spec.fps != source_fps:
+        filters.append(f'fps={spec.fps}')
+    w, h = spec.width, spec.height
+    if source != (w, h):
+        if spec.fit == 'crop':
+            filters.append(f'scale={w}:{h}:force_original_aspect_ratio=increase:flags=lanczos')
+            filters.append(f'crop={w}:{h}')
+        elif spec.fit == 'pad':
+            filters.append(f'scale={w}:{h}:force_original_aspect_ratio=decrease:flags=lanczos')
+            filters.append(f'pad={w}:{h}:(ow-iw)/2:(oh-ih)/2')
+        else:
+            filters.append(f'scale={w}:{h}:flags=lanczos')
+    return ','.join(filters) or 'null'
+
+
+def encoder_command(source: Tuple[int, int], source_fps: int, spec: OutputSpec,
+                    preset: str = 'medium') -> list:
+    """ffmpeg command reading raw RGB frames from stdin for one output."""
+    width, height = source
+    cmd = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+        '-s', f'{width}x{height}', '-framerate', str(source_fps),
+        '-i', '-',
+    ]
+    chain = fit_filter(source, spec, source_fps)
+    if spec.is_gif:
+        # Single pass: palettegen buffers the stream, paletteuse maps it
+        cmd += ['-filter_complex',
+                f'[0:v]{chain},split[a][b];[a]palettegen=stats_mode=diff[p];'
+                f'[b][p]paletteuse=dither=bayer:bayer_scale=5']
+    else:
+        cmd += ['-vf', chain, '-c:v', 'libx264', '-pix_fmt', 'yuv420p',
+                '-crf', str(spec.crf), '-preset', preset]
+    cmd.append(spec.path)
+    return cmd
+
+
+class FanoutEncoder:
+    """Streams each frame into one ffmpeg process per output."""
+
+    def __init__(self, source_size: Tuple[int, int], fps: int,
+                 outputs: Sequence[OutputSpec], preset: str = 'medium'):
+        """Configure the fan-out.
+
+        Args:
+            source_size: (width, height) of every frame passed to write()
+            fps: Frame rate of the written frames
+            outputs: Outputs to encode
+            preset: x264 preset for video outputs
+        """
+        if not outputs:
+            raise ValueError("No outputs given")
+        self.source_size = tuple(source_size)
+        self.fps = fps
+        self.outputs = list(outputs)
+        self.preset = preset
+
+        self.frames_written = 0
+        self.results: Dict[str, bool] = {}
+        self._pipes = []
+
+    def __enter__(self) -> 'FanoutEncoder':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """Launch one ffmpeg process per output."""
+        for spec in self.outputs:
+            directory = os.path.dirname(spec.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            limit = None
+            if spec.max_duration:
+                limit = int(spec.max_duration * self.fps)
+            log = tempfile.TemporaryFile()
+            process = subprocess.Popen(
+                encoder_command(self.source_size, self.fps, spec, self.preset),
+                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log,
+            )
+            self._pipes.append({'spec': spec, 'process': process, 'log': log,
+                                'limit': limit, 'ok': True})
+
+    def write(self, image):
+        """Send one frame (PIL image at source_size) to every open output."""
+        if image.size != self.source_size:
+            raise ValueError(f"Frame size {image.size} != {self.source_size}")
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        data = image.tobytes()
+
+        for pipe in self._pipes:
+            stdin = pipe['process'].stdin
+            if stdin is None or stdin.closed:
+                continue
+            if pipe['limit'] is not None and self.frames_written >= pipe['limit']:
+                stdin.close()
+                continue
+            try:
+                stdin.write(data)
+            except (BrokenPipeError, OSError):
+                pipe['ok'] = False
+                stdin.close()
+        self.frames_written += 1
+
+    @property
+    def active(self) -> int:
+        """Outputs still accepting frames."""
+        return sum(1 for pipe in self._pipes
+                   if pipe['process'].stdin is not None and not pipe['process'].stdin.closed)
+
+    def close(self) -> Dict[str, bool]:
+        """Finish every output.
+
+        Returns:
+            Dict mapping output paths to success status
+        """
+        for pipe in self._pipes:
+            stdin = pipe['process'].stdin
+            if stdin is not None and not stdin.closed:
+                try:
+                    stdin.close()
+                except (BrokenPipeError, OSError):
+                    pipe['ok'] = False
+        for pipe in self._pipes:
+            returncode = pipe['process'].wait()
+            spec = pipe['spec']
+            ok = pipe['ok'] and returncode == 0
+            if not ok:
+                pipe['log'].seek(0)
+                error = pipe['log'].read().decode(errors='replace').strip()
+                print(f"ffmpeg error ({spec.path}): {error or f'exit code {returncode}'}")
+            pipe['log'].close()
+            self.results[spec.path] = ok
+        self._pipes = []
+        return self.results
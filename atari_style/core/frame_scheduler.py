@@ -0,0 +1,227 @@
+"""Fixed-timestep frame scheduler for interactive run loops.
+
+Simulation advances in fixed steps (so physics never sees dt spikes)
+while rendering happens once per loop iteration. Sleeps are computed
+against absolute deadlines, so the frame rate holds at the target no
+matter how long each frame takes to draw. Under overload the scheduler
+runs several updates per rendered frame (skipping renders) and, past
+``max_updates``, drops simulation time rather than spiralling.
+
+Usage:
+    from atari_style.core.frame_scheduler import FrameScheduler
+
+    scheduler = FrameScheduler(target_fps=60)
+    scheduler.start()
+    while running:
+        handle_events()
+        for dt in scheduler.updates():
+            game.update(dt)
+        game.draw()
+        scheduler.end_frame()
+"""
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .profiler import FrameProfiler
+
+
+# Tolerance so exact multiples of the step are not lost to float rounding
+_EPSILON = 1e-9
+
+
+class FrameStats:
+    """Rolling frame-time statistics.
+
+    Args:
+        window: Number of recent frames to keep
+    """
+
+    def __init__(self, window: int = 120):
+        self.intervals = deque(maxlen=window)  # Start-to-start time per frame
+        self.work_times = deque(maxlen=window)  # Time spent before sleeping
+        self.frames = 0
+        self.updates = 0
+        self.skipped_updates = 0
+
+    def record(self, interval: float, work_time: float) -> None:
+        """Record one completed frame."""
+        self.frames += 1
+        if interval > 0:
+            self.intervals.append(interval)
+        self.work_times.append(work_time)
+
+    @staticmethod
+    def _percentile(values, pct: float) -> float:
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    @property
+    def fps(self) -> float:
+        """Measured frames per second over the window."""
+        total = sum(self.intervals)
+        return len(self.intervals) / total if total > 0 else 0.0
+
+    @property
+    def avg_frame_ms(self) -> float:
+        """Mean frame interval in milliseconds."""
+        return 1000.0 * sum(self.intervals) / len(self.intervals) if self.intervals else 0.0
+
+    @property
+    def p95_frame_ms(self) -> float:
+        """95th percentile frame interval in milliseconds."""
+        return 1000.0 * self._percentile(self.intervals, 95)
+
+    @property
+    def max_frame_ms(self) -> float:
+        """Longest frame interval in the window, in milliseconds."""
+        return 1000.0 * max(self.intervals) if self.intervals else 0.0
+
+    @property
+    def avg_work_ms(self) -> float:
+        """Mean time spent doing work (excluding sleep) in milliseconds."""
+        return 1000.0 * sum(self.work_times) / len(self.work_times) if self.work_times else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """Snapshot of all statistics."""
+        return {
+            'fps': self.fps,
+            'avg_frame_ms': self.avg_frame_ms,
+            'p95_frame_ms': self.p95_frame_ms,
+            'max_frame_ms': self.max_frame_ms,
+            'avg_work_ms': self.avg_work_ms,
+            'frames': self.frames,
+            'updates': self.updates,
+            'skipped_updates': self.skipped_updates,
+        }
+
+
+class FrameScheduler:
+    """Paces a loop at a target fps with fixed-timestep updates.
+
+    Args:
+        target_fps: Render rate to aim for
+        update_rate: Fixed simulation rate in Hz (default: target_fps)
+        max_updates: Maximum updates per frame before dropping time
+        stats_window: Frames kept for rolling statistics
+        clock: Monotonic clock (injectable for tests)
+        sleep: Sleep function (injectable for tests)
+        profiler: Optional FrameProfiler; receives frame boundaries and
+            'update'/'sleep' sections
+    """
+
+    def __init__(
+        self,
+        target_fps: float = 60.0,
+        update_rate: Optional[float] = None,
+        max_updates: int = 5,
+        stats_window: int = 120,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+        profiler: Optional['FrameProfiler'] = None,
+    ):
+        if target_fps <= 0:
+            raise ValueError(f"target_fps must be positive, got {target_fps}")
+        self.target_fps = target_fps
+        self.frame_period = 1.0 / target_fps
+        self.step = 1.0 / (update_rate or target_fps)
+        self.max_updates = max(1, max_updates)
+        self.stats = FrameStats(stats_window)
+        self._clock = clock
+        self._sleep = sleep
+        self.profiler = profiler
+
+        self._accumulator = 0.0
+        self._last_update: Optional[float] = None
+        self._frame_start: Optional[float] = None
+        self._next_deadline: Optional[float] = None
+        self.frame_updates = 0
+
+    def start(self) -> None:
+        """Reset timing; call right before entering the loop."""
+        now = self._clock()
+        self._accumulator = 0.0
+        self._last_update = now
+        self._frame_start = now
+        self._next_deadline = now + self.frame_period
+        self.frame_updates = 0
+        if self.profiler is not None:
+            self.profiler.begin_frame()
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a step left in the accumulator, for render interpolation."""
+        return self._accumulator / self.step
+
+    @property
+    def frame_dt(self) -> float:
+        """Simulated time advanced during the current frame."""
+        return self.frame_updates * self.step
+
+    def updates(self) -> Iterator[float]:
+        """Yield the fixed step once per update due this frame.
+
+        Elapsed real time since the previous call is added to an
+        accumulator. If more than ``max_updates`` steps are owed, the
+        excess is dropped and counted in ``stats.skipped_updates``.
+        """
+        if self._last_update is None:
+            self.start()
+        now = self._clock()
+        self._accumulator += now - self._last_update
+        self._last_update = now
+
+        owed = int(self._accumulator / self.step + _EPSILON)
+        if owed > self.max_updates:
+            self.stats.skipped_updates += owed - self.max_updates
+            self._accumulator -= (owed - self.max_updates) * self.step
+
+        self.frame_updates = 0
+        profiler = self.profiler
+        while self._accumulator + _EPSILON >= self.step:
+            self._accumulator = max(0.0, self._accumulator - self.step)
+            self.frame_updates += 1
+            self.stats.updates += 1
+            if profiler is None:
+                yield self.step
+            else:
+                started = profiler.clock()
+                yield self.step
+                profiler.record('update', started, profiler.clock())
+
+    def end_frame(self) -> None:
+        """Record frame statistics and sleep until the next frame is due.
+
+        Deadlines advance by exactly one frame period, so oversleeping one
+        frame is compensated by a shorter sleep on the next. After falling
+        more than a frame behind the schedule resynchronises instead of
+        rendering a burst of catch-up frames.
+        """
+        if self._frame_start is None:
+            self.start()
+        now = self._clock()
+        work_time = now - self._frame_start
+
+        remaining = self._next_deadline - now
+        if remaining > 0:
+            if self.profiler is not None:
+                with self.profiler.section('sleep'):
+                    self._sleep(remaining)
+            else:
+                self._sleep(remaining)
+            self._next_deadline += self.frame_period
+        elif -remaining > self.frame_period:
+            self._next_deadline = now + self.frame_period
+        else:
+            self._next_deadline += self.frame_period
+
+        frame_end = self._clock()
+        self.stats.record(frame_end - self._frame_start, work_time)
+        self._frame_start = frame_end
+        if self.profiler is not None:
+            self.profiler.end_frame()
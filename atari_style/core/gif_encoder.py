@@ -0,0 +1,390 @@
+"""In-process animated GIF encoder for terminal-rendered frames.
+
+Terminal frames only ever contain the background, a small set of
+foreground colors, and anti-aliased glyph edges blending the two. Rather
+than running ffmpeg's palettegen/paletteuse over temp PNGs, GifPalette
+builds one global palette of background-to-color ramps up front, and an
+18-bit lookup table maps every RGB pixel to its palette index with a
+single NumPy gather. The table is filled lazily: each bucket's nearest
+color is found the first time a frame contains it.
+
+GifWriter then streams frames straight to the file:
+- each frame is cropped to the rectangle that changed since the last one
+- unchanged pixels inside that rectangle become transparent, which LZW
+  compresses to almost nothing
+- identical consecutive frames are merged by extending the frame delay
+
+Usage:
+    from atari_style.core.gif_encoder import GifPalette, GifWriter
+
+    palette = GifPalette.for_renderer(renderer)
+    with GifWriter('out.gif', palette, fps=15) as gif:
+        for frame in frames:
+            gif.add_frame(frame)
+"""
+
+import io
+import os
+import struct
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = None
+
+RGB = Tuple[int, int, int]
+
+TRANSPARENT_INDEX = 255
+MAX_RAMP_LEVELS = 32
+
+# GIF disposal method 1: leave the frame in place for the next one to patch
+_DISPOSAL_KEEP = 1
+
+
+class _NearestLut:
+    """Lazily filled map from 18-bit RGB buckets to nearest palette indices.
+
+    Resolving all 262,144 buckets up front costs seconds per process, while
+    a terminal animation only ever produces a few thousand distinct
+    buckets. Buckets are resolved the first time a frame contains them and
+    memoized, so later frames are a single gather.
+
+    Exact palette colors are patched in up front so they always map to
+    themselves; ``anchors`` are patched last and win shared buckets.
+    """
+
+    def __init__(self, colors: Tuple[RGB, ...], anchors: Tuple[int, ...]):
+        self.palette = np.array(colors, dtype=np.int32)
+        # Palette indices stop below TRANSPARENT_INDEX, so it marks unresolved buckets
+        self.table = np.full(1 << 18, TRANSPARENT_INDEX, dtype=np.uint8)
+        order = [i for i in range(len(colors)) if i not in anchors] + list(anchors)
+        self.table[_lut_keys(self.palette[order])] = order
+        self.table.setflags(write=False)
+
+    @property
+    def resolved(self) -> int:
+        """Number of buckets resolved so far."""
+        return int(np.count_nonzero(self.table != TRANSPARENT_INDEX))
+
+    def _resolve(self, keys: np.ndarray):
+        """Fill in the nearest palette index for unresolved bucket ``keys``."""
+        keys = keys.astype(np.int32)
+        centers = np.stack([keys >> 12, (keys >> 6) & 63, keys & 63], axis=1) * 4 + 2
+        nearest = np.empty(len(keys), dtype=np.uint8)
+        for start in range(0, len(keys), 8192):
+            chunk = centers[start:start + 8192, None, :] - self.palette[None, :, :]
+            nearest[start:start + 8192] = np.argmin((chunk * chunk).sum(axis=2), axis=1)
+        # Copy-on-write so readers never see a half-filled table
+        table = self.table.copy()
+        table[keys] = nearest
+        table.setflags(write=False)
+        self.table = table
+
+    def __getitem__(self, keys: np.ndarray) -> np.ndarray:
+        indices = self.table[keys]
+        unresolved = indices == TRANSPARENT_INDEX
+        if unresolved.any():
+            self._resolve(np.unique(keys[unresolved]))
+            indices = self.table[keys]
+        return indices
+
+
+@lru_cache(maxsize=8)
+def _nearest_lut(colors: Tuple[RGB, ...], anchors: Tuple[int, ...]) -> _NearestLut:
+    """Shared lazy lookup table for a palette (memoized per process)."""
+    return _NearestLut(colors, anchors)
+
+
+def _lut_keys(rgb: np.ndarray) -> np.ndarray:
+    """18-bit bucket key (6 bits per channel) of an ``(..., 3)`` RGB array."""
+    rgb = rgb.astype(np.int32) >> 2
+    return rgb[..., 0] << 12 | rgb[..., 1] << 6 | rgb[..., 2]
+
+
+class GifPalette:
+    """A fixed global GIF palette built from color ramps.
+
+    Index 0 is the background; each ramp then contributes ``levels``
+    evenly spaced blends ending at its target color (plus its start color
+    if that isn't the background). Index 255 is reserved for transparency.
+    """
+
+    def __init__(
+        self,
+        background: RGB,
+        colors: Iterable[RGB],
+        ramps: Sequence[Tuple[RGB, RGB]] = (),
+        levels: Optional[int] = None,
+    ):
+        """Build the palette.
+
+        Args:
+            background: Background RGB color
+            colors: Foreground colors, each ramped from the background
+            ramps: Extra (start, end) ramps, e.g. text drawn on a box
+            levels: Blend steps per ramp (default: as many as fit)
+        """
+        self.background = tuple(background)
+        all_ramps = []
+        for color in colors:
+            ramp = (self.background, tuple(color))
+            if ramp not in all_ramps and ramp[1] != self.background:
+                all_ramps.append(ramp)
+        for start, end in ramps:
+            ramp = (tuple(start), tuple(end))
+            if ramp not in all_ramps:
+                all_ramps.append(ramp)
+
+        if not all_ramps:
+            raise ValueError("GifPalette needs at least one foreground color")
+        # Ramps that don't start at the background need their start color too
+        starts = sum(start != self.background for start, _ in all_ramps)
+        max_levels = (TRANSPARENT_INDEX - 1 - starts) // len(all_ramps)
+        if max_levels < 1:
+            raise ValueError(f"Too many colors for one GIF palette: {len(all_ramps)}")
+        self.levels = min(levels or MAX_RAMP_LEVELS, max_levels)
+
+        entries = [self.background]
+        ends = []
+        for start, end in all_ramps:
+            start_rgb = np.array(start, dtype=np.float64)
+            end_rgb = np.array(end, dtype=np.float64)
+            first = 1 if start == self.background else 0
+            for k in range(first, self.levels + 1):
+                blend = start_rgb + (end_rgb - start_rgb) * (k / self.levels)
+                entries.append(tuple(int(round(c)) for c in blend))
+            ends.append(len(entries) - 1)
+        self.colors: Tuple[RGB, ...] = tuple(entries)
+        # Ramp end points are the colors actually drawn, and the background
+        # is everywhere: both must survive any bucket they share with a blend
+        self.lut = _nearest_lut(self.colors, tuple(ends) + (0,))
+
+        table = np.zeros((256, 3), dtype=np.uint8)
+        table[:len(entries)] = entries
+        table[TRANSPARENT_INDEX] = self.background
+        self.rgb = table
+
+    @classmethod
+    def for_renderer(cls, renderer, **kwargs) -> 'GifPalette':
+        """Palette for everything a HeadlessRenderer can draw."""
+        from .headless_renderer import ANSI_COLORS, DEFAULT_FG_COLOR
+        colors = list(ANSI_COLORS.values()) + [DEFAULT_FG_COLOR]
+        return cls(renderer.bg_color, colors, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    def quantize(self, image) -> np.ndarray:
+        """Map an RGB image (PIL or HxWx3 array) to palette indices."""
+        if not isinstance(image, np.ndarray):
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+            image = np.asarray(image)
+        return self.lut[_lut_keys(image)]
+
+
+def _lzw_image_data(indices: np.ndarray) -> bytes:
+    """LZW-encode 8-bit indices using Pillow's encoder.
+
+    Pillow writes a single-frame GIF; the image data sub-blocks (code size
+    byte through block terminator) are lifted out of it unchanged.
+    """
+    height, width = indices.shape
+    im = Image.frombytes('P', (width, height), np.ascontiguousarray(indices).tobytes())
+    im.putpalette(bytes(range(256)) * 3)  # Full 256 entries keeps 8-bit codes
+    buf = io.BytesIO()
+    im.save(buf, format='GIF', optimize=False, interlace=False)
+    data = buf.getvalue()
+
+    pos = 13  # Header + logical screen descriptor
+    flags = data[10]
+    if flags & 0x80:
+        pos += 3 << ((flags & 7) + 1)
+    while data[pos] == 0x21:  # Skip extensions
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    if data[pos] != 0x2C:
+        raise ValueError("Unexpected GIF structure from Pillow")
+    flags = data[pos + 9]
+    pos += 10
+    if flags & 0x80:
+        pos += 3 << ((flags & 7) + 1)
+
+    start = pos
+    pos += 1  # LZW minimum code size
+    while data[pos]:
+        pos += data[pos] + 1
+    return data[start:pos + 1]
+
+
+class GifWriter:
+    """Streams frames to an animated GIF with delta frames."""
+
+    def __init__(
+        self,
+        path: str,
+        palette: GifPalette,
+        fps: float = 15,
+        scale: Optional[int] = None,
+        loop: int = 0,
+    ):
+        """Open a GIF for writing.
+
+        Args:
+            path: Output GIF path
+            palette: Global palette every frame is mapped to
+            fps: Default frame rate (each frame lasts 1/fps)
+            scale: Output width in pixels (height keeps aspect ratio)
+            loop: Loop count (0 = forever)
+        """
+        if not PIL_AVAILABLE:
+            raise ImportError("PIL/Pillow is required for GIF export. Install with: pip install Pillow")
+        self.path = path
+        self.palette = palette
+        self.fps = fps
+        self.scale = scale
+        self.loop = loop
+
+        self.frames_written = 0
+        self.frames_merged = 0
+
+        self._file = None
+        self._size = None
+        self._shown = None  # Canvas as displayed after the last written frame
+        self._pending = None
+        self._pending_duration = 0.0
+        self._elapsed = 0.0
+        self._written_cs = 0
+
+    def __enter__(self) -> 'GifWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _prepare(self, image) -> np.ndarray:
+        if self.scale and image.width != self.scale:
+            height = max(1, round(image.height * self.scale / image.width))
+            image = image.convert('RGB').resize((self.scale, height), Image.LANCZOS)
+        return self.palette.quantize(image)
+
+    def add_frame(self, image, duration: Optional[float] = None):
+        """Append a frame.
+
+        Args:
+            image: PIL Image (RGB) of the full frame
+            duration: Seconds to show the frame (default: 1/fps)
+        """
+        indices = self._prepare(image)
+        if duration is None:
+            duration = 1.0 / self.fps
+
+        if self._pending is not None:
+            if indices.shape != self._pending.shape:
+                raise ValueError(f"Frame size changed: {indices.shape[::-1]} vs {self._pending.shape[::-1]}")
+            if np.array_equal(indices, self._pending):
+                self._pending_duration += duration
+                self.frames_merged += 1
+                return
+            self._flush()
+
+        self._pending = indices
+        self._pending_duration = duration
+
+    def extend(self, duration: Optional[float] = None):
+        """Hold the last added frame for longer, without re-sending it.
+
+        Args:
+            duration: Extra seconds to show the frame (default: 1/fps)
+        """
+        if self._pending is None:
+            raise ValueError("No frame to extend")
+        self._pending_duration += 1.0 / self.fps if duration is None else duration
+        self.frames_merged += 1
+
+    def _open(self, width: int, height: int):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'wb')
+        self._size = (width, height)
+        header = bytearray(b'GIF89a')
+        # Global color table present, 8 bits per channel, 256 entries
+        header += struct.pack('<HHBBB', width, height, 0xF7, 0, 0)
+        header += self.palette.rgb.tobytes()
+        # NETSCAPE2.0 looping extension
+        header += b'\x21\xFF\x0BNETSCAPE2.0\x03\x01' + struct.pack('<H', self.loop) + b'\x00'
+        self._file.write(header)
+
+    def _flush(self):
+        """Write the pending frame as a delta against the displayed canvas."""
+        indices = self._pending
+        if self._file is None:
+            self._open(indices.shape[1], indices.shape[0])
+
+        # Delay in centiseconds, rounded against the running clock so
+        # long animations don't drift
+        self._elapsed += self._pending_duration
+        delay = max(1, round(self._elapsed * 100) - self._written_cs)
+        self._written_cs += delay
+
+        if self._shown is None:
+            x0, y0 = 0, 0
+            patch = indices
+            transparent = False
+        else:
+            changed = indices != self._shown
+            # Never empty: identical frames were merged in add_frame()
+            rows = np.flatnonzero(changed.any(axis=1))
+            cols = np.flatnonzero(changed.any(axis=0))
+            y0, y1 = int(rows[0]), int(rows[-1]) + 1
+            x0, x1 = int(cols[0]), int(cols[-1]) + 1
+            patch = np.where(changed[y0:y1, x0:x1], indices[y0:y1, x0:x1], TRANSPARENT_INDEX).astype(np.uint8)
+            transparent = True
+
+        height, width = patch.shape
+        packed = _DISPOSAL_KEEP << 2 | int(transparent)
+        block = bytearray(b'\x21\xF9\x04')
+        block += struct.pack('<BHBB', packed, delay, TRANSPARENT_INDEX, 0)
+        block += b'\x2C' + struct.pack('<HHHHB', x0, y0, width, height, 0)
+        block += _lzw_image_data(patch)
+        self._file.write(block)
+
+        self._shown = indices
+        self._pending = None
+        self.frames_written += 1
+
+    def close(self):
+        """Write any pending frame and finish the file."""
+        if self._pending is not None:
+            self._flush()
+        if self._file is not None:
+            self._file.write(b'\x3B')
+            self._file.close()
+            self._file = None
+
+
+def write_gif(
+    frames: Iterable,
+    path: str,
+    palette: GifPalette,
+    fps: float = 15,
+    scale: Optional[int] = None,
+) -> GifWriter:
+    """Encode an iterable of PIL images to ``path``.
+
+    Returns:
+        The closed GifWriter (see frames_written / frames_merged)
+    """
+    with GifWriter(path, palette, fps=fps, scale=scale) as gif:
+        for frame in frames:
+            gif.add_frame(frame)
+    return gif
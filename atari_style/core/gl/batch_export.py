@@ -0,0 +1,225 @@
+"""Process-parallel batch export of GL composites.
+
+A single moderngl standalone context renders one frame at a time, so on
+a software rasterizer (llvmpipe) exporting a catalog composite after
+composite leaves most cores idle. The batch exporter splits the work into
+jobs - whole composites, or contiguous time segments of one when there
+are fewer composites than workers - and renders each job in its own
+worker process with its own standalone context. Segments are encoded
+with identical settings and joined with a stream-copy concat, so the
+result matches a sequential export.
+
+Usage:
+    from atari_style.core.gl.batch_export import export_batch
+
+    result = export_batch(['plasma_lissajous', 'flux_spiral'], './out',
+                          duration=10.0, workers=8)
+    print(result.summary())
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..fanout_encoder import FanoutEncoder, OutputSpec
+from ..video_base import FFmpegEncoder
+
+
+@dataclass
+class SegmentJob:
+    """A contiguous run of frames of one composite, rendered by one worker."""
+    composite_name: str
+    output_path: str
+    start_frame: int
+    end_frame: int  # Exclusive
+    fps: int
+    width: int
+    height: int
+    crf: int = 18
+    params: Optional[Tuple[float, float, float, float]] = None
+    color_mode: Optional[int] = None
+    ascii_preset: Optional[str] = None
+
+    @property
+    def frame_count(self) -> int:
+        return self.end_frame - self.start_frame
+
+
+@dataclass
+class SegmentResult:
+    """Outcome of one SegmentJob."""
+    job: SegmentJob
+    success: bool
+    frames: int
+    seconds: float
+    error: str = ''
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a batch export."""
+    outputs: Dict[str, bool] = field(default_factory=dict)  # composite -> success
+    segments: List[SegmentResult] = field(default_factory=list)
+    workers: int = 1
+    elapsed: float = 0.0
+
+    @property
+    def frames(self) -> int:
+        """Frames rendered across every worker."""
+        return sum(r.frames for r in self.segments)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate frames per second of wall time."""
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Summed worker time over wall time (1.0 = no parallelism gained)."""
+        busy = sum(r.seconds for r in self.segments)
+        return busy / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line throughput report."""
+        ok = sum(self.outputs.values())
+        return (f"{ok}/{len(self.outputs)} composites, {self.frames} frames in {self.elapsed:.1f}s "
+                f"({self.throughput:.1f} fps aggregate, {self.speedup:.1f}x over {self.workers} workers)")
+
+
+def plan_jobs(composites: Sequence[str], output_dir: str, total_frames: int, fps: int,
+              width: int, height: int, workers: int, **render_args) -> Dict[str, List[SegmentJob]]:
+    """Split composites into per-worker jobs.
+
+    With at least as many composites as workers each composite is one
+    job; otherwise every composite is cut into equal time segments so the
+    job count reaches the worker count.
+
+    Returns:
+        Composite name -> its segment jobs in playback order
+    """
+    segments = max(1, -(-workers // max(1, len(composites))))
+    segments = min(segments, max(1, total_frames))
+    plan = {}
+    for name in composites:
+        jobs = []
+        for k in range(segments):
+            start = total_frames * k // segments
+            end = total_frames * (k + 1) // segments
+            path = os.path.join(output_dir, f"{name}.part{k:03d}.mp4")
+            jobs.append(SegmentJob(name, path, start, end, fps, width, height, **render_args))
+        plan[name] = jobs
+    return plan
+
+
+def _init_worker(threads: int):
+    """Share the cores between workers' llvmpipe thread pools."""
+    os.environ.setdefault('LP_NUM_THREADS', str(threads))
+
+
+def _render_segment(job: SegmentJob) -> SegmentResult:
+    """Render and encode one segment on this process's own GL context."""
+    from .composites import CompositeManager
+
+    start = time.perf_counter()
+    frames = 0
+    try:
+        manager = CompositeManager(job.width, job.height)
+        spec = OutputSpec(job.output_path, job.width, job.height, job.fps, job.crf)
+        with FanoutEncoder((job.width, job.height), job.fps, [spec]) as encoder:
+            for frame_num in range(job.start_frame, job.end_frame):
+                img = manager.render_frame(job.composite_name, frame_num / job.fps,
+                                           job.params, job.color_mode, job.width, job.height,
+                                           ascii_preset=job.ascii_preset)
+                encoder.write(img)
+                frames += 1
+        success = encoder.results.get(job.output_path, False)
+        error = '' if success else 'encoding failed'
+    except Exception as e:
+        success, error = False, str(e)
+    return SegmentResult(job, success, frames, time.perf_counter() - start, error)
+
+
+def export_batch(composites: Sequence[str], output_dir: str, duration: float = 10.0,
+                 fps: int = 30, width: int = 1280, height: int = 720,
+                 workers: Optional[int] = None, crf: int = 18,
+                 params: Optional[Tuple[float, float, float, float]] = None,
+                 color_mode: Optional[int] = None,
+                 ascii_preset: Optional[str] = None) -> BatchResult:
+    """Export composites to ``output_dir/<name>.mp4`` across worker processes.
+
+    Args:
+        composites: Composite names to export
+        output_dir: Directory for output videos
+        duration: Duration of each video in seconds
+        fps: Frames per second
+        width: Video width
+        height: Video height
+        workers: Worker processes (default: one per CPU; 1 renders in-process)
+        crf: FFmpeg CRF quality
+        params: Custom parameters (uses defaults if None)
+        color_mode: Color palette (uses default if None)
+        ascii_preset: ASCII post-processing preset
+
+    Returns:
+        BatchResult with per-composite success and throughput
+
+    Raises:
+        RuntimeError: If ffmpeg is not available
+    """
+    encoder = FFmpegEncoder()
+    if not encoder.is_available():
+        raise RuntimeError("ffmpeg not found. Install ffmpeg to export videos.")
+
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    segment_dir = tempfile.mkdtemp(prefix='gl_batch_', dir=output_dir)
+    total_frames = int(duration * fps)
+    plan = plan_jobs(composites, segment_dir, total_frames, fps, width, height, workers,
+                     crf=crf, params=params, color_mode=color_mode, ascii_preset=ascii_preset)
+    jobs = [job for segment_jobs in plan.values() for job in segment_jobs]
+    workers = min(workers, len(jobs))
+
+    print(f"Batch export: {len(plan)} composites as {len(jobs)} jobs on {workers} workers "
+          f"({total_frames} frames each at {width}x{height}, {fps} FPS)")
+
+    result = BatchResult(workers=workers)
+    start = time.perf_counter()
+    try:
+        if workers == 1:
+            segments = [_render_segment(job) for job in jobs]
+        else:
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            # Spawned workers each create their own GL context from scratch
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_worker, initargs=(threads,)) as pool:
+                segments = list(pool.map(_render_segment, jobs))
+        result.segments = segments
+
+        by_path = {r.job.output_path: r for r in segments}
+        for name, segment_jobs in plan.items():
+            parts = [by_path[job.output_path] for job in segment_jobs]
+            output_path = os.path.join(output_dir, f"{name}.mp4")
+            failed = [r for r in parts if not r.success]
+            if failed:
+                print(f"  {name}: FAILED ({failed[0].error})")
+                result.outputs[name] = False
+                continue
+            if len(parts) == 1:
+                os.replace(parts[0].job.output_path, output_path)
+                ok = True
+            else:
+                ok = encoder.concat_videos([r.job.output_path for r in parts], output_path)
+            result.outputs[name] = ok
+            print(f"  {name}: {'OK' if ok else 'FAILED (concat)'} -> {output_path}")
+    finally:
+        result.elapsed = time.perf_counter() - start
+        shutil.rmtree(segment_dir, ignore_errors=True)
+
+    print(result.summary())
+    return result
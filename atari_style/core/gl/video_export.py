@@ -17,6 +17,10 @@ Usage:
     # Export YouTube Shorts (vertical 9:16)
     exporter.export_shorts('plasma_lissajous', 'shorts.mp4', duration=45.0)
 
+    # Render once, encode to several formats
+    exporter.export_fanout('flux_spiral', {'youtube_1080p': 'wide.mp4',
+                                           'youtube_shorts': 'short.mp4'})
+
     # Use format presets
     fmt = VIDEO_FORMATS['youtube_shorts']
     exporter.export_composite('flux_spiral', 'output.mp4',
@@ -30,7 +34,7 @@ warnings.filterwarnings('ignore', category=RuntimeWarning, module='runpy')
 import os
 import tempfile
 import shutil
-from typing import Optional, Tuple, Callable, Dict
+from typing import Optional, Tuple, Callable, Dict, List
 
 try:
     from PIL import Image
@@ -40,10 +44,14 @@ except ImportError:
 from .composites import CompositeManager, COMPOSITES
 from .pipeline import ASCII_PRESETS, get_ascii_preset_names
 from ..video_base import VideoFormat, PresetManager, FFmpegEncoder
+from ..fanout_encoder import FanoutEncoder, OutputSpec, master_size
 
 # Backward compatibility: alias VIDEO_FORMATS to PresetManager.PRESETS
 VIDEO_FORMATS: Dict[str, VideoFormat] = PresetManager.PRESETS
 
+# Output name for the preview GIF in export_fanout()
+GIF_OUTPUT = 'gif'
+
 
 def get_format_names() -> list:
     """Get list of available format preset names."""
@@ -175,41 +183,30 @@ class VideoExporter:
     def export_all_composites(self, output_dir: str, duration: float = 10.0,
                               fps: Optional[int] = None,
                               width: Optional[int] = None,
-                              height: Optional[int] = None) -> dict:
+                              height: Optional[int] = None,
+                              workers: Optional[int] = None) -> dict:
         """Export all composite animations to videos.
 
+        Composites (or time segments of them) render in parallel worker
+        processes, each on its own GL context; see batch_export.
+
         Args:
             output_dir: Directory for output videos
             duration: Duration for each video
             fps: Frames per second
             width: Video width
             height: Video height
+            workers: Worker processes (default: one per CPU; 1 renders in-process)
 
         Returns:
             Dict mapping composite names to success status
         """
-        results = {}
-
-        os.makedirs(output_dir, exist_ok=True)
+        from .batch_export import export_batch
 
-        for composite_name in COMPOSITES:
-            output_path = os.path.join(output_dir, f"{composite_name}.mp4")
-            print(f"\n{'=' * 60}")
-            print(f"Exporting: {composite_name}")
-            print('=' * 60)
-
-            try:
-                success = self.export_composite(
-                    composite_name, output_path,
-                    duration=duration, fps=fps,
-                    width=width, height=height
-                )
-                results[composite_name] = success
-            except Exception as e:
-                print(f"Error: {e}")
-                results[composite_name] = False
-
-        return results
+        result = export_batch(list(COMPOSITES), output_dir, duration,
+                              fps=fps or self.fps, width=width or self.width,
+                              height=height or self.height, workers=workers)
+        return result.outputs
 
     def export_with_format(self, composite_name: str, output_path: str,
                            format_name: str, duration: Optional[float] = None,
@@ -331,28 +328,129 @@ class VideoExporter:
         Returns:
             Dict mapping composite names to success status
         """
-        if format_name not in VIDEO_FORMATS:
-            raise ValueError(f"Unknown format: {format_name}")
+        results = self.export_all_with_formats(output_dir, [format_name], duration)
+        return {name: status[format_name] for name, status in results.items()}
+
+    def export_all_with_formats(self, output_dir: str, format_names: List[str],
+                                duration: Optional[float] = None,
+                                gif: bool = False) -> Dict[str, Dict[str, bool]]:
+        """Export all composites to several format presets, rendering each once.
+
+        Args:
+            output_dir: Directory for output videos
+            format_names: Format preset names (e.g., ['youtube_1080p', 'youtube_shorts'])
+            duration: Duration for each video (uses format defaults if None)
+            gif: Also write a preview GIF of each composite
+
+        Returns:
+            Dict mapping composite names to {format name: success status}
+        """
+        for format_name in format_names:
+            if format_name not in VIDEO_FORMATS:
+                raise ValueError(f"Unknown format: {format_name}")
 
-        fmt = VIDEO_FORMATS[format_name]
         results = {}
         os.makedirs(output_dir, exist_ok=True)
+        names = ', '.join(VIDEO_FORMATS[f].name for f in format_names)
 
         for composite_name in COMPOSITES:
-            output_path = os.path.join(output_dir, f"{composite_name}_{format_name}.mp4")
+            outputs = {f: os.path.join(output_dir, f"{composite_name}_{f}.mp4") for f in format_names}
+            if gif:
+                outputs[GIF_OUTPUT] = os.path.join(output_dir, f"{composite_name}.gif")
             print(f"\n{'=' * 60}")
-            print(f"Exporting ({fmt.name}): {composite_name}")
+            print(f"Exporting ({names}): {composite_name}")
             print('=' * 60)
 
             try:
-                success = self.export_with_format(
-                    composite_name, output_path, format_name, duration
-                )
-                results[composite_name] = success
+                results[composite_name] = self.export_fanout(composite_name, outputs, duration)
             except Exception as e:
                 print(f"Error: {e}")
-                results[composite_name] = False
+                results[composite_name] = {f: False for f in outputs}
+
+        return results
+
+    def export_fanout(self, composite_name: str, outputs: Dict[str, str],
+                      duration: Optional[float] = None,
+                      params: Optional[Tuple[float, float, float, float]] = None,
+                      color_mode: Optional[int] = None,
+                      ascii_preset: Optional[str] = None,
+                      fit: str = 'crop',
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, bool]:
+        """Render a composite once and encode it to several formats at once.
+
+        Frames are rendered at a master size big enough for every output
+        and piped to one ffmpeg process per output, which scales and crops
+        (or pads) it to that output's resolution and frame rate.
+
+        Args:
+            composite_name: Name of composite to render
+            outputs: Format preset name -> output path. The name 'gif'
+                (GIF_OUTPUT) adds a 480x270 15 FPS preview GIF.
+            duration: Duration in seconds (longest format limit, or 10s, if None).
+                Outputs with a shorter platform limit stop at their limit.
+            params: Custom parameters (uses defaults if None)
+            color_mode: Color palette (uses default if None)
+            ascii_preset: ASCII post-processing preset
+            fit: How each output takes its aspect ratio from the master
+                frame: 'crop', 'pad' or 'scale'
+            progress_callback: Optional callback(current_frame, total_frames)
+
+        Returns:
+            Dict mapping format names to success status
+
+        Raises:
+            ValueError: If a composite or format name is not recognized
+            RuntimeError: If ffmpeg is not available
+        """
+        if Image is None:
+            raise ImportError("Pillow required: pip install Pillow")
+
+        if not self.encoder.is_available():
+            raise RuntimeError("ffmpeg not found. Install ffmpeg to export videos.")
+
+        if composite_name not in COMPOSITES:
+            raise ValueError(f"Unknown composite: {composite_name}. Available: {list(COMPOSITES.keys())}")
+
+        specs = {}
+        for format_name, path in outputs.items():
+            if format_name == GIF_OUTPUT:
+                specs[format_name] = OutputSpec(path, 480, 270, fps=15, fit=fit)
+            elif format_name in VIDEO_FORMATS:
+                specs[format_name] = OutputSpec.from_format(path, VIDEO_FORMATS[format_name], fit)
+            else:
+                raise ValueError(f"Unknown format: {format_name}. Available: {get_format_names()}")
+
+        if duration is None:
+            limits = [spec.max_duration for spec in specs.values() if spec.max_duration]
+            duration = max(limits) if limits else 10.0
+
+        w, h = master_size(list(specs.values()))
+        frame_rate = max(spec.fps for spec in specs.values())
+        total_frames = int(duration * frame_rate)
+        manager = CompositeManager(w, h)
+
+        print(f"Rendering {composite_name} once: {total_frames} frames at {frame_rate} FPS, {w}x{h}")
+        for format_name, spec in specs.items():
+            print(f"  -> {format_name}: {spec.width}x{spec.height} @ {spec.fps}fps  {spec.path}")
 
+        with FanoutEncoder((w, h), frame_rate, list(specs.values())) as fanout:
+            for frame_num in range(total_frames):
+                img = manager.render_frame(composite_name, frame_num / frame_rate, params, color_mode,
+                                           w, h, ascii_preset=ascii_preset)
+                fanout.write(img)
+                if not fanout.active:
+                    break  # Every output reached its platform limit
+
+                if progress_callback:
+                    progress_callback(frame_num + 1, total_frames)
+                elif (frame_num + 1) % 30 == 0:
+                    percent = (frame_num + 1) / total_frames * 100
+                    print(f"  Frame {frame_num + 1}/{total_frames} ({percent:.0f}%)")
+
+        results = {name: fanout.results.get(spec.path, False) for name, spec in specs.items()}
+        for name, spec in specs.items():
+            if results[name]:
+                print(f"Saved {name}: {spec.path} ({os.path.getsize(spec.path) / 1024 / 1024:.1f} MB)")
         return results
 
     def export_frames(self, composite_name: str, output_dir: str,
@@ -608,8 +706,13 @@ Examples:
   %(prog)s plasma_lissajous --shorts
   %(prog)s flux_spiral --format youtube_shorts -d 45
   %(prog)s --all --shorts
+  %(prog)s --all -j 8 -o ./out/               # 8 parallel render workers
   %(prog)s lissajous_plasma --format instagram_reels -o reel.mp4
 
+Render once, encode many (one render fanned out to every format):
+  %(prog)s plasma_lissajous --formats youtube_1080p,youtube_shorts,instagram_square -o ./out/
+  %(prog)s --all --publish social --gif -o ./publish/
+
 Quick preview (GIF):
   %(prog)s plasma_lissajous --preview
   %(prog)s flux_spiral --preview --params 0.4,1.5,0.8,0.6 --color 2
@@ -640,6 +743,10 @@ Thumbnails (PNG):
                               help='Use a format preset (overrides width/height/fps)')
     format_group.add_argument('--shorts', action='store_true',
                               help='Export as YouTube Shorts (1080x1920, 9:16)')
+    format_group.add_argument('--formats', type=str, metavar='F1,F2,...',
+                              help='Render once, encode to several format presets')
+    format_group.add_argument('--publish', choices=list(PresetManager.PUBLISH_SETS.keys()),
+                              help='Render once, encode to a publish set of presets')
 
     parser.add_argument('--gif', action='store_true', help='Export as GIF instead')
     parser.add_argument('--preview', action='store_true',
@@ -652,6 +759,8 @@ Thumbnails (PNG):
                         choices=get_ascii_preset_names(),
                         help='Apply ASCII post-processing (default: terminal). Options: off, terminal, hires, lores, neon, colored')
     parser.add_argument('--all', action='store_true', help='Export all composites')
+    parser.add_argument('--jobs', '-j', type=int, metavar='N',
+                        help='Worker processes for --all (default: one per CPU)')
     parser.add_argument('--list-formats', action='store_true',
                         help='List available format presets')
 
@@ -684,6 +793,40 @@ Thumbnails (PNG):
             print(f"Error parsing --params: {e}")
             return
 
+    # Multi-format fan-out exports
+    fanout_formats = None
+    if args.publish:
+        fanout_formats = PresetManager.get_publish_set(args.publish)
+    elif args.formats:
+        fanout_formats = [f.strip() for f in args.formats.split(',') if f.strip()]
+        unknown = [f for f in fanout_formats if f not in VIDEO_FORMATS]
+        if unknown:
+            print(f"Error: unknown format(s): {', '.join(unknown)}")
+            return
+
+    if fanout_formats:
+        if args.all:
+            output_dir = args.output or '/tmp/gl_publish'
+            results = VideoExporter().export_all_with_formats(
+                output_dir, fanout_formats, args.duration, gif=args.gif)
+            print("\nSummary:")
+            for name, statuses in results.items():
+                failed = [f for f, ok in statuses.items() if not ok]
+                print(f"  {name}: {'FAILED ' + ', '.join(failed) if failed else 'OK'}")
+        elif args.composite:
+            output_dir = args.output or f'/tmp/{args.composite}_publish'
+            outputs = {f: os.path.join(output_dir, f"{args.composite}_{f}.mp4") for f in fanout_formats}
+            if args.gif:
+                outputs[GIF_OUTPUT] = os.path.join(output_dir, f"{args.composite}.gif")
+            results = VideoExporter().export_fanout(
+                args.composite, outputs, args.duration,
+                params=custom_params, color_mode=args.color, ascii_preset=args.ascii)
+            for name, success in results.items():
+                print(f"  {name}: {'OK' if success else 'FAILED'}")
+        else:
+            parser.print_help()
+        return
+
     # Determine format name for format-based exports
     format_name = 'youtube_shorts' if args.shorts else args.format
 
@@ -735,7 +878,7 @@ Thumbnails (PNG):
         else:
             output_dir = args.output or '/tmp/gl_composites'
             results = exporter.export_all_composites(output_dir, duration,
-                                                      fps, width, height)
+                                                      fps, width, height, workers=args.jobs)
         print("\nSummary:")
         for name, success in results.items():
             status = "OK" if success else "FAILED"
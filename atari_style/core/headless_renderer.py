@@ -29,6 +29,8 @@ except ImportError:
 
 from atari_style.utils.fonts import load_monospace_font
 
+from .profiler import profiled
+
 
 # ANSI color names to RGB values
 # Based on typical terminal color schemes (close to Ubuntu/VSCode defaults)
@@ -122,10 +124,19 @@ class HeadlessRenderer:
         # Initialize buffers (same structure as Renderer)
         self.buffer = [[' ' for _ in range(width)] for _ in range(height)]
         self.color_buffer = [[None for _ in range(width)] for _ in range(height)]
+        self.profiler = None  # Optional FrameProfiler timing render/write
 
         # Load font
         self.font = self._load_font(font_path)
 
+        # Last rasterized frame and the buffers it shows (see to_image)
+        self._frame = None
+        self._frame_state = None
+        self._frame_rows = []
+        self._frame_colors = []
+        self._reach_chars = set()
+        self._reach = (0, 0, 0, 0)
+
     def _load_font(self, font_path: Optional[str]) -> 'ImageFont.FreeTypeFont':
         """Load monospace font for rendering."""
         font_size = self.char_height - 4  # Leave some padding
@@ -163,6 +174,15 @@ class HeadlessRenderer:
             self.buffer[y][x] = char[0] if char else ' '
             self.color_buffer[y][x] = color
 
+    def fill_span(self, x0: int, x1: int, y: int, char: str = '█', color: Optional[str] = None):
+        """Fill cells x0 <= x < x1 of row y (clipped to the buffer) in one slice write."""
+        x0 = max(0, x0)
+        x1 = min(self.width, x1)
+        if x0 < x1 and 0 <= y < self.height:
+            count = x1 - x0
+            self.buffer[y][x0:x1] = [char[0] if char else ' '] * count
+            self.color_buffer[y][x0:x1] = [color] * count
+
     def draw_text(self, x: int, y: int, text: str, color: Optional[str] = None):
         """Draw text at the given position."""
         for i, char in enumerate(text):
@@ -191,8 +211,13 @@ class HeadlessRenderer:
         self.set_pixel(x + width - 1, y + height - 1, '┘', color)
 
     def render(self):
-        """No-op for headless mode (compatibility with Renderer)."""
-        pass
+        """Present a frame (compatibility with Renderer).
+
+        Nothing is drawn here; the buffer is rasterized by to_image().
+        Only the profiler HUD, if enabled, is added to the buffer.
+        """
+        if self.profiler is not None:
+            self.profiler.draw_hud(self)
 
     def enter_fullscreen(self):
         """No-op for headless mode."""
@@ -206,42 +231,165 @@ class HeadlessRenderer:
         """Clear buffer (alias for clear_buffer in headless mode)."""
         self.clear_buffer()
 
+    def frame_key(self) -> Tuple[Tuple[str, ...], Tuple[Tuple[Optional[str], ...], ...]]:
+        """Hashable snapshot of the cell buffers.
+
+        Two frames with equal keys rasterize to identical images, so
+        exporters can compare keys to detect held frames without drawing.
+        """
+        return (
+            tuple(''.join(row) for row in self.buffer),
+            tuple(tuple(row) for row in self.color_buffer),
+        )
+
     def to_image(self) -> 'Image.Image':
         """Render the buffer to a PIL Image.
 
+        The previous frame is kept, and only cells whose character or color
+        changed since then are redrawn (together with any neighbors their
+        glyphs overhang). Size, font or background changes redraw
+        everything.
+
         Returns:
-            PIL Image with rendered terminal content
+            PIL Image with rendered terminal content (a new image each call)
+        """
+        with profiled(self.profiler, 'render'):
+            return self._rasterize().copy()
+
+    def invalidate(self):
+        """Forget the previous frame so the next to_image() redraws every cell."""
+        self._frame = None
+
+    def _rasterize(self) -> 'Image.Image':
+        """Bring the kept frame image up to date with the buffers."""
+        rows = [''.join(row) for row in self.buffer]
+        colors = [tuple(row) for row in self.color_buffer]
+        state = (self.width, self.height, self.char_width, self.char_height,
+                 self.pixel_width, self.pixel_height, self.font, self.bg_color)
+
+        if self._frame is None or self._frame_state != state or len(rows) != len(self._frame_rows):
+            self._redraw_all(rows, colors)
+        else:
+            dirty = self._dirty_cells(rows, colors)
+            if len(dirty) * 2 > self.width * self.height:
+                self._redraw_all(rows, colors)
+            elif dirty:
+                self._patch(dirty, rows, colors)
+
+        self._frame_state = state
+        self._frame_rows = rows
+        self._frame_colors = colors
+        return self._frame
+
+    def _dirty_cells(self, rows, colors):
+        """(x, y) of cells that differ from the kept frame."""
+        dirty = []
+        for y, (chars, row_colors) in enumerate(zip(rows, colors)):
+            old_chars, old_colors = self._frame_rows[y], self._frame_colors[y]
+            if chars == old_chars and row_colors == old_colors:
+                continue
+            if len(chars) != len(old_chars):
+                dirty.extend((x, y) for x in range(max(len(chars), len(old_chars))))
+                continue
+            dirty.extend(
+                (x, y) for x in range(len(chars))
+                if chars[x] != old_chars[x] or row_colors[x] != old_colors[x]
+            )
+        return dirty
+
+    def _glyph_reach(self, chars) -> Tuple[int, int, int, int]:
+        """Cells any glyph seen so far overhangs its own (left, right, up, down).
+
+        Grows monotonically as new characters appear, so it also covers
+        every glyph already in the kept frame.
         """
+        if self.font:
+            for char in set(chars) - self._reach_chars:
+                self._reach_chars.add(char)
+                left, top, right, bottom = self.font.getbbox(char)
+                reach = (
+                    max(0, -(left // self.char_width)),
+                    max(0, -(-right // self.char_width) - 1),
+                    max(0, -(top // self.char_height)),
+                    max(0, -(-bottom // self.char_height) - 1),
+                )
+                self._reach = tuple(max(a, b) for a, b in zip(self._reach, reach))
+        return self._reach
+
+    def _draw_cell(self, draw, char: str, color: Optional[str], px: int, py: int):
+        """Draw one character with its top-left corner at pixel (px, py)."""
+        rgb = self._color_to_rgb(color)
+        if self.font:
+            draw.text((px, py), char, font=self.font, fill=rgb)
+        else:
+            # Fallback: draw a colored rectangle for non-space chars
+            draw.rectangle(
+                [px + 2, py + 2, px + self.char_width - 2, py + self.char_height - 2],
+                fill=rgb
+            )
+
+    def _redraw_all(self, rows, colors):
+        """Draw every buffer cell onto a new image."""
+        self._reach_chars = set()
+        self._reach = (0, 0, 0, 0)
+        self._glyph_reach(''.join(rows))
+
         # Create image with background color
         img = Image.new('RGB', (self.pixel_width, self.pixel_height), self.bg_color)
         draw = ImageDraw.Draw(img)
 
         # Render each character
-        for y in range(self.height):
-            for x in range(self.width):
-                char = self.buffer[y][x]
+        for y, (chars, row_colors) in enumerate(zip(rows, colors)):
+            py = y * self.char_height
+            for x, char in enumerate(chars):
                 if char == ' ':
                     continue  # Skip spaces for performance
+                self._draw_cell(draw, char, row_colors[x], x * self.char_width, py)
 
-                color = self.color_buffer[y][x]
-                rgb = self._color_to_rgb(color)
-
-                # Calculate pixel position
-                px = x * self.char_width
-                py = y * self.char_height
+        self._frame = img
 
-                # Draw character
-                if self.font:
-                    draw.text((px, py), char, font=self.font, fill=rgb)
-                else:
-                    # Fallback: draw a colored rectangle for non-space chars
-                    if char != ' ':
-                        draw.rectangle(
-                            [px + 2, py + 2, px + self.char_width - 2, py + self.char_height - 2],
-                            fill=rgb
-                        )
+    def _patch(self, dirty, rows, colors):
+        """Redraw the cells around ``dirty`` and paste them into the kept frame.
 
-        return img
+        A changed glyph can overhang neighboring cells, both as it was and
+        as it is now, so every cell within reach of a dirty one is redrawn.
+        Each redrawn run of cells starts from the background and gets every
+        glyph that can reach it, in the same row-major order as a full
+        redraw, so the patched frame is pixel-identical to one.
+        """
+        reach_left, reach_right, reach_up, reach_down = self._glyph_reach(
+            ''.join(rows[y][x] for x, y in dirty if x < len(rows[y])))
+        width, height = self.width, len(rows)
+        cw, ch = self.char_width, self.char_height
+
+        # Cells whose pixels a dirty cell's glyph can touch
+        affected = {}
+        for x, y in dirty:
+            for ty in range(max(0, y - reach_up), min(height, y + reach_down + 1)):
+                row = affected.setdefault(ty, set())
+                row.update(range(max(0, x - reach_left), min(width, x + reach_right + 1)))
+
+        for y, xs in affected.items():
+            xs = sorted(xs)
+            runs = []
+            start = prev = xs[0]
+            for x in xs[1:]:
+                if x != prev + 1:
+                    runs.append((start, prev + 1))
+                    start = x
+                prev = x
+            runs.append((start, prev + 1))
+
+            for x0, x1 in runs:
+                tile = Image.new('RGB', ((x1 - x0) * cw, ch), self.bg_color)
+                draw = ImageDraw.Draw(tile)
+                for sy in range(max(0, y - reach_down), min(height, y + reach_up + 1)):
+                    chars, row_colors = rows[sy], colors[sy]
+                    for sx in range(max(0, x0 - reach_right), min(len(chars), x1 + reach_left)):
+                        char = chars[sx]
+                        if char != ' ':
+                            self._draw_cell(draw, char, row_colors[sx], (sx - x0) * cw, (sy - y) * ch)
+                self._frame.paste(tile, (x0 * cw, y * ch))
 
     def save_frame(self, path: str):
         """Render and save frame to file.
@@ -250,7 +398,8 @@ class HeadlessRenderer:
             path: Output file path (PNG, JPEG, etc.)
         """
         img = self.to_image()
-        img.save(path)
+        with profiled(self.profiler, 'write'):
+            img.save(path)
 
 
 class HeadlessRendererFactory:
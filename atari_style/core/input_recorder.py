@@ -2,17 +2,21 @@
 """Input script recorder for demo video generation.
 
 Records live joystick input and saves it as a JSON script file
-compatible with the demo video export system.
+compatible with the demo video export system. Output paths ending in
+.arec use the compact binary format (see recording_format), which keeps
+long, high-rate recordings small.
 
 Usage:
     python -m atari_style.core.input_recorder --duration 15 --fps 30 -o my-recording.json
+    python -m atari_style.core.input_recorder --duration 3600 --fps 120 -o session.arec
 
 Options:
     --duration    Recording length in seconds
     --fps         Sample rate (default 30)
     --digital     Quantize analog to -1/0/1 for digital sticks
     --sparse      Only save keyframes on state changes
-    -o            Output JSON file
+    --compression Block compression for .arec output (zlib, zstd, none)
+    -o            Output file (.json or .arec)
 """
 
 import argparse
@@ -24,6 +28,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .input_handler import InputHandler
+from .recording_format import BINARY_SUFFIX, save_recording
 
 
 @dataclass
@@ -54,6 +59,9 @@ class InputRecorder:
     # Threshold for digital quantization (-1, 0, 1)
     DIGITAL_THRESHOLD = 0.5
 
+    # Seconds between progress line updates (printing every poll slows capture)
+    PROGRESS_INTERVAL = 0.25
+
     def __init__(
         self,
         duration: float,
@@ -160,6 +168,7 @@ class InputRecorder:
         print("RECORDING!       ")
 
         start_time = time.time()
+        next_progress = start_time
 
         try:
             for frame in range(total_frames):
@@ -180,19 +189,21 @@ class InputRecorder:
                 if not self.sparse or self._state_changed(x, y, buttons):
                     self._record_keyframe(current_time, x, y, buttons)
 
-                # Display progress
-                elapsed = time.time() - start_time
-                remaining = self.duration - elapsed
-                bar_width = 30
-                progress = (frame + 1) / total_frames
-                filled = int(bar_width * progress)
-                bar = '#' * filled + '-' * (bar_width - filled)
-
-                # Show current state
-                btn_str = ','.join(map(str, buttons)) if buttons else '-'
-                print(f"\rFrame {frame + 1:5d}/{total_frames} [{bar}] "
-                      f"X:{x:+.2f} Y:{y:+.2f} BTN:[{btn_str}] "
-                      f"Remaining: {remaining:.1f}s  ", end='', flush=True)
+                # Display progress (throttled; always shows the last frame)
+                now = time.time()
+                if now >= next_progress or frame == total_frames - 1:
+                    next_progress = now + self.PROGRESS_INTERVAL
+                    remaining = self.duration - (now - start_time)
+                    bar_width = 30
+                    progress = (frame + 1) / total_frames
+                    filled = int(bar_width * progress)
+                    bar = '#' * filled + '-' * (bar_width - filled)
+
+                    # Show current state
+                    btn_str = ','.join(map(str, buttons)) if buttons else '-'
+                    print(f"\rFrame {frame + 1:5d}/{total_frames} [{bar}] "
+                          f"X:{x:+.2f} Y:{y:+.2f} BTN:[{btn_str}] "
+                          f"Remaining: {remaining:.1f}s  ", end='', flush=True)
 
                 # Sleep to maintain frame rate
                 frame_elapsed = time.time() - frame_start
@@ -240,14 +251,20 @@ class InputRecorder:
             'keyframes': [kf.to_dict() for kf in self.keyframes],
         }
 
-    def save(self, path: str):
-        """Save recording to JSON file.
+    def save(self, path: str, compression: str = 'zlib'):
+        """Save recording to a JSON file, or binary if ``path`` ends in .arec.
 
         Args:
             path: Output file path
+            compression: Block compression for binary output
         """
         data = self.to_dict()
 
+        if Path(path).suffix == BINARY_SUFFIX:
+            save_recording(data, path, compression=compression)
+            print(f"Saved to: {path}")
+            return
+
         # Ensure parent directory exists
         Path(path).parent.mkdir(parents=True, exist_ok=True)
 
@@ -268,6 +285,7 @@ Examples:
   %(prog)s --duration 30 --fps 60 -o high-fps-demo.json
   %(prog)s --duration 10 --digital -o digital-input.json
   %(prog)s --duration 60 --sparse -o sparse-demo.json
+  %(prog)s --duration 3600 --fps 120 -o session.arec
 
 The output JSON can be used with demo_video.py:
   python -m atari_style.core.demo_video joystick_test my-demo.json -o output.mp4
@@ -282,8 +300,10 @@ The output JSON can be used with demo_video.py:
                         help='Quantize analog values to -1/0/1 (for digital joysticks)')
     parser.add_argument('--sparse', '-s', action='store_true',
                         help='Only save keyframes when input state changes')
+    parser.add_argument('--compression', choices=['zlib', 'zstd', 'none'], default='zlib',
+                        help='Block compression for .arec output (default: zlib)')
     parser.add_argument('-o', '--output', required=True,
-                        help='Output JSON file path')
+                        help='Output file path (.json, or .arec for binary)')
 
     args = parser.parse_args()
 
@@ -302,7 +322,7 @@ The output JSON can be used with demo_video.py:
         )
 
         recorder.record()
-        recorder.save(args.output)
+        recorder.save(args.output, compression=args.compression)
 
     except KeyboardInterrupt:
         print("\nRecording cancelled.")
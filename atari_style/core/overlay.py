@@ -126,12 +126,43 @@ class DemoOverlay(Overlay):
         return demo_name if demo_name else 'Demo'
 
 
+class ProfilerOverlay(Overlay):
+    """Frame profiler HUD (rolling p50/p95/p99 per section).
+
+    Rendered as a block of rows; bottom positions grow upwards.
+    """
+
+    def __init__(self, position: OverlayPosition = OverlayPosition.TOP_RIGHT):
+        super().__init__(position)
+        self.color = 'bright_green'
+
+    def format(self, profiler=None, **kwargs) -> str:
+        """Format the HUD as newline-separated rows."""
+        if profiler is None:
+            return ''
+        return '\n'.join(profiler.hud_lines())
+
+    def render(self, renderer: RendererProtocol, **kwargs) -> None:
+        """Render each HUD row to the buffer."""
+        text = self.format(**kwargs)
+        if not text:
+            return
+        lines = text.split('\n')
+        width = max(len(line) for line in lines)
+        x, y = self._calculate_position(renderer, ' ' * width)
+        if self.position in (OverlayPosition.BOTTOM_LEFT, OverlayPosition.BOTTOM_RIGHT):
+            y -= len(lines) - 1
+        for i, line in enumerate(lines):
+            renderer.draw_text(x, y + i, line.ljust(width), self.color)
+
+
 # Registry of overlay types
 OVERLAY_TYPES = {
     'frame': FrameOverlay,
     'timestamp': TimestampOverlay,
     'fps': FpsOverlay,
     'demo': DemoOverlay,
+    'profiler': ProfilerOverlay,
 }
 
 
@@ -148,6 +179,7 @@ class OverlayManager:
         'timestamp': OverlayPosition.BOTTOM_RIGHT,
         'fps': OverlayPosition.TOP_RIGHT,
         'demo': OverlayPosition.TOP_LEFT,
+        'profiler': OverlayPosition.TOP_RIGHT,
     }
 
     def __init__(self):
@@ -168,7 +200,7 @@ class OverlayManager:
         """Add an overlay by type name.
 
         Args:
-            overlay_type: One of 'frame', 'timestamp', 'fps', 'demo'
+            overlay_type: One of 'frame', 'timestamp', 'fps', 'demo', 'profiler'
             position: Override default position
             color: Override default color
 
@@ -224,6 +256,7 @@ class OverlayManager:
         total_frames: int = 0,
         fps: int = 30,
         demo_name: str = '',
+        **kwargs,
     ) -> None:
         """Render all overlays to the buffer.
 
@@ -233,6 +266,7 @@ class OverlayManager:
             total_frames: Total frames in video
             fps: Frames per second
             demo_name: Name of the demo
+            **kwargs: Extra values for specific overlays (e.g. profiler)
         """
         for overlay in self.overlays:
             overlay.render(
@@ -241,6 +275,7 @@ class OverlayManager:
                 total_frames=total_frames,
                 fps=fps,
                 demo_name=demo_name,
+                **kwargs,
             )
 
     def clear(self) -> None:
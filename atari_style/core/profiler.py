@@ -0,0 +1,303 @@
+"""Opt-in per-frame profiler with an in-terminal HUD and trace export.
+
+FrameProfiler times named sections of each frame (input, update, draw,
+render, terminal write, sleep), keeps rolling per-section timings for
+p50/p95/p99 readouts, and can record every section as a Chrome trace
+event for offline analysis in chrome://tracing or Perfetto.
+
+Sections are collected without touching game code: the FrameScheduler
+marks frame boundaries and fixed updates, renderers time their own
+``render``/write step through their ``profiler`` attribute, and
+``attach()`` wraps a game's ``draw`` and input handler methods.
+
+Enable it for interactive games and visualizers with an environment
+variable:
+
+    ATARI_STYLE_PROFILE=1 python run.py               # HUD only
+    ATARI_STYLE_PROFILE=trace-{name}.json python run.py  # HUD + trace file
+
+Usage:
+    from atari_style.core.profiler import FrameProfiler
+
+    profiler = FrameProfiler(trace=True)
+    profiler.attach(game)
+    scheduler = FrameScheduler(target_fps=60, profiler=profiler)
+    ...
+    profiler.export_trace('frame-trace.json')
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+PROFILE_ENV_VAR = 'ATARI_STYLE_PROFILE'
+
+# Sections shown in the HUD, in display order (others follow alphabetically)
+SECTION_ORDER = ('frame', 'input', 'update', 'draw', 'render', 'write', 'sleep')
+
+DEFAULT_WINDOW = 300
+
+# Cap on recorded trace events (~10 minutes of 60 fps with 8 sections)
+DEFAULT_MAX_TRACE_EVENTS = 300_000
+
+# Input handler methods timed as the 'input' section
+INPUT_METHODS = ('get_input', 'get_joystick_state', 'get_joystick_buttons')
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def profiled(profiler: Optional['FrameProfiler'], name: str):
+    """Context manager timing ``name`` when a profiler is set, else a no-op."""
+    if profiler is None:
+        return _NULL_SECTION
+    return profiler.section(name)
+
+
+class _NullSection:
+    """Reusable do-nothing context manager for disabled profiling."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class FrameProfiler:
+    """Collects per-frame section timings.
+
+    Args:
+        window: Frames of history kept for percentile statistics
+        trace: Record individual events for export_trace()
+        max_trace_events: Oldest trace events are dropped beyond this
+        hud: Draw the statistics overlay when the renderer presents a frame
+        clock: Monotonic clock in seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        trace: bool = False,
+        max_trace_events: int = DEFAULT_MAX_TRACE_EVENTS,
+        hud: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.window = window
+        self.clock = clock
+        self.trace_enabled = trace
+        self.trace_path: Optional[str] = None
+        self.frames = 0
+
+        self._epoch = clock()
+        self._frame_start: Optional[float] = None
+        self._current: Dict[str, float] = {}
+        self._history: Dict[str, Deque[float]] = {}
+        self._events: Deque[Tuple[str, float, float, int]] = deque(maxlen=max_trace_events)
+        self._lock = threading.Lock()
+
+        self.hud = None
+        if hud:
+            from .overlay import OverlayManager, OverlayPosition
+            self.hud = OverlayManager().add('profiler', position=OverlayPosition.TOP_RIGHT)
+
+    @classmethod
+    def from_env(cls, game: Any = None, name: Optional[str] = None) -> Optional['FrameProfiler']:
+        """Create a profiler if ATARI_STYLE_PROFILE is set, else None.
+
+        A value of ``1``/``true``/``hud`` enables the HUD only; any other
+        value is a trace output path (``{name}`` is replaced with the game
+        class name) written when the process exits.
+
+        Args:
+            game: Object to attach() to
+            name: Name for the trace file (default: game class name)
+        """
+        value = os.environ.get(PROFILE_ENV_VAR, '').strip()
+        if not value or value.lower() in ('0', 'false', 'off', 'no'):
+            return None
+
+        trace_path = None
+        if value.lower() not in ('1', 'true', 'on', 'yes', 'hud'):
+            name = name or (type(game).__name__.lower() if game is not None else 'frame')
+            trace_path = value.replace('{name}', name)
+
+        profiler = cls(trace=trace_path is not None)
+        profiler.trace_path = trace_path
+        if game is not None:
+            profiler.attach(game)
+        if trace_path:
+            atexit.register(profiler.export_trace, trace_path)
+        return profiler
+
+    # -- Collection ----------------------------------------------------------
+
+    def begin_frame(self) -> None:
+        """Mark the start of a frame."""
+        self._frame_start = self.clock()
+        self._current = {}
+
+    def end_frame(self) -> None:
+        """Close the current frame and fold its sections into the history."""
+        if self._frame_start is None:
+            self.begin_frame()
+            return
+        end = self.clock()
+        self.record('frame', self._frame_start, end)
+        with self._lock:
+            for name, total in self._current.items():
+                history = self._history.get(name)
+                if history is None:
+                    history = self._history[name] = deque(maxlen=self.window)
+                history.append(total)
+            self.frames += 1
+        self._frame_start = end
+        self._current = {}
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """Add a timed section (repeated sections within a frame are summed)."""
+        duration = end - start
+        self._current[name] = self._current.get(name, 0.0) + duration
+        if self.trace_enabled:
+            self._events.append((name, start, duration, threading.get_ident()))
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as section ``name``."""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.record(name, start, self.clock())
+
+    def wrap(self, func: Callable, name: str) -> Callable:
+        """Return ``func`` timed as section ``name``."""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = self.clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, start, self.clock())
+        timed.__profiled__ = True
+        return timed
+
+    def instrument(self, obj: Any, method: str, name: Optional[str] = None) -> bool:
+        """Time an instance's method by shadowing it with a wrapper.
+
+        Returns:
+            True if the method exists and was wrapped
+        """
+        func = getattr(obj, method, None)
+        if func is None or not callable(func) or getattr(func, '__profiled__', False):
+            return False
+        setattr(obj, method, self.wrap(func, name or method))
+        return True
+
+    def attach(self, game: Any) -> 'FrameProfiler':
+        """Instrument a game or visualizer.
+
+        Times ``game.draw`` as 'draw', its input handler's polling methods
+        as 'input', and sets ``profiler`` on its renderer so the render and
+        terminal write steps are timed (and the HUD drawn).
+        """
+        self.instrument(game, 'draw', 'draw')
+        input_handler = getattr(game, 'input_handler', None)
+        if input_handler is not None:
+            for method in INPUT_METHODS:
+                self.instrument(input_handler, method, 'input')
+        renderer = getattr(game, 'renderer', None)
+        if renderer is not None:
+            renderer.profiler = self
+        return self
+
+    # -- Statistics ----------------------------------------------------------
+
+    def sections(self) -> List[str]:
+        """Names of all sections seen so far, in display order."""
+        with self._lock:
+            names = list(self._history)
+        known = [n for n in SECTION_ORDER if n in names]
+        return known + sorted(n for n in names if n not in SECTION_ORDER)
+
+    def percentiles(self, name: str) -> Dict[str, float]:
+        """Rolling p50/p95/p99/max for a section, in milliseconds per frame."""
+        with self._lock:
+            ordered = sorted(self._history.get(name, ()))
+        return {
+            'p50': 1000.0 * percentile(ordered, 50),
+            'p95': 1000.0 * percentile(ordered, 95),
+            'p99': 1000.0 * percentile(ordered, 99),
+            'max': 1000.0 * ordered[-1] if ordered else 0.0,
+            'samples': len(ordered),
+        }
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Percentiles for every section."""
+        return {name: self.percentiles(name) for name in self.sections()}
+
+    def hud_lines(self) -> List[str]:
+        """Text rows for the HUD overlay."""
+        lines = [f"{'ms':<7}{'p50':>6}{'p95':>6}{'p99':>6}"]
+        for name in self.sections():
+            stats = self.percentiles(name)
+            lines.append(f"{name:<7}{stats['p50']:6.1f}{stats['p95']:6.1f}{stats['p99']:6.1f}")
+        return lines
+
+    def draw_hud(self, renderer) -> None:
+        """Draw the HUD into a renderer's buffer (no-op if disabled)."""
+        if self.hud:
+            self.hud.render(renderer, profiler=self)
+
+    # -- Export --------------------------------------------------------------
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        """Recorded sections as Chrome trace 'complete' events."""
+        pid = os.getpid()
+        events = []
+        for name, start, duration, tid in list(self._events):
+            events.append({
+                'name': name,
+                'cat': 'frame',
+                'ph': 'X',
+                'ts': round((start - self._epoch) * 1e6, 3),
+                'dur': round(duration * 1e6, 3),
+                'pid': pid,
+                'tid': tid,
+            })
+        return events
+
+    def export_trace(self, path: str) -> str:
+        """Write recorded events in Chrome trace format.
+
+        The file also carries the per-section percentile summary under
+        ``metadata`` for quick inspection without a trace viewer.
+
+        Returns:
+            The path written
+        """
+        data = {
+            'traceEvents': self.trace_events(),
+            'displayTimeUnit': 'ms',
+            'metadata': {'frames': self.frames, 'sections': self.summary()},
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        return path
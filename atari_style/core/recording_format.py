@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""Compact binary format for input recordings and attract-mode demos.
+
+JSON recordings spend ~60 bytes per sample on keys, punctuation and
+decimal text. The binary format stores the same data as small integers:
+
+    header   magic b'AREC', version, codec, JSON metadata
+    index    one entry per block: start time, offset, length, record count
+    blocks   independently compressed runs of records
+
+Input recordings (``{"keyframes": [...]}``) encode each keyframe as
+zigzag varints of the time delta (in ticks), the x/y deltas (axes
+quantized to int16) and the XOR of the button bitmask with the previous
+keyframe. A steady stick at a fixed sample rate costs 4 bytes per sample
+before compression. Hand-written keyframes with extra fields (such as
+"note") or omitted defaults carry a small JSON layout payload as well.
+
+Attract-mode demos (``{"events": [...]}``) encode the time delta, an
+event code, and a compact payload: interned input names, frame number
+deltas, and JSON text for arbitrary values and state snapshots.
+
+Each block restarts its deltas, so seeking to a time decodes only one
+block. Blocks are compressed with zlib (default), zstd (if the
+``zstandard`` package is installed) or not at all.
+
+Conversion is lossless: decode_recording(encode_recording(data)) == data
+for any recording the repo writes. Scales are picked so every timestamp
+and axis value round-trips exactly; data that can't (e.g. unsorted button
+lists) raises ValueError rather than being silently altered.
+
+Usage:
+    python -m atari_style.core.recording_format convert demo.json demo.arec
+    python -m atari_style.core.recording_format convert demo.arec demo.json
+    python -m atari_style.core.recording_format info demo.arec
+"""
+
+import argparse
+import bisect
+import json
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+MAGIC = b'AREC'
+VERSION = 1
+BINARY_SUFFIX = '.arec'
+
+CODECS = {'none': 0, 'zlib': 1, 'zstd': 2}
+_CODEC_NAMES = {code: name for name, code in CODECS.items()}
+
+# Candidate scales, coarsest first; the first one that is exact wins
+TIME_SCALES = (1000, 1_000_000)
+AXIS_SCALES = (1000, 10000)
+RAW_TIME = 0  # time_scale for timestamps stored as float64
+
+DEFAULT_BLOCK_SIZE = 4096
+
+_HEADER = struct.Struct('<4sBBI')
+_BLOCK_COUNT = struct.Struct('<I')
+_INDEX_ENTRY = struct.Struct('<dQII')  # start time, offset, length, records
+_FLOAT = struct.Struct('<d')
+
+# Event codes for attract-mode demos
+_EVENT_INPUT = 0
+_EVENT_FRAME = 1
+_EVENT_STATE = 2
+_EVENT_OTHER = 3
+
+
+# ---------------------------------------------------------------------------
+# Varints
+
+
+def _zigzag(n: int) -> int:
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n >> 1 if not n & 1 else -(n >> 1) - 1
+
+
+def _write_varint(buf: bytearray, n: int):
+    while n > 0x7F:
+        buf.append(n & 0x7F | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_bytes(buf: bytearray, payload: bytes):
+    _write_varint(buf, len(payload))
+    buf += payload
+
+
+def _read_bytes(data: bytes, pos: int) -> Tuple[bytes, int]:
+    length, pos = _read_varint(data, pos)
+    return data[pos:pos + length], pos + length
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+# ---------------------------------------------------------------------------
+# Quantization
+
+
+def _exact_scale(values: List[float], scales: Tuple[int, ...], limit: Optional[int] = None) -> Optional[int]:
+    """First scale at which every value is an exact integer multiple of 1/scale."""
+    for scale in scales:
+        ok = True
+        for value in values:
+            ticks = round(value * scale)
+            if ticks / scale != value or (limit is not None and abs(ticks) > limit):
+                ok = False
+                break
+        if ok:
+            return scale
+    return None
+
+
+def _time_scale(times: List[float]) -> int:
+    scale = _exact_scale(times, TIME_SCALES)
+    return RAW_TIME if scale is None else scale
+
+
+class _TimeWriter:
+    """Delta-encodes timestamps as zigzag varint ticks (or raw doubles)."""
+
+    def __init__(self, scale: int):
+        self.scale = scale
+        self.last = 0
+
+    def write(self, buf: bytearray, t: float):
+        if self.scale == RAW_TIME:
+            buf += _FLOAT.pack(t)
+            return
+        ticks = round(t * self.scale)
+        _write_varint(buf, _zigzag(ticks - self.last))
+        self.last = ticks
+
+
+class _TimeReader:
+
+    def __init__(self, scale: int):
+        self.scale = scale
+        self.last = 0
+
+    def read(self, data: bytes, pos: int) -> Tuple[float, int]:
+        if self.scale == RAW_TIME:
+            return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+        delta, pos = _read_varint(data, pos)
+        self.last += _unzigzag(delta)
+        return self.last / self.scale, pos
+
+
+# ---------------------------------------------------------------------------
+# Input recordings
+
+
+def _buttons_mask(buttons: List[int]) -> int:
+    if list(buttons) != sorted(set(buttons)) or any(
+            not isinstance(b, int) or not 0 <= b < 64 for b in buttons):
+        raise ValueError(f"Buttons must be sorted unique IDs 0-63 to encode losslessly: {buttons}")
+    mask = 0
+    for button in buttons:
+        mask |= 1 << button
+    return mask
+
+
+def _mask_buttons(mask: int) -> List[int]:
+    return [button for button in range(mask.bit_length()) if mask >> button & 1]
+
+
+_KEYFRAME_FIELDS = ['time', 'x', 'y', 'buttons']
+
+
+def _keyframe_layout(kf: Dict[str, Any]) -> Optional[bytes]:
+    """JSON layout for keyframes that aren't exactly time/x/y/buttons, else None."""
+    if list(kf) == _KEYFRAME_FIELDS:
+        return None
+    extra = {key: value for key, value in kf.items() if key not in _KEYFRAME_FIELDS}
+    return _dumps({'keys': list(kf), 'extra': extra})
+
+
+def _prepare_keyframes(keyframes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    times = [kf['time'] for kf in keyframes]
+    axes = [kf.get(axis, 0.0) for kf in keyframes for axis in ('x', 'y')]
+    axis_scale = _exact_scale(axes, AXIS_SCALES, limit=0x7FFF)
+    if axis_scale is None:
+        raise ValueError("Axis values need more precision than int16 quantization allows")
+    return {'time_scale': _time_scale(times), 'axis_scale': axis_scale}
+
+
+def _encode_keyframes(keyframes: List[Dict[str, Any]], meta: Dict[str, Any]) -> bytes:
+    buf = bytearray()
+    clock = _TimeWriter(meta['time_scale'])
+    scale = meta['axis_scale']
+    last_x = last_y = last_mask = 0
+    for kf in keyframes:
+        clock.write(buf, kf['time'])
+        qx = round(kf.get('x', 0.0) * scale)
+        qy = round(kf.get('y', 0.0) * scale)
+        mask = _buttons_mask(kf.get('buttons', []))
+        layout = _keyframe_layout(kf)
+        _write_varint(buf, _zigzag(qx - last_x))
+        _write_varint(buf, _zigzag(qy - last_y))
+        # Low bit flags a layout payload after the button flips
+        _write_varint(buf, (mask ^ last_mask) << 1 | (layout is not None))
+        if layout is not None:
+            _write_bytes(buf, layout)
+        last_x, last_y, last_mask = qx, qy, mask
+    return bytes(buf)
+
+
+def _decode_keyframes(data: bytes, count: int, meta: Dict[str, Any]) -> List[Dict[str, Any]]:
+    clock = _TimeReader(meta['time_scale'])
+    scale = meta['axis_scale']
+    keyframes = []
+    pos = qx = qy = mask = 0
+    for _ in range(count):
+        t, pos = clock.read(data, pos)
+        dx, pos = _read_varint(data, pos)
+        dy, pos = _read_varint(data, pos)
+        flips, pos = _read_varint(data, pos)
+        qx += _unzigzag(dx)
+        qy += _unzigzag(dy)
+        mask ^= flips >> 1
+        keyframe = {
+            'time': t,
+            'x': qx / scale,
+            'y': qy / scale,
+            'buttons': _mask_buttons(mask),
+        }
+        if flips & 1:
+            payload, pos = _read_bytes(data, pos)
+            layout = json.loads(payload)
+            fields = {**keyframe, **layout['extra']}
+            keyframe = {key: fields[key] for key in layout['keys']}
+        keyframes.append(keyframe)
+    return keyframes
+
+
+# ---------------------------------------------------------------------------
+# Attract-mode events
+
+
+def _event_code(event: Dict[str, Any]) -> int:
+    keys = set(event)
+    kind = event.get('type')
+    if kind == 'input' and keys == {'type', 'timestamp', 'input_type', 'value'} \
+            and isinstance(event['input_type'], str):
+        return _EVENT_INPUT
+    if kind == 'frame' and keys == {'type', 'timestamp', 'frame'} \
+            and type(event['frame']) is int:
+        return _EVENT_FRAME
+    if kind == 'state' and keys == {'type', 'timestamp', 'state'}:
+        return _EVENT_STATE
+    return _EVENT_OTHER
+
+
+def _prepare_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    symbols = sorted({e['input_type'] for e in events if _event_code(e) == _EVENT_INPUT})
+    return {'time_scale': _time_scale([e['timestamp'] for e in events]), 'symbols': symbols}
+
+
+def _encode_events(events: List[Dict[str, Any]], meta: Dict[str, Any]) -> bytes:
+    buf = bytearray()
+    clock = _TimeWriter(meta['time_scale'])
+    symbols = {name: i for i, name in enumerate(meta['symbols'])}
+    last_frame = 0
+    for event in events:
+        clock.write(buf, event['timestamp'])
+        code = _event_code(event)
+        buf.append(code)
+        if code == _EVENT_INPUT:
+            _write_varint(buf, symbols[event['input_type']])
+            # None (the common case) is an empty payload
+            _write_bytes(buf, b'' if event['value'] is None else _dumps(event['value']))
+        elif code == _EVENT_FRAME:
+            _write_varint(buf, _zigzag(event['frame'] - last_frame))
+            last_frame = event['frame']
+        elif code == _EVENT_STATE:
+            _write_bytes(buf, _dumps(event['state']))
+        else:
+            rest = {key: value for key, value in event.items() if key != 'timestamp'}
+            _write_bytes(buf, _dumps(rest))
+    return bytes(buf)
+
+
+def _decode_events(data: bytes, count: int, meta: Dict[str, Any]) -> List[Dict[str, Any]]:
+    clock = _TimeReader(meta['time_scale'])
+    symbols = meta['symbols']
+    events = []
+    pos = last_frame = 0
+    for _ in range(count):
+        t, pos = clock.read(data, pos)
+        code = data[pos]
+        pos += 1
+        if code == _EVENT_INPUT:
+            symbol, pos = _read_varint(data, pos)
+            payload, pos = _read_bytes(data, pos)
+            events.append({
+                'type': 'input',
+                'timestamp': t,
+                'input_type': symbols[symbol],
+                'value': json.loads(payload) if payload else None,
+            })
+        elif code == _EVENT_FRAME:
+            delta, pos = _read_varint(data, pos)
+            last_frame += _unzigzag(delta)
+            events.append({'type': 'frame', 'timestamp': t, 'frame': last_frame})
+        elif code == _EVENT_STATE:
+            payload, pos = _read_bytes(data, pos)
+            events.append({'type': 'state', 'timestamp': t, 'state': json.loads(payload)})
+        else:
+            payload, pos = _read_bytes(data, pos)
+            events.append({**json.loads(payload), 'timestamp': t})
+    return events
+
+
+# kind -> (records key, time key, prepare, encode, decode)
+_KINDS = {
+    'input': ('keyframes', 'time', _prepare_keyframes, _encode_keyframes, _decode_keyframes),
+    'events': ('events', 'timestamp', _prepare_events, _encode_events, _decode_events),
+}
+
+
+# ---------------------------------------------------------------------------
+# Compression
+
+
+def _compress(codec: str, payload: bytes) -> bytes:
+    if codec == 'zlib':
+        return zlib.compress(payload, 6)
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=9).compress(payload)
+    return payload
+
+
+def _decompress(codec: str, payload: bytes) -> bytes:
+    if codec == 'zlib':
+        return zlib.decompress(payload)
+    if codec == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Recording is zstd-compressed. Install with: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return payload
+
+
+# ---------------------------------------------------------------------------
+# Container
+
+
+def _recording_kind(data: Dict[str, Any]) -> str:
+    for kind, (key, *_) in _KINDS.items():
+        if isinstance(data.get(key), list):
+            return kind
+    raise ValueError("Recording must have a 'keyframes' or 'events' list")
+
+
+def encode_recording(
+    data: Dict[str, Any],
+    compression: str = 'zlib',
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> bytes:
+    """Encode a JSON-style recording dict to the binary format.
+
+    Args:
+        data: Input script dict (with 'keyframes') or attract-mode demo dict
+            (with 'events'); all other top-level fields are kept verbatim
+        compression: 'zlib', 'zstd' or 'none'
+        block_size: Records per independently decodable block
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        ValueError: If the data can't be encoded losslessly
+    """
+    if compression not in CODECS:
+        raise ValueError(f"Unknown compression '{compression}'. Choose from: {', '.join(CODECS)}")
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        raise RuntimeError("zstd compression requires: pip install zstandard")
+    if block_size < 1:
+        raise ValueError("block_size must be positive")
+
+    kind = _recording_kind(data)
+    key, time_key, prepare, encode, _ = _KINDS[kind]
+    records = data[key]
+
+    meta = prepare(records)
+    meta.update({
+        'kind': kind,
+        'count': len(records),
+        'fields': {k: v for k, v in data.items() if k != key},
+        # Position of the records list among the top-level keys
+        'position': list(data).index(key),
+    })
+
+    index = []
+    blocks = bytearray()
+    for start in range(0, len(records), block_size):
+        chunk = records[start:start + block_size]
+        payload = _compress(compression, encode(chunk, meta))
+        index.append(_INDEX_ENTRY.pack(float(chunk[0][time_key]), len(blocks), len(payload), len(chunk)))
+        blocks += payload
+
+    meta_bytes = _dumps(meta)
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, CODECS[compression], len(meta_bytes)))
+    out += meta_bytes
+    out += _BLOCK_COUNT.pack(len(index))
+    for entry in index:
+        out += entry
+    out += blocks
+    return bytes(out)
+
+
+class RecordingReader:
+    """Random access to an encoded recording.
+
+    Only the header and seek index are parsed up front; blocks are
+    decompressed on demand, so seeking into a long recording touches a
+    single block.
+    """
+
+    def __init__(self, blob: bytes):
+        if len(blob) < _HEADER.size:
+            raise ValueError("Not a binary recording (file too short)")
+        magic, version, codec, meta_len = _HEADER.unpack_from(blob, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a binary recording (bad magic)")
+        if version > VERSION:
+            raise ValueError(f"Recording format version {version} is newer than supported ({VERSION})")
+        if codec not in _CODEC_NAMES:
+            raise ValueError(f"Unknown compression codec {codec}")
+
+        pos = _HEADER.size
+        self.meta = json.loads(blob[pos:pos + meta_len])
+        pos += meta_len
+        block_count = _BLOCK_COUNT.unpack_from(blob, pos)[0]
+        pos += _BLOCK_COUNT.size
+
+        self.index = [_INDEX_ENTRY.unpack_from(blob, pos + i * _INDEX_ENTRY.size)
+                      for i in range(block_count)]
+        self._data_start = pos + block_count * _INDEX_ENTRY.size
+        self._blob = blob
+        self.codec = _CODEC_NAMES[codec]
+        self.kind = self.meta['kind']
+        self._start_times = [entry[0] for entry in self.index]
+
+    @classmethod
+    def open(cls, path: str) -> 'RecordingReader':
+        """Read a recording file."""
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def __len__(self) -> int:
+        return self.meta['count']
+
+    def block(self, i: int) -> List[Dict[str, Any]]:
+        """Decode block ``i`` into keyframe or event dicts."""
+        _, offset, length, count = self.index[i]
+        start = self._data_start + offset
+        payload = _decompress(self.codec, self._blob[start:start + length])
+        return _KINDS[self.kind][4](payload, count, self.meta)
+
+    def block_for_time(self, t: float) -> int:
+        """Index of the block holding the records at time ``t``."""
+        return max(0, bisect.bisect_right(self._start_times, t) - 1)
+
+    def records(self, start_time: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over records, optionally starting at ``start_time``."""
+        first = 0 if start_time is None else self.block_for_time(start_time)
+        time_key = _KINDS[self.kind][1]
+        for i in range(first, len(self.index)):
+            for record in self.block(i):
+                if start_time is None or record[time_key] >= start_time:
+                    yield record
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Rebuild the original JSON-style recording dict."""
+        items = list(self.meta['fields'].items())
+        items.insert(self.meta['position'], (_KINDS[self.kind][0], list(self.records())))
+        return dict(items)
+
+
+def decode_recording(blob: bytes) -> Dict[str, Any]:
+    """Decode binary recording bytes back to the JSON-style dict."""
+    return RecordingReader(blob).to_dict()
+
+
+def is_binary_recording(path: str) -> bool:
+    """True if ``path`` starts with the binary recording magic."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def save_recording(data: Dict[str, Any], path: str, compression: str = 'zlib'):
+    """Write a recording dict to ``path`` in the binary format."""
+    blob = encode_recording(data, compression=compression)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(blob)
+
+
+def load_recording(path: str) -> Dict[str, Any]:
+    """Load a recording dict from a binary or JSON file."""
+    if is_binary_recording(path):
+        return RecordingReader.open(path).to_dict()
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def convert(src: str, dst: str, compression: str = 'zlib'):
+    """Convert between JSON and binary; the format follows ``dst``'s suffix."""
+    data = load_recording(src)
+    if Path(dst).suffix == BINARY_SUFFIX:
+        save_recording(data, dst, compression=compression)
+    else:
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+        with open(dst, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description='Convert and inspect binary input recordings')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = subparsers.add_parser('convert', help='Convert between JSON and binary')
+    convert_parser.add_argument('src', help='Input recording (.json or .arec)')
+    convert_parser.add_argument('dst', help=f'Output path ({BINARY_SUFFIX} for binary, otherwise JSON)')
+    convert_parser.add_argument('--compression', choices=list(CODECS), default='zlib',
+                                help='Block compression for binary output (default: zlib)')
+
+    info_parser = subparsers.add_parser('info', help='Show a binary recording header')
+    info_parser.add_argument('path', help='Binary recording')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'convert':
+            convert(args.src, args.dst, compression=args.compression)
+            src_size = Path(args.src).stat().st_size
+            dst_size = Path(args.dst).stat().st_size
+            print(f"{args.src} ({src_size:,} bytes) -> {args.dst} ({dst_size:,} bytes)")
+        else:
+            reader = RecordingReader.open(args.path)
+            print(f"Kind: {reader.kind}")
+            print(f"Records: {len(reader):,} in {len(reader.index)} blocks ({reader.codec})")
+            print(f"Time scale: {reader.meta['time_scale'] or 'raw float64'}")
+            if 'axis_scale' in reader.meta:
+                print(f"Axis scale: {reader.meta['axis_scale']}")
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""Batched 3D transform, projection and line rasterization for wireframes.
+
+Vertices are handled as whole ``(N, 3)`` arrays: one composed rotation
+matrix per frame, one vectorized perspective divide, and a batch line
+rasterizer that returns the character cells for every edge at once.
+Demos then only loop over the final cells to write them into a renderer.
+
+Usage:
+    from atari_style.core import render3d
+
+    rotation = render3d.rotation_matrix(rx, ry, rz)
+    points = render3d.transform(vertices, rotation, scale=15)
+    sx, sy = render3d.project(points, fov=200, distance=5,
+                              cx=width / 2, cy=height / 2, aspect=0.5)
+    xs, ys, edge = render3d.rasterize_lines(sx[a], sy[a], sx[b], sy[b], width, height)
+
+Axis conventions match the original per-point code: ``rotation_x`` turns
++Y towards +Z, ``rotation_y`` turns +Z towards +X and ``rotation_z``
+turns +X towards +Y. Screen Y grows downwards.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Projected coordinates are clamped to this magnitude so points at or
+# behind the camera plane cannot produce overflowing integers
+_COORD_LIMIT = 1 << 20
+
+
+def rotation_x(angle: float) -> np.ndarray:
+    """Rotation matrix about the X axis."""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]])
+
+
+def rotation_y(angle: float) -> np.ndarray:
+    """Rotation matrix about the Y axis."""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]])
+
+
+def rotation_z(angle: float) -> np.ndarray:
+    """Rotation matrix about the Z axis."""
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def rotation_matrix(rx: float = 0.0, ry: float = 0.0, rz: float = 0.0) -> np.ndarray:
+    """Composed rotation applying X, then Y, then Z (six trig calls per frame)."""
+    return rotation_z(rz) @ rotation_y(ry) @ rotation_x(rx)
+
+
+def as_points(points) -> np.ndarray:
+    """View a sequence of (x, y, z) triples as a float ``(N, 3)`` array."""
+    return np.asarray(points, dtype=np.float64).reshape(-1, 3)
+
+
+def transform(points, matrix: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """Rotate (and uniformly scale) every point: ``scale * matrix @ p``."""
+    out = as_points(points) @ matrix.T
+    if scale != 1.0:
+        out *= scale
+    return out
+
+
+def perspective(z: np.ndarray, focal: float, distance: float) -> np.ndarray:
+    """Per-point perspective factor ``focal / (distance + z)``.
+
+    Points on the camera plane get an infinite factor instead of raising;
+    project() clamps the resulting coordinates.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return focal / (distance + z)
+
+
+def project(
+    points,
+    fov: float,
+    distance: float,
+    cx: float,
+    cy: float,
+    aspect: float = 0.5,
+    scale: float = 1.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Perspective-project points to integer screen cells.
+
+    ``sx = int(x * f * scale + cx)`` and ``sy = int(y * f * scale * aspect + cy)``
+    with ``f = fov / (distance + z)``; conversion truncates like ``int()``.
+    ``aspect`` corrects for character cells being taller than wide.
+
+    Returns:
+        (sx, sy) int64 arrays
+    """
+    points = as_points(points)
+    # inf * 0 on the camera plane gives NaN; _to_cells clamps both
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = perspective(points[:, 2], fov, distance) * scale
+        sx = points[:, 0] * factor + cx
+        sy = points[:, 1] * factor * aspect + cy
+    return _to_cells(sx), _to_cells(sy)
+
+
+def _to_cells(values: np.ndarray) -> np.ndarray:
+    values = np.nan_to_num(values, nan=0.0, posinf=_COORD_LIMIT, neginf=-_COORD_LIMIT)
+    return np.clip(values, -_COORD_LIMIT, _COORD_LIMIT).astype(np.int64)
+
+
+def depth_order(depth, far_first: bool = True) -> np.ndarray:
+    """Indices that sort points by depth (stable, larger z is farther).
+
+    Draw in this order so nearer points overwrite farther ones.
+    """
+    depth = np.asarray(depth)
+    order = np.argsort(-depth if far_first else depth, kind='stable')
+    return order
+
+
+def edge_glyphs(x0, y0, x1, y1) -> np.ndarray:
+    """Box-drawing character for each edge by its dominant direction."""
+    dx = np.asarray(x1) - np.asarray(x0)
+    dy = np.asarray(y1) - np.asarray(y0)
+    adx, ady = np.abs(dx), np.abs(dy)
+    # Screen Y grows downwards, so equal signs run down-right: '\'
+    diagonal = np.where((dx > 0) == (dy > 0), '\\', '/')
+    return np.where(adx > ady, '─', np.where(ady > adx, '│', diagonal))
+
+
+def rasterize_lines(
+    x0, y0, x1, y1,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bresenham cells for many segments at once.
+
+    Uses the closed form of the integer Bresenham loop: step ``k`` of a
+    segment is ``k`` cells along its major axis and
+    ``(2*k*minor + major - 1) // (2*major)`` along its minor axis, which
+    gives exactly the cells the per-pixel loop visits. With a viewport
+    size only the steps whose major coordinate lies on screen are
+    generated, so a segment costs at most one screen width or height no
+    matter how far off-screen its ends were projected.
+
+    Returns:
+        (xs, ys, edge) int64 arrays, grouped by edge in input order and
+        in drawing order within each edge; ``edge`` indexes the segments
+    """
+    x0, y0, x1, y1 = (np.asarray(a, dtype=np.int64).ravel() for a in (x0, y0, x1, y1))
+    dx, dy = np.abs(x1 - x0), np.abs(y1 - y0)
+    sx = np.where(x0 < x1, 1, -1)
+    sy = np.where(y0 < y1, 1, -1)
+
+    x_major = dx >= dy
+    major = np.where(x_major, dx, dy)
+    minor = np.where(x_major, dy, dx)
+    start_major = np.where(x_major, x0, y0)
+    start_minor = np.where(x_major, y0, x0)
+    step_major = np.where(x_major, sx, sy)
+    step_minor = np.where(x_major, sy, sx)
+
+    k_lo = np.zeros_like(major)
+    k_hi = major.copy()
+    clipped = width is not None and height is not None
+    if clipped:
+        # Keep only steps whose major coordinate is on screen
+        limit = np.where(x_major, width, height) - 1
+        k_lo = np.maximum(k_lo, np.where(step_major > 0, -start_major, start_major - limit))
+        k_hi = np.minimum(k_hi, np.where(step_major > 0, limit - start_major, start_major))
+        # Drop segments entirely beyond one side along the minor axis
+        end_minor = np.where(x_major, y1, x1)
+        minor_limit = np.where(x_major, height, width) - 1
+        off = (((start_minor < 0) & (end_minor < 0))
+               | ((start_minor > minor_limit) & (end_minor > minor_limit)))
+        k_hi = np.where(off, -1, k_hi)
+
+    counts = np.maximum(k_hi - k_lo + 1, 0)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty
+
+    edge = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.cumsum(counts) - counts
+    k = np.arange(total) - np.repeat(offsets, counts) + np.repeat(k_lo, counts)
+
+    major_e = major[edge]
+    minor_step = np.where(
+        major_e > 0,
+        (2 * k * minor[edge] + major_e - 1) // np.maximum(2 * major_e, 1),
+        0,
+    )
+    along = start_major[edge] + step_major[edge] * k
+    across = start_minor[edge] + step_minor[edge] * minor_step
+    xm = x_major[edge]
+    xs = np.where(xm, along, across)
+    ys = np.where(xm, across, along)
+
+    if clipped:
+        on_screen = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        xs, ys, edge = xs[on_screen], ys[on_screen], edge[on_screen]
+    return xs, ys, edge
+
+
+def draw_edges(
+    renderer,
+    sx: np.ndarray,
+    sy: np.ndarray,
+    edges: Sequence[Tuple[int, int]],
+    color: Optional[str] = None,
+    glyphs: Optional[np.ndarray] = None,
+) -> None:
+    """Rasterize ``edges`` between projected vertices into ``renderer``.
+
+    Args:
+        renderer: Renderer or HeadlessRenderer
+        sx, sy: Projected vertex cells from project()
+        edges: (a, b) vertex index pairs
+        color: Line color
+        glyphs: Per-edge characters (default: edge_glyphs)
+    """
+    if not len(edges):
+        return
+    pairs = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    x0, y0 = sx[pairs[:, 0]], sy[pairs[:, 0]]
+    x1, y1 = sx[pairs[:, 1]], sy[pairs[:, 1]]
+    if glyphs is None:
+        glyphs = edge_glyphs(x0, y0, x1, y1)
+    xs, ys, edge = rasterize_lines(x0, y0, x1, y1, renderer.width, renderer.height)
+    set_pixel = renderer.set_pixel
+    for x, y, char in zip(xs.tolist(), ys.tolist(), glyphs[edge].tolist()):
+        set_pixel(x, y, char, color)
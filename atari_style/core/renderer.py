@@ -5,6 +5,8 @@ from typing import Tuple, Optional
 import time
 import os
 
+from .profiler import profiled
+
 
 class Renderer:
     """Handles terminal rendering with double buffering."""
@@ -15,6 +17,7 @@ class Renderer:
         self.height = self.term.height
         self.buffer = [[' ' for _ in range(self.width)] for _ in range(self.height)]
         self.color_buffer = [[None for _ in range(self.width)] for _ in range(self.height)]
+        self.profiler = None  # Optional FrameProfiler timing render/write
 
     def clear_buffer(self):
         """Clear the rendering buffer."""
@@ -31,6 +34,15 @@ class Renderer:
             self.buffer[y][x] = char[0] if char else ' '
             self.color_buffer[y][x] = color
 
+    def fill_span(self, x0: int, x1: int, y: int, char: str = '█', color: Optional[str] = None):
+        """Fill cells x0 <= x < x1 of row y (clipped to the buffer) in one slice write."""
+        x0 = max(0, x0)
+        x1 = min(self.width, x1)
+        if x0 < x1 and 0 <= y < self.height:
+            count = x1 - x0
+            self.buffer[y][x0:x1] = [char[0] if char else ' '] * count
+            self.color_buffer[y][x0:x1] = [color] * count
+
     def draw_text(self, x: int, y: int, text: str, color: Optional[str] = None):
         """Draw text at the given position."""
         for i, char in enumerate(text):
@@ -60,18 +72,25 @@ class Renderer:
 
     def render(self):
         """Render the buffer to the terminal."""
-        output = []
-        for y in range(self.height):
-            for x in range(self.width):
-                char = self.buffer[y][x]
-                color = self.color_buffer[y][x]
-
-                if color:
-                    output.append(self.term.move_xy(x, y) + getattr(self.term, color, '')(char))
-                else:
-                    output.append(self.term.move_xy(x, y) + char)
-
-        print(''.join(output), end='', flush=True)
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.draw_hud(self)
+
+        with profiled(profiler, 'render'):
+            output = []
+            for y in range(self.height):
+                for x in range(self.width):
+                    char = self.buffer[y][x]
+                    color = self.color_buffer[y][x]
+
+                    if color:
+                        output.append(self.term.move_xy(x, y) + getattr(self.term, color, '')(char))
+                    else:
+                        output.append(self.term.move_xy(x, y) + char)
+            frame = ''.join(output)
+
+        with profiled(profiler, 'write'):
+            print(frame, end='', flush=True)
 
     def enter_fullscreen(self):
         """Enter fullscreen mode."""
@@ -15,6 +15,15 @@ Usage:
         buttons = handler.get_joystick_buttons()
         # ... render frame ...
         handler.advance_frame(1/30)  # Advance by frame time
+
+Scripts are compiled into an InputTimeline (per-frame axes and button
+masks sampled at the script's fps), so per-frame queries are a list index
+rather than a keyframe search. Long scripts can be compiled once and
+saved:
+
+    timeline = InputTimeline.compile(InputScript.from_file(path))
+    timeline.save('demo.timeline.npz')
+    handler = ScriptedInputHandler(timeline=InputTimeline.load('demo.timeline.npz'))
 """
 
 import json
@@ -23,6 +32,12 @@ from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
+from .recording_format import load_recording
+
+NUM_BUTTONS = 12  # Buttons reported by get_joystick_buttons()
+
 
 @dataclass
 class InputKeyframe:
@@ -67,10 +82,8 @@ class InputScript:
 
     @classmethod
     def from_file(cls, path: str) -> 'InputScript':
-        """Load InputScript from JSON file."""
-        with open(path, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        """Load InputScript from a JSON or binary (.arec) recording file."""
+        return cls.from_dict(load_recording(path))
 
 
 def _smooth_interpolate(t: float) -> float:
@@ -84,26 +97,239 @@ def _lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
 
 
+def _buttons_to_mask(buttons: List[int]) -> int:
+    """Pack button IDs (0-31) into a bitmask."""
+    mask = 0
+    for button in buttons:
+        if 0 <= button < 32:
+            mask |= 1 << button
+    return mask
+
+
+def _mask_to_buttons(mask: int) -> List[int]:
+    """Unpack a bitmask into a sorted list of button IDs."""
+    return [button for button in range(32) if mask >> button & 1]
+
+
+@dataclass
+class InputTimeline:
+    """An input script sampled once per frame.
+
+    ``axes[frame]`` is the (x, y) stick position and ``buttons[frame]`` the
+    pressed-button bitmask at ``frame / fps`` seconds. ``events`` lists
+    every frame where the button mask changes as rows of
+    (frame, pressed_mask, released_mask).
+
+    The source keyframes are kept too (``key_times``, ``key_axes``,
+    ``key_buttons``), so times between frames can still be evaluated
+    exactly and the original script rebuilt with to_script().
+    """
+    fps: int
+    duration: float
+    interpolation: str
+    key_times: np.ndarray
+    key_axes: np.ndarray
+    key_buttons: np.ndarray
+    axes: np.ndarray
+    buttons: np.ndarray
+    events: np.ndarray
+    name: str = ""
+    description: str = ""
+
+    @classmethod
+    def compile(cls, script: InputScript) -> 'InputTimeline':
+        """Sample a script at its fps, one entry per frame.
+
+        Frames run from 0 through ``int(duration * fps)`` inclusive.
+        Keyframes are ordered by time (stable), as from_dict() does.
+        """
+        keyframes = sorted(script.keyframes, key=lambda k: k.time)
+        key_times = np.array([kf.time for kf in keyframes], dtype=np.float64)
+        key_axes = np.array([(kf.x, kf.y) for kf in keyframes], dtype=np.float64).reshape(-1, 2)
+        key_buttons = np.array([_buttons_to_mask(kf.buttons) for kf in keyframes], dtype=np.uint32)
+
+        frames = int(script.duration * script.fps) + 1
+        times = np.arange(frames) * (1.0 / script.fps)
+        axes, buttons = _sample_keyframes(key_times, key_axes, key_buttons,
+                                          script.interpolation, times)
+
+        # Button edges: frames where the mask differs from the frame before
+        previous = np.concatenate(([0], buttons[:-1])).astype(np.uint32)
+        changed = np.flatnonzero(buttons != previous)
+        events = np.stack([
+            changed,
+            buttons[changed] & ~previous[changed],
+            previous[changed] & ~buttons[changed],
+        ], axis=1).astype(np.int64).reshape(-1, 3)
+
+        return cls(
+            fps=script.fps,
+            duration=script.duration,
+            interpolation=script.interpolation,
+            key_times=key_times,
+            key_axes=key_axes,
+            key_buttons=key_buttons,
+            axes=axes,
+            buttons=buttons,
+            events=events,
+            name=script.name,
+            description=script.description,
+        )
+
+    def __len__(self) -> int:
+        return len(self.buttons)
+
+    def frame_for_time(self, t: float) -> Optional[int]:
+        """Frame sampled at time ``t``, or None if ``t`` is between frames."""
+        position = t * self.fps
+        frame = int(round(position))
+        if 0 <= frame < len(self.buttons) and abs(position - frame) <= 1e-6:
+            return frame
+        return None
+
+    def sample(self, t: float) -> Tuple[float, float, int]:
+        """Evaluate the keyframes at an arbitrary time.
+
+        Returns:
+            (x, y, button_mask)
+        """
+        axes, buttons = _sample_keyframes(self.key_times, self.key_axes, self.key_buttons,
+                                          self.interpolation, np.array([t], dtype=np.float64))
+        return float(axes[0, 0]), float(axes[0, 1]), int(buttons[0])
+
+    def events_between(self, start: int, stop: int) -> np.ndarray:
+        """Button events for frames ``start <= frame < stop``."""
+        lo, hi = np.searchsorted(self.events[:, 0], [start, stop])
+        return self.events[lo:hi]
+
+    def to_script(self) -> InputScript:
+        """Rebuild the InputScript this timeline was compiled from."""
+        keyframes = [
+            InputKeyframe(time=float(t), x=float(x), y=float(y), buttons=_mask_to_buttons(int(mask)))
+            for t, (x, y), mask in zip(self.key_times, self.key_axes, self.key_buttons)
+        ]
+        return InputScript(
+            duration=self.duration,
+            fps=self.fps,
+            keyframes=keyframes,
+            interpolation=self.interpolation,
+            name=self.name,
+            description=self.description,
+        )
+
+    def save(self, path: str):
+        """Save the compiled timeline as a compressed .npz file."""
+        meta = {
+            'fps': self.fps,
+            'duration': self.duration,
+            'interpolation': self.interpolation,
+            'name': self.name,
+            'description': self.description,
+            'version': 1,
+        }
+        with open(path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                meta=np.array(json.dumps(meta)),
+                key_times=self.key_times,
+                key_axes=self.key_axes,
+                key_buttons=self.key_buttons,
+                axes=self.axes,
+                buttons=self.buttons,
+                events=self.events,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> 'InputTimeline':
+        """Load a timeline written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            return cls(
+                fps=meta['fps'],
+                duration=meta['duration'],
+                interpolation=meta['interpolation'],
+                key_times=data['key_times'],
+                key_axes=data['key_axes'],
+                key_buttons=data['key_buttons'],
+                axes=data['axes'],
+                buttons=data['buttons'],
+                events=data['events'],
+                name=meta.get('name', ''),
+                description=meta.get('description', ''),
+            )
+
+
+def _sample_keyframes(
+    key_times: np.ndarray,
+    key_axes: np.ndarray,
+    key_buttons: np.ndarray,
+    interpolation: str,
+    times: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate keyframes at many times at once.
+
+    Same rules as the per-query lookup it replaces: the previous keyframe is
+    the last one at or before ``t`` (the first keyframe before it starts),
+    positions ease towards the next keyframe, and buttons hold the previous
+    keyframe's state.
+
+    Returns:
+        (axes, buttons): float64 array of shape (len(times), 2) and uint32
+        button masks of shape (len(times),)
+    """
+    if len(key_times) == 0:
+        return np.zeros((len(times), 2)), np.zeros(len(times), dtype=np.uint32)
+
+    last = len(key_times) - 1
+    before = np.searchsorted(key_times, times, side='right') - 1
+    prev = np.maximum(before, 0)
+    has_next = (before >= 0) & (before < last)
+    nxt = np.where(has_next, prev + 1, prev)
+
+    span = np.where(has_next, key_times[nxt] - key_times[prev], 1.0)
+    u = np.where(has_next, np.clip((times - key_times[prev]) / span, 0.0, 1.0), 1.0)
+
+    start = key_axes[prev]
+    if interpolation == "step":
+        axes = start
+    else:
+        if interpolation == "smooth":
+            u = _smooth_interpolate(u)
+        axes = _lerp(start, key_axes[nxt], u[:, None])
+
+    return axes, key_buttons[prev]
+
+
 class ScriptedInputHandler:
     """Mock InputHandler that replays scripted input sequences.
 
     Designed to be a drop-in replacement for InputHandler in demo contexts,
     providing the same interface for joystick state queries.
+
+    The script is compiled to an InputTimeline on first query; assign a new
+    ``script`` (rather than editing its keyframes in place) to change it.
     """
 
-    def __init__(self, script_path: Optional[str] = None, script: Optional[InputScript] = None):
-        """Initialize with script file or InputScript object.
+    def __init__(self, script_path: Optional[str] = None, script: Optional[InputScript] = None,
+                 timeline: Optional[InputTimeline] = None):
+        """Initialize with script file, InputScript or compiled InputTimeline.
 
         Args:
             script_path: Path to JSON script file
             script: Pre-loaded InputScript object
+            timeline: Pre-compiled InputTimeline (see InputTimeline.load)
         """
+        self._timeline = None
+        self._compiled_script = None
         if script:
             self.script = script
+        elif timeline is not None:
+            self.script = timeline.to_script()
+            self._use_timeline(timeline)
         elif script_path:
             self.script = InputScript.from_file(script_path)
         else:
-            raise ValueError("Must provide either script_path or script")
+            raise ValueError("Must provide either script_path, script or timeline")
 
         self.current_time = 0.0
         self.started = False
@@ -145,52 +371,29 @@ class ScriptedInputHandler:
         """Get current frame number."""
         return int(self.current_time * self.script.fps)
 
-    def _find_keyframes(self, t: float) -> Tuple[Optional[InputKeyframe], Optional[InputKeyframe], float]:
-        """Find surrounding keyframes and interpolation factor for time t.
-
-        Returns:
-            (prev_keyframe, next_keyframe, interpolation_t)
-        """
-        if not self.script.keyframes:
-            return None, None, 0.0
-
-        # Find surrounding keyframes
-        prev_kf = None
-        next_kf = None
-
-        for i, kf in enumerate(self.script.keyframes):
-            if kf.time <= t:
-                prev_kf = kf
-            if kf.time > t and next_kf is None:
-                next_kf = kf
-                break
-
-        # Handle edge cases
-        if prev_kf is None:
-            prev_kf = self.script.keyframes[0]
-        if next_kf is None:
-            next_kf = prev_kf  # Stay at last keyframe
-            return prev_kf, next_kf, 1.0
-
-        # Calculate interpolation factor
-        if next_kf.time == prev_kf.time:
-            interp_t = 1.0
-        else:
-            interp_t = (t - prev_kf.time) / (next_kf.time - prev_kf.time)
-            interp_t = max(0.0, min(1.0, interp_t))
-
-        return prev_kf, next_kf, interp_t
-
-    def _interpolate_position(self, prev_kf: InputKeyframe, next_kf: InputKeyframe, t: float) -> Tuple[float, float]:
-        """Interpolate position between keyframes."""
-        if self.script.interpolation == "step":
-            return prev_kf.x, prev_kf.y
-        elif self.script.interpolation == "smooth":
-            t = _smooth_interpolate(t)
-        # Linear or smoothed linear
-        x = _lerp(prev_kf.x, next_kf.x, t)
-        y = _lerp(prev_kf.y, next_kf.y, t)
-        return x, y
+    @property
+    def timeline(self) -> InputTimeline:
+        """The compiled per-frame timeline for the current script."""
+        if self._compiled_script is not self.script:
+            self._use_timeline(InputTimeline.compile(self.script))
+        return self._timeline
+
+    def _use_timeline(self, timeline: InputTimeline):
+        self._timeline = timeline
+        self._compiled_script = self.script
+        # Python lists index faster than NumPy scalars on the per-frame path
+        self._frame_axes = [tuple(xy) for xy in timeline.axes.tolist()]
+        self._frame_buttons = timeline.buttons.tolist()
+        self._button_dicts = {}
+
+    def _state_at(self, t: float) -> Tuple[Tuple[float, float], int]:
+        """Stick position and button mask at time t."""
+        timeline = self.timeline
+        frame = timeline.frame_for_time(t)
+        if frame is not None:
+            return self._frame_axes[frame], self._frame_buttons[frame]
+        x, y, mask = timeline.sample(t)
+        return (x, y), mask
 
     def get_joystick_state(self) -> Tuple[float, float]:
         """Get interpolated joystick position at current time.
@@ -198,12 +401,10 @@ class ScriptedInputHandler:
         Returns:
             (x, y) tuple with values in range -1.0 to 1.0
         """
-        prev_kf, next_kf, t = self._find_keyframes(self.current_time)
-
-        if prev_kf is None:
+        if not self.script.keyframes:
             return 0.0, 0.0
 
-        return self._interpolate_position(prev_kf, next_kf, t)
+        return self._state_at(self.current_time)[0]
 
     def get_joystick_buttons(self) -> Dict[int, bool]:
         """Get button states at current time.
@@ -213,13 +414,16 @@ class ScriptedInputHandler:
         Returns:
             Dictionary mapping button IDs to pressed state
         """
-        prev_kf, _, _ = self._find_keyframes(self.current_time)
-
-        if prev_kf is None:
+        if not self.script.keyframes:
             return {}
 
-        # Return dict with True for pressed buttons, False for others (up to 12 buttons)
-        return {i: (i in prev_kf.buttons) for i in range(12)}
+        mask = self._state_at(self.current_time)[1]
+        buttons = self._button_dicts.get(mask)
+        if buttons is None:
+            # Return dict with True for pressed buttons, False for others (up to 12 buttons)
+            buttons = {i: bool(mask >> i & 1) for i in range(NUM_BUTTONS)}
+            self._button_dicts[mask] = buttons
+        return dict(buttons)
 
     def verify_joystick(self) -> Dict[str, Any]:
         """Return mock joystick info (for interface compatibility)."""
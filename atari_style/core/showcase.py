@@ -15,17 +15,25 @@ Usage:
         --output showcase.mp4
 
     python -m atari_style.core.showcase create --manifest showcase.json
+
+Normalized segments are cached under ~/.atari-style/cache/showcase, keyed
+by source content hash and target width/height/fps, so rebuilding a
+showcase only re-encodes clips and title cards that actually changed.
+Normalization runs on a bounded worker pool (--jobs).
 """
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
     from PIL import Image, ImageDraw, ImageFont
@@ -33,6 +41,7 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+from .config import CONFIG_DIR
 from .headless_renderer import (
     HeadlessRenderer,
     ANSI_COLORS,
@@ -40,6 +49,99 @@ from .headless_renderer import (
 )
 
 
+DEFAULT_CACHE_DIR = CONFIG_DIR / 'cache' / 'showcase'
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Bump when normalization ffmpeg arguments change so stale outputs are ignored
+NORMALIZE_VERSION = 1
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class NormalizationCache:
+    """On-disk cache of normalized showcase segments.
+
+    Segments are stored as ``<key>.mp4`` where the key hashes the source
+    content (or title card parameters) together with the target
+    width/height/fps. Source digests are memoized in ``index.json`` by
+    (path, size, mtime) so unchanged clips are not re-hashed on every run.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, dict]] = None
+        self._dirty = False
+
+    def _load_index(self) -> Dict[str, dict]:
+        if self._index is None:
+            index_path = self.cache_dir / self.INDEX_FILE
+            try:
+                with open(index_path, 'r') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def source_digest(self, path: str) -> str:
+        """Content digest of a source file, memoized by path/size/mtime."""
+        abs_path = os.path.abspath(path)
+        st = os.stat(abs_path)
+        with self._lock:
+            cached = self._load_index().get(abs_path)
+        if cached and cached.get('size') == st.st_size and cached.get('mtime_ns') == st.st_mtime_ns:
+            return cached['digest']
+
+        digest = file_digest(abs_path)
+        with self._lock:
+            self._load_index()[abs_path] = {
+                'size': st.st_size,
+                'mtime_ns': st.st_mtime_ns,
+                'digest': digest,
+            }
+            self._dirty = True
+        return digest
+
+    @staticmethod
+    def make_key(source: str, width: int, height: int, fps: int) -> str:
+        """Build a cache key from a source identity and target format."""
+        raw = f"v{NORMALIZE_VERSION}:{source}:{width}x{height}@{fps}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+    def path_for(self, key: str) -> str:
+        """Path where the segment for ``key`` lives (whether or not it exists)."""
+        return str(self.cache_dir / f"{key}.mp4")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached segment path for ``key`` if present."""
+        path = self.path_for(key)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            return path
+        return None
+
+    def save_index(self) -> None:
+        """Persist the digest index if it changed."""
+        with self._lock:
+            if not self._dirty or self._index is None:
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            index_path = self.cache_dir / self.INDEX_FILE
+            tmp_path = index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, index_path)
+            self._dirty = False
+
+
 @dataclass
 class ShowcaseEntry:
     """A single entry in the showcase playlist."""
@@ -239,11 +341,39 @@ class TitleCardGenerator:
             os.unlink(temp_img)
 
 
+@dataclass
+class _SegmentJob:
+    """A single segment of the showcase timeline."""
+    label: str
+    output_path: str
+    source_path: Optional[str] = None  # None for title cards
+    title: Optional[str] = None
+    title_duration: float = 2.0
+    cache_key: Optional[str] = None
+    ready: bool = False  # True when output already exists (cache hit or passthrough)
+
+
 class ShowcaseGenerator:
-    """Generates showcase videos by concatenating demos."""
+    """Generates showcase videos by concatenating demos.
 
-    def __init__(self, manifest: ShowcaseManifest):
+    Args:
+        manifest: Showcase description
+        cache_dir: Directory for cached normalized segments
+            (default: ~/.atari-style/cache/showcase)
+        max_workers: Maximum concurrent ffmpeg/ffprobe jobs
+        use_cache: Disable to always re-encode into a temporary directory
+    """
+
+    def __init__(
+        self,
+        manifest: ShowcaseManifest,
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+    ):
         self.manifest = manifest
+        self.max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+        self.cache = NormalizationCache(cache_dir) if use_cache else None
         self.title_generator = TitleCardGenerator(
             width=manifest.width,
             height=manifest.height,
@@ -283,6 +413,48 @@ class ShowcaseGenerator:
 
         return width, height, fps
 
+    def _probe_streams(self, path: str) -> List[dict]:
+        """Return codec/format details for every stream in ``path``."""
+        cmd = [
+            'ffprobe', '-v', 'error',
+            '-show_entries', 'stream=codec_type,codec_name,pix_fmt,width,height,r_frame_rate',
+            '-of', 'json',
+            path,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffprobe failed for {path}: {result.stderr}")
+        return json.loads(result.stdout).get('streams', [])
+
+    def _matches_target(
+        self,
+        path: str,
+        target_width: int,
+        target_height: int,
+        target_fps: int,
+    ) -> bool:
+        """Check whether a source can be stream-copied without re-encoding.
+
+        The source must have exactly one stream, encoded the same way
+        ``_normalize_video`` would encode it (h264/yuv420p, no audio, exact
+        target size and integer frame rate).
+        """
+        try:
+            streams = self._probe_streams(path)
+        except (RuntimeError, ValueError):
+            return False
+        if len(streams) != 1:
+            return False
+        stream = streams[0]
+        return (
+            stream.get('codec_type') == 'video'
+            and stream.get('codec_name') == 'h264'
+            and stream.get('pix_fmt') == 'yuv420p'
+            and stream.get('width') == target_width
+            and stream.get('height') == target_height
+            and stream.get('r_frame_rate') in (f"{target_fps}/1", str(target_fps))
+        )
+
     def _normalize_video(
         self,
         input_path: str,
@@ -307,6 +479,130 @@ class ShowcaseGenerator:
         if result.returncode != 0:
             raise RuntimeError(f"ffmpeg normalization failed: {result.stderr}")
 
+    def _title_identity(self, title: str, duration: float) -> str:
+        """Stable identity of a title card for cache keying."""
+        return 'title:' + json.dumps(
+            [title, duration, self.manifest.title_style], ensure_ascii=False
+        )
+
+    def _plan_segments(
+        self,
+        temp_dir: str,
+        target_width: int,
+        target_height: int,
+        target_fps: int,
+    ) -> List[_SegmentJob]:
+        """Build the ordered segment list, resolving cache hits up front.
+
+        Source hashing and probing run on the worker pool since both are
+        I/O bound.
+        """
+        jobs: List[_SegmentJob] = []
+        for i, entry in enumerate(self.manifest.entries):
+            if entry.title:
+                jobs.append(_SegmentJob(
+                    label=f"Creating title: {entry.title}",
+                    output_path=os.path.join(temp_dir, f"title_{i:03d}.mp4"),
+                    title=entry.title,
+                    title_duration=entry.title_duration,
+                ))
+            jobs.append(_SegmentJob(
+                label=f"Processing: {entry.video_path}",
+                output_path=os.path.join(temp_dir, f"segment_{i:03d}.mp4"),
+                source_path=entry.video_path,
+            ))
+
+        def resolve(job: _SegmentJob) -> None:
+            if job.source_path and self._matches_target(
+                job.source_path, target_width, target_height, target_fps
+            ):
+                job.output_path = job.source_path
+                job.ready = True
+                return
+            if self.cache is None:
+                return
+            if job.source_path:
+                identity = self.cache.source_digest(job.source_path)
+            else:
+                identity = self._title_identity(job.title, job.title_duration)
+            job.cache_key = self.cache.make_key(identity, target_width, target_height, target_fps)
+            job.output_path = self.cache.path_for(job.cache_key)
+            job.ready = self.cache.get(job.cache_key) is not None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # list() re-raises the first worker exception, if any
+            list(pool.map(resolve, jobs))
+
+        if self.cache is not None:
+            self.cache.save_index()
+        return jobs
+
+    def _build_segment(
+        self,
+        job: _SegmentJob,
+        target_width: int,
+        target_height: int,
+        target_fps: int,
+    ) -> None:
+        """Encode one segment, publishing cached outputs atomically."""
+        if job.cache_key is not None:
+            Path(job.output_path).parent.mkdir(parents=True, exist_ok=True)
+            write_path = f"{job.output_path}.{os.getpid()}.{threading.get_ident()}.tmp.mp4"
+        else:
+            write_path = job.output_path
+
+        try:
+            if job.source_path:
+                self._normalize_video(
+                    job.source_path,
+                    write_path,
+                    target_width,
+                    target_height,
+                    target_fps,
+                )
+            else:
+                self.title_generator.generate(job.title, job.title_duration, write_path)
+            if write_path != job.output_path:
+                os.replace(write_path, job.output_path)
+        finally:
+            if write_path != job.output_path and os.path.exists(write_path):
+                os.unlink(write_path)
+
+    def _run_segments(
+        self,
+        jobs: List[_SegmentJob],
+        target_width: int,
+        target_height: int,
+        target_fps: int,
+        progress_callback=None,
+    ) -> None:
+        """Encode all pending segments on a bounded worker pool."""
+        total_steps = len(jobs)
+        step = 0
+
+        for job in jobs:
+            if job.ready:
+                step += 1
+                if progress_callback:
+                    progress_callback(step, total_steps, f"{job.label} (cached)")
+
+        pending = [job for job in jobs if not job.ready]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._build_segment, job, target_width, target_height, target_fps): job
+                for job in pending
+            }
+            # Report in timeline order; a failure surfaces at its own step
+            for future, job in futures.items():
+                future.result()
+                job.ready = True
+                step += 1
+                if progress_callback:
+                    progress_callback(step, total_steps, job.label)
+
     def generate(self, progress_callback=None) -> str:
         """Generate the showcase video.
 
@@ -337,52 +633,20 @@ class ShowcaseGenerator:
             )
         target_fps = self.manifest.fps
 
-        # Create temporary directory for intermediate files
         with tempfile.TemporaryDirectory() as temp_dir:
-            segments = []
-            # Count actual steps: one per entry (normalize) + one per entry with title
-            total_steps = len(self.manifest.entries) + sum(1 for e in self.manifest.entries if e.title)
-            step = 0
-
-            for i, entry in enumerate(self.manifest.entries):
-                # Generate title card if title provided
-                if entry.title:
-                    step += 1
-                    if progress_callback:
-                        progress_callback(step, total_steps, f"Creating title: {entry.title}")
-
-                    title_path = os.path.join(temp_dir, f"title_{i:03d}.mp4")
-                    self.title_generator.generate(
-                        entry.title,
-                        entry.title_duration,
-                        title_path,
-                    )
-                    segments.append(title_path)
-
-                # Normalize video segment
-                step += 1
-                if progress_callback:
-                    progress_callback(step, total_steps, f"Processing: {entry.video_path}")
-
-                normalized_path = os.path.join(temp_dir, f"segment_{i:03d}.mp4")
-                self._normalize_video(
-                    entry.video_path,
-                    normalized_path,
-                    target_width,
-                    target_height,
-                    target_fps,
-                )
-                segments.append(normalized_path)
+            jobs = self._plan_segments(temp_dir, target_width, target_height, target_fps)
+            total_steps = len(jobs)
+            self._run_segments(jobs, target_width, target_height, target_fps, progress_callback)
 
             # Create concat file
             concat_file = os.path.join(temp_dir, "concat.txt")
             with open(concat_file, 'w') as f:
-                for seg in segments:
+                for job in jobs:
                     # Escape special characters in path
-                    escaped = seg.replace("'", "'\\''")
+                    escaped = os.path.abspath(job.output_path).replace("'", "'\\''")
                     f.write(f"file '{escaped}'\n")
 
-            # Concatenate all segments
+            # Every segment now shares codec, size and fps: concat by stream copy
             if progress_callback:
                 progress_callback(total_steps, total_steps, "Concatenating segments...")
 
@@ -414,6 +678,9 @@ def create_showcase(
     width: Optional[int] = None,
     height: Optional[int] = None,
     progress_callback=None,
+    cache_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
 ) -> str:
     """Convenience function to create a showcase video.
 
@@ -427,6 +694,9 @@ def create_showcase(
         width: Output width (None = auto from first video)
         height: Output height (None = auto from first video)
         progress_callback: Optional callback(step, total, message)
+        cache_dir: Directory for cached normalized segments
+        max_workers: Maximum concurrent ffmpeg jobs
+        use_cache: Reuse previously normalized segments when possible
 
     Returns:
         Path to output video
@@ -472,7 +742,12 @@ def create_showcase(
         height=height,
     )
 
-    generator = ShowcaseGenerator(manifest)
+    generator = ShowcaseGenerator(
+        manifest,
+        cache_dir=cache_dir,
+        max_workers=max_workers,
+        use_cache=use_cache,
+    )
     return generator.generate(progress_callback)
 
 
@@ -506,6 +781,11 @@ Examples:
                                help='Output frame rate (default: 30)')
     create_parser.add_argument('--width', type=int, help='Output width')
     create_parser.add_argument('--height', type=int, help='Output height')
+    create_parser.add_argument('--jobs', '-j', type=int, default=None,
+                               help=f'Concurrent normalization jobs (default: {DEFAULT_MAX_WORKERS})')
+    create_parser.add_argument('--cache-dir', help=f'Segment cache directory (default: {DEFAULT_CACHE_DIR})')
+    create_parser.add_argument('--no-cache', action='store_true',
+                               help='Re-encode every segment instead of reusing cached ones')
 
     # Init command (create manifest template)
     init_parser = subparsers.add_parser('init', help='Create manifest template')
@@ -560,7 +840,12 @@ Examples:
             print(f"[{step}/{total}] {msg}")
 
         try:
-            generator = ShowcaseGenerator(manifest)
+            generator = ShowcaseGenerator(
+                manifest,
+                cache_dir=args.cache_dir,
+                max_workers=args.jobs,
+                use_cache=not args.no_cache,
+            )
             output = generator.generate(progress_callback=progress)
             print(f"\nShowcase created: {output}")
         except Exception as e:
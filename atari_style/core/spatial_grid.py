@@ -0,0 +1,208 @@
+"""Occupancy-grid broadphase for character-cell collision checks.
+
+Games collide things by comparing integer cell coordinates, so instead
+of testing every bullet against every enemy (or every ball against
+every brick) each frame, objects register the cells they cover and a
+collision check becomes a lookup of the probe's cell. The grid is
+maintained incrementally: ``move`` only touches the index when an
+object actually crosses into a different cell.
+
+Usage:
+    from atari_style.core.spatial_grid import SpatialGrid
+
+    grid = SpatialGrid()
+    for brick in bricks:
+        grid.insert(brick, brick.x, brick.y, brick.width, 2)
+
+    brick = grid.first(ball.x, ball.y)   # None if the cell is empty
+    grid.remove(brick)                   # once it is destroyed
+
+UniformGrid is the float-coordinate counterpart for world-space objects
+(e.g. Canvas Explorer boxes): it buckets rectangles into fixed-size cells
+and answers point and viewport queries.
+"""
+
+import math
+from typing import Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """Maps integer cells to the objects occupying them.
+
+    Coordinates are truncated with ``int()``, matching the games' own
+    ``int(x) == int(other.x)`` tests. Objects may span several cells
+    (``width`` x ``height``); objects sharing a cell are returned in
+    insertion order.
+    """
+
+    def __init__(self):
+        self._cells: Dict[Cell, Dict[Hashable, None]] = {}
+        self._occupied: Dict[Hashable, Tuple[Cell, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._occupied)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._occupied
+
+    @staticmethod
+    def cells_for(x: float, y: float, width: int = 1, height: int = 1) -> Tuple[Cell, ...]:
+        """Cells covered by a ``width`` x ``height`` box at (x, y)."""
+        cx, cy = int(x), int(y)
+        if width == 1 and height == 1:
+            return ((cx, cy),)
+        return tuple((cx + dx, cy + dy) for dy in range(height) for dx in range(width))
+
+    def insert(self, item: Hashable, x: float, y: float, width: int = 1, height: int = 1) -> None:
+        """Add ``item`` covering the box at (x, y), replacing any previous entry."""
+        if item in self._occupied:
+            self.remove(item)
+        cells = self.cells_for(x, y, width, height)
+        self._occupied[item] = cells
+        for cell in cells:
+            self._cells.setdefault(cell, {})[item] = None
+
+    def move(self, item: Hashable, x: float, y: float, width: int = 1, height: int = 1) -> None:
+        """Update ``item``'s position; a no-op while it stays in the same cells."""
+        if self._occupied.get(item) != self.cells_for(x, y, width, height):
+            self.insert(item, x, y, width, height)
+
+    def remove(self, item: Hashable) -> None:
+        """Forget ``item`` (ignored if it is not in the grid)."""
+        for cell in self._occupied.pop(item, ()):
+            occupants = self._cells[cell]
+            del occupants[item]
+            if not occupants:
+                del self._cells[cell]
+
+    def clear(self) -> None:
+        """Remove every object."""
+        self._cells.clear()
+        self._occupied.clear()
+
+    def at(self, x: float, y: float) -> List[Hashable]:
+        """Objects occupying the cell containing (x, y)."""
+        return list(self._cells.get((int(x), int(y)), ()))
+
+    def first(
+        self,
+        x: float,
+        y: float,
+        predicate: Optional[Callable[[Hashable], bool]] = None,
+    ) -> Optional[Hashable]:
+        """First object in the cell at (x, y) matching ``predicate``, or None."""
+        for item in self._cells.get((int(x), int(y)), ()):
+            if predicate is None or predicate(item):
+                return item
+        return None
+
+    def items(self) -> Iterator[Hashable]:
+        """All objects in the grid."""
+        return iter(self._occupied)
+
+
+class UniformGrid:
+    """Bucket grid over float rectangles, for world-space hit tests and culling.
+
+    Unlike SpatialGrid, coordinates are continuous (and may be negative):
+    each object is registered in every ``cell_size`` bucket its bounding
+    rectangle overlaps. Queries return candidates in insertion order
+    (re-registering an object with ``move`` keeps its place), so callers
+    can rely on it for drawing order. Objects are tracked by identity, so
+    unhashable ones such as dataclasses work.
+    """
+
+    def __init__(self, cell_size: float = 32.0):
+        self.cell_size = cell_size
+        self._cells: Dict[Cell, Dict[int, None]] = {}
+        # id(item) -> (item, insertion sequence, cells)
+        self._entries: Dict[int, Tuple[object, int, Tuple[Cell, ...]]] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self._entries
+
+    def _cell_range(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (math.floor(min(x0, x1) / size), math.floor(min(y0, y1) / size),
+                math.floor(max(x0, x1) / size), math.floor(max(y0, y1) / size))
+
+    def cells_for(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[Cell, ...]:
+        """Buckets overlapped by the rectangle (x0, y0)-(x1, y1), edges included."""
+        cx0, cy0, cx1, cy1 = self._cell_range(x0, y0, x1, y1)
+        return tuple((cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1))
+
+    def insert(self, item: object, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Register ``item`` covering the rectangle; re-inserting moves it."""
+        key = id(item)
+        entry = self._entries.get(key)
+        if entry is not None:
+            seq = entry[1]
+            self._unlink(key, entry[2])
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        cells = self.cells_for(x0, y0, x1, y1)
+        self._entries[key] = (item, seq, cells)
+        for cell in cells:
+            self._cells.setdefault(cell, {})[key] = None
+
+    def move(self, item: object, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Update ``item``'s rectangle; a no-op while it stays in the same buckets."""
+        entry = self._entries.get(id(item))
+        if entry is None or entry[2] != self.cells_for(x0, y0, x1, y1):
+            self.insert(item, x0, y0, x1, y1)
+
+    def remove(self, item: object) -> None:
+        """Forget ``item`` (ignored if it is not in the grid)."""
+        entry = self._entries.pop(id(item), None)
+        if entry is not None:
+            self._unlink(id(item), entry[2])
+
+    def _unlink(self, key: int, cells: Tuple[Cell, ...]) -> None:
+        for cell in cells:
+            occupants = self._cells[cell]
+            del occupants[key]
+            if not occupants:
+                del self._cells[cell]
+
+    def clear(self) -> None:
+        """Remove every object."""
+        self._cells.clear()
+        self._entries.clear()
+
+    def at(self, x: float, y: float) -> List[object]:
+        """Candidates whose bucket contains (x, y), in insertion order."""
+        size = self.cell_size
+        keys = self._cells.get((math.floor(x / size), math.floor(y / size)), ())
+        return self._ordered(keys)
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> List[object]:
+        """Candidates overlapping the rectangle's buckets, in insertion order.
+
+        Cost depends on the number of buckets the rectangle spans and the
+        objects in them, not on the total number of objects.
+        """
+        cx0, cy0, cx1, cy1 = self._cell_range(x0, y0, x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            # Query larger than the occupied area: scan occupied buckets
+            keys = {key: None for (cx, cy), occupants in self._cells.items()
+                    if cx0 <= cx <= cx1 and cy0 <= cy <= cy1 for key in occupants}
+        else:
+            keys = {}
+            for cy in range(cy0, cy1 + 1):
+                for cx in range(cx0, cx1 + 1):
+                    occupants = self._cells.get((cx, cy))
+                    if occupants:
+                        keys.update(occupants)
+        return self._ordered(keys)
+
+    def _ordered(self, keys) -> List[object]:
+        entries = sorted((self._entries[key] for key in keys), key=lambda entry: entry[1])
+        return [entry[0] for entry in entries]
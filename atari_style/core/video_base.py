@@ -16,7 +16,7 @@ import tempfile
 import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Sequence
 
 
 @dataclass
@@ -82,6 +82,7 @@ class FFmpegEncoder:
         preset: str = 'medium',
         pix_fmt: str = 'yuv420p',
         codec: str = 'libx264',
+        durations: Optional[Sequence[float]] = None,
     ) -> bool:
         """Encode frames to MP4 video using ffmpeg.
 
@@ -94,6 +95,9 @@ class FFmpegEncoder:
             preset: Encoding preset (ultrafast, fast, medium, slow, veryslow)
             pix_fmt: Pixel format (yuv420p for compatibility)
             codec: Video codec (libx264 for H.264)
+            durations: Optional seconds to show each frame. Held frames are
+                then stored once and fed through an ffmpeg concat list; the
+                output is still resampled to a constant ``fps``.
 
         Returns:
             True if encoding succeeded, False otherwise
@@ -111,11 +115,16 @@ class FFmpegEncoder:
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
+        if durations is None:
+            input_args = ['-framerate', str(fps), '-i', frame_path]
+        else:
+            list_path = write_concat_list(frames_dir, frame_pattern, durations)
+            input_args = ['-f', 'concat', '-safe', '0', '-i', list_path, '-vf', f'fps={fps}']
+
         cmd = [
             'ffmpeg',
             '-y',  # Overwrite output
-            '-framerate', str(fps),
-            '-i', frame_path,
+            *input_args,
             '-c:v', codec,
             '-pix_fmt', pix_fmt,
             '-crf', str(crf),
@@ -139,6 +148,7 @@ class FFmpegEncoder:
         frame_pattern: str = 'frame_%05d.png',
         scale: int = 480,
         colors: int = 256,
+        palette=None,
     ) -> bool:
         """Encode frames to animated GIF using ffmpeg.
 
@@ -149,6 +159,8 @@ class FFmpegEncoder:
             frame_pattern: Frame filename pattern
             scale: Maximum width in pixels (maintains aspect ratio)
             colors: Number of colors in palette (max 256)
+            palette: Optional GifPalette; frames drawn from a known color
+                set are then encoded in-process without ffmpeg
 
         Returns:
             True if encoding succeeded, False otherwise
@@ -156,6 +168,11 @@ class FFmpegEncoder:
         Raises:
             RuntimeError: If ffmpeg is not available
         """
+        if palette is not None:
+            return self._encode_gif_with_palette(
+                frames_dir, output_path, fps, frame_pattern, scale, palette
+            )
+
         if not self._ffmpeg_available:
             raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
 
@@ -202,6 +219,103 @@ class FFmpegEncoder:
             print(f"GIF encoding error: {result.stderr}")
             return False
 
+    def concat_videos(self, segment_paths: Sequence[str], output_path: str) -> bool:
+        """Join video segments end to end without re-encoding.
+
+        The segments must share codec settings (e.g. encoded by the same
+        pipeline); ffmpeg's concat demuxer then stream-copies them.
+
+        Args:
+            segment_paths: Segment files in playback order
+            output_path: Output video file path
+
+        Returns:
+            True if concatenation succeeded, False otherwise
+
+        Raises:
+            RuntimeError: If ffmpeg is not available
+        """
+        if not self._ffmpeg_available:
+            raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
+
+        output_dir = os.path.dirname(output_path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        with tempfile.NamedTemporaryFile('w', suffix='.ffconcat', delete=False) as f:
+            f.write('ffconcat version 1.0\n')
+            for path in segment_paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+            list_path = f.name
+
+        try:
+            cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0', '-i', list_path,
+                   '-c', 'copy', output_path]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        finally:
+            os.unlink(list_path)
+
+        if result.returncode == 0:
+            return True
+        else:
+            print(f"ffmpeg concat error: {result.stderr}")
+            return False
+
+    @staticmethod
+    def _encode_gif_with_palette(
+        frames_dir: str,
+        output_path: str,
+        fps: int,
+        frame_pattern: str,
+        scale: int,
+        palette,
+    ) -> bool:
+        """Encode numbered frames against a fixed palette with GifWriter."""
+        from PIL import Image
+        from .gif_encoder import GifWriter
+
+        with GifWriter(output_path, palette, fps=fps, scale=scale) as gif:
+            frame_num = 0
+            while True:
+                frame_path = os.path.join(frames_dir, frame_pattern % frame_num)
+                if not os.path.exists(frame_path):
+                    break
+                with Image.open(frame_path) as img:
+                    gif.add_frame(img)
+                frame_num += 1
+
+        if frame_num == 0:
+            print(f"GIF encoding error: no frames matching {frame_pattern} in {frames_dir}")
+            return False
+        return True
+
+
+def write_concat_list(frames_dir: str, frame_pattern: str, durations: Sequence[float]) -> str:
+    """Write an ffmpeg concat demuxer list giving each frame a duration.
+
+    Args:
+        frames_dir: Directory containing frame images
+        frame_pattern: Frame filename pattern, numbered from 0
+        durations: Seconds to show each frame
+
+    Returns:
+        Path of the written list file
+    """
+    lines = ['ffconcat version 1.0']
+    for i, duration in enumerate(durations):
+        lines.append(f"file '{frame_pattern % i}'")
+        lines.append(f'duration {duration:.6f}')
+    if durations:
+        # The concat demuxer ignores the last duration unless the final
+        # file is listed again
+        lines.append(f"file '{frame_pattern % (len(durations) - 1)}'")
+
+    list_path = os.path.join(frames_dir, 'frames.ffconcat')
+    with open(list_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return list_path
+
 
 class ProgressReporter:
     """Progress reporting for video export operations."""
@@ -397,6 +511,25 @@ class PresetManager:
         ),
     }
 
+    # Preset groups published together from a single render (see fanout_encoder)
+    PUBLISH_SETS: Dict[str, List[str]] = {
+        'social': ['youtube_1080p', 'youtube_shorts', 'instagram_square'],
+        'vertical': ['youtube_shorts', 'tiktok', 'instagram_reels'],
+        'youtube': ['youtube_1080p', 'youtube_shorts'],
+    }
+
+    @classmethod
+    def get_publish_set(cls, name: str) -> List[str]:
+        """Get the preset names in a publish set.
+
+        Raises:
+            ValueError: If the set name is not found
+        """
+        if name not in cls.PUBLISH_SETS:
+            available = ', '.join(cls.PUBLISH_SETS.keys())
+            raise ValueError(f"Unknown publish set '{name}'. Available: {available}")
+        return list(cls.PUBLISH_SETS[name])
+
     @classmethod
     def get_preset(cls, name: str) -> VideoFormat:
         """Get a video format preset by name.
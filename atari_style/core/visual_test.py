@@ -13,12 +13,22 @@ Usage:
 
     # Generate diff images
     python -m atari_style.core.visual_test compare joystick_test --save-diff
+
+    # Compare every baseline in the baseline directory, one process per demo
+    python -m atari_style.core.visual_test suite --jobs 4
+
+Only the frames listed in a baseline's metadata are rasterized, and each
+frame is checked against a stored content hash before any pixel diff is
+computed. Diff images are built only for frames that fail (or when
+--save-diff is given and the frame differs at all).
 """
 
 import sys
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 
 try:
     from PIL import Image, ImageChops, ImageDraw
@@ -36,25 +46,33 @@ from .headless_renderer import HeadlessRenderer
 from .demo_video import DEMO_REGISTRY
 
 
-def render_demo_frames(
+def render_selected_frames(
     demo_factory,
     renderer: HeadlessRenderer,
     input_handler: ScriptedInputHandler,
-    total_frames: int,
-) -> List['Image.Image']:
-    """Render frames from a demo using scripted input.
+    frames: Iterable[int],
+) -> Dict[int, 'Image.Image']:
+    """Render only the requested frames from a demo using scripted input.
+
+    Demos keep state between draws, so every frame up to the last requested
+    one is still drawn into the character buffer; only the requested frames
+    are rasterized to images, which is where nearly all the time goes.
 
     Args:
         demo_factory: Factory function(renderer, input_handler) -> demo
         renderer: HeadlessRenderer instance
         input_handler: ScriptedInputHandler with loaded script
-        total_frames: Number of frames to render
+        frames: Frame numbers to capture
 
     Returns:
-        List of PIL Image objects
+        Dict mapping frame number to PIL Image
     """
+    wanted = {f for f in frames if f >= 0}
+    if not wanted:
+        return {}
+
     demo = demo_factory(renderer, input_handler)
-    frame_images = []
+    frame_images = {}
 
     # Start script playback
     input_handler.start()
@@ -62,8 +80,7 @@ def render_demo_frames(
     # Get frame time from script FPS
     frame_time = 1.0 / input_handler.script.fps
 
-    # Render each frame
-    for frame_num in range(total_frames):
+    for frame_num in range(max(wanted) + 1):
         # Update input handler time
         input_handler.current_time = frame_num * frame_time
 
@@ -71,11 +88,48 @@ def render_demo_frames(
         demo.draw()
 
         # Capture as image
-        frame_images.append(renderer.to_image())
+        if frame_num in wanted:
+            frame_images[frame_num] = renderer.to_image()
 
     return frame_images
 
 
+def render_demo_frames(
+    demo_factory,
+    renderer: HeadlessRenderer,
+    input_handler: ScriptedInputHandler,
+    total_frames: int,
+) -> List['Image.Image']:
+    """Render frames from a demo using scripted input.
+
+    Args:
+        demo_factory: Factory function(renderer, input_handler) -> demo
+        renderer: HeadlessRenderer instance
+        input_handler: ScriptedInputHandler with loaded script
+        total_frames: Number of frames to render
+
+    Returns:
+        List of PIL Image objects
+    """
+    frame_images = render_selected_frames(
+        demo_factory, renderer, input_handler, range(total_frames)
+    )
+    return [frame_images[frame_num] for frame_num in range(total_frames)]
+
+
+def image_digest(img: 'Image.Image') -> str:
+    """Content hash of an image's RGB pixels.
+
+    Two images with the same digest are pixel-identical, so a matching
+    digest lets a comparison skip the pixel diff entirely.
+    """
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    digest = hashlib.sha256(f"{img.size[0]}x{img.size[1]}".encode())
+    digest.update(img.tobytes())
+    return digest.hexdigest()
+
+
 class VisualTestConfig:
     """Configuration for visual regression tests."""
 
@@ -179,22 +233,24 @@ def generate_baseline(
     input_handler = ScriptedInputHandler(script=script)
     demo_factory = DEMO_REGISTRY[demo_name]['factory']
 
-    frame_images = render_demo_frames(
+    frame_images = render_selected_frames(
         demo_factory=demo_factory,
         renderer=renderer,
         input_handler=input_handler,
-        total_frames=max(frames) + 1,
+        frames=frames,
     )
 
     # Save selected frames as baselines
     saved_count = 0
+    hashes = {}
     for frame_num in frames:
-        if frame_num >= len(frame_images):
-            print(f"WARNING: Frame {frame_num} not available (only {len(frame_images)} frames rendered)")
+        if frame_num not in frame_images:
+            print(f"WARNING: Frame {frame_num} not available")
             continue
 
         baseline_path = demo_baseline_dir / f"frame_{frame_num:04d}.png"
         frame_images[frame_num].save(baseline_path)
+        hashes[str(frame_num)] = image_digest(frame_images[frame_num])
         print(f"  Saved: {baseline_path.name}")
         saved_count += 1
 
@@ -205,7 +261,8 @@ def generate_baseline(
         'frames': frames,
         'width': width,
         'height': height,
-        'version': '1.0',
+        'hashes': hashes,
+        'version': '1.1',
     }
     metadata_path = demo_baseline_dir / 'metadata.json'
     with open(metadata_path, 'w') as f:
@@ -219,7 +276,7 @@ def compare_images(
     baseline_img: 'Image.Image',
     current_img: 'Image.Image',
     allow_antialiasing: bool = True,
-) -> Tuple[float, 'Image.Image']:
+) -> Tuple[float, Optional['Image.Image']]:
     """Compare two images and generate diff visualization.
 
     Args:
@@ -230,7 +287,35 @@ def compare_images(
     Returns:
         Tuple of (diff_ratio, diff_image)
         diff_ratio: Fraction of differing pixels (0.0-1.0)
-        diff_image: Highlighted diff visualization
+        diff_image: Highlighted diff visualization, or None when the
+            images are identical
+    """
+    baseline_img, current_img, diff_ratio, diff_mask = _diff_pixels(
+        baseline_img, current_img, allow_antialiasing
+    )
+    if diff_mask is None:
+        return diff_ratio, None
+
+    # Generate visualization
+    diff_visual = _create_diff_visualization(
+        baseline_img,
+        current_img,
+        diff_mask,
+    )
+
+    return diff_ratio, diff_visual
+
+
+def _diff_pixels(
+    baseline_img: 'Image.Image',
+    current_img: 'Image.Image',
+    allow_antialiasing: bool,
+) -> Tuple['Image.Image', 'Image.Image', float, Optional['np.ndarray']]:
+    """Measure how much two images differ.
+
+    Returns:
+        Tuple of (baseline_rgb, current_rgb, diff_ratio, diff_mask), where
+        diff_mask is None when the images are byte-identical.
     """
     if baseline_img.size != current_img.size:
         raise ValueError(f"Image size mismatch: {baseline_img.size} vs {current_img.size}")
@@ -241,6 +326,10 @@ def compare_images(
     if current_img.mode != 'RGB':
         current_img = current_img.convert('RGB')
 
+    # Identical images need no pixel diff
+    if baseline_img.tobytes() == current_img.tobytes():
+        return baseline_img, current_img, 0.0, None
+
     # Calculate pixel-wise difference
     diff = ImageChops.difference(baseline_img, current_img)
     diff_array = np.array(diff)
@@ -259,16 +348,9 @@ def compare_images(
     # Calculate diff ratio
     total_pixels = pixel_diffs.size
     diff_pixels = significant_diff_mask.sum()
-    diff_ratio = diff_pixels / total_pixels
+    diff_ratio = float(diff_pixels / total_pixels)
 
-    # Generate visualization
-    diff_visual = _create_diff_visualization(
-        baseline_img,
-        current_img,
-        significant_diff_mask,
-    )
-
-    return diff_ratio, diff_visual
+    return baseline_img, current_img, diff_ratio, significant_diff_mask
 
 
 def _create_diff_visualization(
@@ -367,6 +449,7 @@ def compare_baseline(
         metadata = json.load(f)
 
     frames = metadata['frames']
+    hashes = metadata.get('hashes', {})
 
     # Render current frames
     script = InputScript.from_file(script_path)
@@ -374,11 +457,11 @@ def compare_baseline(
     input_handler = ScriptedInputHandler(script=script)
     demo_factory = DEMO_REGISTRY[demo_name]['factory']
 
-    frame_images = render_demo_frames(
+    frame_images = render_selected_frames(
         demo_factory=demo_factory,
         renderer=renderer,
         input_handler=input_handler,
-        total_frames=max(frames) + 1,
+        frames=frames,
     )
 
     # Compare each frame
@@ -393,31 +476,36 @@ def compare_baseline(
             ))
             continue
 
-        if frame_num >= len(frame_images):
+        if frame_num not in frame_images:
             results.append(VisualTestResult(
                 demo_name, frame_num, False,
                 error=f"Frame {frame_num} not rendered"
             ))
             continue
 
-        # Load baseline
-        baseline_img = Image.open(baseline_path)
         current_img = frame_images[frame_num]
 
+        # Matching content hash: identical pixels, no need to decode the PNG
+        if hashes.get(str(frame_num)) == image_digest(current_img):
+            results.append(VisualTestResult(demo_name, frame_num, True))
+            continue
+
         try:
-            # Compare
-            diff_ratio, diff_img = compare_images(
-                baseline_img,
-                current_img,
-                allow_antialiasing=config.allow_antialiasing,
-            )
+            # Load baseline and measure the difference
+            with Image.open(baseline_path) as baseline_img:
+                baseline_img, current_img, diff_ratio, diff_mask = _diff_pixels(
+                    baseline_img,
+                    current_img,
+                    allow_antialiasing=config.allow_antialiasing,
+                )
 
             # Check threshold
             passed = diff_ratio <= config.threshold
 
-            # Save diff if requested or if failed
+            # Build and save a diff only if requested or if failed
             diff_path = None
-            if save_diffs or not passed:
+            if diff_mask is not None and (save_diffs or not passed):
+                diff_img = _create_diff_visualization(baseline_img, current_img, diff_mask)
                 diff_path = config.diff_dir / demo_name / f"diff_frame_{frame_num:04d}.png"
                 diff_path.parent.mkdir(parents=True, exist_ok=True)
                 diff_img.save(diff_path)
@@ -437,6 +525,65 @@ def compare_baseline(
     return results
 
 
+def discover_baselines(config: VisualTestConfig) -> List[Tuple[str, str]]:
+    """Find every demo with baseline metadata in the baseline directory.
+
+    Returns:
+        Sorted list of (demo_name, script_path) pairs
+    """
+    jobs = []
+    for metadata_path in sorted(config.baseline_dir.glob('*/metadata.json')):
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+        jobs.append((metadata_path.parent.name, metadata['script_path']))
+    return jobs
+
+
+def _compare_job(job) -> List[VisualTestResult]:
+    """Process pool entry point: compare one demo against its baseline."""
+    demo_name, script_path, config, save_diffs, width, height = job
+    try:
+        return compare_baseline(demo_name, script_path, config, save_diffs, width, height)
+    except Exception as e:
+        return [VisualTestResult(demo_name, 0, False, error=str(e))]
+
+
+def run_suite(
+    jobs: List[Tuple[str, str]],
+    config: VisualTestConfig,
+    save_diffs: bool = False,
+    workers: Optional[int] = None,
+    width: int = 120,
+    height: int = 40,
+) -> List[VisualTestResult]:
+    """Compare several demos against their baselines in parallel.
+
+    Each demo renders in its own worker process, so a suite of baselines
+    uses every core instead of rendering demo after demo.
+
+    Args:
+        jobs: (demo_name, script_path) pairs, e.g. from discover_baselines()
+        config: Visual test configuration
+        save_diffs: Save diff images for every differing frame
+        workers: Worker processes (default: one per CPU; 1 runs in-process)
+        width: Terminal width in characters
+        height: Terminal height in characters
+
+    Returns:
+        Results for every frame of every demo, in job order
+    """
+    args = [(demo_name, script_path, config, save_diffs, width, height)
+            for demo_name, script_path in jobs]
+
+    if workers == 1 or len(args) <= 1:
+        per_demo = [_compare_job(job) for job in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            per_demo = list(pool.map(_compare_job, args))
+
+    return [result for results in per_demo for result in results]
+
+
 def print_results(results: List[VisualTestResult], verbose: bool = True):
     """Print test results summary.
 
@@ -462,7 +609,8 @@ def print_results(results: List[VisualTestResult], verbose: bool = True):
 
         reset_code = "\033[0m"
 
-        print(f"{color_code}{status}{reset_code} Frame {result.frame_number:4d}: diff={result.diff_ratio:.4f}")
+        print(f"{color_code}{status}{reset_code} {result.demo_name} frame {result.frame_number:4d}: "
+              f"diff={result.diff_ratio:.4f}")
 
         if verbose and result.error:
             print(f"       Error: {result.error}")
@@ -537,6 +685,38 @@ if __name__ == '__main__':
         help='Disable anti-aliasing tolerance'
     )
 
+    # Suite command
+    suite_parser = subparsers.add_parser(
+        'suite',
+        help='Compare every demo in the baseline directory in parallel'
+    )
+    suite_parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Worker processes (default: one per CPU)'
+    )
+    suite_parser.add_argument(
+        '--save-diff',
+        action='store_true',
+        help='Save diff images'
+    )
+    suite_parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.01,
+        help='Diff threshold (0.0-1.0)'
+    )
+    suite_parser.add_argument(
+        '--baseline-dir',
+        help='Baseline directory'
+    )
+    suite_parser.add_argument(
+        '--no-antialiasing',
+        action='store_true',
+        help='Disable anti-aliasing tolerance'
+    )
+
     args = parser.parse_args()
 
     # Create config
@@ -565,3 +745,17 @@ if __name__ == '__main__':
         )
         passed, failed = print_results(results)
         sys.exit(0 if failed == 0 else 1)
+
+    elif args.command == 'suite':
+        jobs = discover_baselines(config)
+        if not jobs:
+            print(f"ERROR: No baselines found in {config.baseline_dir}")
+            sys.exit(1)
+        results = run_suite(
+            jobs,
+            config,
+            save_diffs=args.save_diff,
+            workers=args.jobs,
+        )
+        passed, failed = print_results(results)
+        sys.exit(0 if failed == 0 else 1)
@@ -5,6 +5,9 @@ import random
 import math
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
+from ...core.spatial_grid import SpatialGrid
 
 
 class PowerUp:
@@ -151,6 +154,8 @@ class Breakout:
 
         # Bricks
         self.bricks = []
+        self.brick_grid = SpatialGrid()  # Intact bricks by cell
+        self.bricks_remaining = 0  # Intact destructible bricks
         self._create_level(1)
 
         # Power-ups
@@ -173,6 +178,8 @@ class Breakout:
     def _create_level(self, level):
         """Create brick layout for level."""
         self.bricks = []
+        self.brick_grid.clear()
+        self.bricks_remaining = 0
 
         # Determine layout pattern
         patterns = ['full', 'checkerboard', 'pyramid', 'diamonds', 'waves']
@@ -215,7 +222,11 @@ class Breakout:
                     brick_type = 'unbreakable'
 
                 if create_brick:
-                    self.bricks.append(Brick(x, y, row, brick_type))
+                    brick = Brick(x, y, row, brick_type)
+                    self.bricks.append(brick)
+                    self.brick_grid.insert(brick, x, y, brick.width, 2)
+                    if not brick.indestructible:
+                        self.bricks_remaining += 1
 
     def _reset_paddle(self):
         """Reset paddle to normal state."""
@@ -324,15 +335,10 @@ class Breakout:
                 laser.update(dt)
 
                 # Check laser-brick collision
-                for brick in self.bricks:
-                    if brick.destroyed or brick.indestructible:
-                        continue
-
-                    if (brick.x <= laser.x < brick.x + brick.width and
-                        brick.y <= laser.y < brick.y + 2):
-                        self._destroy_brick(brick, laser.x, laser.y)
-                        laser.active = False
-                        break
+                brick = self.brick_grid.first(laser.x, laser.y, lambda b: not b.indestructible)
+                if brick is not None:
+                    self._destroy_brick(brick, laser.x, laser.y)
+                    laser.active = False
 
                 # Remove if off screen
                 if laser.y < 0:
@@ -341,8 +347,7 @@ class Breakout:
             self.lasers = [l for l in self.lasers if l.active]
 
         # Check victory
-        destroyable_bricks = [b for b in self.bricks if not b.destroyed and not b.indestructible]
-        if not destroyable_bricks:
+        if self.bricks_remaining == 0:
             self.state = self.STATE_VICTORY
 
     def _handle_ball_collisions(self, ball):
@@ -383,29 +388,21 @@ class Breakout:
             if ball.vy > 0:
                 ball.vy = -ball.vy
 
-        # Brick collision
-        for brick in self.bricks:
-            if brick.destroyed:
-                continue
-
-            # Simple AABB collision
-            if (brick.x <= ball_int_x < brick.x + brick.width and
-                brick.y <= ball_int_y < brick.y + 2):
-
-                if not brick.indestructible:
-                    self._destroy_brick(brick, ball.x, ball.y)
+        # Brick collision (lookup of the ball's cell)
+        brick = self.brick_grid.first(ball_int_x, ball_int_y)
+        if brick is not None:
+            if not brick.indestructible:
+                self._destroy_brick(brick, ball.x, ball.y)
 
-                # Determine bounce direction
-                # Simple approach: reverse vertical direction
-                ball.vy = -ball.vy
-
-                # Slight speed increase (max cap)
-                speed = math.sqrt(ball.vx**2 + ball.vy**2)
-                if speed < 40:
-                    ball.vx *= 1.02
-                    ball.vy *= 1.02
+            # Determine bounce direction
+            # Simple approach: reverse vertical direction
+            ball.vy = -ball.vy
 
-                break
+            # Slight speed increase (max cap)
+            speed = math.sqrt(ball.vx**2 + ball.vy**2)
+            if speed < 40:
+                ball.vx *= 1.02
+                ball.vy *= 1.02
 
     def _destroy_brick(self, brick, hit_x, hit_y):
         """Destroy or damage a brick."""
@@ -413,6 +410,8 @@ class Breakout:
 
         if brick.hits_remaining <= 0:
             brick.destroyed = True
+            self.brick_grid.remove(brick)
+            self.bricks_remaining -= 1
             self.score += brick.get_value()
             self.combo += 1
 
@@ -618,16 +617,11 @@ class Breakout:
         self.renderer.enter_fullscreen()
 
         try:
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             running = True
 
             while running:
-                current_time = time.time()
-                dt = current_time - self.last_time
-                self.last_time = current_time
-
-                # Cap dt to prevent huge jumps
-                dt = min(dt, 0.1)
-
                 # Handle input
                 input_type = self.input_handler.get_input(timeout=0.001)
 
@@ -637,18 +631,18 @@ class Breakout:
                     if not self.handle_input(input_type):
                         running = False
 
-                # Update paddle (needs continuous input)
-                if self.state in [self.STATE_SERVING, self.STATE_PLAYING]:
-                    self.update_paddle(dt)
+                for dt in scheduler.updates():
+                    # Update paddle (needs continuous input)
+                    if self.state in [self.STATE_SERVING, self.STATE_PLAYING]:
+                        self.update_paddle(dt)
 
-                # Update game
-                self.update(dt)
+                    # Update game
+                    self.update(dt)
 
                 # Draw
                 self.draw()
 
-                # Frame rate limiting (60 FPS)
-                time.sleep(0.016)
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
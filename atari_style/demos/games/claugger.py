@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -1135,15 +1137,11 @@ class Claugger:
                 if not self._wait_for_resize():
                     return
 
-            self.last_time = time.time()
+            scheduler = FrameScheduler(target_fps=30, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             running = True
 
             while running:
-                current_time = time.time()
-                dt = current_time - self.last_time
-                self.last_time = current_time
-                dt = min(dt, 0.1)  # Cap to avoid spiral of death
-
                 input_type = self.input_handler.get_input(timeout=0.001)
 
                 # Always record input for Konami Code detection
@@ -1169,9 +1167,10 @@ class Claugger:
                     elif input_type == InputType.RIGHT:
                         self.move_chicken(1, 0)
 
-                self.update(dt)
+                for dt in scheduler.updates():
+                    self.update(dt)
                 self.draw()
-                time.sleep(0.033)  # ~30 FPS
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
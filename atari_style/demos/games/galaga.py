@@ -4,6 +4,9 @@ import time
 import random
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
+from ...core.spatial_grid import SpatialGrid
 
 
 class Bullet:
@@ -233,6 +236,7 @@ class Galaga:
 
         # Enemies
         self.enemies = []
+        self.enemy_grid = SpatialGrid()  # Active enemies by cell
         self.formation_offset_x = 0
         self.formation_offset_y = 0
         self.formation_direction = 1  # 1 = right, -1 = left
@@ -269,6 +273,7 @@ class Galaga:
     def _create_wave(self, wave):
         """Create enemy formation for wave."""
         self.enemies = []
+        self.enemy_grid.clear()
 
         # Reset formation
         self.formation_offset_x = 0
@@ -298,6 +303,7 @@ class Galaga:
 
                 enemy = Enemy(x, y, enemy_type)
                 self.enemies.append(enemy)
+                self.enemy_grid.insert(enemy, enemy.x, enemy.y)
 
         # Increase difficulty
         self.formation_speed = 5 + wave * 0.5
@@ -352,6 +358,7 @@ class Galaga:
         for enemy in self.enemies:
             if enemy.active:
                 enemy.update(dt, self.formation_offset_x, self.formation_offset_y)
+                self.enemy_grid.move(enemy, enemy.x, enemy.y)
 
                 # Random firing
                 if random.random() < enemy.info['fire_rate'] * dt:
@@ -400,7 +407,7 @@ class Galaga:
         self._check_collisions()
 
         # Check wave complete
-        if all(not e.active for e in self.enemies):
+        if not self.enemy_grid:
             self.state = self.STATE_VICTORY
             self.wave += 1
 
@@ -411,26 +418,19 @@ class Galaga:
             if not bullet.active:
                 continue
 
-            bullet_hit = False
-
-            # Check enemy hits
-            for enemy in self.enemies:
-                if not enemy.active:
-                    continue
-
-                if (int(bullet.x) == int(enemy.x) and
-                    int(bullet.y) == int(enemy.y)):
-                    # Hit!
-                    enemy.active = False
-                    bullet.active = False
-                    bullet_hit = True
-                    self.score += enemy.info['value']
-                    self.shots_hit += 1
-                    self.explosions.append(Explosion(enemy.x, enemy.y))
-                    break
+            # Check enemy hits (only enemies in the bullet's cell)
+            enemy = self.enemy_grid.first(bullet.x, bullet.y)
+            if enemy is not None:
+                # Hit!
+                enemy.active = False
+                self.enemy_grid.remove(enemy)
+                bullet.active = False
+                self.score += enemy.info['value']
+                self.shots_hit += 1
+                self.explosions.append(Explosion(enemy.x, enemy.y))
 
             # Check UFO hit
-            if not bullet_hit and self.ufo.active:
+            elif self.ufo.active:
                 if (int(bullet.x) >= int(self.ufo.x) and
                     int(bullet.x) < int(self.ufo.x) + 4 and
                     int(bullet.y) == int(self.ufo.y)):
@@ -462,6 +462,7 @@ class Galaga:
                 int(enemy.y) >= self.player.y - 1):
                 # Collision
                 enemy.active = False
+                self.enemy_grid.remove(enemy)
                 self.explosions.append(Explosion(self.player.x, self.player.y))
                 self.state = self.STATE_DEATH
                 return
@@ -595,16 +596,11 @@ class Galaga:
         self.renderer.enter_fullscreen()
 
         try:
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             running = True
 
             while running:
-                current_time = time.time()
-                dt = current_time - self.last_time
-                self.last_time = current_time
-
-                # Cap dt
-                dt = min(dt, 0.1)
-
                 # Handle input
                 input_type = self.input_handler.get_input(timeout=0.001)
 
@@ -618,18 +614,16 @@ class Galaga:
                         self.wave_start_timer = 2.0
                         self.state = self.STATE_WAVE_START
 
-                # Continuous input for movement
-                if self.state == self.STATE_PLAYING:
-                    self.handle_input(dt)
-
-                # Update
-                self.update(dt)
+                # Fixed-step simulation with continuous input for movement
+                for dt in scheduler.updates():
+                    if self.state == self.STATE_PLAYING:
+                        self.handle_input(dt)
+                    self.update(dt)
 
                 # Draw
                 self.draw()
 
-                # Frame rate (60 FPS)
-                time.sleep(0.016)
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
@@ -112,6 +112,46 @@ class Track:
         return self.segments[index]
 
 
+class RoadProjection:
+    """Per-row perspective lookup tables for the road.
+
+    With a fixed camera height every screen row below the horizon always
+    shows the same depth, so depth, scale and road width are computed
+    once per screen size. Drawing a frame is then one lookup and a few
+    span fills per row, whatever the draw distance.
+    """
+
+    # Road half-width on the bottom row, as a fraction of the screen width
+    ROAD_HALF_WIDTH = 0.45
+
+    def __init__(self, width, height, horizon_y, camera_height, segment_length):
+        """Build tables for rows 1..height below a nominal horizon.
+
+        Args:
+            width, height: Screen size in characters
+            horizon_y: Nominal horizon row; the bottom row sits at the
+                camera's own depth, rows above it recede towards the horizon
+            camera_height: Camera height in world units
+            segment_length: World Z distance per track segment
+        """
+        self.key = (width, height, horizon_y, camera_height, segment_length)
+        reference = max(1, height - 1 - horizon_y)
+
+        # Indexed by rows below the horizon (dy); index 0 is the horizon itself.
+        # Rows past the reference exist for when hills lift the horizon.
+        self.depth = [float('inf')]  # Distance ahead of the camera, in segments
+        self.scale = [0.0]
+        self.half_width = [0]
+        self.car_char = [' ']
+        for dy in range(1, height + 1):
+            z = camera_height * reference / dy
+            scale = dy / reference
+            self.depth.append((z - camera_height) / segment_length)
+            self.scale.append(scale)
+            self.half_width.append(int(scale * width * self.ROAD_HALF_WIDTH))
+            self.car_char.append('█' if scale > 0.5 else '▓' if scale > 0.25 else '▪')
+
+
 class GrandPrix:
     """Main Grand Prix game class."""
 
@@ -162,6 +202,9 @@ class GrandPrix:
         # Camera
         self.camera_height = 1000
         self.draw_distance = 300  # How many segments to draw
+        self.curve_scale = 0.15  # Screen offset per unit of curve at full scale
+        self.hill_pitch = 0.01  # Horizon rows per unit of height change ahead
+        self._projection = None
 
         # Frame timing
         self.last_time = time.time()
@@ -313,89 +356,79 @@ class GrandPrix:
             self.renderer.draw_text(self.width // 2 - len(msg) // 2,
                                     self.height // 2, msg, color)
 
+    def _get_projection(self, horizon_y):
+        """Row lookup tables for the current screen size (rebuilt on resize)."""
+        key = (self.width, self.height, horizon_y,
+               self.camera_height, self.track.segment_length)
+        if self._projection is None or self._projection.key != key:
+            self._projection = RoadProjection(*key)
+        return self._projection
+
     def _draw_racing(self):
         """Draw racing view."""
+        renderer = self.renderer
+        segments = self.track.segments
+        num_segments = len(segments)
+
         # Draw sky
         sky_height = self.height // 3
         for y in range(sky_height):
-            for x in range(self.width):
-                self.renderer.set_pixel(x, y, ' ', Color.CYAN)
-
-        # Draw horizon
-        horizon_y = sky_height
-
-        # Draw road (3D perspective)
-        base_segment = int(self.position)
-
-        for n in range(self.draw_distance):
-            segment_index = (base_segment + n) % len(self.track.segments)
-            segment = self.track.segments[segment_index]
-
-            # 3D projection
-            z = n * self.track.segment_length
-            if z == 0:
-                z = 1  # Avoid division by zero
-
-            # Perspective projection
-            scale = self.camera_height / z
+            renderer.fill_span(0, self.width, y, ' ', Color.CYAN)
 
-            # Road width in screen coordinates
-            road_width = scale * 2000
+        projection = self._get_projection(sky_height)
 
-            # Calculate screen position
-            screen_y = horizon_y + int(scale * segment.height * 0.1)
-            screen_y = max(0, min(screen_y, self.height - 1))
+        # Hills tilt the view: the horizon rises ahead of a climb and
+        # drops ahead of a descent
+        current = self.track.get_segment(self.position)
+        ahead = self.track.get_segment(self.position + 10)
+        pitch = int((ahead.height - current.height) * self.hill_pitch)
+        horizon_y = sky_height - max(-sky_height // 2, min(sky_height // 2, pitch))
 
-            # Calculate horizontal offset from curves
-            curve_offset = segment.world_x - self.track.get_segment(self.position).world_x
-            screen_x_offset = int(scale * curve_offset * 0.5)
-
-            # Road center
-            road_center_x = self.width // 2 + screen_x_offset
-
-            # Draw road segment
-            road_half_width = int(road_width / 2)
-
-            # Grass (sides)
+        opponents_by_segment = {}
+        for opponent in self.opponents:
+            index = int(opponent.position) % num_segments
+            opponents_by_segment.setdefault(index, []).append(opponent)
+
+        # Draw road one scanline at a time, far to near
+        center_x = self.width // 2
+        drawn_segments = set()
+        for y in range(max(0, horizon_y + 1), self.height):
+            dy = y - horizon_y
+            depth = projection.depth[dy]
+            if depth > self.draw_distance:
+                continue
+
+            n = int(self.position + depth)
+            segment_index = n % num_segments
+            segment = segments[segment_index]
+            scale = projection.scale[dy]
+            road_half_width = projection.half_width[dy]
+
+            # Horizontal offset from curves
+            curve_offset = segment.world_x - current.world_x
+            road_center_x = center_x + int(scale * curve_offset * self.curve_scale)
+
+            # Stripes are fixed to the track so they stream past
             grass_color = Color.GREEN if n % 10 < 5 else Color.BRIGHT_GREEN
-
-            # Road surface
             road_color = Color.WHITE if n % 20 < 10 else Color.BRIGHT_WHITE
 
-            # Draw grass left
-            for x in range(max(0, road_center_x - road_half_width * 2),
-                           max(0, road_center_x - road_half_width)):
-                if 0 <= x < self.width:
-                    self.renderer.set_pixel(x, screen_y, '░', grass_color)
-
-            # Draw road
-            for x in range(max(0, road_center_x - road_half_width),
-                           min(self.width, road_center_x + road_half_width)):
-                if 0 <= x < self.width:
-                    self.renderer.set_pixel(x, screen_y, '▓', road_color)
-
-            # Draw grass right
-            for x in range(min(self.width, road_center_x + road_half_width),
-                           min(self.width, road_center_x + road_half_width * 2)):
-                if 0 <= x < self.width:
-                    self.renderer.set_pixel(x, screen_y, '░', grass_color)
+            left = road_center_x - road_half_width
+            right = road_center_x + road_half_width
+            renderer.fill_span(left - road_half_width, left, y, '░', grass_color)
+            renderer.fill_span(left, right, y, '▓', road_color)
+            renderer.fill_span(right, right + road_half_width, y, '░', grass_color)
 
             # Draw lane markers
             if n % 15 < 8:
-                marker_x = road_center_x
-                if 0 <= marker_x < self.width:
-                    self.renderer.set_pixel(marker_x, screen_y, '│', Color.YELLOW)
-
-            # Draw opponent cars on this segment
-            for opponent in self.opponents:
-                opp_segment_index = int(opponent.position) % len(self.track.segments)
-                if opp_segment_index == segment_index:
-                    # Draw opponent
+                renderer.set_pixel(road_center_x, y, '│', Color.YELLOW)
+
+            # Draw opponent cars on the farthest row showing their segment
+            if segment_index in opponents_by_segment and segment_index not in drawn_segments:
+                drawn_segments.add(segment_index)
+                car_char = projection.car_char[dy]
+                for opponent in opponents_by_segment[segment_index]:
                     opp_x = road_center_x + int(opponent.lateral * road_half_width)
-                    if 0 <= opp_x < self.width and 0 <= screen_y < self.height:
-                        # Scale car size by distance
-                        car_char = '█' if scale > 0.05 else '▓' if scale > 0.02 else '▪'
-                        self.renderer.set_pixel(opp_x, screen_y, car_char, opponent.color)
+                    renderer.set_pixel(opp_x, y, car_char, opponent.color)
 
         # Draw player car (at bottom center)
         player_y = self.height - 5
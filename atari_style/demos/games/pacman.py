@@ -1,10 +1,20 @@
 """Pac-Man style maze chase game with ghost AI."""
 
-import time
+import hashlib
+import os
 import random
+import struct
+import time
+from array import array
 from collections import deque
+from pathlib import Path
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.config import CONFIG_DIR
+
+
+# Precomputed ghost navigation tables, one file per maze layout
+NAV_CACHE_DIR = CONFIG_DIR / 'cache' / 'pacman'
 
 
 class Maze:
@@ -53,6 +63,7 @@ class Maze:
         self.height = len(self.MAZE_DATA)
         self.tiles = [list(row) for row in self.MAZE_DATA]
         self.pellet_count = self._count_pellets()
+        self._navigator = None
 
     def _count_pellets(self):
         """Count total pellets (excluding power pellets)."""
@@ -82,6 +93,203 @@ class Maze:
         tile = self.get_tile(x, y)
         return tile != self.WALL or tile == self.GHOST_GATE
 
+    @property
+    def navigator(self):
+        """Shortest-path tables for this maze's walls (built on first use)."""
+        if self._navigator is None:
+            self._navigator = MazeNavigator.for_layout(self.MAZE_DATA, self.WALL)
+        return self._navigator
+
+
+class MazeNavigator:
+    """All-pairs shortest-path tables for a static maze layout.
+
+    Walls never change during a game, so the BFS from every walkable
+    tile is done once per layout. Afterwards the ghosts' per-tick
+    steering is a table lookup: ``next_direction(start, target)`` gives
+    the first step of a shortest path and ``distance(a, b)`` its length.
+    Tables are cached in memory per layout and on disk (keyed by a hash
+    of the layout) so later runs skip the build entirely.
+    """
+
+    # Step order also breaks ties between equally short paths
+    DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+    UNREACHABLE = 0xFFFF
+    NO_MOVE = 0xFF
+
+    CACHE_MAGIC = b'PMNV'
+    CACHE_VERSION = 1
+    _HEADER = struct.Struct('<4sHHHI')  # magic, version, width, height, cells
+
+    _loaded = {}  # layout digest -> MazeNavigator
+
+    def __init__(self, layout, wall='#', cells=None, dist=None, step=None):
+        """Build (or adopt precomputed) tables for ``layout``.
+
+        Args:
+            layout: Maze rows; every character except ``wall`` is walkable
+            wall: Wall tile character
+            cells, dist, step: Precomputed tables (from the disk cache)
+        """
+        self.width = len(layout[0])
+        self.height = len(layout)
+        if cells is None:
+            cells = [(x, y) for y, row in enumerate(layout)
+                     for x, tile in enumerate(row) if tile != wall]
+        self.cells = cells
+        self.index = {cell: i for i, cell in enumerate(cells)}
+        if dist is None:
+            dist, step = self._build()
+        self.dist = dist  # dist[target * n + start]
+        self.step = step  # DIRECTIONS index of the first move, same layout
+        self._nearest = self._nearest_cells()
+
+    @staticmethod
+    def layout_digest(layout, wall='#'):
+        """Stable key for a layout's walkable shape."""
+        shape = '\n'.join(''.join('#' if t == wall else ' ' for t in row) for row in layout)
+        return hashlib.sha256(shape.encode()).hexdigest()[:16]
+
+    @classmethod
+    def for_layout(cls, layout, wall='#', cache_dir=None):
+        """Navigator for ``layout``, loaded from memory or disk when possible."""
+        key = cls.layout_digest(layout, wall)
+        navigator = cls._loaded.get(key)
+        if navigator is not None:
+            return navigator
+
+        path = Path(cache_dir if cache_dir is not None else NAV_CACHE_DIR) / f'nav-{key}.bin'
+        navigator = cls._load(path, layout)
+        if navigator is None:
+            navigator = cls(layout, wall)
+            navigator._save(path)
+        cls._loaded[key] = navigator
+        return navigator
+
+    def _neighbors(self, i):
+        x, y = self.cells[i]
+        index = self.index
+        for d, (dx, dy) in enumerate(self.DIRECTIONS):
+            j = index.get((x + dx, y + dy))
+            if j is not None:
+                yield d, j
+
+    def _build(self):
+        n = len(self.cells)
+        adjacency = [list(self._neighbors(i)) for i in range(n)]
+        dist = array('H', [self.UNREACHABLE]) * (n * n)
+        step = bytearray([self.NO_MOVE]) * (n * n)
+
+        # Undirected graph: a BFS out of each target gives every start's
+        # distance to it, and the first move is any neighbor one closer.
+        for target in range(n):
+            base = target * n
+            row = [self.UNREACHABLE] * n
+            row[target] = 0
+            queue = deque([target])
+            while queue:
+                i = queue.popleft()
+                d = row[i] + 1
+                for _, j in adjacency[i]:
+                    if row[j] == self.UNREACHABLE:
+                        row[j] = d
+                        queue.append(j)
+            dist[base:base + n] = array('H', row)
+            for start in range(n):
+                d = row[start]
+                if d == self.UNREACHABLE or d == 0:
+                    continue
+                for direction, j in adjacency[start]:
+                    if row[j] == d - 1:
+                        step[base + start] = direction
+                        break
+        return dist, step
+
+    def _nearest_cells(self):
+        """Map every grid position to the index of the closest walkable cell."""
+        nearest = [-1] * (self.width * self.height)
+        queue = deque()
+        for i, (x, y) in enumerate(self.cells):
+            nearest[y * self.width + x] = i
+            queue.append((x, y))
+        while queue:
+            x, y = queue.popleft()
+            i = nearest[y * self.width + x]
+            for dx, dy in self.DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.width and 0 <= ny < self.height and nearest[ny * self.width + nx] < 0:
+                    nearest[ny * self.width + nx] = i
+                    queue.append((nx, ny))
+        return nearest
+
+    def cell_index(self, pos):
+        """Index of the walkable cell at, or closest to, ``pos``.
+
+        Off-map positions are clamped to the grid first, so any target
+        a ghost computes (e.g. several tiles ahead of the player) maps
+        to a reachable tile.
+        """
+        x = min(max(int(pos[0]), 0), self.width - 1)
+        y = min(max(int(pos[1]), 0), self.height - 1)
+        return self._nearest[y * self.width + x]
+
+    def next_direction(self, start, target):
+        """First move (dx, dy) of a shortest path, or None if already there."""
+        i = self.index.get((int(start[0]), int(start[1])))
+        if i is None:
+            i = self.cell_index(start)
+        d = self.step[self.cell_index(target) * len(self.cells) + i]
+        return None if d == self.NO_MOVE else self.DIRECTIONS[d]
+
+    def distance(self, a, b):
+        """Shortest path length in tiles between two positions (None if unreachable)."""
+        d = self.dist[self.cell_index(b) * len(self.cells) + self.cell_index(a)]
+        return None if d == self.UNREACHABLE else d
+
+    def _save(self, path):
+        """Write the tables atomically; a read-only cache dir is not an error."""
+        n = len(self.cells)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(self._HEADER.pack(self.CACHE_MAGIC, self.CACHE_VERSION,
+                                          self.width, self.height, n))
+                f.write(array('H', [c for cell in self.cells for c in cell]).tobytes())
+                f.write(self.dist.tobytes())
+                f.write(self.step)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _load(cls, path, layout):
+        """Read cached tables, or None if missing, stale or corrupt."""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) < cls._HEADER.size:
+            return None
+        magic, version, width, height, n = cls._HEADER.unpack_from(data)
+        if (magic, version, width, height) != (cls.CACHE_MAGIC, cls.CACHE_VERSION,
+                                               len(layout[0]), len(layout)):
+            return None
+        offset = cls._HEADER.size
+        sizes = (2 * 2 * n, 2 * n * n, n * n)
+        if len(data) != offset + sum(sizes):
+            return None
+        coords = array('H')
+        coords.frombytes(data[offset:offset + sizes[0]])
+        offset += sizes[0]
+        dist = array('H')
+        dist.frombytes(data[offset:offset + sizes[1]])
+        offset += sizes[1]
+        step = bytearray(data[offset:])
+        cells = list(zip(coords[0::2], coords[1::2]))
+        return cls(layout, cells=cells, dist=dist, step=step)
+
 
 class Entity:
     """Base class for player and ghosts."""
@@ -146,42 +354,25 @@ class Ghost(Entity):
         self.scatter_target = scatter_target  # Target corner in scatter mode
         self.mode = self.MODE_SCATTER
         self.spawn_pos = (x, y)
-        self.path = []
-        self.path_update_timer = 0
+        self.target = None
+        self.target_update_timer = 0
 
     def update(self, dt, maze, player_pos, player_direction, other_ghosts):
         """Update ghost AI."""
         super().update(dt)
 
-        # Update path periodically
-        self.path_update_timer += dt
-        if self.path_update_timer >= 0.5:  # Recalculate path every 0.5s
-            self.path_update_timer = 0
-            target = self._get_target(player_pos, player_direction, other_ghosts)
-            self.path = self._find_path(maze, target)
-
-        # Follow path
-        if self.path:
-            next_tile = self.path[0]
-            tx, ty = next_tile
-            gx, gy = self.get_tile_pos()
-
-            # Check if reached next waypoint
-            if (gx, gy) == (tx, ty):
-                self.path.pop(0)
-                if self.path:
-                    next_tile = self.path[0]
-                    tx, ty = next_tile
-
-            # Move toward next waypoint
-            if gx < tx:
-                self.direction = (1, 0)
-            elif gx > tx:
-                self.direction = (-1, 0)
-            elif gy < ty:
-                self.direction = (0, 1)
-            elif gy > ty:
-                self.direction = (0, -1)
+        # Targets are cheap to recompute, so track the player every tick.
+        # Frightened ghosts wander to a random tile that changes every 0.5s.
+        self.target_update_timer += dt
+        if (self.mode != self.MODE_FRIGHTENED or self.target is None
+                or self.target_update_timer >= 0.5):
+            self.target_update_timer = 0
+            self.target = self._get_target(player_pos, player_direction, other_ghosts)
+
+        # Steer along a shortest path with a constant-time table lookup
+        direction = maze.navigator.next_direction(self.get_tile_pos(), self.target)
+        if direction is not None:
+            self.direction = direction
 
     def _get_target(self, player_pos, player_direction, other_ghosts):
         """Get target tile based on ghost personality."""
@@ -226,35 +417,6 @@ class Ghost(Entity):
 
         return player_pos
 
-    def _find_path(self, maze, target):
-        """Find path to target using BFS (simpler than A*)."""
-        start = self.get_tile_pos()
-        target = (int(target[0]), int(target[1]))
-
-        # BFS
-        queue = deque([(start, [start])])
-        visited = {start}
-
-        while queue:
-            (x, y), path = queue.popleft()
-
-            if (x, y) == target:
-                return path[1:]  # Exclude current position
-
-            # Try all directions
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                nx, ny = x + dx, y + dy
-
-                if (nx, ny) not in visited and maze.is_ghost_walkable(nx, ny):
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), path + [(nx, ny)]))
-
-            # Limit search depth
-            if len(visited) > 200:
-                break
-
-        return []
-
     def set_frightened(self):
         """Enter frightened mode."""
         self.mode = self.MODE_FRIGHTENED
@@ -12,15 +12,16 @@ Usage:
 
 import os
 import math
-import subprocess
-import tempfile
-import shutil
 import platform
-from typing import Tuple, List, Generator
+from typing import Tuple, List, Generator, Optional
 from dataclasses import dataclass
 from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from ..core import curves
+from ..core.gif_encoder import GifPalette, GifWriter
+
 
 # Terminal color palette (Dracula-inspired)
 COLOR_RGB = {
@@ -39,6 +40,7 @@ COLOR_RGB = {
     'bright_cyan': (164, 255, 255),
     'bright_white': (255, 255, 255),
 }
+DEFAULT_RGB = COLOR_RGB['white']
 
 # Rainbow palette for Lissajous
 RAINBOW = ['red', 'yellow', 'green', 'cyan', 'blue', 'magenta']
@@ -155,7 +157,7 @@ class TerminalCanvas:
                     continue
 
                 color_name = self.color_buffer[y][x]
-                rgb = COLOR_RGB.get(color_name, (248, 248, 242))
+                rgb = COLOR_RGB.get(color_name, DEFAULT_RGB)
 
                 px = x * self.cell_width
                 py = y * self.cell_height
@@ -187,47 +189,24 @@ def draw_lissajous(canvas: TerminalCanvas, t: float, a: float, b: float, delta:
     scale_x = canvas.cols // 3
     scale_y = canvas.rows // 3
 
-    # Draw trails first (older = dimmer)
+    # Draw trails first (older = dimmer), then the current curve on top.
+    # Row k of the sample grid is trail step trail_length-1-k; the last
+    # row (step 0) is the bright head.
     trail_chars = ['●', '○', '◦', '·', '·', '.', '.', '.']
+    steps = np.arange(max(trail_length, 1) - 1, -1, -1)
+    x, y = curves.lissajous(points, a, b, delta, t - steps * 0.02)
 
-    for trail in range(trail_length - 1, -1, -1):
-        trail_t = t - trail * 0.02  # Each trail step is slightly in the past
-        alpha = 1.0 - (trail / trail_length)  # Fade factor
-
-        for i in range(points):
-            angle = (i / points) * 2 * math.pi
-
-            x = math.sin(a * angle + trail_t)
-            y = math.sin(b * angle + delta + trail_t * 0.5)
-
-            screen_x = int(cx + x * scale_x * 1.5)
-            screen_y = int(cy + y * scale_y * 0.8)
-
-            # Only draw if not at current position (avoid overlap with bright head)
-            if trail > 0:
-                color_idx = int((i / points) * len(palette))
-                color = palette[color_idx % len(palette)]
-
-                # Use dimmer character for trails
-                char_idx = min(trail, len(trail_chars) - 1)
-                char = trail_chars[char_idx]
-
-                canvas.set_pixel(screen_x, screen_y, char, color)
+    screen_x = (cx + x * scale_x * 1.5).astype(np.int64)
+    screen_y = (cy + y * scale_y * 0.8).astype(np.int64)
 
-    # Draw the current (brightest) curve on top
-    for i in range(points):
-        angle = (i / points) * 2 * math.pi
+    step_chars = [trail_chars[min(step, len(trail_chars) - 1)] for step in steps.tolist()]
+    step_chars[-1] = '●'
+    color_idx = (curves.curve_fraction(points) * len(palette)).astype(np.int64) % len(palette)
 
-        x = math.sin(a * angle + t)
-        y = math.sin(b * angle + delta + t * 0.5)
-
-        screen_x = int(cx + x * scale_x * 1.5)
-        screen_y = int(cy + y * scale_y * 0.8)
-
-        color_idx = int((i / points) * len(palette))
-        color = palette[color_idx % len(palette)]
-
-        canvas.set_pixel(screen_x, screen_y, '●', color)
+    xs, ys = screen_x.ravel().tolist(), screen_y.ravel().tolist()
+    for idx in curves.last_writes(screen_x, screen_y, canvas.cols, canvas.rows).tolist():
+        step, i = divmod(idx, points)
+        canvas.set_pixel(xs[idx], ys[idx], step_chars[step], palette[color_idx[i]])
 
 
 def ease_in_out_cubic(t: float) -> float:
@@ -462,75 +441,46 @@ def generate_showcase_frames(canvas: TerminalCanvas, fps: int, theme: str = 'oce
             frame_num += 1
 
 
-def render_gif(output_path: str, frames: Generator[Image.Image, None, None],
-               fps: int = 15, total_frames: int = 0) -> bool:
-    """Render frames to GIF using two-pass palette optimization."""
+def terminal_palette(canvas: TerminalCanvas, ramps=()) -> GifPalette:
+    """GIF palette covering every color a TerminalCanvas can draw."""
+    colors = list(COLOR_RGB.values()) + [DEFAULT_RGB]
+    return GifPalette(canvas.bg_color, colors, ramps=ramps)
 
-    # Find ffmpeg
-    ffmpeg_cmd = 'ffmpeg'
-    if platform.system() == 'Windows':
-        scoop_ffmpeg = os.path.expanduser('~/scoop/apps/ffmpeg/current/bin/ffmpeg.exe')
-        if os.path.exists(scoop_ffmpeg):
-            ffmpeg_cmd = scoop_ffmpeg
 
-    # Create temp directory for frames
-    temp_dir = tempfile.mkdtemp(prefix='lissajous_')
+def render_gif(output_path: str, frames: Generator[Image.Image, None, None],
+               fps: int = 15, total_frames: int = 0,
+               palette: Optional[GifPalette] = None) -> bool:
+    """Encode frames to GIF against the terminal color palette.
 
-    print(f"Rendering frames to: {temp_dir}")
+    Frames are quantized and delta-encoded in-process as they are
+    generated; no temp files or ffmpeg passes are involved.
 
-    try:
-        # Save frames
-        frame_count = 0
-        for i, frame in enumerate(frames):
-            frame_path = os.path.join(temp_dir, f"frame_{i:05d}.png")
-            frame.save(frame_path)
-            frame_count += 1
+    Args:
+        output_path: Output GIF path
+        frames: Frame generator
+        fps: Frames per second
+        total_frames: Unused; kept for callers passing a frame count
+        palette: GIF palette (default: terminal_palette of a default canvas)
+    """
+    if palette is None:
+        palette = terminal_palette(TerminalCanvas(1, 1))
 
+    print("Encoding GIF (fixed terminal palette)...")
+    with GifWriter(output_path, palette, fps=fps) as gif:
+        for i, frame in enumerate(frames):
+            gif.add_frame(frame)
             if (i + 1) % 30 == 0:
                 print(f"  Frame {i + 1}...")
 
-        print(f"Total frames: {frame_count}")
-        print("Encoding GIF (two-pass palette)...")
-
-        frame_pattern = os.path.join(temp_dir, 'frame_%05d.png')
-        palette_path = os.path.join(temp_dir, 'palette.png')
-
-        # Pass 1: Generate optimal palette
-        palette_cmd = [
-            ffmpeg_cmd, '-y',
-            '-framerate', str(fps),
-            '-i', frame_pattern,
-            '-vf', 'palettegen=stats_mode=diff',
-            palette_path
-        ]
-
-        result = subprocess.run(palette_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Palette generation failed: {result.stderr}")
-            return False
-
-        # Pass 2: Encode GIF with palette
-        gif_cmd = [
-            ffmpeg_cmd, '-y',
-            '-framerate', str(fps),
-            '-i', frame_pattern,
-            '-i', palette_path,
-            '-lavfi', 'paletteuse=dither=bayer:bayer_scale=5',
-            output_path
-        ]
-
-        result = subprocess.run(gif_cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"GIF encoding failed: {result.stderr}")
-            return False
-
-        size = os.path.getsize(output_path) / 1024
-        print(f"Success! {output_path} ({size:.1f} KB)")
-        return True
+    frame_count = gif.frames_written + gif.frames_merged
+    if frame_count == 0:
+        print("No frames to encode")
+        return False
 
-    finally:
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    print(f"Total frames: {frame_count} ({gif.frames_merged} merged)")
+    size = os.path.getsize(output_path) / 1024
+    print(f"Success! {output_path} ({size:.1f} KB)")
+    return True
 
 
 def main():
@@ -592,7 +542,7 @@ def main():
         frames = generate_showcase_frames(canvas, args.fps, args.showcase)
 
     # Render to GIF
-    success = render_gif(args.output, frames, args.fps)
+    success = render_gif(args.output, frames, args.fps, palette=terminal_palette(canvas))
     return 0 if success else 1
 
 
@@ -226,10 +226,14 @@ class Canvas:
         self.height = height
         self.canvas = [[' ' for _ in range(width)] for _ in range(height)]
         self.colors = [[Color.WHITE for _ in range(width)] for _ in range(height)]
+        # (x, y) -> (char, color) before the current edit, while recording
+        self.changes = None
 
     def set_pixel(self, x, y, char, color):
         """Set pixel on canvas."""
         if 0 <= x < self.width and 0 <= y < self.height:
+            if self.changes is not None and (x, y) not in self.changes:
+                self.changes[(x, y)] = (self.canvas[y][x], self.colors[y][x])
             self.canvas[y][x] = char
             self.colors[y][x] = color
 
@@ -241,6 +245,11 @@ class Canvas:
 
     def clear(self):
         """Clear canvas."""
+        if self.changes is not None:
+            for y, (row, colors) in enumerate(zip(self.canvas, self.colors)):
+                for x, (char, color) in enumerate(zip(row, colors)):
+                    if (char != ' ' or color != Color.WHITE) and (x, y) not in self.changes:
+                        self.changes[(x, y)] = (char, color)
         self.canvas = [[' ' for _ in range(self.width)] for _ in range(self.height)]
         self.colors = [[Color.WHITE for _ in range(self.width)] for _ in range(self.height)]
 
@@ -251,6 +260,17 @@ class Canvas:
         new_canvas.colors = [row[:] for row in self.colors]
         return new_canvas
 
+    def snapshot(self):
+        """Compact immutable copy of the contents (one string per row)."""
+        return (tuple(''.join(row) for row in self.canvas),
+                tuple(tuple(row) for row in self.colors))
+
+    def restore(self, snapshot):
+        """Replace the contents with a snapshot() result."""
+        rows, colors = snapshot
+        self.canvas = [list(row) for row in rows]
+        self.colors = [list(row) for row in colors]
+
     def to_text(self):
         """Export as plain text."""
         lines = []
@@ -303,6 +323,119 @@ class Canvas:
         return '\n'.join(lines)
 
 
+class CanvasEdit:
+    """One undo step: the cells an operation changed.
+
+    Small edits keep (x, y, old_char, old_color, new_char, new_color) per
+    changed cell. Edits touching a large part of the canvas (clear, big
+    fills) store compact before/after snapshots instead, which are both
+    smaller and faster to apply than per-cell records at that size.
+    """
+
+    # Fraction of the canvas above which an edit is stored as snapshots
+    SNAPSHOT_FRACTION = 0.25
+
+    def __init__(self, canvas, before):
+        self.cells = tuple(
+            (x, y, old_char, old_color, canvas.canvas[y][x], canvas.colors[y][x])
+            for (x, y), (old_char, old_color) in before.items()
+            if (old_char, old_color) != (canvas.canvas[y][x], canvas.colors[y][x])
+        )
+        self.before = self.after = None
+        if len(self.cells) > canvas.width * canvas.height * self.SNAPSHOT_FRACTION:
+            self.after = canvas.snapshot()
+            self.undo(canvas)
+            self.before = canvas.snapshot()
+            canvas.restore(self.after)
+            self.cells = ()
+
+    def __bool__(self):
+        return bool(self.cells) or self.after is not None
+
+    def undo(self, canvas):
+        """Put the changed cells back to their previous contents."""
+        if self.before is not None:
+            canvas.restore(self.before)
+            return
+        for x, y, old_char, old_color, _, _ in self.cells:
+            canvas.canvas[y][x] = old_char
+            canvas.colors[y][x] = old_color
+
+    def redo(self, canvas):
+        """Apply the edit again."""
+        if self.after is not None:
+            canvas.restore(self.after)
+            return
+        for x, y, _, _, new_char, new_color in self.cells:
+            canvas.canvas[y][x] = new_char
+            canvas.colors[y][x] = new_color
+
+
+class UndoHistory:
+    """Delta-based undo/redo for a Canvas.
+
+    An edit is recorded between begin() and end(): the canvas notes the
+    previous contents of each cell the first time it is written, and
+    end() keeps only cells that actually changed. extend() continues
+    the open edit instead, so a held-button drag stroke becomes a single
+    undo step. Memory is proportional to the cells edited, not to
+    canvas size times history depth.
+    """
+
+    def __init__(self, canvas, limit=5000):
+        self.canvas = canvas
+        self.undo_stack = deque(maxlen=limit)
+        self.redo_stack = []
+
+    def __len__(self):
+        return len(self.undo_stack)
+
+    @property
+    def recording(self):
+        """True while an edit is open."""
+        return self.canvas.changes is not None
+
+    def begin(self):
+        """Start recording a new edit (closing any open one)."""
+        self.end()
+        self.canvas.changes = {}
+
+    def extend(self):
+        """Keep recording into the open edit, or start one."""
+        if not self.recording:
+            self.begin()
+
+    def end(self):
+        """Close the open edit; it becomes an undo step if anything changed."""
+        if not self.recording:
+            return
+        edit = CanvasEdit(self.canvas, self.canvas.changes)
+        self.canvas.changes = None
+        if edit:
+            self.undo_stack.append(edit)
+            self.redo_stack.clear()
+
+    def undo(self):
+        """Undo the last edit. Returns False if there is nothing to undo."""
+        self.end()
+        if not self.undo_stack:
+            return False
+        edit = self.undo_stack.pop()
+        edit.undo(self.canvas)
+        self.redo_stack.append(edit)
+        return True
+
+    def redo(self):
+        """Redo the last undone edit. Returns False if there is none."""
+        self.end()
+        if not self.redo_stack:
+            return False
+        edit = self.redo_stack.pop()
+        edit.redo(self.canvas)
+        self.undo_stack.append(edit)
+        return True
+
+
 class ASCIIPainter:
     """Main ASCII Painter application."""
 
@@ -360,8 +493,7 @@ class ASCIIPainter:
         self.brush_size = 1
 
         # Undo/Redo
-        self.undo_stack = deque(maxlen=20)
-        self.redo_stack = deque(maxlen=20)
+        self.history = UndoHistory(self.canvas)
 
         # UI state
         self.show_help = False
@@ -371,6 +503,7 @@ class ASCIIPainter:
 
         # Tool state (for multi-step tools)
         self.tool_start_set = False
+        self.button_held = False
 
         # Frame timing
         self.last_time = time.time()
@@ -467,8 +600,9 @@ class ASCIIPainter:
 
                 # Clear canvas
                 elif key.lower() == 'c':
-                    self.save_undo()
+                    self.history.begin()
                     self.canvas.clear()
+                    self.history.end()
                     self.show_message("Canvas cleared")
 
                 # Save
@@ -485,16 +619,28 @@ class ASCIIPainter:
         self.cursor_x = max(0, min(self.cursor_x, self.canvas.width - 1))
         self.cursor_y = max(0, min(self.cursor_y, self.canvas.height - 1))
 
-        # Drawing action (keyboard or button 0)
+        # Drawing action (keyboard or button 0). Holding the button drags a
+        # freehand stroke that is undone as one step.
         if draw_action or buttons.get(0):
-            self.perform_drawing_action()
-
-    def perform_drawing_action(self):
-        """Perform drawing action with current tool."""
+            self.perform_drawing_action(continue_stroke=self.button_held)
+        self.button_held = bool(buttons.get(0))
+        if not self.button_held:
+            self.history.end()
+
+    def perform_drawing_action(self, continue_stroke=False):
+        """Perform drawing action with current tool.
+
+        Args:
+            continue_stroke: Add freehand drawing to the open undo step
+                (a drag) instead of starting a new one
+        """
         tool = self.tools[self.current_tool]
 
         if self.current_tool == 'freehand':
-            self.save_undo()
+            if continue_stroke:
+                self.history.extend()
+            else:
+                self.history.begin()
             tool.draw(self.canvas, self.cursor_x, self.cursor_y,
                       self.current_char, self.current_color, self.brush_size)
 
@@ -509,35 +655,28 @@ class ASCIIPainter:
                 self.show_message("Start point set. Move cursor and press again.")
             else:
                 # Complete shape
-                self.save_undo()
+                self.history.begin()
                 tool.draw(self.canvas, self.cursor_x, self.cursor_y,
                           self.current_char, self.current_color)
+                self.history.end()
                 self.tool_start_set = False
                 self.show_message("Shape drawn")
 
         elif self.current_tool == 'flood_fill':
-            self.save_undo()
+            self.history.begin()
             tool.draw(self.canvas, self.cursor_x, self.cursor_y,
                       self.current_char, self.current_color)
+            self.history.end()
             self.show_message("Fill complete")
 
-    def save_undo(self):
-        """Save current state to undo stack."""
-        self.undo_stack.append(self.canvas.copy())
-        self.redo_stack.clear()
-
     def undo(self):
         """Undo last action."""
-        if self.undo_stack:
-            self.redo_stack.append(self.canvas.copy())
-            self.canvas = self.undo_stack.pop()
+        if self.history.undo():
             self.show_message("Undo")
 
     def redo(self):
         """Redo last undone action."""
-        if self.redo_stack:
-            self.undo_stack.append(self.canvas.copy())
-            self.canvas = self.redo_stack.pop()
+        if self.history.redo():
             self.show_message("Redo")
 
     def save_drawing(self):
@@ -648,7 +787,7 @@ class ASCIIPainter:
         self.renderer.draw_text(70, 1, pos_text, Color.WHITE)
 
         # Undo levels
-        undo_text = f"Undo: {len(self.undo_stack)}"
+        undo_text = f"Undo: {len(self.history)}"
         self.renderer.draw_text(90, 1, undo_text, Color.YELLOW)
 
         # Message
@@ -18,6 +18,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.spatial_grid import UniformGrid
 
 
 # =============================================================================
@@ -177,7 +178,16 @@ class GridDisplay:
 # =============================================================================
 
 class CanvasModel:
-    """The infinite canvas data model."""
+    """The infinite canvas data model.
+
+    Boxes and markers are kept in draw order (later is on top) and are
+    also registered in a UniformGrid, so hit tests and viewport queries
+    only look at objects near the point or view rather than the whole
+    board. Go through add/move/delete methods so the index stays in sync.
+    """
+
+    # World units per index bucket (about a box width at 1x zoom)
+    INDEX_CELL_SIZE = 32.0
 
     def __init__(self, world_width: float = 1000.0, world_height: float = 1000.0):
         self.world_width = world_width
@@ -185,12 +195,16 @@ class CanvasModel:
         self.markers: List[Marker] = []
         self.boxes: List[Box] = []
         self.next_box_id = 1
+        self.box_index = UniformGrid(self.INDEX_CELL_SIZE)
+        self.marker_index = UniformGrid(self.INDEX_CELL_SIZE)
+        self._selected: Optional[Box] = None
 
     def add_marker(self, x: float, y: float, label: str = "",
                    color: int = Color.YELLOW) -> Marker:
         """Add a marker to the canvas."""
         marker = Marker(x=x, y=y, label=label, color=color)
         self.markers.append(marker)
+        self.marker_index.insert(marker, x, y, x, y)
         return marker
 
     def add_box(self, x: float, y: float, width: float = 20.0,
@@ -206,13 +220,21 @@ class CanvasModel:
         )
         self.next_box_id += 1
         self.boxes.append(box)
+        self.box_index.insert(box, box.x, box.y, box.x2, box.y2)
         return box
 
+    def remove_marker(self, marker: Marker) -> bool:
+        """Remove a marker. Returns True if it was on the canvas."""
+        if marker not in self.marker_index:
+            return False
+        self.marker_index.remove(marker)
+        self.markers[:] = [m for m in self.markers if m is not marker]
+        return True
+
     def marker_to_box(self, marker: Marker, width: float = 20.0,
                       height: float = 8.0) -> Box:
         """Convert a marker to a box (stretch operation)."""
-        if marker in self.markers:
-            self.markers.remove(marker)
+        self.remove_marker(marker)
         return self.add_box(
             x=marker.x - width / 2,
             y=marker.y - height / 2,
@@ -224,28 +246,38 @@ class CanvasModel:
 
     def get_box_at(self, x: float, y: float) -> Optional[Box]:
         """Get box at world coordinates (topmost)."""
-        for box in reversed(self.boxes):  # Check from top to bottom
+        for box in reversed(self.box_index.at(x, y)):  # Check from top to bottom
             if box.contains_point(x, y):
                 return box
         return None
 
+    def boxes_in(self, x1: float, y1: float, x2: float, y2: float) -> List[Box]:
+        """Boxes that may overlap the world rectangle, in draw order."""
+        return self.box_index.query(x1, y1, x2, y2)
+
+    def markers_in(self, x1: float, y1: float, x2: float, y2: float) -> List[Marker]:
+        """Markers that may lie in the world rectangle, in draw order."""
+        return self.marker_index.query(x1, y1, x2, y2)
+
     def select_box(self, box: Optional[Box]) -> None:
         """Select a box, deselecting others."""
-        for b in self.boxes:
-            b.selected = (b is box)
+        if self._selected is not None:
+            self._selected.selected = False
+        self._selected = box
+        if box is not None:
+            box.selected = True
 
     def get_selected_box(self) -> Optional[Box]:
         """Get currently selected box."""
-        for box in self.boxes:
-            if box.selected:
-                return box
-        return None
+        return self._selected
 
     def delete_selected(self) -> bool:
         """Delete selected box. Returns True if deleted."""
         selected = self.get_selected_box()
         if selected:
-            self.boxes.remove(selected)
+            self.box_index.remove(selected)
+            self.boxes[:] = [b for b in self.boxes if b is not selected]
+            self._selected = None
             return True
         return False
 
@@ -253,6 +285,7 @@ class CanvasModel:
         """Move a box by delta."""
         box.x += dx
         box.y += dy
+        self.box_index.move(box, box.x, box.y, box.x2, box.y2)
 
 
 # =============================================================================
@@ -805,12 +838,19 @@ class CanvasExplorer:
         # Draw grid
         self.canvas_renderer.draw_grid(self.viewport, self.grid)
 
+        # Draw only boxes and markers near the screen (which includes the
+        # status bar row); a one-cell margin covers screen-coordinate
+        # truncation at the edges
+        x1, y1 = self.viewport.screen_to_world(-1, -1)
+        x2, y2 = self.viewport.screen_to_world(self.renderer.width + 1, self.renderer.height + 1)
+        visible = (x1, y1, x2, y2)
+
         # Draw boxes
-        for box in self.canvas.boxes:
+        for box in self.canvas.boxes_in(*visible):
             self.canvas_renderer.draw_box(box, self.viewport)
 
         # Draw markers
-        for marker in self.canvas.markers:
+        for marker in self.canvas.markers_in(*visible):
             self.canvas_renderer.draw_marker(marker, self.viewport)
 
         # Draw cursor
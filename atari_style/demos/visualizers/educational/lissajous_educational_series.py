@@ -26,10 +26,12 @@ import math
 from dataclasses import dataclass
 from typing import Generator, List, Optional
 
+import numpy as np
 from PIL import Image
 
+from ....core import curves
 from .lissajous_terminal_gif import (
-    TerminalCanvas, draw_lissajous, render_gif,
+    TerminalCanvas, draw_lissajous, render_gif, terminal_palette,
     ease_in_out_cubic, lerp, THEMES
 )
 
@@ -793,19 +795,16 @@ def draw_oscilloscope_frame(canvas: TerminalCanvas, t: float, a: float, b: float
     scale_y = canvas.rows // 3
     points = 400
 
-    for i in range(points):
-        angle = (i / points) * 2 * math.pi
-        px = math.sin(a * angle + t)
-        py = math.sin(b * angle + delta + t * 0.3)
+    x, y = curves.lissajous(points, a, b, delta, t, y_rate=0.3)
+    screen_x = (cx + x * scale_x * 1.2).astype(np.int64)
+    screen_y = (cy + y * scale_y * 0.7).astype(np.int64)
 
-        screen_x = int(cx + px * scale_x * 1.2)
-        screen_y = int(cy + py * scale_y * 0.7)
-
-        if 0 <= screen_x < canvas.cols and 0 <= screen_y < canvas.rows:
-            # CRT phosphor effect - brighter at current position
-            brightness = 1.0 - (abs(t % 1.0 - i / points))
-            color = 'bright_green' if brightness > 0.7 else 'green'
-            canvas.set_pixel(screen_x, screen_y, '●', color)
+    # CRT phosphor effect - brighter at current position
+    brightness = 1.0 - np.abs(t % 1.0 - curves.curve_fraction(points))
+    bright = (brightness > 0.7).tolist()
+    xs, ys = screen_x.tolist(), screen_y.tolist()
+    for i in curves.last_writes(screen_x, screen_y, canvas.cols, canvas.rows).tolist():
+        canvas.set_pixel(xs[i], ys[i], '●', 'bright_green' if bright[i] else 'green')
 
 
 def generate_oscilloscope_demo_frames(canvas: TerminalCanvas, fps: int
@@ -845,6 +844,13 @@ def generate_oscilloscope_demo_frames(canvas: TerminalCanvas, fps: int
         yield canvas.render()
 
 
+# Laser show beam: samples per trace, trace count and per-trace glyph/color
+LASER_POINTS = 300
+LASER_TRAILS = 8
+LASER_TRAIL_STYLE = ([('●', 'bright_white')] + [('○', 'bright_green')] * 2
+                     + [('·', 'green')] * (LASER_TRAILS - 3))
+
+
 def generate_laser_show_frames(canvas: TerminalCanvas, fps: int
                                ) -> Generator[Image.Image, None, None]:
     """Generate laser show demonstration."""
@@ -872,32 +878,17 @@ def generate_laser_show_frames(canvas: TerminalCanvas, fps: int
             scale_x = canvas.cols // 3
             scale_y = canvas.rows // 3
 
-            # Draw multiple trace lines for laser "beam" effect
-            for trail in range(8):
-                trail_t = t * 3 - trail * 0.02
-                points = 300
-
-                for i in range(points):
-                    angle = (i / points) * 2 * math.pi
-                    px = math.sin(a * angle + trail_t)
-                    py = math.sin(b * angle + math.pi / 2 + trail_t * 0.5)
-
-                    screen_x = int(cx + px * scale_x * 1.3)
-                    screen_y = int(cy + py * scale_y * 0.8)
-
-                    if 0 <= screen_x < canvas.cols and 0 <= screen_y < canvas.rows:
-                        # Color gradient for laser effect
-                        if trail == 0:
-                            color = 'bright_white'
-                            char = '●'
-                        elif trail < 3:
-                            color = 'bright_green'
-                            char = '○'
-                        else:
-                            color = 'green'
-                            char = '·'
-
-                        canvas.set_pixel(screen_x, screen_y, char, color)
+            # Draw multiple trace lines for laser "beam" effect, one row per trail
+            trail_times = t * 3 - np.arange(LASER_TRAILS) * 0.02
+            x, y = curves.lissajous(LASER_POINTS, a, b, math.pi / 2, trail_times)
+            screen_x = (cx + x * scale_x * 1.3).astype(np.int64)
+            screen_y = (cy + y * scale_y * 0.8).astype(np.int64)
+
+            xs, ys = screen_x.ravel().tolist(), screen_y.ravel().tolist()
+            for i in curves.last_writes(screen_x, screen_y, canvas.cols, canvas.rows).tolist():
+                # Color gradient for laser effect
+                char, color = LASER_TRAIL_STYLE[i // LASER_POINTS]
+                canvas.set_pixel(xs[i], ys[i], char, color)
 
             # Info
             info = [
@@ -1274,6 +1265,8 @@ WATERMARK_FONT_SIZE = 24
 WATERMARK_MARGIN_RIGHT = 10
 WATERMARK_MARGIN_TOP = 10
 WATERMARK_BACKGROUND_PADDING = 5
+WATERMARK_BACKGROUND = (0, 0, 0)
+WATERMARK_COLOR = (255, 255, 0)
 
 # Module-level font cache for watermark
 _watermark_font = None
@@ -1344,11 +1337,11 @@ def add_preview_watermark(frame: Image.Image) -> Image.Image:
     draw.rectangle(
         [x - WATERMARK_BACKGROUND_PADDING, y - WATERMARK_BACKGROUND_PADDING,
          x + text_width + WATERMARK_BACKGROUND_PADDING, y + text_height + WATERMARK_BACKGROUND_PADDING],
-        fill=(0, 0, 0)
+        fill=WATERMARK_BACKGROUND
     )
 
     # Draw text in bright yellow
-    draw.text((x, y), text, font=font, fill=(255, 255, 0))
+    draw.text((x, y), text, font=font, fill=WATERMARK_COLOR)
 
     return watermarked
 
@@ -1532,10 +1525,13 @@ Preview mode examples:
         frames = generate_full_series_frames(canvas, args.fps, scheme)
 
     # Apply preview filtering if enabled
+    ramps = ()
     if preview.enabled:
         frames = filter_frames_for_preview(frames, args.fps, preview)
+        ramps = ((WATERMARK_BACKGROUND, WATERMARK_COLOR),)
 
-    success = render_gif(args.output, frames, render_fps)
+    palette = terminal_palette(canvas, ramps=ramps)
+    success = render_gif(args.output, frames, render_fps, palette=palette)
     return 0 if success else 1
 
 
@@ -20,10 +20,13 @@ Usage:
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Generator, List, Tuple
 
+import numpy as np
 from PIL import Image
 
+from ....core import render3d
 from .lissajous_terminal_gif import TerminalCanvas, render_gif
 
 
@@ -145,10 +148,93 @@ def create_particle_swarm(num_particles: int = 60,
     return particles
 
 
+class ParticleSwarm:
+    """Struct-of-arrays Lissajous swarm with ring-buffer trails.
+
+    Frequencies, phases and speeds live in NumPy arrays so a whole swarm
+    is advanced with one vectorized sin. Trails are a fixed
+    (particles x trail_length x 3) ring buffer written in place each
+    frame; each particle only reads back its own trail_length samples.
+    """
+
+    def __init__(self, freqs, phases, speeds, colors: List[str], trail_lengths):
+        self.freqs = np.asarray(freqs, dtype=np.float64).reshape(-1, 3)
+        self.phases = np.asarray(phases, dtype=np.float64).reshape(-1, 3)
+        self.speeds = np.asarray(speeds, dtype=np.float64)
+        self.colors = list(colors)
+        self.trail_lengths = np.maximum(np.asarray(trail_lengths, dtype=np.int64), 1)
+
+        capacity = int(self.trail_lengths.max()) if len(self) else 1
+        self.trails = np.zeros((len(self), capacity, 3))
+        self.frames = 0  # Samples written so far
+
+    @classmethod
+    def from_particles(cls, particles: List[Particle3D]) -> 'ParticleSwarm':
+        """Pack a list of Particle3D into arrays."""
+        return cls(
+            freqs=[(p.freq_x, p.freq_y, p.freq_z) for p in particles],
+            phases=[(p.phase_x, p.phase_y, p.phase_z) for p in particles],
+            speeds=[p.speed for p in particles],
+            colors=[p.color for p in particles],
+            trail_lengths=[p.trail_length for p in particles],
+        )
+
+    def __len__(self) -> int:
+        return len(self.speeds)
+
+    def update(self, t: float, freqs=None) -> np.ndarray:
+        """Calculate all positions at time t and record them in the trails.
+
+        Args:
+            t: Time in seconds.
+            freqs: Optional (N, 3) frequencies overriding self.freqs for
+                this step (for swarms whose ratios morph over time).
+
+        Returns:
+            (N, 3) array of head positions.
+        """
+        freqs = self.freqs if freqs is None else freqs
+        positions = np.sin(freqs * (t * self.speeds)[:, None] + self.phases)
+        self.trails[:, self.frames % self.trails.shape[1]] = positions
+        self.frames += 1
+        return positions
+
+    def trail_points(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Every head and trail point, ready for one batch projection.
+
+        Points are grouped by particle: the head first, then its trail
+        from oldest to newest (matching the per-particle trail lists).
+
+        Returns:
+            (points, particle, intensity, is_head) arrays. ``intensity``
+            rises from the oldest trail sample towards 1.0 at the head.
+        """
+        capacity = self.trails.shape[1]
+        newest = (self.frames - 1) % capacity
+        filled = np.minimum(self.trail_lengths, self.frames)
+
+        # Column 0 is the head (age 0); the rest run from oldest to newest
+        ages = np.concatenate(([0], np.arange(capacity - 1, 0, -1)))
+        valid = ages[None, :] < filled[:, None]
+        particle, column = np.nonzero(valid)
+        age = ages[column]
+
+        points = self.trails[particle, (newest - age) % capacity]
+        intensity = (filled[particle] - age) / filled[particle]
+        return points, particle, intensity, age == 0
+
+
 # =============================================================================
 # 3D PROJECTION
 # =============================================================================
 
+@lru_cache(maxsize=8)
+def _view_trig(rotation_y: float, rotation_x: float) -> Tuple[float, float, float, float]:
+    """cos/sin of the view angles, shared by every point of a frame."""
+    return (math.cos(rotation_y), math.sin(rotation_y),
+            math.cos(rotation_x), math.sin(rotation_x))
+
+
 def project_3d_to_2d(x: float, y: float, z: float,
                      cx: int, cy: int,
                      scale_x: float, scale_y: float,
@@ -168,15 +254,13 @@ def project_3d_to_2d(x: float, y: float, z: float,
     Returns:
         (screen_x, screen_y, depth) tuple.
     """
+    cos_y, sin_y, cos_x, sin_x = _view_trig(rotation_y, rotation_x)
+
     # Apply Y rotation (around vertical axis)
-    cos_y = math.cos(rotation_y)
-    sin_y = math.sin(rotation_y)
     x_rot = x * cos_y - z * sin_y
     z_rot = x * sin_y + z * cos_y
 
     # Apply X rotation (around horizontal axis)
-    cos_x = math.cos(rotation_x)
-    sin_x = math.sin(rotation_x)
     y_rot = y * cos_x - z_rot * sin_x
     z_final = y * sin_x + z_rot * cos_x
 
@@ -189,6 +273,29 @@ def project_3d_to_2d(x: float, y: float, z: float,
     return screen_x, screen_y, z_final
 
 
+def project_points_3d(points, cx: int, cy: int,
+                      scale_x: float, scale_y: float,
+                      camera_distance: float = 3.0,
+                      rotation_y: float = 0.0,
+                      rotation_x: float = 0.0
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Batch version of project_3d_to_2d for an (N, 3) array of points.
+
+    Returns:
+        (screen_x, screen_y, depth) arrays.
+    """
+    # Same rotation order as project_3d_to_2d; its Y rotation turns +X
+    # towards -Z, the opposite sense of render3d.rotation_y
+    rotation = render3d.rotation_x(rotation_x) @ render3d.rotation_y(-rotation_y)
+    rotated = render3d.transform(points, rotation)
+    depth = rotated[:, 2]
+    perspective = render3d.perspective(depth, camera_distance, camera_distance + 1.0)
+
+    screen_x = (cx + rotated[:, 0] * scale_x * perspective).astype(np.int64)
+    screen_y = (cy + rotated[:, 1] * scale_y * perspective).astype(np.int64)
+    return screen_x, screen_y, depth
+
+
 # =============================================================================
 # FRAME GENERATION
 # =============================================================================
@@ -213,7 +320,7 @@ def generate_swarm_frames(canvas: TerminalCanvas, fps: int,
     total_frames = int(duration * fps)
 
     # Create the swarm
-    particles = create_particle_swarm(num_particles, stability_bias)
+    swarm = ParticleSwarm.from_particles(create_particle_swarm(num_particles, stability_bias))
 
     # Scene parameters
     cx = canvas.cols // 2
@@ -233,64 +340,40 @@ def generate_swarm_frames(canvas: TerminalCanvas, fps: int,
         rotation_y = t * 0.3
         rotation_x = math.sin(t * 0.15) * 0.3
 
-        # Collect all points with depth for z-sorting
-        points = []
-
-        for particle in particles:
-            # Update particle position
-            x, y, z = particle.update(t)
-
-            # Project and add current position
-            sx, sy, depth = project_3d_to_2d(
-                x, y, z, cx, cy, scale_x, scale_y,
-                camera_distance=2.5,
-                rotation_y=rotation_y,
-                rotation_x=rotation_x
-            )
-            points.append((depth, sx, sy, particle.color, 1.0, particle))
+        # Advance the whole swarm, then project heads and trails in one batch
+        swarm.update(t)
+        positions, owner, intensity, is_head = swarm.trail_points()
+        intensity = np.where(is_head, intensity, intensity * 0.7)
 
-            # Add trail points
-            for i, (tx, ty, tz) in enumerate(particle.trail[:-1]):
-                trail_sx, trail_sy, trail_depth = project_3d_to_2d(
-                    tx, ty, tz, cx, cy, scale_x, scale_y,
-                    camera_distance=2.5,
-                    rotation_y=rotation_y,
-                    rotation_x=rotation_x
-                )
-                # Fade based on trail position
-                intensity = (i + 1) / len(particle.trail)
-                points.append((trail_depth, trail_sx, trail_sy,
-                              particle.color, intensity * 0.7, None))
-
-        # Sort by depth (far to near)
-        points.sort(key=lambda p: p[0])
-
-        # Render points
-        for depth, sx, sy, color, intensity, particle in points:
-            if not (0 <= sx < canvas.cols and 0 <= sy < canvas.rows):
-                continue
-
-            # Choose character based on depth and intensity
-            depth_normalized = (depth + 1.5) / 3.0  # Normalize to 0-1
-            depth_idx = int(depth_normalized * (len(chars_by_depth) - 1))
-            depth_idx = max(0, min(len(chars_by_depth) - 1, depth_idx))
+        screen_x, screen_y, depths = project_points_3d(
+            positions, cx, cy, scale_x, scale_y,
+            camera_distance=2.5,
+            rotation_y=rotation_y,
+            rotation_x=rotation_x
+        )
 
-            if intensity > 0.8:
-                char = chars_by_depth[-1]  # Brightest
-            elif intensity > 0.5:
-                char = chars_by_depth[max(depth_idx, 2)]
-            elif intensity > 0.2:
-                char = chars_by_depth[max(depth_idx, 1)]
-            else:
-                char = chars_by_depth[depth_idx]
+        # Choose character based on depth and intensity
+        depth_idx = ((depths + 1.5) / 3.0 * (len(chars_by_depth) - 1)).astype(np.int64)
+        depth_idx = np.clip(depth_idx, 0, len(chars_by_depth) - 1)
+        char_idx = np.select(
+            [intensity > 0.8, intensity > 0.5, intensity > 0.2],
+            [len(chars_by_depth) - 1, np.maximum(depth_idx, 2), np.maximum(depth_idx, 1)],
+            depth_idx,
+        )
+        # Current positions in front are drawn brightest
+        bright = is_head & (depths > 0)
 
-            # Adjust color brightness based on depth
-            if particle is not None:  # Current position - brightest
-                render_color = 'bright_white' if depth > 0 else color
-            else:
-                render_color = color
+        # Sort by depth (far to near), dropping off-screen points
+        order = render3d.depth_order(depths, far_first=False)
+        visible = ((screen_x >= 0) & (screen_x < canvas.cols)
+                   & (screen_y >= 0) & (screen_y < canvas.rows))
+        order = order[visible[order]]
 
-            canvas.set_pixel(sx, sy, char, render_color)
+        for sx, sy, ci, particle, is_bright in zip(
+                screen_x[order].tolist(), screen_y[order].tolist(),
+                char_idx[order].tolist(), owner[order].tolist(), bright[order].tolist()):
+            render_color = 'bright_white' if is_bright else swarm.colors[particle]
+            canvas.set_pixel(sx, sy, chars_by_depth[ci], render_color)
 
         yield canvas.render()
 
@@ -345,7 +428,9 @@ def generate_stability_journey_frames(canvas: TerminalCanvas, fps: int,
     speeds = [random.uniform(0.4, 1.2) for _ in range(num_particles)]
     colors = [random.choice(SWARM_COLORS) for _ in range(num_particles)]
     trail_lengths = [random.randint(20, 50) for _ in range(num_particles)]
-    trails = [[] for _ in range(num_particles)]
+    swarm = ParticleSwarm(base_chaotic, phases, speeds, colors, trail_lengths)
+    base_stable = np.array(base_stable)
+    base_chaotic = np.array(base_chaotic)
 
     # Scene parameters
     cx = canvas.cols // 2
@@ -369,69 +454,39 @@ def generate_stability_journey_frames(canvas: TerminalCanvas, fps: int,
         rotation_y = t * 0.25
         rotation_x = math.sin(t * 0.12) * 0.25
 
-        points = []
-
-        for i in range(num_particles):
-            # Interpolate frequencies based on stability
-            fx = base_chaotic[i][0] + stability * (base_stable[i][0] - base_chaotic[i][0])
-            fy = base_chaotic[i][1] + stability * (base_stable[i][1] - base_chaotic[i][1])
-            fz = base_chaotic[i][2] + stability * (base_stable[i][2] - base_chaotic[i][2])
-
-            # Calculate position
-            anim_t = t * speeds[i]
-            x = math.sin(fx * anim_t + phases[i][0])
-            y = math.sin(fy * anim_t + phases[i][1])
-            z = math.sin(fz * anim_t + phases[i][2])
-
-            # Update trail
-            trails[i].append((x, y, z))
-            if len(trails[i]) > trail_lengths[i]:
-                trails[i].pop(0)
-
-            # Project current position
-            sx, sy, depth = project_3d_to_2d(
-                x, y, z, cx, cy, scale_x, scale_y,
-                camera_distance=2.5,
-                rotation_y=rotation_y,
-                rotation_x=rotation_x
-            )
-            points.append((depth, sx, sy, colors[i], 1.0, True))
+        # Interpolate frequencies based on stability, then advance all
+        freqs = base_chaotic + stability * (base_stable - base_chaotic)
+        swarm.update(t, freqs)
+        positions, owner, intensity, is_head = swarm.trail_points()
+        intensity = np.where(is_head, intensity, intensity * 0.6)
+
+        screen_x, screen_y, depths = project_points_3d(
+            positions, cx, cy, scale_x, scale_y,
+            camera_distance=2.5,
+            rotation_y=rotation_y,
+            rotation_x=rotation_x
+        )
 
-            # Project trail
-            for j, (tx, ty, tz) in enumerate(trails[i][:-1]):
-                tsx, tsy, tdepth = project_3d_to_2d(
-                    tx, ty, tz, cx, cy, scale_x, scale_y,
-                    camera_distance=2.5,
-                    rotation_y=rotation_y,
-                    rotation_x=rotation_x
-                )
-                intensity = (j + 1) / len(trails[i])
-                points.append((tdepth, tsx, tsy, colors[i], intensity * 0.6, False))
+        depth_idx = ((depths + 1.5) / 3.0 * (len(chars_by_depth) - 1)).astype(np.int64)
+        depth_idx = np.clip(depth_idx, 0, len(chars_by_depth) - 1)
+        char_idx = np.select(
+            [intensity > 0.6, intensity > 0.3],
+            [np.maximum(depth_idx, 2), np.maximum(depth_idx, 1)],
+            depth_idx,
+        )
+        bright = is_head & (depths > 0.3)
 
         # Sort and render
-        points.sort(key=lambda p: p[0])
-
-        for depth, sx, sy, color, intensity, is_head in points:
-            if not (0 <= sx < canvas.cols and 0 <= sy < canvas.rows):
-                continue
-
-            depth_norm = (depth + 1.5) / 3.0
-            depth_idx = int(depth_norm * (len(chars_by_depth) - 1))
-            depth_idx = max(0, min(len(chars_by_depth) - 1, depth_idx))
-
-            if is_head:
-                char = '●'
-                render_color = 'bright_white' if depth > 0.3 else color
-            elif intensity > 0.6:
-                char = chars_by_depth[max(depth_idx, 2)]
-                render_color = color
-            elif intensity > 0.3:
-                char = chars_by_depth[max(depth_idx, 1)]
-                render_color = color
-            else:
-                char = chars_by_depth[depth_idx]
-                render_color = color
-
+        order = render3d.depth_order(depths, far_first=False)
+        visible = ((screen_x >= 0) & (screen_x < canvas.cols)
+                   & (screen_y >= 0) & (screen_y < canvas.rows))
+        order = order[visible[order]]
+
+        for sx, sy, ci, particle, head, is_bright in zip(
+                screen_x[order].tolist(), screen_y[order].tolist(), char_idx[order].tolist(),
+                owner[order].tolist(), is_head[order].tolist(), bright[order].tolist()):
+            char = '●' if head else chars_by_depth[ci]
+            render_color = 'bright_white' if is_bright else colors[particle]
             canvas.set_pixel(sx, sy, char, render_color)
 
         yield canvas.render()
@@ -5,6 +5,8 @@ import random
 import math
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 
 class FluxControl:
@@ -457,28 +459,23 @@ class FluxControl:
         self.renderer.enter_fullscreen()
 
         try:
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             running = True
 
             while running:
-                current_time = time.time()
-                dt = current_time - self.last_time
-                self.last_time = current_time
-
-                # Cap dt to prevent huge jumps
-                dt = min(dt, 0.1)
-
                 # Handle input
                 if not self.handle_input():
                     running = False
 
                 # Update game
-                self.update(dt)
+                for dt in scheduler.updates():
+                    self.update(dt)
 
                 # Draw
                 self.draw()
 
-                # Frame rate limiting (~60 FPS)
-                time.sleep(0.016)
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
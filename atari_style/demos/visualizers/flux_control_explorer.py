@@ -7,6 +7,8 @@ from pathlib import Path
 from blessed import Terminal
 from ...core.renderer import Renderer, Color
 from .flux_control_zen import FluidLattice
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 
 # ============================================================
@@ -708,16 +710,13 @@ class FluxControlExplorer:
         self.apply_params_to_fluid()
 
         try:
-            last_time = time.time()
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
 
             with self.term.cbreak():
                 while True:
-                    current_time = time.time()
-                    dt = current_time - last_time
-                    last_time = current_time
-
-                    # Read key with short timeout
-                    key = self.term.inkey(timeout=0.016)
+                    # Poll for a key; pacing is left to the scheduler
+                    key = self.term.inkey(timeout=0.001)
 
                     if key:
                         # Exit
@@ -768,9 +767,12 @@ class FluxControlExplorer:
                         elif key.lower() == 'p':
                             self.save_current_preset()
 
-                    self.update(dt)
+                    for dt in scheduler.updates():
+                        self.update(dt)
                     self.draw()
 
+                    scheduler.end_frame()
+
         finally:
             self.renderer.exit_fullscreen()
 
@@ -813,14 +815,15 @@ def run_flux_explorer_extended_demo(duration: int = 270, log_metrics: bool = Fal
 
     try:
         start_time = time.time()
-        last_time = start_time
         phase = 0
         phase_start = start_time
 
+        # 20 FPS for VHS compatibility
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(game))
+        scheduler.start()
+
         while time.time() - start_time < duration:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
             elapsed = current_time - start_time
             phase_elapsed = current_time - phase_start
 
@@ -877,9 +880,10 @@ def run_flux_explorer_extended_demo(duration: int = 270, log_metrics: bool = Fal
                 phase_metrics[phase]['samples'].append(sample)
                 last_sample_time = elapsed
 
-            game.update(dt)
+            for dt in scheduler.updates():
+                game.update(dt)
             game.draw()
-            time.sleep(0.05)  # 20 FPS for VHS compatibility
+            scheduler.end_frame()
 
     finally:
         game.renderer.exit_fullscreen()
@@ -1153,14 +1157,15 @@ def run_flux_explorer_demo(duration: int = 270):
 
     try:
         start_time = time.time()
-        last_time = start_time
         phase = 0
         phase_start = start_time
 
+        # 20 FPS for VHS compatibility
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(game))
+        scheduler.start()
+
         while time.time() - start_time < duration:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
             elapsed = current_time - start_time
             phase_elapsed = current_time - phase_start
 
@@ -1199,9 +1204,10 @@ def run_flux_explorer_demo(duration: int = 270):
                 phase = 5
                 phase_start = current_time
 
-            game.update(dt)
+            for dt in scheduler.updates():
+                game.update(dt)
             game.draw()
-            time.sleep(0.05)  # 20 FPS for VHS compatibility
+            scheduler.end_frame()
 
     finally:
         game.renderer.exit_fullscreen()
@@ -1357,7 +1363,6 @@ def run_parameter_capture(duration: int = 600):
 
     try:
         start_time = time.time()
-        last_time = start_time
         last_log = 0
         last_preset_check = 0
 
@@ -1368,10 +1373,12 @@ def run_parameter_capture(duration: int = 600):
         print(f"Starting {duration}s parameter capture session...")
         print("Output: /tmp/flux_capture.log, /tmp/flux_presets_captured.json")
 
+        # 20 FPS for VHS compatibility
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(game))
+        scheduler.start()
+
         while time.time() - start_time < duration:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
             elapsed = current_time - start_time
 
             # Log every 10 seconds
@@ -1410,9 +1417,10 @@ def run_parameter_capture(duration: int = 600):
                 last_preset_check = elapsed
 
             # Run simulation
-            game.update(dt)
+            for dt in scheduler.updates():
+                game.update(dt)
             game.draw()
-            time.sleep(0.05)  # 20 FPS for VHS compatibility
+            scheduler.end_frame()
 
     finally:
         log_file.close()
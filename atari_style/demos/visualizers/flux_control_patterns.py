@@ -5,10 +5,11 @@ by managing wave propagation with directional drain controls.
 """
 
 import math
-import time
 import random
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 
 class Zone:
@@ -443,17 +444,15 @@ class PatternFluxControl:
             self.renderer.enter_fullscreen()
             self.renderer.clear_screen()
 
-            last_time = time.time()
+            scheduler = FrameScheduler(target_fps=30, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             while self.running:
-                current_time = time.time()
-                dt = current_time - last_time
-                last_time = current_time
-
-                self.draw()
-                self.update(dt)
                 self.handle_input()
+                for dt in scheduler.updates():
+                    self.update(dt)
+                self.draw()
 
-                time.sleep(0.033)  # ~30 FPS
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
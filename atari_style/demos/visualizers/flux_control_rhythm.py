@@ -5,6 +5,8 @@ import random
 import math
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 
 class BeatSystem:
@@ -537,16 +539,12 @@ class RhythmFluxControl:
         self.renderer.enter_fullscreen()
 
         try:
-            last_time = time.time()
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
 
             while True:
-                # Calculate delta time
-                current_time = time.time()
-                dt = current_time - last_time
-                last_time = current_time
-
                 # Handle input
-                input_event = self.input_handler.get_input(timeout=0.016)
+                input_event = self.input_handler.get_input(timeout=0.001)
 
                 if input_event == InputType.QUIT or input_event == InputType.BACK:
                     break
@@ -555,13 +553,13 @@ class RhythmFluxControl:
                     self.handle_drain()
 
                 # Update game state
-                self.update(dt)
+                for dt in scheduler.updates():
+                    self.update(dt)
 
                 # Draw
                 self.draw()
 
-                # Frame rate limiting
-                time.sleep(0.016)  # ~60 FPS
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
@@ -588,16 +586,14 @@ def run_rhythm_flux_demo(duration: int = 90):
 
     try:
         start_time = time.time()
-        last_time = start_time
         drain_cooldown = 0
         beats_since_drain = 0
         last_beat_progress = 0
+        scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(game))
+        scheduler.start()
 
         while True:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-
             elapsed = current_time - start_time
             if elapsed >= duration:
                 break
@@ -608,7 +604,7 @@ def run_rhythm_flux_demo(duration: int = 90):
                     break
             else:
                 progress = game.beat_system.beat_progress
-                drain_cooldown -= dt
+                drain_cooldown -= scheduler.frame_dt  # Simulated time of the last frame
 
                 # Track beat crossings
                 if progress < last_beat_progress:  # Beat just happened
@@ -661,10 +657,11 @@ def run_rhythm_flux_demo(duration: int = 90):
                         beats_since_drain = 0
 
             # Update and draw
-            game.update(dt)
+            for dt in scheduler.updates():
+                game.update(dt)
             game.draw()
 
-            time.sleep(0.016)
+            scheduler.end_frame()
 
     finally:
         game.renderer.exit_fullscreen()
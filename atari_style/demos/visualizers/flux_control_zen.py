@@ -5,6 +5,8 @@ import random
 import math
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 
 class FluidLattice:
@@ -337,15 +339,12 @@ class FluxControlZen:
         self.renderer.enter_fullscreen()
 
         try:
-            last_time = time.time()
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
 
             while True:
-                current_time = time.time()
-                dt = current_time - last_time
-                last_time = current_time
-
                 # Handle input
-                input_event = self.input_handler.get_input(timeout=0.016)
+                input_event = self.input_handler.get_input(timeout=0.001)
 
                 if input_event == InputType.QUIT or input_event == InputType.BACK:
                     break
@@ -369,12 +368,13 @@ class FluxControlZen:
                     self.handle_pan(0.5, 0)
 
                 # Update
-                self.update(dt)
+                for dt in scheduler.updates():
+                    self.update(dt)
 
                 # Draw
                 self.draw()
 
-                time.sleep(0.016)
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
@@ -393,13 +393,12 @@ def run_flux_zen_demo(duration: int = 60):
 
     try:
         start_time = time.time()
-        last_time = start_time
         last_drain_time = 0
+        scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(game))
+        scheduler.start()
 
         while time.time() - start_time < duration:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
             elapsed = current_time - start_time
 
             # Gentle 2D panning using sine waves for smooth circular motion
@@ -417,12 +416,13 @@ def run_flux_zen_demo(duration: int = 60):
                 last_drain_time = elapsed
 
             # Update simulation
-            game.update(dt)
+            for dt in scheduler.updates():
+                game.update(dt)
 
             # Draw
             game.draw()
 
-            time.sleep(0.016)
+            scheduler.end_frame()
 
     finally:
         game.renderer.exit_fullscreen()
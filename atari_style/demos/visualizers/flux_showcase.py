@@ -3,6 +3,8 @@
 import time
 import math
 from ...core.renderer import Renderer, Color
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 from .flux_control_zen import FluidLattice
 
 
@@ -232,14 +234,15 @@ def run_flux_showcase(duration: int = 75):
 
     try:
         start_time = time.time()
-        last_time = start_time
         mode_idx = 0
         last_mode_change = start_time
 
+        # 20 FPS - reduced for VHS compatibility
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
+
         while time.time() - start_time < duration:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
             elapsed = current_time - start_time
 
             # Change mode based on time
@@ -252,9 +255,10 @@ def run_flux_showcase(duration: int = 75):
                 showcase.color_speed = speed
                 last_mode_change = current_time
 
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw()
-            time.sleep(0.05)  # 20 FPS - reduced for VHS compatibility
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -273,16 +277,14 @@ def run_flux_showcase_single(mode: str = 'rainbow', duration: int = 60):
 
     try:
         start_time = time.time()
-        last_time = start_time
+        scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
 
         while time.time() - start_time < duration:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw()
-            time.sleep(0.016)
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -314,13 +316,14 @@ def run_flux_ultimate(duration: int = 240):
 
     try:
         start_time = time.time()
-        last_time = start_time
         mode_idx = 0
 
+        # 20 FPS - reduced for VHS compatibility
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
+
         while time.time() - start_time < duration:
             current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
             elapsed = current_time - start_time
 
             # Change mode based on time (division-based - proven to work)
@@ -332,9 +335,10 @@ def run_flux_ultimate(duration: int = 240):
                 showcase.char_set = chars
                 showcase.color_speed = speed
 
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw()
-            time.sleep(0.05)  # 20 FPS - reduced for VHS compatibility
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -350,16 +354,14 @@ def run_segment_1(duration: int = 60):
 
     try:
         start_time = time.time()
-        last_time = start_time
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
 
         while time.time() - start_time < duration:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw(show_ui=False)  # No UI for clean YouTube look
-            time.sleep(0.05)
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -375,16 +377,14 @@ def run_segment_2(duration: int = 60):
 
     try:
         start_time = time.time()
-        last_time = start_time
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
 
         while time.time() - start_time < duration:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw(show_ui=False)
-            time.sleep(0.05)
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -400,16 +400,14 @@ def run_segment_3(duration: int = 60):
 
     try:
         start_time = time.time()
-        last_time = start_time
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
 
         while time.time() - start_time < duration:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw(show_ui=False)
-            time.sleep(0.05)
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -425,16 +423,14 @@ def run_segment_4(duration: int = 60):
 
     try:
         start_time = time.time()
-        last_time = start_time
+        scheduler = FrameScheduler(target_fps=20, profiler=FrameProfiler.from_env(showcase))
+        scheduler.start()
 
         while time.time() - start_time < duration:
-            current_time = time.time()
-            dt = current_time - last_time
-            last_time = current_time
-
-            showcase.update(dt)
+            for dt in scheduler.updates():
+                showcase.update(dt)
             showcase.draw(show_ui=False)
-            time.sleep(0.05)
+            scheduler.end_frame()
 
     finally:
         showcase.renderer.exit_fullscreen()
@@ -2,48 +2,14 @@
 
 import time
 import math
-from ...core.renderer import Renderer, Color
-from ...core.input_handler import InputHandler, InputType
 
+import numpy as np
 
-class Vector3:
-    """3D vector."""
-
-    def __init__(self, x, y, z):
-        self.x = x
-        self.y = y
-        self.z = z
-
-    def rotate_x(self, angle):
-        """Rotate around X axis."""
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
-        y = self.y * cos_a - self.z * sin_a
-        z = self.y * sin_a + self.z * cos_a
-        return Vector3(self.x, y, z)
-
-    def rotate_y(self, angle):
-        """Rotate around Y axis."""
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
-        x = self.x * cos_a + self.z * sin_a
-        z = -self.x * sin_a + self.z * cos_a
-        return Vector3(x, self.y, z)
-
-    def rotate_z(self, angle):
-        """Rotate around Z axis."""
-        cos_a = math.cos(angle)
-        sin_a = math.sin(angle)
-        x = self.x * cos_a - self.y * sin_a
-        y = self.x * sin_a + self.y * cos_a
-        return Vector3(x, y, self.z)
-
-    def project(self, width, height, fov, distance):
-        """Project 3D point to 2D screen coordinates."""
-        factor = fov / (distance + self.z)
-        x = self.x * factor + width / 2
-        y = self.y * factor * 0.5 + height / 2  # Aspect ratio correction
-        return int(x), int(y)
+from ...core import render3d
+from ...core.renderer import Renderer, Color
+from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 
 
 class PlatonicSolid:
@@ -51,7 +17,7 @@ class PlatonicSolid:
 
     def __init__(self, name, vertices, edges, faces, color):
         self.name = name
-        self.vertices = [Vector3(v[0], v[1], v[2]) for v in vertices]
+        self.vertices = np.array(vertices, dtype=np.float64)  # (N, 3)
         self.edges = edges
         self.faces = faces
         self.color = color
@@ -323,71 +289,25 @@ class PlatonicSolidsViewer:
         """Draw the viewer."""
         self.renderer.clear_buffer()
 
-        # Transform and project vertices
-        projected_vertices = []
-
-        for vertex in self.current_solid.vertices:
-            # Apply rotations
-            v = vertex.rotate_x(self.rotation_x)
-            v = v.rotate_y(self.rotation_y)
-            v = v.rotate_z(self.rotation_z)
-
-            # Scale
-            v = Vector3(v.x * self.zoom, v.y * self.zoom, v.z * self.zoom)
-
-            # Project to 2D
-            x, y = v.project(self.width, self.height, self.fov, self.distance)
-            projected_vertices.append((x, y, v.z))
+        # Transform and project all vertices at once
+        solid = self.current_solid
+        rotation = render3d.rotation_matrix(self.rotation_x, self.rotation_y, self.rotation_z)
+        points = render3d.transform(solid.vertices, rotation, scale=self.zoom)
+        sx, sy = render3d.project(points, self.fov, self.distance,
+                                  self.width / 2, self.height / 2, aspect=0.5)
 
         # Draw edges
-        for edge in self.current_solid.edges:
-            v1_idx, v2_idx = edge
-            x1, y1, z1 = projected_vertices[v1_idx]
-            x2, y2, z2 = projected_vertices[v2_idx]
-
-            self._draw_line(x1, y1, x2, y2, self.current_solid.color)
+        render3d.draw_edges(self.renderer, sx, sy, solid.edges, solid.color)
 
         # Draw vertices (highlight)
-        for x, y, z in projected_vertices:
-            if 0 <= x < self.width and 0 <= y < self.height:
-                self.renderer.set_pixel(x, y, '●', Color.BRIGHT_WHITE)
+        for x, y in zip(sx.tolist(), sy.tolist()):
+            self.renderer.set_pixel(x, y, '●', Color.BRIGHT_WHITE)
 
         # Draw HUD
         self._draw_hud()
 
         self.renderer.render()
 
-    def _draw_line(self, x0, y0, x1, y1, color):
-        """Draw a line using Bresenham's algorithm."""
-        dx = abs(x1 - x0)
-        dy = abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx - dy
-
-        while True:
-            if 0 <= x0 < self.width and 0 <= y0 < self.height:
-                # Determine line character based on direction
-                if abs(dx) > abs(dy):
-                    char = '─'
-                elif abs(dy) > abs(dx):
-                    char = '│'
-                else:
-                    char = '/' if (sx > 0 and sy > 0) or (sx < 0 and sy < 0) else '\\'
-
-                self.renderer.set_pixel(x0, y0, char, color)
-
-            if x0 == x1 and y0 == y1:
-                break
-
-            e2 = 2 * err
-            if e2 > -dy:
-                err -= dy
-                x0 += sx
-            if e2 < dx:
-                err += dx
-                y0 += sy
-
     def _draw_hud(self):
         """Draw heads-up display."""
         # Title
@@ -422,33 +342,27 @@ class PlatonicSolidsViewer:
         self.renderer.enter_fullscreen()
 
         try:
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             running = True
 
             while running:
-                current_time = time.time()
-                dt = current_time - self.last_time
-                self.last_time = current_time
-
-                # Cap dt
-                dt = min(dt, 0.1)
-
                 # Handle input
                 input_type = self.input_handler.get_input(timeout=0.001)
 
                 if input_type == InputType.BACK or input_type == InputType.QUIT:
                     running = False
 
-                # Continuous input
-                self.handle_input(dt)
+                for dt in scheduler.updates():
+                    self.update(dt)
 
-                # Update
-                self.update(dt)
+                # Continuous input (per frame: button handling debounces with sleeps)
+                self.handle_input(scheduler.frame_dt)
 
                 # Draw
                 self.draw()
 
-                # Frame rate (30-60 FPS)
-                time.sleep(0.016)
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
@@ -3,9 +3,13 @@
 import math
 import time
 import random
+import numpy as np
 import pygame
+from ...core import curves
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
 from .screensaver_presets import ANIMATION_PRESETS, get_preset_names, get_preset
 
 
@@ -94,15 +98,17 @@ class LissajousCurve(ParametricAnimation):
 
         # Draw the curve
         points = self.points
-        for i in range(points):
-            angle = (i / points) * 2 * math.pi
-            x = int(cx + scale_x * math.sin(self.a * angle + t))
-            y = int(cy + scale_y * math.sin(self.b * angle + self.delta + t * 0.5))
+        x, y = curves.lissajous(points, self.a, self.b, self.delta, t)
+        screen_x = (cx + scale_x * x).astype(np.int64)
+        screen_y = (cy + scale_y * y).astype(np.int64)
 
-            # Color based on position
-            color_idx = int((i / points) * 6)
-            colors = [Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA]
-            self.renderer.set_pixel(x, y, '●', colors[color_idx])
+        # Color based on position
+        colors = [Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA]
+        color_idx = (curves.curve_fraction(points) * 6).astype(np.int64).tolist()
+        xs, ys = screen_x.tolist(), screen_y.tolist()
+        width, height = self.renderer.width, self.renderer.height
+        for i in curves.last_writes(screen_x, screen_y, width, height).tolist():
+            self.renderer.set_pixel(xs[i], ys[i], '●', colors[color_idx[i]])
 
     def get_value_at(self, x: int, y: int, t: float) -> float:
         """Get normalized distance to nearest curve point.
@@ -116,22 +122,14 @@ class LissajousCurve(ParametricAnimation):
         scale_y = self.renderer.height // 3
         
         # Sample a few points on the curve and find minimum distance
-        min_dist_sq = float('inf')
-        # Note: 50 samples is a reasonable compromise between accuracy and performance
-        # This method is typically called infrequently in current composites
-        # For heavy use cases, consider caching or adaptive sampling
+        # Note: 50 samples is a reasonable compromise between accuracy and performance;
+        # the angle grid is cached so each call is a couple of vector sin calls
         samples = 50
-        
-        for i in range(samples):
-            angle = (i / samples) * 2 * math.pi
-            curve_x = cx + scale_x * math.sin(self.a * angle + t)
-            curve_y = cy + scale_y * math.sin(self.b * angle + self.delta + t * 0.5)
-            
-            dx = x - curve_x
-            dy = y - curve_y
-            dist_sq = dx * dx + dy * dy
-            min_dist_sq = min(min_dist_sq, dist_sq)
-        
+        curve_x, curve_y = curves.lissajous(samples, self.a, self.b, self.delta, t)
+        dx = x - (cx + scale_x * curve_x)
+        dy = y - (cy + scale_y * curve_y)
+        min_dist_sq = float((dx * dx + dy * dy).min())
+
         # Convert distance to normalized value (closer = higher value)
         # Use exponential decay for smoother falloff
         max_dist = 50.0  # Maximum meaningful distance
@@ -1220,22 +1218,21 @@ class ScreenSaver:
             self.renderer.enter_fullscreen()
             self.renderer.clear_screen()
 
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
             for preset_name in preset_names:
                 # Apply the preset
                 self.apply_preset(mode, preset_name)
 
                 # Display the preset for the specified duration
                 start_time = time.time()
-                last_time = start_time
+                scheduler.start()
 
                 while time.time() - start_time < seconds_per_preset:
-                    current_time = time.time()
-                    dt = current_time - last_time
-                    last_time = current_time
-
-                    # Draw and update
-                    self.renderer.clear_buffer()
+                    # Update and draw
                     anim = self.animations[self.current_animation]
+                    for dt in scheduler.updates():
+                        anim.update(dt * self.speed_multiplier)
+                    self.renderer.clear_buffer()
                     anim.draw(anim.t)
 
                     # Draw preset tour info
@@ -1266,14 +1263,13 @@ class ScreenSaver:
                     self.renderer.draw_text(2, 13, "Press ESC/Q to exit tour", Color.RED)
 
                     self.renderer.render()
-                    anim.update(dt * self.speed_multiplier)
 
                     # Check for exit
-                    input_type = self.input_handler.get_input(timeout=0.01)
+                    input_type = self.input_handler.get_input(timeout=0.001)
                     if input_type == InputType.QUIT:
                         return
 
-                    time.sleep(0.016)  # ~60 FPS
+                    scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
@@ -1573,16 +1569,14 @@ class ScreenSaver:
             self.renderer.enter_fullscreen()
             self.renderer.clear_screen()
 
-            last_time = time.time()
+            scheduler = FrameScheduler(target_fps=60, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             while self.running:
-                current_time = time.time()
-                dt = current_time - last_time
-                last_time = current_time
-
-                self.draw()
-                self.update(dt)
                 self.handle_input()
-                time.sleep(0.016)  # ~60 FPS
+                for dt in scheduler.updates():
+                    self.update(dt)
+                self.draw()
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
@@ -2,39 +2,113 @@
 
 import random
 import time
-import math
+import numpy as np
+from ...core import curves
 from ...core.renderer import Renderer, Color
 from ...core.input_handler import InputHandler, InputType
-
-
-class Star:
-    """Represents a star in 3D space."""
-
-    def __init__(self, width: int, height: int, layer=0):
-        self.x = random.uniform(-width, width)
-        self.y = random.uniform(-height, height)
-        self.z = random.uniform(1, width)
-        self.layer = layer  # 0=far, 1=mid, 2=near
+from ...core.frame_scheduler import FrameScheduler
+from ...core.profiler import FrameProfiler
+
+
+def _seeded_rng() -> np.random.Generator:
+    """NumPy generator seeded from ``random`` so random.seed() still applies."""
+    return np.random.default_rng(random.getrandbits(32))
+
+
+def paint_cells(renderer, xs, ys, chars, colors):
+    """Write cells in drawing order, skipping off-screen and overdrawn ones.
+
+    Args:
+        renderer: Target with width/height and set_pixel
+        xs, ys: Integer cell arrays in drawing order
+        chars, colors: Per-cell sequences (or arrays) aligned with xs/ys
+    """
+    set_pixel = renderer.set_pixel
+    xs, ys = np.asarray(xs), np.asarray(ys)
+    keep = curves.last_writes(xs, ys, renderer.width, renderer.height)
+    for x, y, char, color in zip(xs[keep].tolist(), ys[keep].tolist(),
+                                 np.asarray(chars)[keep].tolist(),
+                                 np.asarray(colors)[keep].tolist()):
+        set_pixel(x, y, char, color)
+
+
+def streak_cells(x, y, lengths, tunnel_center=None):
+    """Batch motion-streak rasterizer.
+
+    Each star's streak is followed by its own head cell, so painting the
+    result in order reproduces drawing star by star. Normal streaks run
+    ``lengths`` cells to the left of the star; tunnel streaks place
+    ``lengths - 1`` cells on the ray towards ``tunnel_center``.
+
+    Args:
+        x, y: Star head cells
+        lengths: Per-star streak length (0 for no streak)
+        tunnel_center: (cx, cy) for radial streaks, None for horizontal
+
+    Returns:
+        (xs, ys, owner, is_head) arrays in drawing order
+    """
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    longest = int(lengths.max(initial=0))
+    # Streak steps i = 0 .. L-1 (normal) or 1 .. L-1 (tunnel)
+    steps = np.arange(0 if tunnel_center is None else 1, max(longest, 1))
+    # One row per star: its streak steps, then the head in the last column
+    valid = np.concatenate((steps[None, :] < lengths[:, None],
+                            np.ones((len(x), 1), dtype=bool)), axis=1)
+    owner, column = np.nonzero(valid)
+    is_head = column == len(steps)
+    step = np.append(steps, 0)[column]
+
+    sx, sy = x[owner], y[owner]
+    if tunnel_center is None:
+        xs = sx - step
+        ys = sy
+    else:
+        cx, cy = tunnel_center
+        length = np.maximum(lengths[owner], 1)
+        xs = np.where(is_head, sx, (sx + (cx - sx) * step / length).astype(np.int64))
+        ys = np.where(is_head, sy, (sy + (cy - sy) * step / length).astype(np.int64))
+    return xs, ys, owner, is_head
+
+
+class StarField:
+    """Struct-of-arrays star positions for all parallax layers.
+
+    Layer 0 is far (dim, slow), 1 mid and 2 near (bright, fast).
+    """
+
+    LAYER_SPEED = np.array([0.3, 0.7, 1.0])
+
+    def __init__(self, width: int, height: int, counts=(60, 80, 60), rng=None):
+        self.rng = rng if rng is not None else _seeded_rng()
+        self.layer = np.repeat(np.arange(len(counts)), counts)
+        n = len(self.layer)
+        self.x = self.rng.uniform(-width, width, n)
+        self.y = self.rng.uniform(-height, height, n)
+        self.z = self.rng.uniform(1, width, n)
+
+    def __len__(self) -> int:
+        return len(self.layer)
 
     def update(self, speed: float, width: int, height: int, lateral_drift=0):
-        """Update star position."""
-        # Layer-based speed multiplier for parallax
-        layer_speed = [0.3, 0.7, 1.0][self.layer]
-
+        """Advance every star; stars that pass the camera respawn far away."""
+        layer_speed = self.LAYER_SPEED[self.layer]
         self.z -= speed * layer_speed
         self.x += lateral_drift * layer_speed
 
-        if self.z <= 0:
-            self.x = random.uniform(-width, width)
-            self.y = random.uniform(-height, height)
-            self.z = width
+        passed = np.flatnonzero(self.z <= 0)
+        if len(passed):
+            self.x[passed] = self.rng.uniform(-width, width, len(passed))
+            self.y[passed] = self.rng.uniform(-height, height, len(passed))
+            self.z[passed] = width
 
     def project(self, width: int, height: int):
-        """Project 3D position to 2D screen coordinates."""
-        # Perspective projection
+        """Perspective-project all stars to (x, y, k) arrays."""
         k = 128 / self.z
-        x = int(self.x * k + width / 2)
-        y = int(self.y * k + height / 2)
+        x = (self.x * k + width / 2).astype(np.int64)
+        y = (self.y * k + height / 2).astype(np.int64)
         return x, y, k
 
 
@@ -51,6 +125,7 @@ class Nebula:
             Color.CYAN, Color.GREEN
         ])
         self.density_char = random.choice(['░', '▒'])
+        self.rng = _seeded_rng()
 
     def update(self, speed, width, height):
         """Update nebula position."""
@@ -69,51 +144,57 @@ class Nebula:
         cy = int(self.y * k * 0.5 + height / 2)
         size = int(self.size * k)
 
-        # Draw cloud using Perlin-noise-like distribution
-        for dy in range(-size, size):
-            for dx in range(-size, size):
-                dist = math.sqrt(dx**2 + dy**2)
-                if dist < size:
-                    # Density falloff from center
-                    if random.random() < (1 - dist / size) * 0.3:
-                        px, py = cx + dx, cy + dy
-                        if 0 <= px < width and 0 <= py < height:
-                            renderer.set_pixel(px, py, self.density_char, self.color)
+        # Only the part of the cloud's square that lands on screen is sampled
+        dxs = np.arange(max(-size, -cx), min(size, width - cx))
+        dys = np.arange(max(-size, -cy), min(size, height - cy))
+        if not len(dxs) or not len(dys):
+            return
+
+        # Random speckle with density falling off from the center
+        dist = np.sqrt(dxs[None, :] ** 2 + dys[:, None] ** 2)
+        lit = (dist < size) & (self.rng.random(dist.shape) < (1 - dist / size) * 0.3)
+        rows, cols = np.nonzero(lit)
+        char, color = self.density_char, self.color
+        for px, py in zip((cx + dxs[cols]).tolist(), (cy + dys[rows]).tolist()):
+            renderer.set_pixel(px, py, char, color)
 
 
-class Asteroid:
-    """Represents an asteroid."""
+class AsteroidField:
+    """Struct-of-arrays asteroid positions and rotations."""
 
     SHAPES = ['◊', '◇', '◆', '⬖', '⬗']
 
-    def __init__(self, width, height):
-        self.x = random.uniform(-width, width)
-        self.y = random.uniform(-height, height)
-        self.z = random.uniform(1, width)
-        self.shape_idx = random.randint(0, len(self.SHAPES) - 1)
-        self.rotation = 0
+    def __init__(self, width: int, height: int, count: int = 100, rng=None):
+        self.rng = rng if rng is not None else _seeded_rng()
+        self.x = self.rng.uniform(-width, width, count)
+        self.y = self.rng.uniform(-height, height, count)
+        self.z = self.rng.uniform(1, width, count)
+        self.rotation = np.zeros(count)
+
+    def __len__(self) -> int:
+        return len(self.z)
 
     def update(self, speed, width, height):
-        """Update asteroid position."""
+        """Advance every asteroid; ones that pass the camera respawn."""
         self.z -= speed
         self.rotation += 0.1
 
-        if self.z <= 0:
-            self.x = random.uniform(-width, width)
-            self.y = random.uniform(-height, height)
-            self.z = width
+        passed = np.flatnonzero(self.z <= 0)
+        if len(passed):
+            self.x[passed] = self.rng.uniform(-width, width, len(passed))
+            self.y[passed] = self.rng.uniform(-height, height, len(passed))
+            self.z[passed] = width
 
     def project(self, width, height):
-        """Project 3D position to 2D."""
+        """Project all asteroids to (x, y, k) arrays."""
         k = 128 / self.z
-        x = int(self.x * k + width / 2)
-        y = int(self.y * k * 0.5 + height / 2)
+        x = (self.x * k + width / 2).astype(np.int64)
+        y = (self.y * k * 0.5 + height / 2).astype(np.int64)
         return x, y, k
 
-    def get_char(self):
-        """Get character based on rotation."""
-        idx = int(self.rotation) % len(self.SHAPES)
-        return self.SHAPES[idx]
+    def chars(self) -> np.ndarray:
+        """Shape character for each asteroid based on its rotation."""
+        return np.array(self.SHAPES)[self.rotation.astype(np.int64) % len(self.SHAPES)]
 
 
 class StarfieldDemo:
@@ -145,7 +226,7 @@ class StarfieldDemo:
         self.mode = self.MODE_STARS
 
         # Parallax layers
-        self.stars = []
+        self.stars = None
         self._init_stars()
 
         # Nebulae
@@ -155,9 +236,7 @@ class StarfieldDemo:
             self.nebulae.append(Nebula(self.renderer.width, self.renderer.height))
 
         # Asteroids
-        self.asteroids = []
-        for _ in range(100):
-            self.asteroids.append(Asteroid(self.renderer.width, self.renderer.height))
+        self.asteroids = AsteroidField(self.renderer.width, self.renderer.height)
 
         # Warp tunnel
         self.warp_tunnel_active = False
@@ -169,75 +248,58 @@ class StarfieldDemo:
         # Frame timing
         self.last_time = time.time()
 
-    def _init_stars(self):
-        """Initialize stars with parallax layers."""
-        self.stars = []
-
-        # Far layer (30% of stars, dim, slow)
-        for _ in range(60):
-            star = Star(self.renderer.width, self.renderer.height, layer=0)
-            self.stars.append(star)
-
-        # Mid layer (40% of stars, medium)
-        for _ in range(80):
-            star = Star(self.renderer.width, self.renderer.height, layer=1)
-            self.stars.append(star)
-
-        # Near layer (30% of stars, bright, fast)
-        for _ in range(60):
-            star = Star(self.renderer.width, self.renderer.height, layer=2)
-            self.stars.append(star)
-
-    def get_star_color(self, star: Star, depth: float) -> str:
-        """Determine star color based on mode and layer."""
-        # Layer-based dimming
-        layer_colors = {
-            0: [Color.BLUE, Color.CYAN, Color.WHITE],  # Far = dim
-            1: [Color.CYAN, Color.WHITE, Color.BRIGHT_WHITE],  # Mid
-            2: [Color.WHITE, Color.BRIGHT_WHITE, Color.BRIGHT_CYAN],  # Near = bright
-        }
-
+    def _init_stars(self, counts=(60, 80, 60)):
+        """Initialize stars with parallax layers.
+
+        Default split: far 30% (dim, slow), mid 40%, near 30% (bright, fast).
+        """
+        self.stars = StarField(self.renderer.width, self.renderer.height, counts)
+
+    # Star colors per layer, from far (dim) to near (bright), indexed by
+    # depth level: 0 (k <= 1), 1 (k <= 2), 2 (k > 2)
+    LAYER_COLORS = np.array([
+        [Color.BLUE, Color.CYAN, Color.WHITE],
+        [Color.CYAN, Color.WHITE, Color.BRIGHT_WHITE],
+        [Color.WHITE, Color.BRIGHT_WHITE, Color.BRIGHT_CYAN],
+    ])
+    RAINBOW = np.array([Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA])
+
+    # Star characters per layer, indexed by depth level 0 (k <= 1) .. 3 (k > 3)
+    LAYER_CHARS = np.array([
+        ['·', '.', '.', '.'],
+        ['·', '·', '●', '●'],
+        ['·', '·', '●', '█'],
+    ])
+
+    def get_star_colors(self, depth: np.ndarray, layer: np.ndarray,
+                        x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Determine star colors based on mode, layer and depth."""
         if self.color_mode == 0:
             # Monochrome with layer-based brightness
-            colors = layer_colors.get(star.layer, [Color.WHITE])
-            if depth > 2:
-                return colors[2] if len(colors) > 2 else colors[-1]
-            elif depth > 1:
-                return colors[1] if len(colors) > 1 else colors[0]
-            else:
-                return colors[0]
+            level = (depth > 1).astype(np.int64) + (depth > 2)
+            return self.LAYER_COLORS[layer, level]
 
         elif self.color_mode == 1:
             # Rainbow based on position
-            colors = [Color.RED, Color.YELLOW, Color.GREEN, Color.CYAN, Color.BLUE, Color.MAGENTA]
-            idx = int(abs(star.x + star.y) * 0.1) % len(colors)
-            return colors[idx]
+            idx = (np.abs(x + y) * 0.1).astype(np.int64) % len(self.RAINBOW)
+            return self.RAINBOW[idx]
 
         else:  # color_mode == 2
             # Speed-based coloring
             if self.warp_speed > 3:
-                return Color.BRIGHT_CYAN
+                color = Color.BRIGHT_CYAN
             elif self.warp_speed > 2:
-                return Color.BRIGHT_BLUE
+                color = Color.BRIGHT_BLUE
             elif self.warp_speed > 1.5:
-                return Color.BLUE
-            else:
-                return Color.WHITE
-
-    def get_star_char(self, depth: float, layer: int) -> str:
-        """Get character to draw based on star depth and layer."""
-        # Layer affects brightness
-        if layer == 0:  # Far
-            return '.' if depth > 1 else '·'
-        elif layer == 1:  # Mid
-            return '●' if depth > 2 else '·'
-        else:  # Near
-            if depth > 3:
-                return '█'
-            elif depth > 2:
-                return '●'
+                color = Color.BLUE
             else:
-                return '·'
+                color = Color.WHITE
+            return np.full(len(depth), color)
+
+    def get_star_chars(self, depth: np.ndarray, layer: np.ndarray) -> np.ndarray:
+        """Get characters to draw based on star depth and layer."""
+        level = (depth > 1).astype(np.int64) + (depth > 2) + (depth > 3)
+        return self.LAYER_CHARS[layer, level]
 
     def draw(self):
         """Render the starfield."""
@@ -247,8 +309,7 @@ class StarfieldDemo:
         if self.hyperspace_state == self.HS_FLASH:
             # White screen flash
             for y in range(self.renderer.height):
-                for x in range(self.renderer.width):
-                    self.renderer.set_pixel(x, y, '█', Color.BRIGHT_WHITE)
+                self.renderer.fill_span(0, self.renderer.width, y, '█', Color.BRIGHT_WHITE)
             self.renderer.render()
             return
 
@@ -276,46 +337,40 @@ class StarfieldDemo:
         elif self.warp_speed <= 3.0 and self.warp_tunnel_active:
             self.warp_tunnel_active = False
 
-        for star in self.stars:
-            x, y, depth = star.project(self.renderer.width, self.renderer.height)
-
-            # Warp tunnel: arrange stars into tunnel walls
-            if self.warp_tunnel_active:
-                # Radial arrangement
-                cx, cy = self.renderer.width / 2, self.renderer.height / 2
-                dx, dy = x - cx, y - cy
-                dist = math.sqrt(dx**2 + dy**2)
-
-                if dist > 0:
-                    # Push stars outward to tunnel walls
-                    tunnel_radius = 20 + depth * 5
-                    x = int(cx + (dx / dist) * tunnel_radius)
-                    y = int(cy + (dy / dist) * tunnel_radius * 0.5)  # Aspect correction
-
-            if 0 <= x < self.renderer.width and 0 <= y < self.renderer.height:
-                char = self.get_star_char(depth, star.layer)
-                color = self.get_star_color(star, depth)
-
-                # Draw motion trails at high speed (streaking effect)
-                if self.warp_speed > 2.5:
-                    trail_length = int(self.warp_speed * (1 + star.layer * 0.5))
-
-                    if self.warp_tunnel_active:
-                        # Radial streaks in tunnel mode
-                        cx, cy = self.renderer.width / 2, self.renderer.height / 2
-                        for i in range(1, trail_length):
-                            tx = int(x + (cx - x) * i / trail_length)
-                            ty = int(y + (cy - y) * i / trail_length)
-                            if 0 <= tx < self.renderer.width and 0 <= ty < self.renderer.height:
-                                self.renderer.set_pixel(tx, ty, '-', color)
-                    else:
-                        # Horizontal trails in normal mode
-                        for i in range(trail_length):
-                            trail_x = x - i
-                            if 0 <= trail_x < self.renderer.width:
-                                self.renderer.set_pixel(trail_x, y, '-', color)
-
-                self.renderer.set_pixel(x, y, char, color)
+        width, height = self.renderer.width, self.renderer.height
+        stars = self.stars
+        x, y, depth = stars.project(width, height)
+        cx, cy = width / 2, height / 2
+
+        # Warp tunnel: arrange stars into tunnel walls
+        if self.warp_tunnel_active:
+            # Radial arrangement: push stars outward to tunnel walls
+            dx, dy = x - cx, y - cy
+            dist = np.hypot(dx, dy)
+            off_center = dist > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                tunnel_radius = 20 + depth * 5
+                tx = (cx + (dx / dist) * tunnel_radius).astype(np.int64)
+                ty = (cy + (dy / dist) * tunnel_radius * 0.5).astype(np.int64)  # Aspect correction
+            x = np.where(off_center, tx, x)
+            y = np.where(off_center, ty, y)
+
+        visible = np.flatnonzero((x >= 0) & (x < width) & (y >= 0) & (y < height))
+        x, y, depth = x[visible], y[visible], depth[visible]
+        layer = stars.layer[visible]
+        chars = self.get_star_chars(depth, layer)
+        colors = self.get_star_colors(depth, layer, stars.x[visible], stars.y[visible])
+
+        # Draw motion trails at high speed (streaking effect), then each
+        # star on top of its own trail
+        if self.warp_speed > 2.5:
+            lengths = (self.warp_speed * (1 + np.array([0.0, 0.5, 1.0]))).astype(np.int64)[layer]
+        else:
+            lengths = np.zeros(len(x), dtype=np.int64)
+        # Radial streaks in tunnel mode, horizontal trails otherwise
+        center = (cx, cy) if self.warp_tunnel_active else None
+        xs, ys, owner, is_head = streak_cells(x, y, lengths, center)
+        paint_cells(self.renderer, xs, ys, np.where(is_head, chars[owner], '-'), colors[owner])
 
         # Hyperspace burst effect
         if self.hyperspace_state == self.HS_BURST:
@@ -323,50 +378,39 @@ class StarfieldDemo:
 
     def _draw_asteroids(self):
         """Draw asteroid field."""
-        for asteroid in self.asteroids:
-            x, y, depth = asteroid.project(self.renderer.width, self.renderer.height)
-
-            if 0 <= x < self.renderer.width and 0 <= y < self.renderer.height:
-                char = asteroid.get_char()
-
-                # Size varies with depth
-                if depth > 2:
-                    color = Color.BRIGHT_WHITE
-                elif depth > 1:
-                    color = Color.WHITE
-                else:
-                    color = Color.CYAN
-
-                # Draw 3x3 cluster for larger asteroids
-                if depth > 2.5:
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            px, py = x + dx, y + dy
-                            if 0 <= px < self.renderer.width and 0 <= py < self.renderer.height:
-                                self.renderer.set_pixel(px, py, char, color)
-                else:
-                    self.renderer.set_pixel(x, y, char, color)
+        width, height = self.renderer.width, self.renderer.height
+        x, y, depth = self.asteroids.project(width, height)
+        visible = np.flatnonzero((x >= 0) & (x < width) & (y >= 0) & (y < height))
+        x, y, depth = x[visible], y[visible], depth[visible]
+        chars = self.asteroids.chars()[visible]
+
+        # Size varies with depth
+        colors = np.where(depth > 2, Color.BRIGHT_WHITE, np.where(depth > 1, Color.WHITE, Color.CYAN))
+
+        # Draw 3x3 cluster for larger asteroids: cell 4 of the cluster is
+        # the center, the only cell drawn for small ones
+        offsets = np.arange(-1, 2)
+        cluster_x = x[:, None] + np.tile(offsets, 3)[None, :]
+        cluster_y = y[:, None] + np.repeat(offsets, 3)[None, :]
+        drawn = (depth > 2.5)[:, None] | (np.arange(9) == 4)[None, :]
+        owner, _ = np.nonzero(drawn)
+        paint_cells(self.renderer, cluster_x[drawn], cluster_y[drawn], chars[owner], colors[owner])
 
     def _draw_hyperspace_burst(self):
         """Draw hyperspace burst animation."""
         # Stars burst outward from center
         cx, cy = self.renderer.width / 2, self.renderer.height / 2
 
-        for star in self.stars:
-            # Project normally
-            x, y, depth = star.project(self.renderer.width, self.renderer.height)
-
-            # Then push radially outward
-            dx, dy = x - cx, y - cy
-            dist = math.sqrt(dx**2 + dy**2)
-
-            if dist > 0:
-                burst_factor = 3
-                x = int(cx + (dx / dist) * dist * burst_factor)
-                y = int(cy + (dy / dist) * dist * burst_factor)
-
-                if 0 <= x < self.renderer.width and 0 <= y < self.renderer.height:
-                    self.renderer.set_pixel(x, y, '*', Color.BRIGHT_CYAN)
+        # Project normally, then push radially outward
+        x, y, _ = self.stars.project(self.renderer.width, self.renderer.height)
+        dx, dy = x - cx, y - cy
+        dist = np.hypot(dx, dy)
+        moved = dist > 0
+        burst_factor = 3
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bx = (cx + (dx / dist) * dist * burst_factor)[moved].astype(np.int64)
+            by = (cy + (dy / dist) * dist * burst_factor)[moved].astype(np.int64)
+        paint_cells(self.renderer, bx, by, np.full(len(bx), '*'), np.full(len(bx), Color.BRIGHT_CYAN))
 
     def _draw_hud(self):
         """Draw heads-up display."""
@@ -416,10 +460,9 @@ class StarfieldDemo:
 
         # Update stars/asteroids
         if self.mode == self.MODE_STARS:
-            for star in self.stars:
-                star.update(self.base_speed * self.warp_speed,
-                            self.renderer.width, self.renderer.height,
-                            self.lateral_drift)
+            self.stars.update(self.base_speed * self.warp_speed,
+                              self.renderer.width, self.renderer.height,
+                              self.lateral_drift)
 
             # Update nebulae
             if self.nebulae_visible:
@@ -427,9 +470,8 @@ class StarfieldDemo:
                     nebula.update(self.base_speed * self.warp_speed,
                                   self.renderer.width, self.renderer.height)
         else:
-            for asteroid in self.asteroids:
-                asteroid.update(self.base_speed * self.warp_speed,
-                                self.renderer.width, self.renderer.height)
+            self.asteroids.update(self.base_speed * self.warp_speed,
+                                  self.renderer.width, self.renderer.height)
 
     def _update_hyperspace(self, dt):
         """Update hyperspace jump sequence."""
@@ -534,19 +576,15 @@ class StarfieldDemo:
             self.renderer.enter_fullscreen()
             self.renderer.clear_screen()
 
+            scheduler = FrameScheduler(target_fps=30, profiler=FrameProfiler.from_env(self))
+            scheduler.start()
             while self.running:
-                current_time = time.time()
-                dt = current_time - self.last_time
-                self.last_time = current_time
-
-                # Cap dt
-                dt = min(dt, 0.1)
-
+                for dt in scheduler.updates():
+                    self.update(dt)
                 self.draw()
-                self.update(dt)
-                self.handle_input(dt)
+                self.handle_input(scheduler.frame_dt)
 
-                time.sleep(0.033)  # ~30 FPS
+                scheduler.end_frame()
 
         finally:
             self.renderer.exit_fullscreen()
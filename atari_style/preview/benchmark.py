@@ -0,0 +1,200 @@
+"""Concurrent-viewer benchmark for the preview server.
+
+Starts a PreviewServer on an ephemeral port and drives it with stand-in
+clients that fetch media in byte ranges over keep-alive connections, the
+way a scrubbing <video> element does.
+
+Usage:
+    python -m atari_style.preview.benchmark
+    python -m atari_style.preview.benchmark -d output --clients 20 --duration 10
+"""
+
+import argparse
+import http.client
+import random
+import shutil
+import tempfile
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .gallery import format_bytes
+from .server import PreviewServer
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def _client_loop(
+    port: int,
+    targets: List[Dict],
+    deadline: float,
+    range_size: int,
+    seed: int,
+    latencies: List[float],
+    counters: Dict[str, int],
+    lock: threading.Lock,
+) -> None:
+    """Issue ranged GETs on one persistent connection until the deadline."""
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    local_latencies = []
+    local_bytes = 0
+    errors = 0
+    try:
+        while time.perf_counter() < deadline:
+            target = rng.choice(targets)
+            size = target['size']
+            start = rng.randrange(0, max(1, size - range_size))
+            end = min(size - 1, start + range_size - 1)
+            began = time.perf_counter()
+            try:
+                conn.request('GET', target['url'], headers={'Range': f'bytes={start}-{end}'})
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+                continue
+            if response.status not in (200, 206):
+                errors += 1
+                continue
+            local_latencies.append(time.perf_counter() - began)
+            local_bytes += len(body)
+    finally:
+        conn.close()
+
+    with lock:
+        latencies.extend(local_latencies)
+        counters['bytes'] += local_bytes
+        counters['errors'] += errors
+
+
+def run_benchmark(
+    directories: Optional[List[Path]] = None,
+    clients: int = 20,
+    duration: float = 5.0,
+    range_size: int = 1024 * 1024,
+    synthetic_size: int = 64 * 1024 * 1024,
+) -> Dict:
+    """Measure preview server media throughput under concurrent clients.
+
+    Args:
+        directories: Media directories to serve. When None a temporary
+            directory with one synthetic video file is used.
+        clients: Number of concurrent stand-in viewers
+        duration: Seconds to run the load
+        range_size: Bytes requested per ranged GET
+        synthetic_size: Size of the synthetic file when no directories given
+
+    Returns:
+        Dictionary with request/byte counts, throughput and latency percentiles
+    """
+    temp_dir = None
+    if directories is None:
+        temp_dir = tempfile.mkdtemp(prefix='preview-bench-')
+        with open(Path(temp_dir) / 'synthetic.mp4', 'wb') as f:
+            block = random.Random(0).randbytes(1024 * 1024)
+            written = 0
+            while written < synthetic_size:
+                chunk = block[:synthetic_size - written]
+                f.write(chunk)
+                written += len(chunk)
+        directories = [Path(temp_dir)]
+
+    preview = PreviewServer(directories=directories, port=0, host='127.0.0.1', log_requests=False)
+    server = preview.make_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        files = [f for f in preview.gallery.scan(force=True) if f.file_type in ('video', 'image') and f.size_bytes]
+        if not files:
+            raise ValueError("No video or image files found to benchmark")
+        targets = [
+            {'url': '/media/' + urllib.parse.quote(f.unique_id), 'size': f.size_bytes}
+            for f in files
+        ]
+
+        port = server.server_address[1]
+        latencies: List[float] = []
+        counters = {'bytes': 0, 'errors': 0}
+        lock = threading.Lock()
+
+        started = time.perf_counter()
+        deadline = started + duration
+        workers = [
+            threading.Thread(
+                target=_client_loop,
+                args=(port, targets, deadline, range_size, i, latencies, counters, lock),
+            )
+            for i in range(clients)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    latencies.sort()
+    return {
+        'clients': clients,
+        'requests': len(latencies),
+        'errors': counters['errors'],
+        'bytes': counters['bytes'],
+        'elapsed': elapsed,
+        'requests_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'bytes_per_sec': counters['bytes'] / elapsed if elapsed else 0.0,
+        'latency_p50_ms': _percentile(latencies, 50) * 1000,
+        'latency_p95_ms': _percentile(latencies, 95) * 1000,
+        'latency_p99_ms': _percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark preview server media throughput with concurrent clients',
+    )
+    parser.add_argument('-d', '--directory', action='append', dest='directories',
+                        help='Directory with media to serve (default: synthetic file)')
+    parser.add_argument('-c', '--clients', type=int, default=20,
+                        help='Concurrent clients (default: 20)')
+    parser.add_argument('-t', '--duration', type=float, default=5.0,
+                        help='Seconds to run (default: 5)')
+    parser.add_argument('--range-kb', type=int, default=1024,
+                        help='Bytes per ranged request in KB (default: 1024)')
+    args = parser.parse_args()
+
+    directories = [Path(d) for d in args.directories] if args.directories else None
+    results = run_benchmark(
+        directories=directories,
+        clients=args.clients,
+        duration=args.duration,
+        range_size=args.range_kb * 1024,
+    )
+
+    print(f"Clients:     {results['clients']}")
+    print(f"Requests:    {results['requests']} ({results['errors']} errors)")
+    print(f"Throughput:  {results['requests_per_sec']:.1f} req/s, "
+          f"{format_bytes(int(results['bytes_per_sec']))}/s")
+    print(f"Latency:     p50 {results['latency_p50_ms']:.1f} ms, "
+          f"p95 {results['latency_p95_ms']:.1f} ms, "
+          f"p99 {results['latency_p99_ms']:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,20 +2,35 @@
 
 Scans directories for supported media types and extracts metadata
 for display in the preview server.
+
+Probe results are kept in a MediaIndex keyed by path and validated by
+size and mtime, so rescans only re-probe files that changed. The index
+can be persisted to a JSON sidecar to survive server restarts.
 """
 
 import json
 import os
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .library import LibraryIndex
 
 
 # Constants
 BYTES_PER_KB = 1024
+DEFAULT_PROBE_WORKERS = 4
+
+# Metadata fields stored in the index (storyboard_data is not persisted)
+INDEXED_FIELDS = ('duration', 'width', 'height', 'fps')
+
+# Seconds before a media file whose probe came back empty is probed again
+FAILED_PROBE_RETRY = 60.0
 
 
 def format_bytes(size_bytes: int) -> str:
@@ -117,6 +132,107 @@ class MediaFile:
         }
 
 
+class MediaIndex:
+    """Probe metadata cache keyed by absolute path.
+
+    An entry is valid only while the file's size and mtime are unchanged.
+    Entries are also recorded for files that turned out not to be media
+    (e.g. unrelated JSON), so those are not re-parsed either. A media file
+    whose probe returned nothing (e.g. a transient ffprobe failure) is kept
+    in memory only and probed again after FAILED_PROBE_RETRY seconds.
+
+    Args:
+        path: Optional JSON sidecar to load from and save to. When None the
+            index lives in memory only.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self._entries = data.get('entries', {})
+
+    def lookup(self, path: str, size: int, mtime_ns: int) -> Optional[Dict]:
+        """Return the cached entry if the file is unchanged, else None."""
+        with self._lock:
+            entry = self._entries.get(path)
+        if not entry or entry['size'] != size or entry['mtime_ns'] != mtime_ns:
+            return None
+        if 'retry_at' in entry and time.time() >= entry['retry_at']:
+            return None
+        return entry
+
+    def store(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        file_type: Optional[str],
+        metadata: Dict,
+    ) -> Dict:
+        """Record probe results for a file and return the new entry."""
+        entry = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'file_type': file_type,
+            'metadata': {k: metadata[k] for k in INDEXED_FIELDS if k in metadata},
+        }
+        if file_type is not None and not metadata:
+            entry['retry_at'] = time.time() + FAILED_PROBE_RETRY
+        with self._lock:
+            self._entries[path] = entry
+            self._dirty = True
+        return entry
+
+    def prune(self, roots: List[Path], seen: set) -> int:
+        """Drop entries under ``roots`` that were not seen in the last scan.
+
+        Returns:
+            Number of entries removed
+        """
+        prefixes = tuple(os.path.join(os.path.abspath(str(root)), '') for root in roots)
+        with self._lock:
+            stale = [p for p in self._entries if p.startswith(prefixes) and p not in seen]
+            for p in stale:
+                del self._entries[p]
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        """Write the index to its sidecar file if it changed."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {p: e for p, e in self._entries.items() if 'retry_at' not in e}
+            data = {'version': self.VERSION, 'entries': entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
 class Gallery:
     """Scans directories and manages media file collections."""
 
@@ -127,12 +243,21 @@ class Gallery:
         'storyboard': {'.json'},  # Will check content to differentiate
     }
 
-    def __init__(self, directories: Optional[List[Path]] = None, cache_ttl: float = 30.0):
+    def __init__(
+        self,
+        directories: Optional[List[Path]] = None,
+        cache_ttl: float = 30.0,
+        index_path: Optional[Path] = None,
+        probe_workers: int = DEFAULT_PROBE_WORKERS,
+    ):
         """Initialize gallery with directories to scan.
 
         Args:
             directories: List of directories to scan. Defaults to ['output/']
             cache_ttl: Cache time-to-live in seconds. Set to 0 to disable caching.
+            index_path: JSON sidecar for persisting probe metadata between runs.
+                None keeps the index in memory only.
+            probe_workers: Maximum concurrent ffprobe/parse jobs during a scan.
         """
         if directories is None:
             # Default to output directory relative to project root
@@ -146,6 +271,18 @@ class Gallery:
         self._last_scan_time: float = 0
         # Track files by unique_id for lookup
         self._file_index: Dict[str, MediaFile] = {}
+        # Probe metadata cache, validated by size/mtime
+        self.index = MediaIndex(index_path)
+        self.probe_workers = max(1, probe_workers)
+        self._media_extensions = set().union(*self.EXTENSIONS.values())
+        # Secondary indexes (by type, extension, name, sort order) for queries
+        self.library = LibraryIndex()
+        # Incremented whenever a scan adds, removes or modifies files
+        self.generation = 0
+        self.last_changes: Dict[str, List[str]] = {'added': [], 'removed': [], 'modified': []}
+        self._scan_lock = threading.Lock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
 
     def _check_ffprobe(self) -> bool:
         """Check if ffprobe is available."""
@@ -307,9 +444,53 @@ class Gallery:
         except (json.JSONDecodeError, IOError):
             return {}
 
+    def _walk(self, directory: Path, recursive: bool) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (path, stat) for candidate media files under ``directory``.
+
+        Uses os.scandir so each entry is stat'ed once, and skips files whose
+        extension can never be media before touching their contents.
+        """
+        stack = [str(directory)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    if os.path.splitext(entry.name)[1].lower() not in self._media_extensions:
+                        continue
+                    yield entry.path, entry.stat()
+                except OSError:
+                    continue
+
+    def _probe_file(self, path: Path) -> Tuple[Optional[str], Dict]:
+        """Determine file type and probe metadata for one file."""
+        file_type = self._get_file_type(path)
+        if file_type == 'video':
+            metadata = self._probe_video(path)
+        elif file_type == 'image':
+            metadata = self._probe_image(path)
+        elif file_type in ('storyboard', 'input_script'):
+            metadata = self._parse_storyboard(path)
+        else:
+            metadata = {}
+        return file_type, metadata
+
     def scan(self, recursive: bool = True, force: bool = False) -> List[MediaFile]:
         """Scan directories for media files.
 
+        Only files that are new or whose size/mtime changed since they were
+        last indexed are probed; probing runs on a bounded thread pool.
+
         Args:
             recursive: Whether to scan subdirectories
             force: Force rescan even if cache is still valid
@@ -318,82 +499,171 @@ class Gallery:
             List of MediaFile objects
         """
         # Check if cache is still valid
-        if not force and self._cache_ttl > 0 and self.files:
-            elapsed = time.time() - self._last_scan_time
-            if elapsed < self._cache_ttl:
+        if not force and self._last_scan_time:
+            if self.is_watching:
                 return self.files
+            if self._cache_ttl > 0 and self.files:
+                elapsed = time.time() - self._last_scan_time
+                if elapsed < self._cache_ttl:
+                    return self.files
+
+        requested_at = time.time()
+        with self._scan_lock:
+            # Concurrent requests that waited on another scan reuse its result
+            if not force and self._last_scan_time >= requested_at:
+                return self.files
+            return self._scan_locked(recursive)
 
-        self.files = []
-        self._file_index = {}
+    def _scan_locked(self, recursive: bool) -> List[MediaFile]:
+        previous = {str(f.path): f for f in self.files}
 
+        # Pass 1: walk and stat, resolving unchanged files from the index
+        found = []  # (directory, path, stat, index entry or None)
+        seen = set()
         for directory in self.directories:
             if not directory.exists():
                 continue
+            for path, st in self._walk(directory, recursive):
+                key = os.path.abspath(path)
+                seen.add(key)
+                entry = self.index.lookup(key, st.st_size, st.st_mtime_ns)
+                found.append((directory, path, st, entry))
+
+        # Pass 2: probe new or changed files concurrently
+        pending = [i for i, item in enumerate(found) if item[3] is None]
+        fresh_metadata: Dict[str, Dict] = {}
+        if pending:
+            # Resolve ffprobe availability once, before workers race on it
+            if any(not found[i][1].lower().endswith('.json') for i in pending):
+                self._check_ffprobe()
+
+            def probe(i: int) -> None:
+                directory, path, st, _ = found[i]
+                file_type, metadata = self._probe_file(Path(path))
+                fresh_metadata[path] = metadata
+                entry = self.index.store(
+                    os.path.abspath(path), st.st_size, st.st_mtime_ns, file_type, metadata
+                )
+                found[i] = (directory, path, st, entry)
 
-            # Get all files
-            if recursive:
-                paths = directory.rglob('*')
+            if len(pending) > 1 and self.probe_workers > 1:
+                with ThreadPoolExecutor(max_workers=self.probe_workers) as pool:
+                    list(pool.map(probe, pending))
             else:
-                paths = directory.glob('*')
+                for i in pending:
+                    probe(i)
+
+        # Pass 3: build MediaFile objects, reusing unchanged ones
+        files: List[MediaFile] = []
+        file_index: Dict[str, MediaFile] = {}
+        added, modified = [], []
+        for directory, path, st, entry in found:
+            file_type = entry['file_type']
+            if file_type is None:
+                continue
 
-            for path in paths:
-                if not path.is_file():
-                    continue
+            old = previous.pop(path, None)
+            # Files re-probed after a failed probe are rebuilt even if unchanged
+            if (old is not None and path not in fresh_metadata
+                    and old.file_type == file_type
+                    and old.size_bytes == st.st_size
+                    and old.modified_time == datetime.fromtimestamp(st.st_mtime)):
+                files.append(old)
+                file_index[old.unique_id] = old
+                continue
 
-                file_type = self._get_file_type(path)
-                if file_type is None:
-                    continue
+            # Calculate relative path from directory root
+            try:
+                relative_path = os.path.relpath(path, str(directory))
+            except ValueError:
+                relative_path = os.path.basename(path)
+
+            # For multi-directory scans, prefix with directory name to avoid collisions
+            if len(self.directories) > 1:
+                dir_prefix = directory.name
+                relative_path = os.path.join(dir_prefix, relative_path)
+
+            media_file = MediaFile(
+                path=Path(path),
+                filename=os.path.basename(path),
+                relative_path=relative_path,
+                file_type=file_type,
+                extension=os.path.splitext(path)[1].lower(),
+                size_bytes=st.st_size,
+                modified_time=datetime.fromtimestamp(st.st_mtime),
+            )
 
-                # Get basic file info
-                stat = path.stat()
+            # Apply metadata (full probe result when fresh, indexed fields otherwise)
+            metadata = fresh_metadata.get(path, entry['metadata'])
+            for key, value in metadata.items():
+                if hasattr(media_file, key):
+                    setattr(media_file, key, value)
 
-                # Calculate relative path from directory root
-                try:
-                    relative_path = str(path.relative_to(directory))
-                except ValueError:
-                    relative_path = path.name
-
-                # For multi-directory scans, prefix with directory name to avoid collisions
-                if len(self.directories) > 1:
-                    dir_prefix = directory.name
-                    relative_path = os.path.join(dir_prefix, relative_path)
-
-                media_file = MediaFile(
-                    path=path,
-                    filename=path.name,
-                    relative_path=relative_path,
-                    file_type=file_type,
-                    extension=path.suffix.lower(),
-                    size_bytes=stat.st_size,
-                    modified_time=datetime.fromtimestamp(stat.st_mtime),
-                )
+            (modified if old is not None else added).append(media_file.unique_id)
+            files.append(media_file)
+            file_index[media_file.unique_id] = media_file
 
-                # Probe for additional metadata
-                if file_type == 'video':
-                    metadata = self._probe_video(path)
-                elif file_type == 'image':
-                    metadata = self._probe_image(path)
-                elif file_type in ('storyboard', 'input_script'):
-                    metadata = self._parse_storyboard(path)
-                else:
-                    metadata = {}
+        removed = [f.unique_id for f in previous.values()]
 
-                # Apply metadata
-                for key, value in metadata.items():
-                    if hasattr(media_file, key):
-                        setattr(media_file, key, value)
+        # Sort by modification time (newest first)
+        files.sort(key=lambda f: f.modified_time, reverse=True)
 
-                self.files.append(media_file)
-                self._file_index[media_file.unique_id] = media_file
+        # Publish the new snapshot in one step so readers never see a partial list
+        self.files = files
+        self._file_index = file_index
+        if added or removed or modified:
+            self.library.update(file_index, added, removed, modified)
+            self.generation += 1
+        self.last_changes = {'added': added, 'removed': removed, 'modified': modified}
 
-        # Sort by modification time (newest first)
-        self.files.sort(key=lambda f: f.modified_time, reverse=True)
+        self.index.prune(self.directories, seen)
+        self.index.save()
 
         # Update cache timestamp
         self._last_scan_time = time.time()
 
         return self.files
 
+    @property
+    def is_watching(self) -> bool:
+        """Whether a background polling thread is keeping the gallery fresh."""
+        return self._watch_thread is not None and self._watch_thread.is_alive()
+
+    def watch(self, interval: float = 2.0, recursive: bool = True) -> None:
+        """Start polling the directories for changes in a background thread.
+
+        Each poll is an incremental scan (stat only for unchanged files).
+        While watching, non-forced scan() calls return the current snapshot
+        immediately instead of waiting for cache_ttl to expire.
+
+        Args:
+            interval: Seconds between polls
+            recursive: Whether to scan subdirectories
+        """
+        if self.is_watching:
+            return
+        self._watch_stop.clear()
+
+        def poll():
+            while not self._watch_stop.wait(interval):
+                try:
+                    self.scan(recursive=recursive, force=True)
+                except OSError:
+                    continue
+
+        if not self._last_scan_time:
+            self.scan(recursive=recursive, force=True)
+        self._watch_thread = threading.Thread(target=poll, name='gallery-watch', daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self) -> None:
+        """Stop the background polling thread, if running."""
+        if self._watch_thread is None:
+            return
+        self._watch_stop.set()
+        self._watch_thread.join()
+        self._watch_thread = None
+
     def filter_by_type(self, file_type: str) -> List[MediaFile]:
         """Get files of a specific type.
 
@@ -403,7 +673,7 @@ class Gallery:
         Returns:
             Filtered list of MediaFile objects
         """
-        return [f for f in self.files if f.file_type == file_type]
+        return self.library.by_type(file_type)
 
     def get_by_filename(self, filename: str) -> Optional[MediaFile]:
         """Get a file by its filename.
@@ -417,10 +687,8 @@ class Gallery:
         Returns:
             MediaFile if found, None otherwise
         """
-        for f in self.files:
-            if f.filename == filename:
-                return f
-        return None
+        matches = self.library.by_filename(filename)
+        return matches[0] if matches else None
 
     def get_by_id(self, unique_id: str) -> Optional[MediaFile]:
         """Get a file by its unique identifier.
@@ -441,7 +709,8 @@ class Gallery:
         Returns:
             Dictionary with counts and totals
         """
-        total_size = sum(f.size_bytes for f in self.files)
+        stats = self.library.type_stats()
+        total_size = sum(size for _, size in stats.values())
 
         summary = {
             'total_files': len(self.files),
@@ -451,10 +720,9 @@ class Gallery:
         }
 
         for file_type in ['video', 'image', 'storyboard', 'input_script']:
-            files = self.filter_by_type(file_type)
-            type_size = sum(f.size_bytes for f in files)
+            count, type_size = stats.get(file_type, (0, 0))
             summary['by_type'][file_type] = {
-                'count': len(files),
+                'count': count,
                 'size': type_size,
                 'size_human': format_bytes(type_size),
             }
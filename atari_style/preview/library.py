@@ -0,0 +1,350 @@
+"""In-memory secondary indexes over the gallery's media files.
+
+LibraryIndex keeps every file in sorted lists per sort key, both for the
+whole library and per file type, extension and type+extension pair, plus
+a case-insensitive name list for prefix search. Lists are updated
+incrementally from the gallery's scan deltas, and queries page through
+them with opaque cursors (merging one list per requested extension), so
+request cost depends on the page size rather than the library size.
+Prefix searches are sorted once and cached until a matching file
+changes.
+"""
+
+import base64
+import binascii
+import bisect
+import heapq
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .gallery import MediaFile
+
+
+SortKey = Tuple
+
+# Sort key functions; unique_id breaks ties so keys are unique
+SORT_KEYS: Dict[str, Callable[['MediaFile'], SortKey]] = {
+    'modified': lambda f: (f.modified_time.timestamp(), f.unique_id),
+    'name': lambda f: (f.filename.lower(), f.unique_id),
+    'size': lambda f: (f.size_bytes, f.unique_id),
+}
+
+DEFAULT_ORDER = {'modified': 'desc', 'name': 'asc', 'size': 'desc'}
+
+# JSON types a decoded cursor's leading key element may have, per sort
+CURSOR_TYPES = {'modified': (int, float), 'name': (str,), 'size': (int, float)}
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Sorted prefix-search results kept between requests
+PREFIX_CACHE_SIZE = 64
+
+# Above this fraction of changed files a full rebuild beats incremental updates
+REBUILD_FRACTION = 0.25
+
+
+def encode_cursor(sort: str, key: SortKey) -> str:
+    """Encode a sort position as an opaque URL-safe cursor."""
+    raw = json.dumps([sort, list(key)], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, sort: str) -> SortKey:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (binascii.Error, ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    if cursor_sort != sort or not isinstance(key, list) or len(key) != 2:
+        raise ValueError("Cursor does not match sort order")
+    value, unique_id = key
+    if isinstance(value, bool) or not isinstance(value, CURSOR_TYPES.get(sort, ())) or not isinstance(unique_id, str):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
+class LibraryIndex:
+    """Sorted secondary indexes with cursor paging.
+
+    Index lists are keyed by (sort, facet, value) where facet is None (all
+    files), 'type', 'ext' or 'type+ext' (value is a (type, ext) pair). Each
+    list holds ascending (sort_key, unique_id) pairs; descending queries
+    walk it backwards.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._files: Dict[str, 'MediaFile'] = {}
+        self._keys: Dict[str, Dict[str, SortKey]] = {}
+        self._lists: Dict[Tuple[str, Optional[str], object], List[SortKey]] = {}
+        self._names: List[Tuple[str, str]] = []
+        self._prefixes: 'OrderedDict[Tuple, List[SortKey]]' = OrderedDict()
+        self._by_name: Dict[str, List[str]] = {}
+        self._dicts: Dict[str, Dict] = {}
+        self._type_stats: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self._files
+
+    @staticmethod
+    def _facets(f: 'MediaFile') -> Tuple[Tuple[Optional[str], object], ...]:
+        return (
+            (None, None), ('type', f.file_type), ('ext', f.extension),
+            ('type+ext', (f.file_type, f.extension)),
+        )
+
+    def rebuild(self, files: Iterable['MediaFile']) -> None:
+        """Replace the index contents, sorting each list once."""
+        with self._lock:
+            self._files = {f.unique_id: f for f in files}
+            self._keys = {}
+            self._lists = {}
+            self._by_name = {}
+            self._dicts = {}
+            self._type_stats = {}
+            self._prefixes.clear()
+            for f in self._files.values():
+                keys = {sort: key_fn(f) for sort, key_fn in SORT_KEYS.items()}
+                self._keys[f.unique_id] = keys
+                for facet, value in self._facets(f):
+                    for sort, key in keys.items():
+                        self._lists.setdefault((sort, facet, value), []).append(key)
+                self._by_name.setdefault(f.filename, []).append(f.unique_id)
+                self._count(f, 1)
+            for entries in self._lists.values():
+                entries.sort()
+            self._names = sorted((f.filename.lower(), uid) for uid, f in self._files.items())
+
+    def update(
+        self,
+        files_by_id: Dict[str, 'MediaFile'],
+        added: List[str],
+        removed: List[str],
+        modified: List[str],
+    ) -> None:
+        """Apply a scan delta.
+
+        Args:
+            files_by_id: The gallery's complete id -> MediaFile mapping
+            added: Ids of new files
+            removed: Ids of files that disappeared
+            modified: Ids whose MediaFile was replaced
+        """
+        with self._lock:
+            changed = len(added) + len(removed) + len(modified)
+            if not self._files or changed > REBUILD_FRACTION * max(1, len(files_by_id)):
+                self.rebuild(files_by_id.values())
+                return
+            for uid in removed:
+                self._remove(uid)
+            for uid in modified:
+                self._remove(uid)
+                self._add(files_by_id[uid])
+            for uid in added:
+                self._add(files_by_id[uid])
+
+    def _count(self, f: 'MediaFile', sign: int) -> None:
+        stats = self._type_stats.setdefault(f.file_type, [0, 0])
+        stats[0] += sign
+        stats[1] += sign * f.size_bytes
+
+    def _invalidate_prefixes(self, f: 'MediaFile') -> None:
+        """Drop cached prefix searches that could include ``f``."""
+        name = f.filename.lower()
+        for cache_key in [k for k in self._prefixes if name.startswith(k[1])]:
+            del self._prefixes[cache_key]
+
+    def _add(self, f: 'MediaFile') -> None:
+        uid = f.unique_id
+        if uid in self._files:
+            self._remove(uid)
+        keys = {sort: key_fn(f) for sort, key_fn in SORT_KEYS.items()}
+        self._files[uid] = f
+        self._keys[uid] = keys
+        for facet, value in self._facets(f):
+            for sort, key in keys.items():
+                bisect.insort(self._lists.setdefault((sort, facet, value), []), key)
+        bisect.insort(self._names, (f.filename.lower(), uid))
+        self._by_name.setdefault(f.filename, []).append(uid)
+        self._count(f, 1)
+        self._invalidate_prefixes(f)
+
+    def _remove(self, uid: str) -> None:
+        f = self._files.pop(uid, None)
+        if f is None:
+            return
+        keys = self._keys.pop(uid)
+        for facet, value in self._facets(f):
+            for sort, key in keys.items():
+                entries = self._lists[(sort, facet, value)]
+                i = bisect.bisect_left(entries, key)
+                if i < len(entries) and entries[i] == key:
+                    del entries[i]
+        name_key = (f.filename.lower(), uid)
+        i = bisect.bisect_left(self._names, name_key)
+        if i < len(self._names) and self._names[i] == name_key:
+            del self._names[i]
+        same_name = self._by_name.get(f.filename, [])
+        if uid in same_name:
+            same_name.remove(uid)
+            if not same_name:
+                del self._by_name[f.filename]
+        self._dicts.pop(uid, None)
+        self._count(f, -1)
+        self._invalidate_prefixes(f)
+
+    def to_dict(self, f: 'MediaFile') -> Dict:
+        """Serialized form of a file, memoized until the file changes."""
+        cached = self._dicts.get(f.unique_id)
+        if cached is None or self._files.get(f.unique_id) is not f:
+            cached = f.to_dict()
+            if self._files.get(f.unique_id) is f:
+                self._dicts[f.unique_id] = cached
+        return cached
+
+    def get(self, unique_id: str) -> Optional['MediaFile']:
+        """Look up a file by unique id."""
+        return self._files.get(unique_id)
+
+    def by_filename(self, filename: str) -> List['MediaFile']:
+        """All files with an exact filename, newest first."""
+        with self._lock:
+            files = [self._files[uid] for uid in self._by_name.get(filename, [])]
+        return sorted(files, key=SORT_KEYS['modified'], reverse=True)
+
+    def by_type(self, file_type: Optional[str], sort: str = 'modified', order: Optional[str] = None) -> List['MediaFile']:
+        """All files of a type (None for all) in the given order."""
+        order = order or DEFAULT_ORDER[sort]
+        with self._lock:
+            facet = 'type' if file_type else None
+            entries = self._lists.get((sort, facet, file_type), [])
+            ids = [uid for _, uid in entries]
+            files = [self._files[uid] for uid in ids]
+        if order == 'desc':
+            files.reverse()
+        return files
+
+    def type_stats(self) -> Dict[str, Tuple[int, int]]:
+        """Per-type (count, total bytes)."""
+        with self._lock:
+            return {t: (count, size) for t, (count, size) in self._type_stats.items()}
+
+    def query(
+        self,
+        file_type: Optional[str] = None,
+        extensions: Optional[List[str]] = None,
+        prefix: Optional[str] = None,
+        sort: str = 'modified',
+        order: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List['MediaFile'], Optional[str], int]:
+        """Return one page of matching files.
+
+        Args:
+            file_type: Restrict to one file type
+            extensions: Restrict to these extensions (with or without dot)
+            prefix: Case-insensitive filename prefix
+            sort: One of SORT_KEYS
+            order: 'asc' or 'desc' (default depends on sort)
+            limit: Page size, clamped to 1..MAX_PAGE_SIZE
+            cursor: Cursor from a previous page
+
+        Returns:
+            (files, next_cursor or None, total matching files)
+
+        Raises:
+            ValueError: For unknown sort/order values or a bad cursor
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Unknown sort: {sort}")
+        order = order or DEFAULT_ORDER[sort]
+        if order not in ('asc', 'desc'):
+            raise ValueError(f"Unknown order: {order}")
+        limit = max(1, min(MAX_PAGE_SIZE, limit))
+        after = decode_cursor(cursor, sort) if cursor else None
+
+        exts = None
+        if extensions:
+            exts = sorted({e.lower() if e.startswith('.') else '.' + e.lower() for e in extensions})
+
+        with self._lock:
+            lists = self._candidates(sort, file_type, exts, prefix)
+            total = sum(len(entries) for entries in lists)
+
+            page: List['MediaFile'] = []
+            last_key = None
+            has_more = False
+            walks = [self._walk(entries, order, after) for entries in lists]
+            keys = walks[0] if len(walks) == 1 else heapq.merge(*walks, reverse=order == 'desc')
+            for key in keys:
+                if len(page) == limit:
+                    has_more = True
+                    break
+                page.append(self._files[key[1]])
+                last_key = key
+
+        next_cursor = encode_cursor(sort, last_key) if has_more else None
+        return page, next_cursor, total
+
+    def _candidates(self, sort, file_type, exts, prefix) -> List[List[SortKey]]:
+        """The sorted index lists whose union is exactly the matching files.
+
+        Each file has one type and one extension, so the lists are disjoint.
+        """
+        if prefix:
+            return [self._prefix_list(sort, file_type, exts, prefix.lower())]
+        if not exts:
+            if file_type:
+                return [self._lists.get((sort, 'type', file_type), [])]
+            return [self._lists.get((sort, None, None), [])]
+        if file_type:
+            return [self._lists.get((sort, 'type+ext', (file_type, ext)), []) for ext in exts]
+        return [self._lists.get((sort, 'ext', ext), []) for ext in exts]
+
+    def _prefix_list(self, sort, file_type, exts, lowered) -> List[SortKey]:
+        """Sorted keys of files matching a prefix search, cached until one changes."""
+        cache_key = (sort, lowered, file_type, tuple(exts or ()))
+        entries = self._prefixes.get(cache_key)
+        if entries is not None:
+            self._prefixes.move_to_end(cache_key)
+            return entries
+
+        key_fn = SORT_KEYS[sort]
+        entries = []
+        i = bisect.bisect_left(self._names, (lowered,))
+        while i < len(self._names) and self._names[i][0].startswith(lowered):
+            f = self._files[self._names[i][1]]
+            if (not file_type or f.file_type == file_type) and (not exts or f.extension in exts):
+                entries.append(key_fn(f))
+            i += 1
+        entries.sort()
+
+        self._prefixes[cache_key] = entries
+        if len(self._prefixes) > PREFIX_CACHE_SIZE:
+            self._prefixes.popitem(last=False)
+        return entries
+
+    @staticmethod
+    def _walk(entries: List[SortKey], order: str, after: Optional[SortKey]) -> Iterable[SortKey]:
+        """Iterate sorted entries in ``order`` starting just past ``after``."""
+        if order == 'asc':
+            start = bisect.bisect_right(entries, after) if after is not None else 0
+            for i in range(start, len(entries)):
+                yield entries[i]
+        else:
+            end = bisect.bisect_left(entries, after) if after is not None else len(entries)
+            for i in range(end - 1, -1, -1):
+                yield entries[i]
@@ -1,29 +1,103 @@
 """HTTP preview server for atari-style media files.
 
 Serves a web-based gallery and viewer for exported videos, images,
-and storyboard JSON files. Uses Python's built-in http.server.
+and storyboard JSON files. Uses Python's built-in http.server with one
+thread per connection, HTTP/1.1 keep-alive, and Range/ETag support for
+media so browsers can seek and revalidate without re-downloading.
 """
 
 import argparse
+import concurrent.futures
 import html
 import json
 import mimetypes
+import os
+import re
 import sys
 import urllib.parse
 from functools import partial
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+from ..core.config import CONFIG_DIR
 from .gallery import Gallery, MediaFile
+from .library import DEFAULT_PAGE_SIZE
+from .thumbnails import ThumbnailCache, thumbnail_url
+
+DEFAULT_INDEX_PATH = CONFIG_DIR / 'cache' / 'preview_index.json'
+DEFAULT_THUMBNAIL_DIR = CONFIG_DIR / 'cache' / 'thumbnails'
+
+# Seconds a request waits for a thumbnail being generated
+THUMBNAIL_TIMEOUT = 30.0
+
+# Fallback copy size when os.sendfile is unavailable
+COPY_CHUNK_SIZE = 256 * 1024
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_range(header: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range HTTP Range header.
+
+    Args:
+        header: Range header value (e.g. "bytes=0-1023", "bytes=500-", "bytes=-500")
+        file_size: Size of the resource in bytes
+
+    Returns:
+        Inclusive (start, end) byte positions, or None when the header is
+        absent or not a single byte range (serve the full file).
+
+    Raises:
+        ValueError: If the range is syntactically valid but unsatisfiable
+    """
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None  # Multi-range or unknown unit: ignore per RFC 9110
+
+    start_str, end_str = match.groups()
+    if not start_str and not end_str:
+        return None
+    if not start_str:
+        # Suffix range: last N bytes
+        length = int(end_str)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(0, file_size - length), file_size - 1
+
+    start = int(start_str)
+    end = int(end_str) if end_str else file_size - 1
+    if start >= file_size or end < start:
+        raise ValueError("Range not satisfiable")
+    return start, min(end, file_size - 1)
+
+
+def make_etag(stat_result: os.stat_result) -> str:
+    """Build a strong validator from file size and mtime."""
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
 
 
 class PreviewHandler(SimpleHTTPRequestHandler):
     """HTTP request handler for the preview server."""
 
-    def __init__(self, *args, gallery: Gallery, templates_dir: Path, **kwargs):
+    # Persistent connections; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    def __init__(
+        self,
+        *args,
+        gallery: Gallery,
+        templates_dir: Path,
+        thumbnails: Optional[ThumbnailCache] = None,
+        log_requests: bool = True,
+        **kwargs
+    ):
         self.gallery = gallery
         self.templates_dir = templates_dir
+        self.thumbnails = thumbnails
+        self.log_requests = log_requests
         super().__init__(*args, **kwargs)
 
     def do_GET(self):
@@ -45,11 +119,21 @@ class PreviewHandler(SimpleHTTPRequestHandler):
             self._serve_api_summary()
         elif path.startswith('/media/'):
             self._serve_media_file(path[7:])  # Strip '/media/'
+        elif path.startswith('/thumb/'):
+            self._serve_thumbnail(path[7:])  # Strip '/thumb/'
         elif path.startswith('/static/'):
             self._serve_static(path[8:])  # Strip '/static/'
         else:
             self.send_error(404, "Not Found")
 
+    def do_HEAD(self):
+        """Handle HEAD requests (media headers only)."""
+        path = urllib.parse.urlparse(self.path).path
+        if path.startswith('/media/'):
+            self._serve_media_file(path[7:], head_only=True)
+        else:
+            self.send_error(405, "Method Not Allowed")
+
     def _send_html(self, content: str, status: int = 200):
         """Send HTML response."""
         encoded = content.encode('utf-8')
@@ -86,20 +170,23 @@ class PreviewHandler(SimpleHTTPRequestHandler):
         }
         icon = type_icons.get(f.file_type, '📄')
 
-        # Build preview/thumbnail
+        # Build preview from a server-side poster thumbnail; the full video
+        # is only fetched when the card is hovered
+        thumb_src = thumbnail_url(f.unique_id)
         if f.file_type == 'video':
             preview = f'''
                 <div class="preview video-preview">
-                    <video muted loop preload="metadata">
-                        <source src="/media/{urllib.parse.quote(f.unique_id)}" type="video/mp4">
-                    </video>
+                    <img class="poster" src="{thumb_src}" alt="{html.escape(f.filename)}" loading="lazy"
+                         onerror="this.classList.add('thumb-missing')">
+                    <video muted loop preload="none" data-src="/media/{urllib.parse.quote(f.unique_id)}"></video>
                     <div class="play-overlay">▶</div>
                 </div>
             '''
         elif f.file_type == 'image':
             preview = f'''
                 <div class="preview image-preview">
-                    <img src="/media/{urllib.parse.quote(f.unique_id)}" alt="{html.escape(f.filename)}" loading="lazy">
+                    <img src="{thumb_src}" alt="{html.escape(f.filename)}" loading="lazy"
+                         onerror="this.onerror=null; this.src='/media/{urllib.parse.quote(f.unique_id)}'">
                 </div>
             '''
         else:
@@ -355,8 +442,12 @@ class PreviewHandler(SimpleHTTPRequestHandler):
         output += '</div>'
         return output
 
-    def _serve_media_file(self, file_id: str):
-        """Serve a media file directly with chunked streaming for large files."""
+    def _serve_media_file(self, file_id: str, head_only: bool = False):
+        """Serve a media file with Range, ETag and zero-copy transfer.
+
+        Supports single byte ranges (206/416) so browsers can seek, and
+        If-None-Match/If-Range revalidation against an size+mtime ETag.
+        """
         file_id = urllib.parse.unquote(file_id)
         media_file = self.gallery.get_by_id(file_id)
 
@@ -364,32 +455,146 @@ class PreviewHandler(SimpleHTTPRequestHandler):
             self.send_error(404, "File not found")
             return
 
-        # Serve the file with chunked streaming
         try:
+            f = open(media_file.path, 'rb')
+        except IOError:
+            self.send_error(500, "Error reading file")
+            return
+
+        with f:
+            stat_result = os.fstat(f.fileno())
+            file_size = stat_result.st_size
+            etag = make_etag(stat_result)
+
             # Determine content type
             content_type, _ = mimetypes.guess_type(str(media_file.path))
             if not content_type:
                 content_type = 'application/octet-stream'
 
-            file_size = Path(media_file.path).stat().st_size
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match and etag in [t.strip() for t in if_none_match.split(',')]:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'max-age=3600')
+                self.end_headers()
+                return
 
-            self.send_response(200)
+            # If-Range: only honour Range when the client's copy is current
+            range_header = self.headers.get('Range')
+            if_range = self.headers.get('If-Range')
+            if if_range and if_range.strip() != etag:
+                range_header = None
+
+            try:
+                byte_range = parse_range(range_header, file_size)
+            except ValueError:
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{file_size}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+
+            if byte_range is None:
+                start, end = 0, file_size - 1
+                self.send_response(200)
+            else:
+                start, end = byte_range
+                self.send_response(206)
+                self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+
+            length = end - start + 1 if file_size else 0
             self.send_header('Content-Type', content_type)
-            self.send_header('Content-Length', str(file_size))
+            self.send_header('Content-Length', str(length))
+            self.send_header('Accept-Ranges', 'bytes')
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', self.date_time_string(stat_result.st_mtime))
             self.send_header('Cache-Control', 'max-age=3600')
             self.end_headers()
 
-            # Stream file in chunks to avoid loading large files into memory
-            chunk_size = 8192
-            with open(media_file.path, 'rb') as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-                    self.wfile.write(chunk)
+            if head_only or length == 0:
+                return
 
-        except IOError:
-            self.send_error(500, "Error reading file")
+            try:
+                self._copy_file(f, start, length)
+            except (BrokenPipeError, ConnectionResetError):
+                # Client aborted (e.g. scrubbed to another position)
+                self.close_connection = True
+
+    def _serve_thumbnail(self, file_id: str):
+        """Serve a poster thumbnail, generating it on first request."""
+        file_id = urllib.parse.unquote(file_id)
+        media_file = self.gallery.get_by_id(file_id)
+        if not media_file or media_file.file_type not in ('video', 'image'):
+            self.send_error(404, "File not found")
+            return
+        if self.thumbnails is None:
+            self.send_error(404, "Thumbnails disabled")
+            return
+
+        try:
+            thumb_path = self.thumbnails.get_or_create(media_file, timeout=THUMBNAIL_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            # Not the builtin TimeoutError before Python 3.11
+            thumb_path = None
+        if thumb_path is None:
+            self.send_error(404, "Thumbnail unavailable")
+            return
+
+        # The cache key is content-derived; mtime changes on every LRU touch
+        etag = f'"{thumb_path.stem}"'
+        try:
+            content = thumb_path.read_bytes()
+        except OSError:
+            self.send_error(404, "Thumbnail unavailable")
+            return
+
+        if etag in [t.strip() for t in self.headers.get('If-None-Match', '').split(',')]:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/jpeg')
+        self.send_header('Content-Length', str(len(content)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'max-age=86400')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _copy_file(self, f, offset: int, length: int):
+        """Send ``length`` bytes of ``f`` from ``offset`` to the client.
+
+        Uses os.sendfile when the connection is a real socket; falls back
+        to buffered read/write otherwise.
+        """
+        sock_fileno = None
+        connection = getattr(self, 'connection', None)
+        if hasattr(os, 'sendfile') and connection is not None:
+            try:
+                sock_fileno = connection.fileno()
+            except (AttributeError, OSError):
+                sock_fileno = None
+
+        if isinstance(sock_fileno, int) and sock_fileno >= 0:
+            self.wfile.flush()
+            remaining = length
+            while remaining > 0:
+                sent = os.sendfile(sock_fileno, f.fileno(), offset, remaining)
+                if sent == 0:
+                    raise BrokenPipeError("Connection closed during sendfile")
+                offset += sent
+                remaining -= sent
+            return
+
+        f.seek(offset)
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(COPY_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
 
     def _serve_static(self, path: str):
         """Serve static files (CSS, JS)."""
@@ -423,19 +628,46 @@ class PreviewHandler(SimpleHTTPRequestHandler):
             self.send_error(500, "Error reading file")
 
     def _serve_api_files(self, query: dict):
-        """Serve file list as JSON."""
+        """Serve a page of the file list as JSON.
+
+        Query parameters:
+            type: File type filter ('all' or omitted for every type)
+            ext: Comma-separated extensions (e.g. "mp4,gif")
+            q: Case-insensitive filename prefix
+            sort: modified (default), name or size
+            order: asc or desc (default depends on sort)
+            limit: Page size (default 100, max 1000)
+            cursor: next_cursor from the previous page
+        """
         force_refresh = query.get('refresh', ['0'])[0] == '1'
         self.gallery.scan(force=force_refresh)
 
         type_filter = query.get('type', [None])[0]
-        if type_filter and type_filter != 'all':
-            files = self.gallery.filter_by_type(type_filter)
-        else:
-            files = self.gallery.files
+        if type_filter == 'all':
+            type_filter = None
+        ext_param = query.get('ext', [None])[0]
+        extensions = [e.strip() for e in ext_param.split(',') if e.strip()] if ext_param else None
+
+        try:
+            limit = int(query.get('limit', [DEFAULT_PAGE_SIZE])[0])
+            files, next_cursor, total = self.gallery.library.query(
+                file_type=type_filter,
+                extensions=extensions,
+                prefix=query.get('q', [None])[0],
+                sort=query.get('sort', ['modified'])[0],
+                order=query.get('order', [None])[0],
+                limit=limit,
+                cursor=query.get('cursor', [None])[0],
+            )
+        except ValueError as e:
+            self._send_json({'error': str(e)}, status=400)
+            return
 
         self._send_json({
-            'files': [f.to_dict() for f in files],
+            'files': [self.gallery.library.to_dict(f) for f in files],
             'count': len(files),
+            'total': total,
+            'next_cursor': next_cursor,
         })
 
     def _serve_api_summary(self):
@@ -445,6 +677,8 @@ class PreviewHandler(SimpleHTTPRequestHandler):
 
     def log_message(self, format, *args):
         """Custom log format."""
+        if not self.log_requests:
+            return
         print(f"[preview] {args[0]}")
 
 
@@ -455,7 +689,11 @@ class PreviewServer:
         self,
         directories: Optional[list] = None,
         port: int = 8000,
-        host: str = 'localhost'
+        host: str = 'localhost',
+        index_path: Optional[Path] = None,
+        watch_interval: Optional[float] = None,
+        log_requests: bool = True,
+        thumbnail_dir: Optional[Path] = DEFAULT_THUMBNAIL_DIR,
     ):
         """Initialize the preview server.
 
@@ -463,12 +701,37 @@ class PreviewServer:
             directories: List of directories to scan for media
             port: HTTP port to listen on
             host: Host to bind to
+            index_path: JSON sidecar persisting probe metadata across restarts
+            watch_interval: Poll directories every N seconds for incremental
+                updates (None = rescan on request once the cache expires)
+            log_requests: Print a line per request
+            thumbnail_dir: On-disk thumbnail cache (None disables thumbnails)
         """
         self.port = port
         self.host = host
-        self.gallery = Gallery(directories)
+        self.watch_interval = watch_interval
+        self.log_requests = log_requests
+        self.thumbnails = ThumbnailCache(thumbnail_dir) if thumbnail_dir else None
+        self.gallery = Gallery(directories, index_path=index_path)
         self.templates_dir = Path(__file__).parent / 'templates'
 
+    def make_server(self) -> ThreadingHTTPServer:
+        """Create the threaded HTTP server bound to host/port.
+
+        Each connection is handled on its own daemon thread, so one client
+        streaming a large video does not block the others.
+        """
+        handler = partial(
+            PreviewHandler,
+            gallery=self.gallery,
+            templates_dir=self.templates_dir,
+            thumbnails=self.thumbnails,
+            log_requests=self.log_requests,
+        )
+        server = ThreadingHTTPServer((self.host, self.port), handler)
+        server.daemon_threads = True
+        return server
+
     def run(self):
         """Start the server."""
         # Initial scan
@@ -484,24 +747,25 @@ class PreviewServer:
         print(f"  Images: {summary['by_type']['image']['count']}")
         print(f"  Storyboards: {summary['by_type']['storyboard']['count']}")
         print(f"  Input Scripts: {summary['by_type']['input_script']['count']}")
+        if self.watch_interval:
+            self.gallery.watch(interval=self.watch_interval)
+            print(f"Watching for changes every {self.watch_interval}s")
         print()
         print(f"Server running at http://{self.host}:{self.port}/")
         print("Press Ctrl+C to stop")
         print()
 
-        # Create handler with gallery reference
-        handler = partial(
-            PreviewHandler,
-            gallery=self.gallery,
-            templates_dir=self.templates_dir,
-        )
-
+        server = self.make_server()
         try:
-            server = HTTPServer((self.host, self.port), handler)
             server.serve_forever()
         except KeyboardInterrupt:
             print("\nShutting down server...")
             server.shutdown()
+        finally:
+            server.server_close()
+            self.gallery.stop_watching()
+            if self.thumbnails:
+                self.thumbnails.shutdown()
 
 
 def main():
@@ -515,6 +779,7 @@ Examples:
   %(prog)s -d ./renders             # Serve from custom directory
   %(prog)s -p 3000                  # Use custom port
   %(prog)s -d output -d storyboards # Multiple directories
+  %(prog)s --watch 2                # Poll for new files every 2s
 """
     )
 
@@ -536,6 +801,24 @@ Examples:
         help='Host to bind to (default: localhost)'
     )
 
+    parser.add_argument(
+        '--index',
+        type=Path,
+        default=DEFAULT_INDEX_PATH,
+        help=f'Metadata index file (default: {DEFAULT_INDEX_PATH})'
+    )
+    parser.add_argument(
+        '--no-index',
+        action='store_true',
+        help='Do not persist probe metadata between runs'
+    )
+    parser.add_argument(
+        '--watch',
+        type=float,
+        metavar='SECONDS',
+        help='Poll directories for changes at this interval'
+    )
+
     args = parser.parse_args()
 
     # Convert directory strings to Paths
@@ -548,6 +831,8 @@ Examples:
             directories=directories,
             port=args.port,
             host=args.host,
+            index_path=None if args.no_index else args.index,
+            watch_interval=args.watch,
         )
         server.run()
     except Exception as e:
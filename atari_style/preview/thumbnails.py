@@ -0,0 +1,263 @@
+"""On-demand poster thumbnails for the preview gallery.
+
+Thumbnails are generated on first request (ffmpeg seek for videos, PIL
+resize for images) by a small background worker pool and stored in a
+size-bounded on-disk LRU cache. Cache entries are keyed by a content
+fingerprint, so renamed or moved files reuse their thumbnails and edited
+files get new ones. Concurrent requests for the same thumbnail share one
+generation job.
+"""
+
+import hashlib
+import os
+import subprocess
+import threading
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+from .gallery import MediaFile
+
+
+DEFAULT_THUMBNAIL_SIZE = (320, 180)
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_THUMBNAIL_WORKERS = 2
+
+# Bytes read from each end of a file for its fingerprint
+FINGERPRINT_SAMPLE = 64 * 1024
+
+# Bump when thumbnail rendering changes so old cache entries are ignored
+THUMBNAIL_VERSION = 1
+
+
+def file_fingerprint(path: Path, size: int) -> str:
+    """Fast content fingerprint: file size plus head and tail samples.
+
+    Hashing entire multi-gigabyte videos on first view would defeat the
+    purpose; size + first/last 64 KB identifies exported media reliably.
+    """
+    digest = hashlib.sha256(str(size).encode('ascii'))
+    with open(path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE))
+        if size > 2 * FINGERPRINT_SAMPLE:
+            f.seek(size - FINGERPRINT_SAMPLE)
+            digest.update(f.read(FINGERPRINT_SAMPLE))
+    return digest.hexdigest()
+
+
+def thumbnail_url(unique_id: str) -> str:
+    """URL path for a media file's thumbnail."""
+    return f"/thumb/{urllib.parse.quote(unique_id)}"
+
+
+class ThumbnailCache:
+    """Size-bounded LRU cache of JPEG poster frames.
+
+    Recency is tracked through file mtimes (touched on every hit), so the
+    LRU order survives restarts without a separate index.
+
+    Args:
+        cache_dir: Directory holding ``<key>.jpg`` files (created lazily)
+        max_bytes: Evict least recently used thumbnails above this size
+        size: Maximum (width, height) of generated thumbnails
+        workers: Concurrent generation jobs
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        size: Tuple[int, int] = DEFAULT_THUMBNAIL_SIZE,
+        workers: int = DEFAULT_THUMBNAIL_WORKERS,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.size = size
+        self.workers = max(1, workers)
+
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._fingerprints: Dict[Tuple[str, int, int], str] = {}
+        self._total_bytes: Optional[int] = None
+
+    def key_for(self, media_file: MediaFile) -> str:
+        """Cache key for a media file's thumbnail at the configured size."""
+        st = os.stat(media_file.path)
+        memo_key = (str(media_file.path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            fingerprint = self._fingerprints.get(memo_key)
+        if fingerprint is None:
+            fingerprint = file_fingerprint(Path(media_file.path), st.st_size)
+            with self._lock:
+                self._fingerprints[memo_key] = fingerprint
+        raw = f"v{THUMBNAIL_VERSION}:{fingerprint}:{self.size[0]}x{self.size[1]}"
+        return hashlib.sha256(raw.encode('ascii')).hexdigest()[:32]
+
+    def path_for(self, key: str) -> Path:
+        """Location of the thumbnail for ``key``."""
+        return self.cache_dir / f"{key}.jpg"
+
+    def get(self, media_file: MediaFile) -> Optional[Path]:
+        """Return a cached thumbnail without generating one."""
+        try:
+            path = self.path_for(self.key_for(media_file))
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            return None
+        return path
+
+    def request(self, media_file: MediaFile) -> Future:
+        """Return a future resolving to the thumbnail path (or None).
+
+        Cache hits resolve immediately; misses are queued on the worker
+        pool, and concurrent requests for the same key share one job.
+        """
+        try:
+            key = self.key_for(media_file)
+        except OSError:
+            future: Future = Future()
+            future.set_result(None)
+            return future
+
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+            future = Future()
+            future.set_result(path)
+            return future
+        except OSError:
+            pass
+
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix='thumbnail'
+                )
+            future = self._executor.submit(self._generate, media_file, key)
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def get_or_create(self, media_file: MediaFile, timeout: Optional[float] = 30.0) -> Optional[Path]:
+        """Blocking convenience wrapper around request()."""
+        return self.request(media_file).result(timeout=timeout)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def _generate(self, media_file: MediaFile, key: str) -> Optional[Path]:
+        """Render a thumbnail into the cache; returns None on failure."""
+        path = self.path_for(key)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{key}.{threading.get_ident()}.tmp.jpg")
+        try:
+            if media_file.file_type == 'video':
+                ok = self._render_video(media_file, tmp_path)
+            elif media_file.file_type == 'image':
+                ok = self._render_image(media_file, tmp_path)
+            else:
+                ok = False
+            if not ok:
+                return None
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        self._account(path.stat().st_size)
+        return path
+
+    def _render_video(self, media_file: MediaFile, out_path: Path) -> bool:
+        """Extract one poster frame with a fast input seek."""
+        width, height = self.size
+        seek = 1.0
+        if media_file.duration is not None:
+            seek = min(seek, media_file.duration * 0.1)
+
+        for offset in (seek, 0.0) if seek > 0 else (0.0,):
+            cmd = [
+                'ffmpeg', '-v', 'error', '-y',
+                '-ss', f'{offset:.3f}',
+                '-i', str(media_file.path),
+                '-frames:v', '1',
+                '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease',
+                '-q:v', '5',
+                str(out_path),
+            ]
+            try:
+                result = subprocess.run(cmd, capture_output=True)
+            except FileNotFoundError:
+                return False
+            if result.returncode == 0 and out_path.exists() and out_path.stat().st_size > 0:
+                return True
+        return False
+
+    def _render_image(self, media_file: MediaFile, out_path: Path) -> bool:
+        """Downscale an image (first frame for animated formats)."""
+        if not PIL_AVAILABLE:
+            return False
+        try:
+            with Image.open(media_file.path) as img:
+                img.draft('RGB', self.size)  # Fast JPEG DCT downscale when possible
+                img = img.convert('RGB')
+                img.thumbnail(self.size)
+                img.save(out_path, 'JPEG', quality=80)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def _cached_files(self) -> Iterator[Path]:
+        """Completed thumbnails (in-progress temp files excluded)."""
+        for p in self.cache_dir.glob('*.jpg'):
+            if not p.name.endswith('.tmp.jpg'):
+                yield p
+
+    def _account(self, added_bytes: int) -> None:
+        """Track cache size and evict least recently used entries."""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(p.stat().st_size for p in self._cached_files())
+            else:
+                self._total_bytes += added_bytes
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            entries = []
+            for p in self._cached_files():
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+            entries.sort()
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    p.unlink()
+                    total -= size
+                except OSError:
+                    continue
+            self._total_bytes = total
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (pending jobs are finished first)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
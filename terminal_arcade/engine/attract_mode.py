@@ -2,6 +2,9 @@
 
 Provides functionality for games to record demo gameplay and play it back
 in the menu as an "attract mode" preview, similar to arcade cabinets.
+
+Demos are saved as JSON, or in the compact binary recording format when
+the file name ends in .arec (see atari_style.core.recording_format).
 """
 
 import json
@@ -10,6 +13,8 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
+from atari_style.core.recording_format import BINARY_SUFFIX, load_recording, save_recording
+
 
 class DemoEventType(Enum):
     """Types of events that can be recorded in a demo."""
@@ -42,6 +47,14 @@ class DemoRecorder:
         """Stop recording the demo."""
         self.recording = False
 
+    def _timestamp(self) -> float:
+        """Seconds since recording started, to the microsecond.
+
+        Rounding keeps timestamps exactly representable as integer ticks
+        in the binary format.
+        """
+        return round(time.time() - self.start_time, 6)
+
     def record_input(self, input_type: str, value: Any = None):
         """Record an input event.
 
@@ -52,7 +65,7 @@ class DemoRecorder:
         if not self.recording:
             return
 
-        timestamp = time.time() - self.start_time
+        timestamp = self._timestamp()
         self.events.append({
             "type": DemoEventType.INPUT.value,
             "timestamp": timestamp,
@@ -69,7 +82,7 @@ class DemoRecorder:
         if not self.recording:
             return
 
-        timestamp = time.time() - self.start_time
+        timestamp = self._timestamp()
         self.events.append({
             "type": DemoEventType.STATE.value,
             "timestamp": timestamp,
@@ -85,18 +98,19 @@ class DemoRecorder:
         if not self.recording:
             return
 
-        timestamp = time.time() - self.start_time
+        timestamp = self._timestamp()
         self.events.append({
             "type": DemoEventType.FRAME.value,
             "timestamp": timestamp,
             "frame": frame_number,
         })
 
-    def save(self, filepath: Path):
+    def save(self, filepath: Path, compression: str = 'zlib'):
         """Save recorded demo to file.
 
         Args:
-            filepath: Path to save the demo file
+            filepath: Path to save the demo file (.arec for binary)
+            compression: Block compression for binary output
         """
         demo_data = {
             "game": self.game_name,
@@ -105,6 +119,10 @@ class DemoRecorder:
             "version": "1.0",
         }
 
+        if filepath.suffix == BINARY_SUFFIX:
+            save_recording(demo_data, filepath, compression=compression)
+            return
+
         filepath.parent.mkdir(parents=True, exist_ok=True)
         with open(filepath, 'w') as f:
             json.dump(demo_data, f, indent=2)
@@ -133,8 +151,7 @@ class DemoPlayer:
         if not self.filepath.exists():
             raise FileNotFoundError(f"Demo file not found: {self.filepath}")
 
-        with open(self.filepath, 'r') as f:
-            demo_data = json.load(f)
+        demo_data = load_recording(self.filepath)
 
         self.events = demo_data.get("events", [])
         self.duration = demo_data.get("duration", 0)
@@ -202,9 +219,11 @@ class AttractModeManager:
     def _scan_demos(self):
         """Scan demos directory for available demo files."""
         self.available_demos = {}
-        for demo_file in self.demos_dir.glob("*.json"):
-            game_name = demo_file.stem
-            self.available_demos[game_name] = demo_file
+        for pattern in ("*.json", "*" + BINARY_SUFFIX):
+            # Binary demos are scanned last, so they win over a same-named JSON
+            for demo_file in sorted(self.demos_dir.glob(pattern)):
+                game_name = demo_file.stem
+                self.available_demos[game_name] = demo_file
 
     def get_demo_player(self, game_name: str) -> Optional[DemoPlayer]:
         """Get a demo player for a specific game.
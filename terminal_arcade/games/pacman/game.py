@@ -6,6 +6,7 @@ from collections import deque
 import signal
 from ...engine.renderer import Renderer, Color
 from ...engine.input_handler import InputHandler, InputType
+from atari_style.demos.games.pacman import MazeNavigator
 
 
 class Maze:
@@ -54,6 +55,7 @@ class Maze:
         self.height = len(self.MAZE_DATA)
         self.tiles = [list(row) for row in self.MAZE_DATA]
         self.pellet_count = self._count_pellets()
+        self._navigator = None
 
     def _count_pellets(self):
         """Count total pellets (excluding power pellets)."""
@@ -83,6 +85,13 @@ class Maze:
         tile = self.get_tile(x, y)
         return tile != self.WALL or tile == self.GHOST_GATE
 
+    @property
+    def navigator(self):
+        """Shortest-path tables for this maze's walls (built on first use)."""
+        if self._navigator is None:
+            self._navigator = MazeNavigator.for_layout(self.MAZE_DATA, self.WALL)
+        return self._navigator
+
 
 class Entity:
     """Base class for player and ghosts."""
@@ -147,42 +156,25 @@ class Ghost(Entity):
         self.scatter_target = scatter_target  # Target corner in scatter mode
         self.mode = self.MODE_SCATTER
         self.spawn_pos = (x, y)
-        self.path = []
-        self.path_update_timer = 0
+        self.target = None
+        self.target_update_timer = 0
 
     def update(self, dt, maze, player_pos, player_direction, other_ghosts):
         """Update ghost AI."""
         super().update(dt)
 
-        # Update path periodically
-        self.path_update_timer += dt
-        if self.path_update_timer >= 0.5:  # Recalculate path every 0.5s
-            self.path_update_timer = 0
-            target = self._get_target(player_pos, player_direction, other_ghosts)
-            self.path = self._find_path(maze, target)
-
-        # Follow path
-        if self.path:
-            next_tile = self.path[0]
-            tx, ty = next_tile
-            gx, gy = self.get_tile_pos()
-
-            # Check if reached next waypoint
-            if (gx, gy) == (tx, ty):
-                self.path.pop(0)
-                if self.path:
-                    next_tile = self.path[0]
-                    tx, ty = next_tile
-
-            # Move toward next waypoint
-            if gx < tx:
-                self.direction = (1, 0)
-            elif gx > tx:
-                self.direction = (-1, 0)
-            elif gy < ty:
-                self.direction = (0, 1)
-            elif gy > ty:
-                self.direction = (0, -1)
+        # Targets are cheap to recompute, so track the player every tick.
+        # Frightened ghosts wander to a random tile that changes every 0.5s.
+        self.target_update_timer += dt
+        if (self.mode != self.MODE_FRIGHTENED or self.target is None
+                or self.target_update_timer >= 0.5):
+            self.target_update_timer = 0
+            self.target = self._get_target(player_pos, player_direction, other_ghosts)
+
+        # Steer along a shortest path with a constant-time table lookup
+        direction = maze.navigator.next_direction(self.get_tile_pos(), self.target)
+        if direction is not None:
+            self.direction = direction
 
     def _get_target(self, player_pos, player_direction, other_ghosts):
         """Get target tile based on ghost personality."""
@@ -227,35 +219,6 @@ class Ghost(Entity):
 
         return player_pos
 
-    def _find_path(self, maze, target):
-        """Find path to target using BFS (simpler than A*)."""
-        start = self.get_tile_pos()
-        target = (int(target[0]), int(target[1]))
-
-        # BFS
-        queue = deque([(start, [start])])
-        visited = {start}
-
-        while queue:
-            (x, y), path = queue.popleft()
-
-            if (x, y) == target:
-                return path[1:]  # Exclude current position
-
-            # Try all directions
-            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
-                nx, ny = x + dx, y + dy
-
-                if (nx, ny) not in visited and maze.is_ghost_walkable(nx, ny):
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), path + [(nx, ny)]))
-
-            # Limit search depth
-            if len(visited) > 200:
-                break
-
-        return []
-
     def set_frightened(self):
         """Enter frightened mode."""
         self.mode = self.MODE_FRIGHTENED
@@ -0,0 +1,123 @@
+"""Tests for the ASCII painter's delta-based undo history."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from atari_style.core.renderer import Color
+from atari_style.demos.tools import ascii_painter
+from atari_style.demos.tools.ascii_painter import (
+    Canvas, CanvasEdit, FloodFillTool, FreehandTool, UndoHistory,
+)
+
+
+class TestUndoHistory(unittest.TestCase):
+    """Tests for UndoHistory and CanvasEdit."""
+
+    def setUp(self):
+        self.canvas = Canvas(40, 20)
+        self.history = UndoHistory(self.canvas)
+
+    def _edit(self, cells, char='#', color=Color.RED):
+        self.history.begin()
+        for x, y in cells:
+            self.canvas.set_pixel(x, y, char, color)
+        self.history.end()
+
+    def test_undo_redo_round_trip(self):
+        self._edit([(1, 1), (2, 1)])
+        after_first = self.canvas.snapshot()
+        self._edit([(2, 1), (3, 3)], char='@', color=Color.GREEN)
+        after_second = self.canvas.snapshot()
+
+        self.assertTrue(self.history.undo())
+        self.assertEqual(self.canvas.snapshot(), after_first)
+        self.assertTrue(self.history.undo())
+        self.assertEqual(self.canvas.snapshot(), Canvas(40, 20).snapshot())
+        self.assertFalse(self.history.undo())
+
+        self.assertTrue(self.history.redo())
+        self.assertTrue(self.history.redo())
+        self.assertEqual(self.canvas.snapshot(), after_second)
+        self.assertFalse(self.history.redo())
+
+    def test_stores_only_changed_cells(self):
+        self._edit([(5, 5), (5, 5), (6, 5)])
+        edit = self.history.undo_stack[-1]
+        self.assertEqual(len(edit.cells), 2)
+        self.assertEqual(edit.cells[0], (5, 5, ' ', Color.WHITE, '#', Color.RED))
+
+        # Rewriting identical contents is not an undo step
+        self._edit([(5, 5)])
+        self.assertEqual(len(self.history), 1)
+
+    def test_new_edit_clears_redo(self):
+        self._edit([(0, 0)])
+        self.history.undo()
+        self._edit([(1, 0)])
+        self.assertFalse(self.history.redo())
+
+    def test_large_edits_use_snapshots(self):
+        self._edit([(0, 0)])
+        self.history.begin()
+        FloodFillTool().draw(self.canvas, 10, 10, '░', Color.BLUE)
+        self.history.end()
+        filled = self.canvas.snapshot()
+
+        edit = self.history.undo_stack[-1]
+        self.assertIsNotNone(edit.before)
+        self.assertEqual(edit.cells, ())
+
+        self.history.undo()
+        self.assertEqual(self.canvas.get_pixel(10, 10), (' ', Color.WHITE))
+        self.assertEqual(self.canvas.get_pixel(0, 0), ('#', Color.RED))
+        self.history.redo()
+        self.assertEqual(self.canvas.snapshot(), filled)
+
+    def test_clear_is_recorded(self):
+        self._edit([(3, 4)])
+        self.history.begin()
+        self.canvas.clear()
+        self.history.end()
+        self.history.undo()
+        self.assertEqual(self.canvas.get_pixel(3, 4), ('#', Color.RED))
+
+    def test_memory_scales_with_edits(self):
+        canvas = Canvas(400, 200)
+        history = UndoHistory(canvas)
+        for i in range(3000):
+            history.begin()
+            canvas.set_pixel(i % 400, i % 200, '*+'[i // 400 % 2], Color.YELLOW)
+            history.end()
+        self.assertEqual(len(history), 3000)
+        self.assertTrue(all(len(edit.cells) <= 1 for edit in history.undo_stack))
+        self.assertIsInstance(history.undo_stack[0], CanvasEdit)
+
+
+class TestStrokeCoalescing(unittest.TestCase):
+    """Held-button drags become one undo step."""
+
+    def setUp(self):
+        with patch.object(ascii_painter, 'Renderer', MagicMock), \
+                patch.object(ascii_painter, 'InputHandler', MagicMock):
+            self.painter = ascii_painter.ASCIIPainter()
+
+    def test_drag_is_one_step(self):
+        painter = self.painter
+        tool = painter.tools['freehand']
+        self.assertIsInstance(tool, FreehandTool)
+        for i in range(5):
+            painter.cursor_x = 10 + i
+            painter.perform_drawing_action(continue_stroke=i > 0)
+        painter.history.end()
+        painter.cursor_x = 30
+        painter.perform_drawing_action()
+        painter.history.end()
+
+        self.assertEqual(len(painter.history), 2)
+        painter.undo()
+        painter.undo()
+        self.assertEqual(painter.canvas.to_text().strip(), '')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,291 @@
+"""Tests for the benchmark suite runner and regression gating."""
+
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from atari_style.bench import runner
+from atari_style.bench.cli import main
+from atari_style.bench.runner import (
+    BENCHMARKS,
+    BenchmarkResult,
+    SkipBenchmark,
+    benchmark,
+    best_of,
+    compare,
+    load_results,
+    merge_results,
+    run_case,
+    save_results,
+    select,
+    time_operation,
+)
+
+
+class FakeClock:
+    """Clock that advances a fixed step on every read."""
+
+    def __init__(self, step: float = 0.001):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def _result(name: str, ms: float, status: str = 'ok') -> BenchmarkResult:
+    return BenchmarkResult(name=name, group=name.split('.')[0], status=status,
+                           samples=5, min_ms=ms, median_ms=ms, mean_ms=ms, p95_ms=ms)
+
+
+class RegistryTestCase(unittest.TestCase):
+    """Registers temporary benchmarks and removes them afterwards."""
+
+    def setUp(self):
+        self._registered = set(BENCHMARKS)
+
+    def tearDown(self):
+        for name in set(BENCHMARKS) - self._registered:
+            del BENCHMARKS[name]
+
+
+class TestTiming(RegistryTestCase):
+    """Tests for the timing loop and case execution."""
+
+    def test_warmup_and_min_samples(self):
+        calls = []
+        samples = time_operation(lambda: calls.append(1), warmup=3, min_time=0.0,
+                                 min_samples=5, clock=FakeClock())
+        self.assertEqual(len(samples), 5)
+        self.assertEqual(len(calls), 8)
+        for s in samples:
+            self.assertAlmostEqual(s, 0.001)
+
+    def test_samples_until_min_time(self):
+        samples = time_operation(lambda: None, warmup=0, min_time=0.05,
+                                 min_samples=1, clock=FakeClock(0.01))
+        # Each sample reads the clock twice, advancing 20ms
+        self.assertEqual(len(samples), 3)
+
+    def test_max_samples_cap(self):
+        samples = time_operation(lambda: None, warmup=0, min_time=100.0,
+                                 max_samples=7, clock=FakeClock())
+        self.assertEqual(len(samples), 7)
+
+    def test_setup_and_cleanup_run_once(self):
+        events = []
+
+        @benchmark('test.lifecycle', size=3)
+        def lifecycle(size):
+            events.append(('setup', size))
+            try:
+                yield lambda: events.append('op')
+            finally:
+                events.append('cleanup')
+
+        result = run_case(BENCHMARKS['test.lifecycle'], warmup=1, min_time=0.0, min_samples=2)
+        self.assertEqual(result.status, 'ok')
+        self.assertEqual(result.samples, 2)
+        self.assertEqual(result.group, 'test')
+        self.assertEqual(events, [('setup', 3), 'op', 'op', 'op', 'cleanup'])
+
+    def test_skip_and_error(self):
+        @benchmark('test.skip')
+        def skipped():
+            raise SkipBenchmark('no gpu')
+            yield
+
+        @benchmark('test.error')
+        def broken():
+            yield lambda: 1 / 0
+
+        skip = run_case(BENCHMARKS['test.skip'])
+        self.assertEqual((skip.status, skip.reason), ('skipped', 'no gpu'))
+        error = run_case(BENCHMARKS['test.error'], warmup=1)
+        self.assertEqual(error.status, 'error')
+        self.assertIn('ZeroDivisionError', error.reason)
+
+    def test_duplicate_name_rejected(self):
+        @benchmark('test.dup')
+        def first():
+            yield lambda: None
+
+        with self.assertRaises(ValueError):
+            benchmark('test.dup')(first)
+
+    def test_select_patterns(self):
+        for name in ('test.sel.alpha', 'test.sel.beta', 'test.other'):
+            benchmark(name)(lambda: iter([lambda: None]))
+        names = [c.name for c in select(['test.sel'])]
+        self.assertEqual(names, ['test.sel.alpha', 'test.sel.beta'])
+        names = [c.name for c in select(['test.*a'])]
+        self.assertEqual(names, ['test.sel.alpha', 'test.sel.beta'])
+
+    def test_builtin_cases_registered(self):
+        from atari_style.bench import cases  # noqa: F401
+        names = set(BENCHMARKS)
+        for expected in ('renderer.render.80x24', 'headless.to_image.80x24',
+                         'screensaver.plasma.draw', 'fluid_lattice.step.160x48',
+                         'gl.composite.flux_spiral.terminal', 'ffmpeg.encode_gif',
+                         'gallery.scan.warm'):
+            self.assertIn(expected, names)
+
+
+class TestComparison(unittest.TestCase):
+    """Tests for baseline comparison."""
+
+    def test_regression_detected(self):
+        baseline = {'a': {'min_ms': 10.0, 'status': 'ok'}, 'b': {'min_ms': 10.0}}
+        comparisons = compare([_result('a', 13.0), _result('b', 12.0)], baseline, threshold=0.25)
+        self.assertTrue(comparisons[0].regressed)
+        self.assertAlmostEqual(comparisons[0].change, 0.3)
+        self.assertFalse(comparisons[1].regressed)
+
+    def test_per_case_threshold(self):
+        result = _result('a', 14.0)
+        result.threshold = 0.5
+        comparisons = compare([result], {'a': {'min_ms': 10.0}}, threshold=0.1)
+        self.assertFalse(comparisons[0].regressed)
+
+    def test_noise_floor(self):
+        comparisons = compare([_result('a', 0.002)], {'a': {'min_ms': 0.001}})
+        self.assertFalse(comparisons[0].regressed)
+
+    def test_scale_and_metric(self):
+        result = _result('a', 10.0)
+        result.median_ms = 30.0
+        baseline = {'a': {'min_ms': 5.0, 'median_ms': 20.0}}
+        # Machine is twice as slow as when the baseline was recorded
+        self.assertFalse(compare([result], baseline, scale=2.0)[0].regressed)
+        self.assertTrue(compare([result], baseline, scale=1.0)[0].regressed)
+        self.assertTrue(compare([result], baseline, metric='median')[0].regressed)
+        with self.assertRaises(ValueError):
+            compare([result], baseline, metric='mode')
+
+    def test_missing_and_skipped(self):
+        comparisons = compare(
+            [_result('new', 1.0), _result('gone', 1.0, status='skipped')],
+            {'gone': {'min_ms': 1.0}},
+        )
+        self.assertEqual([c.name for c in comparisons], ['new'])
+        self.assertIsNone(comparisons[0].baseline_ms)
+        self.assertFalse(comparisons[0].regressed)
+
+    def test_best_of(self):
+        a, b = _result('x', 2.0), _result('x', 1.0)
+        self.assertIs(best_of(a, b), b)
+        self.assertIs(best_of(a, _result('x', 0.5, status='error')), a)
+
+
+class TestResultsFiles(unittest.TestCase):
+    """Tests for saving, loading and merging results."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / 'bench' / 'baseline.json'
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self):
+        save_results([_result('a', 1.5)], self.path, calibration_ms=3.0)
+        data = json.loads(self.path.read_text())
+        self.assertEqual(data['version'], runner.RESULTS_VERSION)
+        self.assertEqual(data['environment']['calibration_ms'], 3.0)
+        self.assertEqual(load_results(self.path)['a']['min_ms'], 1.5)
+
+    def test_merge_keeps_other_entries(self):
+        save_results([_result('a', 1.0), _result('b', 2.0)], self.path, calibration_ms=1.0)
+        merge_results([_result('b', 5.0), _result('c', 1.0, status='skipped')], self.path, 1.0)
+        results = load_results(self.path)
+        self.assertEqual(sorted(results), ['a', 'b'])
+        self.assertEqual(results['b']['min_ms'], 5.0)
+
+    def test_merge_rescales_to_baseline_calibration(self):
+        save_results([_result('a', 1.0)], self.path, calibration_ms=10.0)
+        merge_results([_result('b', 6.0)], self.path, calibration_ms=12.0)
+        data = json.loads(self.path.read_text())
+        self.assertEqual(data['environment']['calibration_ms'], 10.0)
+        self.assertEqual(data['results']['a']['min_ms'], 1.0)
+        self.assertEqual(data['results']['b']['min_ms'], 5.0)
+
+    def test_rejects_foreign_json(self):
+        self.path.parent.mkdir(parents=True)
+        self.path.write_text('{"hello": 1}')
+        with self.assertRaises(ValueError):
+            load_results(self.path)
+
+
+class TestCli(RegistryTestCase):
+    """End-to-end CLI runs against a temporary baseline."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.baseline = Path(self.temp_dir.name) / 'baseline.json'
+        self.cost = {'value': 0.01}
+
+        @benchmark('clitest.work')
+        def work():
+            yield lambda: None
+
+        # Report a controllable duration instead of real timings
+        def fake_run_case(case, **timing):
+            return BenchmarkResult.from_samples(case, [self.cost['value']] * 5)
+
+        patches = [
+            patch('atari_style.bench.cli.run_case', side_effect=fake_run_case),
+            patch('atari_style.bench.runner.run_case', side_effect=fake_run_case),
+            patch('atari_style.bench.cli.calibrate', return_value=1.0),
+            patch('atari_style.bench.runner.calibrate', return_value=1.0),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def _main(self, *args):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['clitest', '--baseline', str(self.baseline), *args])
+        return code, out.getvalue()
+
+    def test_save_then_pass(self):
+        code, _ = self._main('--save-baseline')
+        self.assertEqual(code, 0)
+        self.assertIn('clitest.work', load_results(self.baseline))
+
+        code, output = self._main()
+        self.assertEqual(code, 0)
+        self.assertIn('No regressions', output)
+
+    def test_regression_fails_after_retries(self):
+        self._main('--save-baseline')
+        self.cost['value'] = 0.02
+        code, output = self._main('--retries', '1')
+        self.assertEqual(code, 1)
+        self.assertIn('REGRESSION', output)
+        self.assertIn('Confirming 1 possible regression', output)
+
+    def test_output_file_written(self):
+        output_path = Path(self.temp_dir.name) / 'results.json'
+        code, _ = self._main('-o', str(output_path))
+        self.assertEqual(code, 0)  # No baseline yet is not a failure
+        self.assertIn('clitest.work', load_results(output_path))
+
+    def test_list(self):
+        code, output = self._main('--list')
+        self.assertEqual(code, 0)
+        self.assertIn('clitest.work', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
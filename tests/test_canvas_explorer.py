@@ -0,0 +1,97 @@
+"""Tests for Canvas Explorer's spatial index and viewport culling."""
+
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+from atari_style.core.headless_renderer import HeadlessRenderer
+from atari_style.demos.tools import canvas_explorer
+from atari_style.demos.tools.canvas_explorer import CanvasModel
+
+
+def make_explorer(width=80, height=24):
+    with patch.object(canvas_explorer, 'Renderer', lambda: HeadlessRenderer(width=width, height=height)), \
+            patch.object(canvas_explorer, 'InputHandler', MagicMock):
+        explorer = canvas_explorer.CanvasExplorer()
+    explorer.renderer.render = lambda: None
+    return explorer
+
+
+class TestCanvasModelIndex(unittest.TestCase):
+    """Hit tests through the index match a linear scan."""
+
+    def setUp(self):
+        rng = random.Random(6)
+        self.model = CanvasModel()
+        for _ in range(400):
+            self.model.add_box(rng.uniform(-500, 500), rng.uniform(-500, 500),
+                               rng.uniform(5, 60), rng.uniform(3, 20))
+        self.rng = rng
+
+    def linear_box_at(self, x, y):
+        for box in reversed(self.model.boxes):
+            if box.contains_point(x, y):
+                return box
+        return None
+
+    def test_get_box_at_matches_scan(self):
+        for _ in range(500):
+            x, y = self.rng.uniform(-520, 520), self.rng.uniform(-520, 520)
+            self.assertIs(self.model.get_box_at(x, y), self.linear_box_at(x, y))
+
+    def test_move_and_delete_update_index(self):
+        box = self.model.boxes[10]
+        self.model.move_box(box, 2000, 2000)
+        self.assertIs(self.model.get_box_at(box.x + 1, box.y + 1), box)
+        self.assertIn(box, self.model.boxes_in(box.x, box.y, box.x2, box.y2))
+
+        self.model.select_box(box)
+        self.assertTrue(self.model.delete_selected())
+        self.assertIsNone(self.model.get_box_at(box.x + 1, box.y + 1))
+        self.assertNotIn(box, self.model.boxes)
+        self.assertIsNone(self.model.get_selected_box())
+
+    def test_marker_to_box(self):
+        marker = self.model.add_marker(3000, 3000, "M")
+        self.assertEqual(self.model.markers_in(2990, 2990, 3010, 3010), [marker])
+        box = self.model.marker_to_box(marker)
+        self.assertEqual(self.model.markers_in(2990, 2990, 3010, 3010), [])
+        self.assertIs(self.model.get_box_at(3000, 3000), box)
+
+
+class TestViewportCulling(unittest.TestCase):
+    """Culled drawing matches drawing every object."""
+
+    def test_draw_matches_full_scan(self):
+        rng = random.Random(8)
+        explorer = make_explorer()
+        for _ in range(300):
+            explorer.canvas.add_box(rng.uniform(-400, 400), rng.uniform(-200, 200),
+                                    rng.uniform(5, 40), rng.uniform(3, 12), "Box")
+            explorer.canvas.add_marker(rng.uniform(-400, 400), rng.uniform(-200, 200), "m")
+
+        reference = HeadlessRenderer(width=80, height=24)
+        for level in (0, 5, 10, 15):
+            for camera in ((0.0, 0.0), (137.3, -41.9), (-250.5, 120.25)):
+                with self.subTest(level=level, camera=camera):
+                    explorer.viewport.zoom.set_level(level)
+                    explorer.viewport.center_on(*camera)
+                    explorer.draw()
+
+                    reference.clear_buffer()
+                    draw = canvas_explorer.CanvasRenderer(reference)
+                    draw.draw_grid(explorer.viewport, explorer.grid)
+                    for box in explorer.canvas.boxes:
+                        draw.draw_box(box, explorer.viewport)
+                    for marker in explorer.canvas.markers:
+                        draw.draw_marker(marker, explorer.viewport)
+                    draw.draw_cursor(explorer.cursor_x, explorer.cursor_y, explorer.mode)
+                    cursor_world = explorer.viewport.screen_to_world(explorer.cursor_x, explorer.cursor_y)
+                    draw.draw_status_bar(cursor_world, explorer.viewport.zoom, explorer.mode,
+                                         explorer.canvas.get_selected_box())
+
+                    self.assertEqual(explorer.renderer.buffer, reference.buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
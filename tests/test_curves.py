@@ -0,0 +1,59 @@
+"""Tests for cached Lissajous sampling and cell de-duplication."""
+
+import math
+import unittest
+
+import numpy as np
+
+from atari_style.core import curves
+
+
+class TestLissajous(unittest.TestCase):
+    """Tests for curves.lissajous."""
+
+    def test_matches_scalar_formula(self):
+        times = np.array([1.0, 0.98, 0.5])
+        x, y = curves.lissajous(120, 3.0, 2.5, 0.7, times, y_rate=0.3)
+        self.assertEqual(x.shape, (3, 120))
+        for row, t in enumerate(times.tolist()):
+            for i in range(0, 120, 7):
+                angle = (i / 120) * 2 * math.pi
+                self.assertAlmostEqual(x[row, i], math.sin(3.0 * angle + t), places=12)
+                self.assertAlmostEqual(y[row, i], math.sin(2.5 * angle + 0.7 + t * 0.3), places=12)
+
+    def test_scalar_time_and_cache(self):
+        x, y = curves.lissajous(64, 1.0, 2.0, 0.0, 0.25)
+        self.assertEqual(x.shape, (64,))
+        self.assertIs(curves.angle_grid(64), curves.angle_grid(64))
+        with self.assertRaises(ValueError):
+            curves.angle_grid(64)[0] = 1.0
+
+
+class TestLastWrites(unittest.TestCase):
+    """Tests for curves.last_writes."""
+
+    def test_keeps_final_write_per_cell(self):
+        xs = np.array([[1, 2, 1], [5, 2, -1]])
+        ys = np.array([[0, 0, 0], [9, 0, 0]])
+        keep = curves.last_writes(xs, ys, width=4, height=3)
+        # (1,0) last written at 2; (2,0) at 4; (5,9) and (-1,0) off-screen
+        self.assertEqual(keep.tolist(), [2, 4])
+
+    def test_replay_matches_full_draw(self):
+        rng = np.random.default_rng(2)
+        xs = rng.integers(-2, 12, size=500)
+        ys = rng.integers(-2, 8, size=500)
+        full, deduped = {}, {}
+        for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+            if 0 <= x < 10 and 0 <= y < 6:
+                full[x, y] = i
+        for i in curves.last_writes(xs, ys, 10, 6).tolist():
+            deduped[xs[i], ys[i]] = i
+        self.assertEqual(full, deduped)
+
+    def test_empty(self):
+        self.assertEqual(len(curves.last_writes(np.array([-1]), np.array([0]), 3, 3)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,13 +2,17 @@
 
 import json
 import os
+import shutil
 import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 
+from PIL import Image, ImageSequence
+
 from atari_style.core.demo_video import (
     DemoVideoExporter,
     DEMO_REGISTRY,
+    gif_frame_selection,
     register_demo,
 )
 
@@ -179,7 +183,7 @@ class TestDemoVideoExporterEncode(unittest.TestCase):
 
     @patch('atari_style.core.demo_video.FFmpegEncoder')
     def test_export_raises_without_ffmpeg(self, mock_encoder_class):
-        """Test that missing ffmpeg raises RuntimeError on export."""
+        """Test that missing ffmpeg raises RuntimeError on MP4 export."""
         mock_encoder = MagicMock()
         mock_encoder.is_available.return_value = False
         mock_encoder_class.return_value = mock_encoder
@@ -187,8 +191,7 @@ class TestDemoVideoExporterEncode(unittest.TestCase):
         exporter = DemoVideoExporter(
             demo_name='joystick_test',
             script_path=self.temp_script.name,
-            output_path='/tmp/test.gif',
-            gif_mode=True,
+            output_path='/tmp/test.mp4',
         )
 
         with self.assertRaises(RuntimeError) as context:
@@ -201,14 +204,13 @@ class TestDemoVideoExporterEncode(unittest.TestCase):
         """Test that encoding failure raises RuntimeError."""
         mock_encoder = MagicMock()
         mock_encoder.is_available.return_value = True
-        mock_encoder.encode_gif.return_value = False
+        mock_encoder.encode_video.return_value = False
         mock_encoder_class.return_value = mock_encoder
 
         exporter = DemoVideoExporter(
             demo_name='joystick_test',
             script_path=self.temp_script.name,
-            output_path='/tmp/test.gif',
-            gif_mode=True,
+            output_path='/tmp/test.mp4',
         )
 
         with self.assertRaises(RuntimeError) as context:
@@ -216,6 +218,115 @@ class TestDemoVideoExporterEncode(unittest.TestCase):
 
         self.assertIn('ffmpeg encoding failed', str(context.exception))
 
+    @patch('atari_style.core.demo_video.FFmpegEncoder')
+    def test_gif_export_without_ffmpeg(self, mock_encoder_class):
+        """Test that GIFs are encoded in-process at the GIF frame rate."""
+        mock_encoder = MagicMock()
+        mock_encoder.is_available.return_value = False
+        mock_encoder_class.return_value = mock_encoder
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, 'test.gif')
+            exporter = DemoVideoExporter(
+                demo_name='joystick_test',
+                script_path=self.temp_script.name,
+                output_path=output_path,
+                char_columns=40,
+                char_rows=12,
+                gif_mode=True,
+                gif_fps=5,
+                gif_scale=200,
+            )
+            drawn = []
+            original_draw = exporter.demo.draw
+            exporter.demo.draw = lambda: drawn.append(1) or original_draw()
+            exporter.export()
+
+            with Image.open(output_path) as img:
+                self.assertEqual(img.width, 200)
+                frames = list(ImageSequence.Iterator(img))
+                total_ms = sum(frame.info['duration'] for frame in frames)
+
+        mock_encoder.encode_gif.assert_not_called()
+        self.assertEqual(len(drawn), 5)  # Every source frame is still drawn
+        self.assertEqual(total_ms, 600)  # 3 GIF frames at 5 fps
+
+
+class TestHeldFrames(unittest.TestCase):
+    """Held frames are rasterized once and stretched in the output."""
+
+    def setUp(self):
+        script = {
+            'name': 'Hold',
+            'duration': 1.0,
+            'fps': 10,
+            'keyframes': [
+                {'time': 0.0, 'x': 0.0, 'y': 0.0, 'buttons': []},
+                {'time': 0.3, 'x': 0.0, 'y': 0.0, 'buttons': []},
+                {'time': 0.4, 'x': 1.0, 'y': 0.0, 'buttons': []},
+            ]
+        }
+        self.temp_dir = tempfile.mkdtemp()
+        self.script_path = os.path.join(self.temp_dir, 'hold.json')
+        with open(self.script_path, 'w') as f:
+            json.dump(script, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _exporter(self, output_name, **kwargs):
+        return DemoVideoExporter(
+            demo_name='joystick_test',
+            script_path=self.script_path,
+            output_path=os.path.join(self.temp_dir, output_name),
+            char_columns=40,
+            char_rows=12,
+            **kwargs,
+        )
+
+    @patch('atari_style.core.demo_video.FFmpegEncoder')
+    def test_mp4_durations(self, mock_encoder_class):
+        saved = []
+
+        def encode_video(frames_dir, output_path, fps, durations=None):
+            saved.extend(sorted(os.listdir(frames_dir)))
+            self.assertEqual(durations, [0.4, 0.6])
+            return True
+
+        mock_encoder = MagicMock()
+        mock_encoder.is_available.return_value = True
+        mock_encoder.encode_video.side_effect = encode_video
+        mock_encoder_class.return_value = mock_encoder
+
+        exporter = self._exporter('hold.mp4')
+        with patch.object(exporter.renderer, 'save_frame', wraps=exporter.renderer.save_frame) as save:
+            exporter.export()
+
+        self.assertEqual(save.call_count, 2)
+        self.assertEqual(saved, ['frame_00000.png', 'frame_00001.png'])
+        self.assertEqual(exporter.frames_reused, 8)
+
+    def test_gif_delays(self):
+        exporter = self._exporter('hold.gif', gif_mode=True, gif_fps=10)
+        with patch.object(exporter.renderer, 'to_image', wraps=exporter.renderer.to_image) as to_image:
+            exporter.export()
+
+        self.assertEqual(to_image.call_count, 2)
+        with Image.open(exporter.output_path) as img:
+            durations = [frame.info['duration'] for frame in ImageSequence.Iterator(img)]
+        self.assertEqual(durations, [400, 600])
+
+
+class TestGifFrameSelection(unittest.TestCase):
+    """Tests for gif_frame_selection."""
+
+    def test_downsample(self):
+        self.assertEqual(sorted(gif_frame_selection(30, 30, 15)), list(range(0, 30, 2)))
+        self.assertEqual(sorted(gif_frame_selection(10, 30, 10)), [0, 3, 6])
+
+    def test_keeps_all_when_gif_is_faster(self):
+        self.assertEqual(gif_frame_selection(4, 10, 15), {0, 1, 2, 3})
+
 
 class TestDemoRegistry(unittest.TestCase):
     """Test demo registry functionality."""
@@ -0,0 +1,124 @@
+"""Tests for the render-once, encode-many fan-out encoder."""
+
+import unittest
+from unittest.mock import patch
+
+from PIL import Image
+
+from atari_style.core.fanout_encoder import (
+    FanoutEncoder, OutputSpec, encoder_command, fit_filter, master_size,
+)
+from atari_style.core.video_base import PresetManager
+
+
+class FakeStdin:
+    """Collects bytes written to an encoder pipe."""
+
+    def __init__(self, fail_after=None):
+        self.frames = 0
+        self.closed = False
+        self.fail_after = fail_after
+
+    def write(self, data):
+        if self.fail_after is not None and self.frames >= self.fail_after:
+            raise BrokenPipeError()
+        self.frames += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakePopen:
+    """Stands in for an ffmpeg process reading stdin."""
+
+    instances = []
+
+    def __init__(self, cmd, stdin=None, stdout=None, stderr=None):
+        self.cmd = cmd
+        self.stdin = FakeStdin()
+        FakePopen.instances.append(self)
+
+    def wait(self):
+        return 0
+
+
+class TestFitFilter(unittest.TestCase):
+    """Tests for master sizing and per-output filters."""
+
+    def test_master_size_covers_outputs(self):
+        outputs = [OutputSpec.from_format(f'{name}.mp4', PresetManager.get_preset(name))
+                   for name in PresetManager.get_publish_set('social')]
+        self.assertEqual(master_size(outputs), (1920, 1920))
+        self.assertEqual(master_size([OutputSpec('a.gif', 481, 271)]), (482, 272))
+
+    def test_filters(self):
+        wide = OutputSpec('wide.mp4', 1920, 1080)
+        self.assertEqual(fit_filter((1920, 1080), wide, 30), 'null')
+        self.assertEqual(
+            fit_filter((1920, 1920), wide, 30),
+            'scale=1920:1080:force_original_aspect_ratio=increase:flags=lanczos,crop=1920:1080')
+
+        padded = OutputSpec('pad.mp4', 1080, 1080, fps=15, fit='pad')
+        self.assertEqual(
+            fit_filter((1920, 1080), padded, 30),
+            'fps=15,scale=1080:1080:force_original_aspect_ratio=decrease:flags=lanczos,'
+            'pad=1080:1080:(ow-iw)/2:(oh-ih)/2')
+
+        with self.assertRaises(ValueError):
+            OutputSpec('x.mp4', 10, 10, fit='zoom')
+
+    def test_commands(self):
+        cmd = encoder_command((640, 480), 30, OutputSpec('out.mp4', 320, 240, crf=28))
+        self.assertEqual(cmd[cmd.index('-s') + 1], '640x480')
+        self.assertEqual(cmd[cmd.index('-i') + 1], '-')
+        self.assertEqual(cmd[cmd.index('-crf') + 1], '28')
+        self.assertEqual(cmd[-1], 'out.mp4')
+
+        gif = encoder_command((640, 480), 30, OutputSpec('out.gif', 320, 240, fps=15))
+        graph = gif[gif.index('-filter_complex') + 1]
+        self.assertIn('palettegen', graph)
+        self.assertTrue(graph.startswith('[0:v]fps=15,scale=320:240'))
+        self.assertNotIn('libx264', gif)
+
+
+@patch('atari_style.core.fanout_encoder.subprocess.Popen', FakePopen)
+class TestFanoutEncoder(unittest.TestCase):
+    """Tests for streaming frames into several encoders."""
+
+    def setUp(self):
+        FakePopen.instances = []
+        self.frame = Image.new('RGB', (64, 36), (10, 20, 30))
+
+    def test_each_frame_reaches_every_output(self):
+        outputs = [OutputSpec('a.mp4', 64, 36), OutputSpec('b.mp4', 32, 32), OutputSpec('c.gif', 16, 9)]
+        with FanoutEncoder((64, 36), 30, outputs) as fanout:
+            for _ in range(5):
+                fanout.write(self.frame)
+        self.assertEqual([p.stdin.frames for p in FakePopen.instances], [5, 5, 5])
+        self.assertTrue(all(p.stdin.closed for p in FakePopen.instances))
+        self.assertEqual(fanout.results, {'a.mp4': True, 'b.mp4': True, 'c.gif': True})
+
+    def test_max_duration_stops_output(self):
+        outputs = [OutputSpec('long.mp4', 64, 36), OutputSpec('short.mp4', 64, 36, max_duration=0.1)]
+        with FanoutEncoder((64, 36), 30, outputs) as fanout:
+            for _ in range(6):
+                fanout.write(self.frame)
+            self.assertEqual(fanout.active, 1)
+        self.assertEqual([p.stdin.frames for p in FakePopen.instances], [6, 3])
+
+    def test_broken_pipe_fails_one_output(self):
+        with FanoutEncoder((64, 36), 30, [OutputSpec('ok.mp4', 64, 36), OutputSpec('bad.mp4', 64, 36)]) as fanout:
+            FakePopen.instances[1].stdin.fail_after = 2
+            for _ in range(4):
+                fanout.write(self.frame)
+        self.assertEqual(fanout.results, {'ok.mp4': True, 'bad.mp4': False})
+        self.assertEqual(FakePopen.instances[0].stdin.frames, 4)
+
+    def test_frame_size_checked(self):
+        with FanoutEncoder((64, 36), 30, [OutputSpec('a.mp4', 64, 36)]) as fanout:
+            with self.assertRaises(ValueError):
+                fanout.write(Image.new('RGB', (32, 32)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Tests for the fixed-timestep frame scheduler."""
+
+import unittest
+
+from atari_style.core.frame_scheduler import FrameScheduler, FrameStats
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep() advances time."""
+
+    def __init__(self, oversleep: float = 0.0):
+        self.now = 100.0
+        self.oversleep = oversleep
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
+
+
+def _scheduler(clock, **kwargs):
+    return FrameScheduler(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestFrameScheduler(unittest.TestCase):
+    """Tests for FrameScheduler pacing and stepping."""
+
+    def test_invalid_fps(self):
+        with self.assertRaises(ValueError):
+            FrameScheduler(target_fps=0)
+
+    def test_fixed_steps_per_frame(self):
+        """Each on-time frame runs exactly one fixed update."""
+        clock = FakeClock()
+        scheduler = _scheduler(clock, target_fps=50)
+        scheduler.start()
+        steps = []
+        for _ in range(10):
+            clock.now += 0.005  # Render work
+            steps.append(list(scheduler.updates()))
+            scheduler.end_frame()
+
+        # The first frame runs before any time is owed
+        self.assertEqual(steps[0], [])
+        for frame_steps in steps[1:]:
+            self.assertEqual(frame_steps, [0.02])
+        self.assertAlmostEqual(scheduler.stats.fps, 50.0)
+
+    def test_sleep_absorbs_work_time(self):
+        """Sleep shortens as the frame's work grows."""
+        clock = FakeClock()
+        scheduler = _scheduler(clock, target_fps=50)
+        scheduler.start()
+        clock.now += 0.015
+        scheduler.end_frame()
+        self.assertAlmostEqual(clock.sleeps[-1], 0.005)
+
+    def test_oversleep_compensated(self):
+        """Oversleeping is made up on later frames, holding the average rate."""
+        clock = FakeClock(oversleep=0.002)
+        scheduler = _scheduler(clock, target_fps=50)
+        scheduler.start()
+        start = clock.now
+        for _ in range(100):
+            clock.now += 0.004
+            for _ in scheduler.updates():
+                pass
+            scheduler.end_frame()
+        self.assertAlmostEqual(clock.now - start, 2.0, delta=0.005)
+
+    def test_slow_frames_catch_up_with_updates(self):
+        """A slow frame is followed by several fixed updates, not a larger dt."""
+        clock = FakeClock()
+        scheduler = _scheduler(clock, target_fps=100)
+        scheduler.start()
+        clock.now += 0.035
+        steps = list(scheduler.updates())
+        self.assertEqual(steps, [0.01, 0.01, 0.01])
+        self.assertAlmostEqual(scheduler.frame_dt, 0.03)
+        self.assertAlmostEqual(scheduler.alpha, 0.5)
+
+    def test_overload_drops_time(self):
+        """Past max_updates the owed time is dropped and counted."""
+        clock = FakeClock()
+        scheduler = _scheduler(clock, target_fps=100, max_updates=4)
+        scheduler.start()
+        clock.now += 1.0
+        steps = list(scheduler.updates())
+        self.assertEqual(len(steps), 4)
+        self.assertEqual(scheduler.stats.skipped_updates, 96)
+
+        # Falling far behind resynchronises instead of sleeping zero forever
+        scheduler.end_frame()
+        self.assertEqual(clock.sleeps, [])
+        clock.now += 0.001
+        scheduler.end_frame()
+        self.assertAlmostEqual(clock.sleeps[-1], 0.009)
+
+    def test_update_rate_independent_of_fps(self):
+        clock = FakeClock()
+        scheduler = _scheduler(clock, target_fps=30, update_rate=120)
+        scheduler.start()
+        scheduler.end_frame()
+        self.assertEqual(len(list(scheduler.updates())), 4)
+
+
+class TestFrameStats(unittest.TestCase):
+    """Tests for FrameStats."""
+
+    def test_summary(self):
+        stats = FrameStats(window=4)
+        for interval in (0.01, 0.02, 0.03, 0.04, 0.05):
+            stats.record(interval, interval / 2)
+        summary = stats.summary()
+        self.assertEqual(summary['frames'], 5)
+        self.assertAlmostEqual(summary['avg_frame_ms'], 35.0)
+        self.assertAlmostEqual(summary['max_frame_ms'], 50.0)
+        self.assertAlmostEqual(summary['p95_frame_ms'], 50.0)
+        self.assertAlmostEqual(summary['avg_work_ms'], 17.5)
+
+    def test_empty(self):
+        self.assertEqual(FrameStats().fps, 0.0)
+        self.assertEqual(FrameStats().p95_frame_ms, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
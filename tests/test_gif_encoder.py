@@ -0,0 +1,173 @@
+"""Tests for the in-process palette GIF encoder."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+from atari_style.core.gif_encoder import (
+    TRANSPARENT_INDEX, GifPalette, GifWriter, _lut_keys, write_gif,
+)
+from atari_style.core.headless_renderer import HeadlessRenderer
+from atari_style.core.video_base import FFmpegEncoder
+
+
+def decode(path):
+    """Decode every frame of a GIF to an RGB array."""
+    with Image.open(path) as gif:
+        return [np.asarray(frame.convert('RGB')) for frame in ImageSequence.Iterator(gif)]
+
+
+def raw_frames(path):
+    """(left, top, width, height, transparency flag) of each stored frame."""
+    data = open(path, 'rb').read()
+    frames = []
+    pos = data.find(b'\x21\xF9\x04')
+    while pos >= 0:
+        transparent = data[pos + 3] & 1
+        left, top, width, height = np.frombuffer(data[pos + 9:pos + 17], dtype='<u2').tolist()
+        frames.append((left, top, width, height, transparent))
+        pos = data.find(b'\x21\xF9\x04', pos + 17)
+    return frames
+
+
+class TestGifPalette(unittest.TestCase):
+    """Tests for GifPalette construction and quantization."""
+
+    def test_exact_colors_map_to_themselves(self):
+        palette = GifPalette((30, 30, 30), [(255, 0, 0), (0, 255, 0), (229, 229, 229)])
+        for index, color in enumerate(palette.colors):
+            pixel = np.array([[color]], dtype=np.uint8)
+            self.assertEqual(palette.rgb[palette.quantize(pixel)[0, 0]].tolist(), list(color))
+        self.assertEqual(palette.quantize(np.array([[(30, 30, 30)]], dtype=np.uint8))[0, 0], 0)
+        self.assertEqual(palette.rgb[TRANSPARENT_INDEX].tolist(), [30, 30, 30])
+
+    def test_levels_fit_in_palette(self):
+        palette = GifPalette((0, 0, 0), [(i, 255 - i, 128) for i in range(1, 40)])
+        self.assertLessEqual(len(palette), TRANSPARENT_INDEX)
+        self.assertEqual(palette.levels, 254 // 39)
+
+        ramped = GifPalette((0, 0, 0), [(255, 255, 255)], ramps=[((0, 0, 255), (255, 255, 0))])
+        self.assertIn((0, 0, 255), ramped.colors)
+        self.assertIn((255, 255, 0), ramped.colors)
+
+    def test_antialiased_frame_error_is_small(self):
+        renderer = HeadlessRenderer(width=20, height=4)
+        renderer.draw_text(0, 0, 'Hello █▓▒░', 'bright_cyan')
+        renderer.draw_text(0, 2, 'world', 'red')
+        frame = renderer.to_image()
+        palette = GifPalette.for_renderer(renderer)
+        error = np.abs(palette.rgb[palette.quantize(frame)].astype(int) - np.asarray(frame).astype(int))
+        self.assertLessEqual(error.max(), 16)
+
+    def test_lookup_resolved_lazily(self):
+        palette = GifPalette((7, 7, 7), [(250, 10, 10), (10, 10, 250)])
+        self.assertEqual(palette.lut.resolved, len(palette))
+
+        pixels = np.random.default_rng(3).integers(0, 256, (40, 50, 3), dtype=np.uint8)
+        indices = palette.quantize(pixels)
+        # Only the buckets this frame touched were resolved
+        touched = np.union1d(_lut_keys(pixels), _lut_keys(np.array(palette.colors)))
+        self.assertEqual(palette.lut.resolved, len(touched))
+
+        # Buckets without a palette color hold the brute-force nearest color
+        centers = (pixels.astype(int) >> 2 << 2) + 2
+        distances = ((centers[:, :, None, :] - np.array(palette.colors)[None, None]) ** 2).sum(axis=3)
+        free = ~np.isin(_lut_keys(pixels), _lut_keys(np.array(palette.colors)))
+        np.testing.assert_array_equal(indices[free], distances.argmin(axis=2)[free])
+
+
+class TestGifWriter(unittest.TestCase):
+    """Tests for delta-frame GIF writing."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'out.gif')
+        self.renderer = HeadlessRenderer(width=30, height=8)
+        self.palette = GifPalette.for_renderer(self.renderer)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _frame(self, x, text='*', color='yellow'):
+        self.renderer.clear_buffer()
+        self.renderer.draw_text(1, 1, 'static', 'green')
+        self.renderer.draw_text(x, 5, text, color)
+        return self.renderer.to_image()
+
+    def test_round_trip_matches_quantized_frames(self):
+        frames = [self._frame(x, 'ab', 'red' if x % 2 else 'cyan') for x in range(0, 20, 3)]
+        gif = write_gif(frames, self.path, self.palette, fps=10)
+        self.assertEqual(gif.frames_written, len(frames))
+
+        decoded = decode(self.path)
+        self.assertEqual(len(decoded), len(frames))
+        for frame, got in zip(frames, decoded):
+            np.testing.assert_array_equal(got, self.palette.rgb[self.palette.quantize(frame)])
+
+    def test_delta_frames_are_cropped(self):
+        write_gif([self._frame(2), self._frame(4)], self.path, self.palette)
+        first, second = raw_frames(self.path)
+        self.assertEqual(first, (0, 0, self.renderer.pixel_width, self.renderer.pixel_height, 0))
+        cell_w = self.renderer.char_width
+        left, top, width, height, transparent = second
+        self.assertEqual(transparent, 1)
+        self.assertGreaterEqual(left, 2 * cell_w)
+        self.assertLessEqual(left + width, 5 * cell_w)
+        self.assertLessEqual(height, self.renderer.char_height)
+
+    def test_identical_frames_extend_delay(self):
+        with GifWriter(self.path, self.palette, fps=10) as gif:
+            gif.add_frame(self._frame(2))
+            gif.add_frame(self._frame(2))
+            gif.add_frame(self._frame(2))
+            gif.add_frame(self._frame(6))
+        self.assertEqual((gif.frames_written, gif.frames_merged), (2, 2))
+        with Image.open(self.path) as img:
+            durations = [frame.info['duration'] for frame in ImageSequence.Iterator(img)]
+        self.assertEqual(durations, [300, 100])
+
+    def test_extend_holds_frame(self):
+        with GifWriter(self.path, self.palette, fps=10) as gif:
+            with self.assertRaises(ValueError):
+                gif.extend()
+            gif.add_frame(self._frame(2))
+            gif.extend()
+            gif.extend(0.5)
+            gif.add_frame(self._frame(6))
+        self.assertEqual((gif.frames_written, gif.frames_merged), (2, 2))
+        with Image.open(self.path) as img:
+            durations = [frame.info['duration'] for frame in ImageSequence.Iterator(img)]
+        self.assertEqual(durations, [700, 100])
+
+    def test_delays_do_not_drift(self):
+        frames = [self._frame(x) for x in range(12)]
+        write_gif(frames, self.path, self.palette, fps=30)
+        with Image.open(self.path) as img:
+            total = sum(frame.info['duration'] for frame in ImageSequence.Iterator(img))
+        self.assertEqual(total, 400)
+
+    def test_scale(self):
+        write_gif([self._frame(1), self._frame(3)], self.path, self.palette, scale=120)
+        with Image.open(self.path) as img:
+            self.assertEqual(img.width, 120)
+
+    def test_encoder_uses_palette_without_ffmpeg(self):
+        frames_dir = os.path.join(self.temp_dir, 'frames')
+        os.makedirs(frames_dir)
+        for i in range(4):
+            self._frame(i * 2).save(os.path.join(frames_dir, f'frame_{i:05d}.png'))
+
+        encoder = FFmpegEncoder()
+        encoder._ffmpeg_available = False
+        self.assertTrue(encoder.encode_gif(frames_dir, self.path, 10, scale=self.renderer.pixel_width,
+                                           palette=self.palette))
+        self.assertEqual(len(decode(self.path)), 4)
+        self.assertFalse(encoder.encode_gif(self.temp_dir + '/missing', self.path, 10, palette=self.palette))
+
+
+if __name__ == '__main__':
+    unittest.main()
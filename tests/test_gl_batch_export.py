@@ -0,0 +1,155 @@
+"""Tests for process-parallel GL composite batch export."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from atari_style.core.gl.batch_export import BatchResult, SegmentResult, export_batch, plan_jobs
+
+
+class FakeStdin:
+    def __init__(self):
+        self.frames = 0
+        self.closed = False
+
+    def write(self, data):
+        self.frames += 1
+
+    def close(self):
+        self.closed = True
+
+
+class FakePopen:
+    """ffmpeg stand-in that writes a marker file for its output."""
+
+    def __init__(self, cmd, stdin=None, stdout=None, stderr=None):
+        self.path = cmd[-1]
+        self.stdin = FakeStdin()
+
+    def wait(self):
+        with open(self.path, 'w') as f:
+            f.write(str(self.stdin.frames))
+        return 0
+
+
+class FakeManagers:
+    """CompositeManager stand-in recording every manager it creates."""
+
+    def __init__(self):
+        self.managers = []
+
+    def __call__(self, width, height):
+        manager = MagicMock()
+        manager.render_frame.side_effect = lambda name, t, *args, **kwargs: Image.new('RGB', (width, height))
+        self.managers.append(manager)
+        return manager
+
+
+class InlinePool:
+    """ProcessPoolExecutor stand-in running jobs in this process."""
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None, initargs=()):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, items):
+        return map(fn, items)
+
+
+class TestPlanJobs(unittest.TestCase):
+    """plan_jobs fills the workers with whole composites or segments."""
+
+    def test_one_job_per_composite(self):
+        plan = plan_jobs(['a', 'b', 'c'], 'out', 90, 30, 64, 36, workers=2)
+        self.assertEqual([len(jobs) for jobs in plan.values()], [1, 1, 1])
+        self.assertEqual((plan['a'][0].start_frame, plan['a'][0].end_frame), (0, 90))
+
+    def test_segments_cover_every_frame(self):
+        plan = plan_jobs(['a', 'b'], 'out', 100, 30, 64, 36, workers=8, crf=20)
+        jobs = plan['a']
+        self.assertEqual(len(jobs), 4)
+        self.assertEqual([(j.start_frame, j.end_frame) for j in jobs],
+                         [(0, 25), (25, 50), (50, 75), (75, 100)])
+        self.assertEqual(len({j.output_path for j in plan['a'] + plan['b']}), 8)
+        self.assertEqual(jobs[0].crf, 20)
+
+    def test_no_more_segments_than_frames(self):
+        plan = plan_jobs(['a'], 'out', 3, 30, 64, 36, workers=8)
+        self.assertEqual([j.frame_count for j in plan['a']], [1, 1, 1])
+
+
+@patch('atari_style.core.fanout_encoder.subprocess.Popen', FakePopen)
+class TestExportBatch(unittest.TestCase):
+    """export_batch renders segments and joins them per composite."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        manager = patch('atari_style.core.gl.composites.CompositeManager', side_effect=FakeManagers())
+        self.manager_class = manager.start()
+        self.addCleanup(manager.stop)
+        available = patch('atari_style.core.gl.batch_export.FFmpegEncoder._check_ffmpeg', return_value=True)
+        available.start()
+        self.addCleanup(available.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_whole_composites(self):
+        result = export_batch(['a', 'b'], self.temp_dir, duration=0.5, fps=10,
+                              width=32, height=18, workers=1)
+        self.assertEqual(result.outputs, {'a': True, 'b': True})
+        self.assertEqual(result.frames, 10)
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['a.mp4', 'b.mp4'])
+        with open(os.path.join(self.temp_dir, 'a.mp4')) as f:
+            self.assertEqual(f.read(), '5')
+
+    @patch('atari_style.core.gl.batch_export.ProcessPoolExecutor', InlinePool)
+    @patch('atari_style.core.gl.batch_export.FFmpegEncoder.concat_videos', return_value=True)
+    def test_segments_concatenated_in_order(self, concat):
+        result = export_batch(['a'], self.temp_dir, duration=1.2, fps=10,
+                              width=32, height=18, workers=3)
+        self.assertEqual(result.outputs, {'a': True})
+        self.assertEqual(result.workers, 3)
+        self.assertEqual([r.frames for r in result.segments], [4, 4, 4])
+        segments, output = concat.call_args[0]
+        self.assertEqual([os.path.basename(p) for p in segments],
+                         ['a.part000.mp4', 'a.part001.mp4', 'a.part002.mp4'])
+        self.assertEqual(output, os.path.join(self.temp_dir, 'a.mp4'))
+
+        # Each segment renders its own slice of the timeline
+        times = [c.args[1] for m in self.manager_class.side_effect.managers
+                 for c in m.render_frame.call_args_list]
+        self.assertEqual(times, [n / 10 for n in range(12)])
+        # Segment files and their directory are cleaned up
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_failed_render_reported(self):
+        self.manager_class.side_effect = RuntimeError('no GL context')
+        result = export_batch(['a'], self.temp_dir, duration=0.2, fps=10,
+                              width=32, height=18, workers=1)
+        self.assertEqual(result.outputs, {'a': False})
+        self.assertEqual(result.segments[0].error, 'no GL context')
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+class TestBatchResult(unittest.TestCase):
+    def test_throughput(self):
+        result = BatchResult(outputs={'a': True, 'b': False}, workers=2, elapsed=2.0)
+        result.segments = [SegmentResult(None, True, 60, 1.8), SegmentResult(None, False, 40, 1.6)]
+        self.assertEqual(result.frames, 100)
+        self.assertEqual(result.throughput, 50.0)
+        self.assertAlmostEqual(result.speedup, 1.7)
+        self.assertIn('1/2 composites', result.summary())
+
+
+if __name__ == '__main__':
+    unittest.main()
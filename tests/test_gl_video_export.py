@@ -295,5 +295,57 @@ class TestThumbnailIntegration(unittest.TestCase):
         self.assertTrue(os.path.exists(nested_path))
 
 
+class TestFanoutExport(unittest.TestCase):
+    """export_fanout renders each frame once for every format."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.exporter = VideoExporter()
+        self.exporter.encoder = MagicMock()
+        self.exporter.encoder.is_available.return_value = True
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @patch('atari_style.core.gl.video_export.FanoutEncoder')
+    @patch('atari_style.core.gl.video_export.CompositeManager')
+    def test_renders_once_at_master_size(self, manager_class, fanout_class):
+        from PIL import Image
+        manager = manager_class.return_value
+        manager.render_frame.side_effect = lambda *args, **kwargs: Image.new('RGB', (args[4], args[5]))
+        fanout = fanout_class.return_value.__enter__.return_value
+        fanout.active = 2
+        outputs = {
+            'youtube_1080p': os.path.join(self.temp_dir, 'wide.mp4'),
+            'youtube_shorts': os.path.join(self.temp_dir, 'short.mp4'),
+        }
+        fanout.results = {path: False for path in outputs.values()}
+
+        results = self.exporter.export_fanout('plasma_lissajous', outputs, duration=0.5)
+
+        manager_class.assert_called_once_with(1920, 1920)
+        self.assertEqual(manager.render_frame.call_count, 15)
+        self.assertEqual(fanout.write.call_count, 15)
+        (size, fps, specs), _ = fanout_class.call_args
+        self.assertEqual((size, fps), ((1920, 1920), 30))
+        self.assertEqual([(s.width, s.height) for s in specs], [(1920, 1080), (1080, 1920)])
+        self.assertEqual(results, {'youtube_1080p': False, 'youtube_shorts': False})
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.exporter.export_fanout('plasma_lissajous', {'vhs': 'x.mp4'})
+
+    @patch.object(VideoExporter, 'export_fanout')
+    def test_export_all_with_format_uses_fanout(self, export_fanout):
+        export_fanout.return_value = {'tiktok': True}
+        results = self.exporter.export_all_with_format(self.temp_dir, 'tiktok', 5.0)
+        self.assertTrue(all(results.values()))
+        self.assertEqual(export_fanout.call_count, len(results))
+        composite, outputs, duration = export_fanout.call_args[0]
+        self.assertEqual(list(outputs), ['tiktok'])
+        self.assertTrue(outputs['tiktok'].endswith(f'{composite}_tiktok.mp4'))
+
+
 if __name__ == '__main__':
     unittest.main()
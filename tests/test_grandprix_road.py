@@ -0,0 +1,91 @@
+"""Tests for the Grand Prix scanline road renderer and span fills."""
+
+import unittest
+
+from atari_style.core.headless_renderer import HeadlessRenderer
+from atari_style.core.renderer import Color
+from atari_style.demos.games.grandprix import GrandPrix, RoadProjection
+
+
+class TestFillSpan(unittest.TestCase):
+    """Tests for the renderer's bulk row fill."""
+
+    def test_fill_and_clip(self):
+        renderer = HeadlessRenderer(width=10, height=3)
+        renderer.fill_span(-4, 3, 1, '▓', Color.WHITE)
+        renderer.fill_span(8, 20, 1, '░', Color.GREEN)
+        renderer.fill_span(0, 10, 5, '#')  # Off-screen row ignored
+        renderer.fill_span(6, 4, 0, '#')  # Empty span ignored
+
+        self.assertEqual(''.join(renderer.buffer[1]), '▓▓▓     ░░')
+        self.assertEqual(renderer.color_buffer[1][:3], [Color.WHITE] * 3)
+        self.assertEqual(renderer.color_buffer[1][8:], [Color.GREEN] * 2)
+        self.assertEqual(''.join(renderer.buffer[0]), ' ' * 10)
+        self.assertEqual(len(renderer.buffer[1]), 10)
+
+
+class TestRoadProjection(unittest.TestCase):
+    """Tests for the per-row lookup tables."""
+
+    def test_rows_recede_towards_horizon(self):
+        projection = RoadProjection(80, 25, 8, 1000, 200)
+        bottom = 25 - 1 - 8
+        self.assertAlmostEqual(projection.depth[bottom], 0.0)
+        self.assertEqual(projection.half_width[bottom], int(80 * RoadProjection.ROAD_HALF_WIDTH))
+        for dy in range(1, bottom):
+            self.assertGreater(projection.depth[dy], projection.depth[dy + 1])
+            self.assertLessEqual(projection.half_width[dy], projection.half_width[dy + 1])
+
+
+class TestScanlineRoad(unittest.TestCase):
+    """Tests for GrandPrix._draw_racing."""
+
+    def setUp(self):
+        self.game = GrandPrix()
+        self.game.renderer = HeadlessRenderer(width=80, height=25)
+        self.game.width, self.game.height = 80, 25
+        self.game.state = GrandPrix.STATE_RACING
+
+    def _draw(self):
+        self.game.renderer.clear_buffer()
+        self.game._draw_racing()
+        return [''.join(row) for row in self.game.renderer.buffer]
+
+    def test_straight_road_centered(self):
+        self.game.position = 0.5
+        rows = self._draw()
+        bottom = rows[25 - 3]  # Above the HUD
+        self.assertIn(bottom[40], '│▓')  # Road center
+        self.assertEqual(bottom[20], '▓')
+        self.assertEqual(bottom[0], '░')
+        self.assertEqual(bottom[20:40], bottom[41:61][::-1])
+
+    def test_cost_independent_of_draw_distance(self):
+        calls = []
+        fill_span = self.game.renderer.fill_span
+
+        def counting_fill(*args, **kwargs):
+            calls.append(args)
+            fill_span(*args, **kwargs)
+
+        self.game.renderer.fill_span = counting_fill
+        counts = []
+        for distance in (300, 30000):
+            self.game.draw_distance = distance
+            calls.clear()
+            self._draw()
+            counts.append(len(calls))
+        self.assertEqual(counts[0], counts[1])
+        self.assertLessEqual(counts[0], 3 * self.game.height)
+
+    def test_draw_distance_clips_far_rows(self):
+        self.game.position = 0.5
+        self.game.draw_distance = 2
+        rows = self._draw()
+        horizon = 25 // 3
+        self.assertEqual(rows[horizon + 1].strip(), '')
+        self.assertIn('▓', rows[-3])
+
+
+if __name__ == '__main__':
+    unittest.main()
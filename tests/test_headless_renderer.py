@@ -0,0 +1,87 @@
+"""Tests for HeadlessRenderer's incremental rasterization."""
+
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from atari_style.core.headless_renderer import HeadlessRenderer
+
+CHARS = '█▓░@#*.─│┼●ab '
+COLORS = ['red', 'cyan', None, 'bright_white', 'green']
+
+
+def full_redraw(renderer):
+    """Rasterize the renderer's buffers from scratch on a fresh renderer."""
+    fresh = HeadlessRenderer(width=renderer.width, height=renderer.height,
+                             bg_color=renderer.bg_color)
+    fresh.buffer = [row[:] for row in renderer.buffer]
+    fresh.color_buffer = [row[:] for row in renderer.color_buffer]
+    return np.asarray(fresh.to_image())
+
+
+class TestIncrementalRasterize(unittest.TestCase):
+    """to_image patches changed cells and matches a full redraw."""
+
+    def setUp(self):
+        self.renderer = HeadlessRenderer(width=30, height=10)
+
+    def test_matches_full_redraw(self):
+        rng = random.Random(5)
+        renderer = self.renderer
+        for step in range(40):
+            for _ in range(rng.choice([0, 1, 4, 30])):
+                renderer.set_pixel(rng.randrange(30), rng.randrange(10),
+                                   rng.choice(CHARS), rng.choice(COLORS))
+            if step % 9 == 0:
+                renderer.fill_span(3, 25, rng.randrange(10), '█', 'blue')
+            if step % 17 == 0:
+                renderer.clear_buffer()
+            with self.subTest(step=step):
+                np.testing.assert_array_equal(np.asarray(renderer.to_image()), full_redraw(renderer))
+
+    def test_overhanging_glyph_removed_cleanly(self):
+        renderer = self.renderer
+        renderer.draw_box(5, 3, 3, 3, '█', 'red')
+        renderer.to_image()
+        renderer.set_pixel(6, 4, ' ')
+        np.testing.assert_array_equal(np.asarray(renderer.to_image()), full_redraw(renderer))
+
+    def test_only_changed_cells_redrawn(self):
+        renderer = self.renderer
+        renderer.draw_text(0, 0, 'static text', 'green')
+        renderer.to_image()
+        renderer.set_pixel(20, 8, 'x', 'yellow')
+        with patch.object(renderer, '_draw_cell', wraps=renderer._draw_cell) as draw_cell:
+            renderer.to_image()
+        self.assertEqual(draw_cell.call_count, 1)
+
+        with patch.object(renderer, '_draw_cell', wraps=renderer._draw_cell) as draw_cell:
+            renderer.to_image()
+        draw_cell.assert_not_called()
+
+    def test_images_are_independent(self):
+        renderer = self.renderer
+        renderer.draw_text(1, 1, 'one', 'red')
+        first = renderer.to_image()
+        before = np.asarray(first).copy()
+        renderer.draw_text(1, 1, 'two', 'cyan')
+        renderer.to_image()
+        np.testing.assert_array_equal(np.asarray(first), before)
+
+    def test_state_change_redraws_everything(self):
+        renderer = self.renderer
+        renderer.draw_text(2, 2, 'hello', 'cyan')
+        renderer.to_image()
+        renderer.bg_color = (0, 0, 40)
+        np.testing.assert_array_equal(np.asarray(renderer.to_image()), full_redraw(renderer))
+
+        renderer.invalidate()
+        with patch.object(renderer, '_draw_cell', wraps=renderer._draw_cell) as draw_cell:
+            renderer.to_image()
+        self.assertEqual(draw_cell.call_count, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
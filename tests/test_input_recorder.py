@@ -7,6 +7,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from atari_style.core.input_recorder import InputRecorder, RecordedKeyframe
+from atari_style.core.recording_format import load_recording
 
 
 class TestRecordedKeyframe(unittest.TestCase):
@@ -189,6 +190,19 @@ class TestInputRecorder(unittest.TestCase):
         finally:
             os.unlink(temp_path)
 
+    def test_save_binary(self):
+        """Test .arec output converts back to the same JSON."""
+        recorder = InputRecorder(duration=1.0, fps=30)
+        recorder.keyframes = [
+            RecordedKeyframe(time=i / 30, x=0.1 * i, y=-0.25, buttons=[i % 3])
+            for i in range(30)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'session.arec')
+            recorder.save(path)
+            self.assertEqual(load_recording(path), recorder.to_dict())
+
 
 class TestInputRecorderIntegration(unittest.TestCase):
     """Integration tests with mocked input handler."""
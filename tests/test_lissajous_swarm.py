@@ -0,0 +1,76 @@
+"""Tests for the struct-of-arrays Lissajous particle swarm."""
+
+import random
+import unittest
+
+import numpy as np
+
+from atari_style.demos.visualizers.educational.lissajous_swarm import (
+    ParticleSwarm, create_particle_swarm, project_3d_to_2d, project_points_3d,
+)
+
+
+class TestParticleSwarm(unittest.TestCase):
+    """Tests for ParticleSwarm updates and ring-buffer trails."""
+
+    def setUp(self):
+        random.seed(3)
+        self.particles = create_particle_swarm(12, 0.5)
+        self.swarm = ParticleSwarm.from_particles(self.particles)
+
+    def test_matches_per_particle_updates(self):
+        for frame in range(60):
+            t = frame / 20
+            heads = self.swarm.update(t)
+            for i, particle in enumerate(self.particles):
+                np.testing.assert_allclose(heads[i], particle.update(t), atol=1e-12)
+
+        points, owner, intensity, is_head = self.swarm.trail_points()
+        expected_points, expected_intensity = [], []
+        for particle in self.particles:
+            # Head first, then the trail from oldest to newest
+            trail = particle.trail
+            expected_points.append(trail[-1])
+            expected_intensity.append(1.0)
+            expected_points.extend(trail[:-1])
+            expected_intensity.extend((j + 1) / len(trail) for j in range(len(trail) - 1))
+
+        np.testing.assert_allclose(points, expected_points, atol=1e-12)
+        np.testing.assert_allclose(intensity, expected_intensity)
+        self.assertEqual(int(is_head.sum()), len(self.particles))
+        self.assertEqual(owner[is_head].tolist(), list(range(len(self.particles))))
+
+    def test_trails_grow_until_full(self):
+        self.assertEqual(len(self.swarm.trail_points()[0]), 0)
+        self.swarm.update(0.0)
+        self.swarm.update(0.1)
+        _, owner, _, _ = self.swarm.trail_points()
+        self.assertEqual(np.bincount(owner).tolist(), [2] * len(self.particles))
+
+        for frame in range(100):
+            self.swarm.update(frame / 10)
+        _, owner, _, _ = self.swarm.trail_points()
+        self.assertEqual(np.bincount(owner).tolist(), [p.trail_length for p in self.particles])
+
+    def test_frequency_override(self):
+        freqs = np.full((len(self.swarm), 3), 2.0)
+        heads = self.swarm.update(0.5, freqs)
+        expected = np.sin(2.0 * 0.5 * self.swarm.speeds[:, None] + self.swarm.phases)
+        np.testing.assert_allclose(heads, expected)
+
+
+class TestProjectPoints(unittest.TestCase):
+    """Tests for the batch projection helper."""
+
+    def test_matches_scalar_projection(self):
+        rng = np.random.default_rng(4)
+        points = rng.uniform(-1, 1, size=(300, 3))
+        sx, sy, depth = project_points_3d(points, 40, 15, 26, 10, 2.5, 1.1, -0.2)
+        for i, (x, y, z) in enumerate(points.tolist()):
+            px, py, pd = project_3d_to_2d(x, y, z, 40, 15, 26, 10, 2.5, 1.1, -0.2)
+            self.assertEqual((px, py), (sx[i], sy[i]))
+            self.assertAlmostEqual(pd, depth[i])
+
+
+if __name__ == '__main__':
+    unittest.main()
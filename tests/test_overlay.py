@@ -245,7 +245,7 @@ class TestOverlayManager(unittest.TestCase):
 
     def test_overlay_types_registered(self):
         """Test all overlay types are registered."""
-        expected = {'frame', 'timestamp', 'fps', 'demo'}
+        expected = {'frame', 'timestamp', 'fps', 'demo', 'profiler'}
         self.assertEqual(set(OVERLAY_TYPES.keys()), expected)
 
 
@@ -0,0 +1,136 @@
+"""Tests for the Pac-Man ghost navigation tables."""
+
+import tempfile
+import unittest
+from collections import deque
+from pathlib import Path
+from unittest.mock import patch
+
+from atari_style.demos.games.pacman import Ghost, Maze, MazeNavigator
+from atari_style.core.renderer import Color
+
+
+def bfs_distances(layout, start):
+    """Reference BFS over non-wall tiles."""
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in MazeNavigator.DIRECTIONS:
+            nxt = (x + dx, y + dy)
+            nx, ny = nxt
+            if (0 <= ny < len(layout) and 0 <= nx < len(layout[0])
+                    and layout[ny][nx] != '#' and nxt not in dist):
+                dist[nxt] = dist[(x, y)] + 1
+                queue.append(nxt)
+    return dist
+
+
+class TestMazeNavigator(unittest.TestCase):
+    """Tests for table construction, lookups and the disk cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        MazeNavigator._loaded.clear()
+        self.addCleanup(MazeNavigator._loaded.clear)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_distances_match_bfs(self):
+        nav = MazeNavigator(Maze.MAZE_DATA)
+        for start in ((1, 1), (12, 11), (6, 13), (26, 25)):
+            expected = bfs_distances(Maze.MAZE_DATA, start)
+            for cell in nav.cells:
+                self.assertEqual(nav.distance(start, cell), expected.get(cell))
+
+    def test_next_direction_follows_shortest_path(self):
+        nav = MazeNavigator(Maze.MAZE_DATA)
+        start, target = (12, 11), (25, 1)
+        pos, steps = start, 0
+        while pos != target:
+            dx, dy = nav.next_direction(pos, target)
+            pos = (pos[0] + dx, pos[1] + dy)
+            self.assertNotEqual(Maze.MAZE_DATA[pos[1]][pos[0]], '#')
+            steps += 1
+        self.assertEqual(steps, nav.distance(start, target))
+        self.assertIsNone(nav.next_direction(target, target))
+
+    def test_targets_snap_to_walkable_tiles(self):
+        nav = MazeNavigator(Maze.MAZE_DATA)
+        # Wall and off-map targets resolve to the nearest walkable tile
+        self.assertEqual(nav.cells[nav.cell_index((0, 0))], (1, 1))
+        self.assertEqual(nav.cells[nav.cell_index((-5, 40))], (1, 25))
+        self.assertIsNotNone(nav.next_direction((12, 11), (40, -3)))
+
+    def test_unreachable_cells(self):
+        layout = ['#####', '#.#.#', '#####']
+        nav = MazeNavigator(layout)
+        self.assertIsNone(nav.distance((1, 1), (3, 1)))
+        self.assertIsNone(nav.next_direction((1, 1), (3, 1)))
+
+    def test_disk_cache_round_trip(self):
+        built = MazeNavigator.for_layout(Maze.MAZE_DATA, cache_dir=self.cache_dir)
+        files = list(self.cache_dir.glob('nav-*.bin'))
+        self.assertEqual(len(files), 1)
+
+        MazeNavigator._loaded.clear()
+        with patch.object(MazeNavigator, '_build', side_effect=AssertionError('rebuilt')):
+            loaded = MazeNavigator.for_layout(Maze.MAZE_DATA, cache_dir=self.cache_dir)
+        self.assertEqual(loaded.cells, built.cells)
+        self.assertEqual(loaded.dist, built.dist)
+        self.assertEqual(loaded.step, built.step)
+
+    def test_corrupt_cache_rebuilt(self):
+        MazeNavigator.for_layout(Maze.MAZE_DATA, cache_dir=self.cache_dir)
+        path = next(self.cache_dir.glob('nav-*.bin'))
+        path.write_bytes(path.read_bytes()[:100])
+
+        MazeNavigator._loaded.clear()
+        nav = MazeNavigator.for_layout(Maze.MAZE_DATA, cache_dir=self.cache_dir)
+        self.assertEqual(nav.distance((1, 1), (2, 1)), 1)
+        self.assertGreater(path.stat().st_size, 100)
+
+    def test_layouts_cached_separately(self):
+        a = MazeNavigator.for_layout(['#####', '#...#', '#####'], cache_dir=self.cache_dir)
+        b = MazeNavigator.for_layout(['#####', '#.#.#', '#####'], cache_dir=self.cache_dir)
+        self.assertIsNot(a, b)
+        self.assertEqual(len(list(self.cache_dir.glob('nav-*.bin'))), 2)
+
+
+class TestGhostSteering(unittest.TestCase):
+    """Tests for ghosts steering with the navigator."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        patcher = patch('atari_style.demos.games.pacman.NAV_CACHE_DIR', Path(self.temp_dir.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        MazeNavigator._loaded.clear()
+        self.addCleanup(MazeNavigator._loaded.clear)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_ghost_reaches_scatter_corner(self):
+        maze = Maze()
+        ghost = Ghost(12, 11, 'Blinky', Color.RED, (25, 1))
+        for _ in range(600):
+            ghost.update(1 / 60, maze, (14, 20), (0, 0), [])
+            if ghost.get_tile_pos() == (25, 1):
+                break
+        self.assertEqual(ghost.get_tile_pos(), (25, 1))
+
+    def test_chase_target_tracks_player_every_tick(self):
+        maze = Maze()
+        ghost = Ghost(12, 11, 'Blinky', Color.RED, (25, 1))
+        ghost.set_chase()
+        ghost.update(1 / 60, maze, (14, 20), (0, 0), [])
+        self.assertEqual(ghost.target, (14, 20))
+        ghost.update(1 / 60, maze, (15, 20), (1, 0), [])
+        self.assertEqual(ghost.target, (15, 20))
+
+
+if __name__ == '__main__':
+    unittest.main()
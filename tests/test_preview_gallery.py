@@ -2,12 +2,13 @@
 
 import json
 import tempfile
+import time
 import unittest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from atari_style.preview.gallery import Gallery, MediaFile, format_bytes
+from atari_style.preview.gallery import FAILED_PROBE_RETRY, Gallery, MediaFile, format_bytes
 
 
 class TestFormatBytes(unittest.TestCase):
@@ -505,6 +506,131 @@ class TestGallery(unittest.TestCase):
         self.assertEqual(files[1].filename, 'old.mp4')
 
 
+class TestGalleryIndex(unittest.TestCase):
+    """Test incremental scanning through the metadata index."""
+
+    def setUp(self):
+        """Create temporary test directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.media_dir = Path(self.temp_dir) / 'media'
+        self.media_dir.mkdir()
+        self.index_path = Path(self.temp_dir) / 'index.json'
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _gallery(self):
+        return Gallery(directories=[self.media_dir], cache_ttl=0, index_path=self.index_path)
+
+    def test_unchanged_files_not_reprobed(self):
+        """A rescan only probes new or modified files."""
+        (self.media_dir / 'a.mp4').write_bytes(b'a')
+        (self.media_dir / 'b.mp4').write_bytes(b'b')
+        gallery = self._gallery()
+
+        with patch.object(gallery, '_probe_file', wraps=gallery._probe_file) as probe:
+            gallery.scan()
+            self.assertEqual(probe.call_count, 2)
+
+            probe.reset_mock()
+            gallery.scan()
+            probe.assert_not_called()
+
+            (self.media_dir / 'c.mp4').write_bytes(b'c')
+            gallery.scan()
+            self.assertEqual(probe.call_count, 1)
+
+        self.assertEqual(gallery.last_changes['added'], ['c.mp4'])
+
+    def test_modified_file_reprobed(self):
+        """Changing a file's size invalidates its index entry."""
+        story = self.media_dir / 'story.json'
+        story.write_text(json.dumps({'scenes': [{'duration': 5}]}))
+        gallery = self._gallery()
+        gallery.scan()
+        self.assertEqual(gallery.files[0].duration, 5)
+
+        story.write_text(json.dumps({'scenes': [{'duration': 5}, {'duration': 7}]}))
+        gallery.scan()
+        self.assertEqual(gallery.files[0].duration, 12)
+        self.assertEqual(gallery.last_changes['modified'], ['story.json'])
+
+    def test_index_persists_across_instances(self):
+        """A new gallery reuses metadata saved by a previous one."""
+        story = self.media_dir / 'story.json'
+        story.write_text(json.dumps({'duration': 9.0, 'scenes': []}))
+        self._gallery().scan()
+        self.assertTrue(self.index_path.exists())
+
+        gallery = self._gallery()
+        with patch.object(gallery, '_probe_file') as probe:
+            files = gallery.scan()
+            probe.assert_not_called()
+        self.assertEqual(files[0].duration, 9.0)
+
+    def test_non_media_json_cached(self):
+        """Unparseable JSON is indexed as non-media and not re-read."""
+        (self.media_dir / 'bad.json').write_text('{ nope')
+        gallery = self._gallery()
+        self.assertEqual(gallery.scan(), [])
+        with patch.object(gallery, '_probe_file') as probe:
+            self.assertEqual(gallery.scan(), [])
+            probe.assert_not_called()
+
+    def test_failed_probe_retried(self):
+        """An empty probe result is not persisted and is retried later."""
+        (self.media_dir / 'flaky.mp4').write_bytes(b'x')
+        gallery = self._gallery()
+        with patch.object(gallery, '_probe_video', return_value={}):
+            gallery.scan()
+        gallery.index.save()
+        self.assertEqual(json.loads(self.index_path.read_text())['entries'], {})
+
+        with patch.object(gallery, '_probe_video', return_value={'duration': 3.0}) as probe:
+            gallery.scan()
+            probe.assert_not_called()
+
+            later = time.time() + FAILED_PROBE_RETRY + 1
+            with patch('atari_style.preview.gallery.time.time', return_value=later):
+                gallery.scan()
+            probe.assert_called_once()
+        self.assertEqual(gallery.files[0].duration, 3.0)
+        self.assertEqual(gallery.last_changes['modified'], ['flaky.mp4'])
+
+    def test_removed_files_pruned(self):
+        """Deleted files leave the gallery and the index."""
+        video = self.media_dir / 'gone.mp4'
+        video.write_bytes(b'x')
+        gallery = self._gallery()
+        gallery.scan()
+        generation = gallery.generation
+
+        video.unlink()
+        self.assertEqual(gallery.scan(), [])
+        self.assertEqual(gallery.last_changes['removed'], ['gone.mp4'])
+        self.assertEqual(len(gallery.index), 0)
+        self.assertGreater(gallery.generation, generation)
+
+    def test_watch_picks_up_new_files(self):
+        """Background polling adds new files without a forced scan."""
+        import time
+
+        gallery = self._gallery()
+        gallery.watch(interval=0.01)
+        try:
+            self.assertTrue(gallery.is_watching)
+            (self.media_dir / 'new.mp4').write_bytes(b'new')
+            deadline = time.time() + 2.0
+            while time.time() < deadline and not gallery.scan():
+                time.sleep(0.01)
+            self.assertEqual([f.filename for f in gallery.scan()], ['new.mp4'])
+        finally:
+            gallery.stop_watching()
+        self.assertFalse(gallery.is_watching)
+
+
 class TestGalleryProbing(unittest.TestCase):
     """Test Gallery probing functionality."""
 
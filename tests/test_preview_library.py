@@ -0,0 +1,268 @@
+"""Tests for the preview gallery's secondary indexes and paged queries."""
+
+import http.client
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from atari_style.preview.gallery import Gallery, MediaFile
+from atari_style.preview.library import LibraryIndex, decode_cursor, encode_cursor
+from atari_style.preview.server import PreviewServer
+
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def _make_file(name: str, file_type: str = 'video', size: int = 100, minutes: int = 0) -> MediaFile:
+    return MediaFile(
+        path=Path('/media') / name,
+        filename=os.path.basename(name),
+        relative_path=name,
+        file_type=file_type,
+        extension=os.path.splitext(name)[1].lower(),
+        size_bytes=size,
+        modified_time=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+def _library_files():
+    return [
+        _make_file('alpha.mp4', 'video', 300, 5),
+        _make_file('beta.mp4', 'video', 100, 1),
+        _make_file('Alpine.png', 'image', 50, 3),
+        _make_file('gamma.gif', 'image', 75, 4),
+        _make_file('story.json', 'storyboard', 10, 2),
+        _make_file('sub/alpha.mp4', 'video', 200, 6),
+    ]
+
+
+def _collect(index, **kwargs):
+    """Page through a query and return all unique ids in order."""
+    ids, cursor = [], None
+    while True:
+        page, cursor, total = index.query(cursor=cursor, **kwargs)
+        ids.extend(f.unique_id for f in page)
+        if cursor is None:
+            return ids, total
+
+
+class TestCursor(unittest.TestCase):
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor('modified', (1234.5, 'a/b.mp4'))
+        self.assertEqual(decode_cursor(cursor, 'modified'), (1234.5, 'a/b.mp4'))
+
+    def test_wrong_sort_rejected(self):
+        cursor = encode_cursor('name', ('a', 'a'))
+        with self.assertRaises(ValueError):
+            decode_cursor(cursor, 'size')
+
+    def test_garbage_rejected(self):
+        with self.assertRaises(ValueError):
+            decode_cursor('not-a-cursor!!', 'name')
+
+    def test_mistyped_key_rejected(self):
+        for sort, key in (('modified', ('a', 1)), ('size', (True, 'a')), ('name', (3, 'a')), ('name', ('a', None))):
+            with self.assertRaisesRegex(ValueError, 'Invalid cursor'):
+                decode_cursor(encode_cursor(sort, key), sort)
+
+
+class TestLibraryIndex(unittest.TestCase):
+    """Tests for LibraryIndex queries and incremental updates."""
+
+    def setUp(self):
+        self.index = LibraryIndex()
+        self.index.rebuild(_library_files())
+
+    def test_default_sort_newest_first(self):
+        ids, total = _collect(self.index)
+        self.assertEqual(total, 6)
+        self.assertEqual(ids, ['sub/alpha.mp4', 'alpha.mp4', 'gamma.gif', 'Alpine.png', 'story.json', 'beta.mp4'])
+
+    def test_pages_cover_everything_once(self):
+        for sort in ('modified', 'name', 'size'):
+            for order in ('asc', 'desc'):
+                full, _ = _collect(self.index, sort=sort, order=order, limit=1000)
+                paged, _ = _collect(self.index, sort=sort, order=order, limit=2)
+                self.assertEqual(paged, full)
+                self.assertEqual(sorted(paged), sorted(f.unique_id for f in _library_files()))
+
+    def test_sort_by_size(self):
+        ids, _ = _collect(self.index, sort='size', order='asc')
+        self.assertEqual(ids[0], 'story.json')
+        self.assertEqual(ids[-1], 'alpha.mp4')
+
+    def test_type_filter(self):
+        ids, total = _collect(self.index, file_type='image')
+        self.assertEqual(total, 2)
+        self.assertEqual(ids, ['gamma.gif', 'Alpine.png'])
+
+    def test_extension_filter(self):
+        _, total = _collect(self.index, extensions=['mp4'])
+        self.assertEqual(total, 3)
+        ids, total = _collect(self.index, extensions=['.GIF', 'json'], sort='name')
+        self.assertEqual(ids, ['gamma.gif', 'story.json'])
+        self.assertEqual(total, 2)
+
+    def test_type_and_extension_filter(self):
+        ids, total = _collect(self.index, file_type='image', extensions=['png'])
+        self.assertEqual(ids, ['Alpine.png'])
+        self.assertEqual(total, 1)
+
+    def test_type_and_extensions_merge_in_order(self):
+        ids, total = _collect(self.index, file_type='image', extensions=['png', 'gif', 'mp4'], limit=1)
+        self.assertEqual(ids, ['gamma.gif', 'Alpine.png'])
+        self.assertEqual(total, 2)
+        ids, _ = _collect(self.index, extensions=['png', 'mp4'], sort='size', order='asc', limit=1)
+        self.assertEqual(ids, ['Alpine.png', 'beta.mp4', 'sub/alpha.mp4', 'alpha.mp4'])
+
+    def test_prefix_search_case_insensitive(self):
+        ids, total = _collect(self.index, prefix='ALP', sort='name')
+        self.assertEqual(total, 3)
+        self.assertEqual(ids, ['alpha.mp4', 'sub/alpha.mp4', 'Alpine.png'])
+
+        ids, _ = _collect(self.index, prefix='alp', file_type='video', limit=1)
+        self.assertEqual(ids, ['sub/alpha.mp4', 'alpha.mp4'])
+
+    def test_prefix_results_follow_updates(self):
+        self.assertEqual(_collect(self.index, prefix='al')[1], 3)
+        files = {f.unique_id: f for f in _library_files()}
+        new = _make_file('Alps.gif', 'image', 1, 50)
+        files[new.unique_id] = new
+        del files['alpha.mp4']
+        self.index.update(files, added=['Alps.gif'], removed=['alpha.mp4'], modified=[])
+        self.assertEqual(_collect(self.index, prefix='al'), (['Alps.gif', 'sub/alpha.mp4', 'Alpine.png'], 3))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            self.index.query(sort='colour')
+        with self.assertRaises(ValueError):
+            self.index.query(order='sideways')
+        with self.assertRaises(ValueError):
+            self.index.query(cursor=encode_cursor('modified', ('a', 1)))
+
+    def test_incremental_update_matches_rebuild(self):
+        files = {f.unique_id: f for f in _library_files()}
+        for i in range(20):
+            extra = _make_file(f'extra{i}.mp4', 'video', i, 10 + i)
+            files[extra.unique_id] = extra
+        self.index.rebuild(files.values())
+
+        del files['beta.mp4']
+        files['gamma.gif'] = _make_file('gamma.gif', 'image', 5000, 99)
+        new = _make_file('delta.webm', 'video', 1, 50)
+        files[new.unique_id] = new
+        self.index.update(files, added=['delta.webm'], removed=['beta.mp4'], modified=['gamma.gif'])
+
+        fresh = LibraryIndex()
+        fresh.rebuild(files.values())
+        for sort in ('modified', 'name', 'size'):
+            self.assertEqual(_collect(self.index, sort=sort), _collect(fresh, sort=sort))
+        self.assertEqual(self.index.type_stats(), fresh.type_stats())
+        self.assertNotIn('beta.mp4', self.index)
+        self.assertEqual(self.index.by_filename('beta.mp4'), [])
+
+    def test_to_dict_memoized_until_modified(self):
+        f = self.index.get('alpha.mp4')
+        first = self.index.to_dict(f)
+        self.assertIs(self.index.to_dict(f), first)
+
+        replacement = _make_file('alpha.mp4', 'video', 999, 7)
+        files = {x.unique_id: x for x in _library_files()}
+        files['alpha.mp4'] = replacement
+        self.index.update(files, added=[], removed=[], modified=['alpha.mp4'])
+        self.assertEqual(self.index.to_dict(replacement)['size_bytes'], 999)
+
+
+class TestGalleryLibrary(unittest.TestCase):
+    """The gallery keeps its library in sync across rescans."""
+
+    def test_rescan_updates_library(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'one.mp4').write_bytes(b'1')
+            gallery = Gallery(directories=[Path(temp_dir)], cache_ttl=0)
+            gallery.scan()
+            self.assertEqual(len(gallery.library), 1)
+
+            (Path(temp_dir) / 'two.png').write_bytes(b'2')
+            (Path(temp_dir) / 'one.mp4').unlink()
+            gallery.scan()
+
+            self.assertEqual([f.filename for f in gallery.library.by_type(None)], ['two.png'])
+            self.assertEqual(gallery.get_summary()['by_type']['image']['count'], 1)
+            self.assertEqual(gallery.get_summary()['by_type']['video']['count'], 0)
+
+
+class TestFilesApi(unittest.TestCase):
+    """Socket-level tests for /api/files paging."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for i in range(7):
+            path = Path(self.temp_dir) / f'clip{i}.mp4'
+            path.write_bytes(b'x' * (i + 1))
+            os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+        (Path(self.temp_dir) / 'still.png').write_bytes(b'png')
+
+        self.preview = PreviewServer(
+            directories=[Path(self.temp_dir)], port=0, host='127.0.0.1',
+            log_requests=False, thumbnail_dir=None,
+        )
+        self.server = self.preview.make_server()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        import shutil
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def _get_json(self, path):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            conn.close()
+
+    def test_cursor_paging(self):
+        status, page = self._get_json('/api/files?type=video&sort=size&order=asc&limit=3')
+        self.assertEqual(status, 200)
+        self.assertEqual(page['total'], 7)
+        self.assertEqual([f['filename'] for f in page['files']], ['clip0.mp4', 'clip1.mp4', 'clip2.mp4'])
+
+        names = [f['filename'] for f in page['files']]
+        while page['next_cursor']:
+            _, page = self._get_json(
+                f"/api/files?type=video&sort=size&order=asc&limit=3&cursor={page['next_cursor']}"
+            )
+            names.extend(f['filename'] for f in page['files'])
+        self.assertEqual(names, [f'clip{i}.mp4' for i in range(7)])
+
+    def test_prefix_and_extension(self):
+        _, page = self._get_json('/api/files?q=STI')
+        self.assertEqual([f['filename'] for f in page['files']], ['still.png'])
+        _, page = self._get_json('/api/files?ext=png,gif')
+        self.assertEqual(page['total'], 1)
+
+    def test_bad_parameters_400(self):
+        status, body = self._get_json('/api/files?sort=bogus')
+        self.assertEqual(status, 400)
+        self.assertIn('error', body)
+        status, _ = self._get_json('/api/files?cursor=garbage')
+        self.assertEqual(status, 400)
+        status, _ = self._get_json('/api/files?cursor=' + encode_cursor('modified', ('a', 1)))
+        self.assertEqual(status, 400)
+        status, _ = self._get_json('/api/files?limit=ten')
+        self.assertEqual(status, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,17 @@
 """Tests for the preview server module."""
 
+import http.client
 import io
 import json
 import tempfile
+import threading
 import unittest
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from atari_style.preview.server import PreviewHandler, PreviewServer, main
+from atari_style.preview.benchmark import run_benchmark
+from atari_style.preview.server import PreviewHandler, PreviewServer, main, parse_range
 from atari_style.preview.gallery import Gallery, MediaFile
 
 
@@ -356,6 +359,133 @@ class TestPathTraversalProtection(unittest.TestCase):
         self.assertIn(error_code, [403, 404])
 
 
+class TestParseRange(unittest.TestCase):
+    """Tests for HTTP Range header parsing."""
+
+    def test_no_header(self):
+        self.assertIsNone(parse_range(None, 100))
+
+    def test_explicit_range(self):
+        self.assertEqual(parse_range('bytes=0-9', 100), (0, 9))
+
+    def test_open_ended_range(self):
+        self.assertEqual(parse_range('bytes=90-', 100), (90, 99))
+
+    def test_suffix_range(self):
+        self.assertEqual(parse_range('bytes=-10', 100), (90, 99))
+        self.assertEqual(parse_range('bytes=-500', 100), (0, 99))
+
+    def test_end_clamped_to_size(self):
+        self.assertEqual(parse_range('bytes=50-500', 100), (50, 99))
+
+    def test_multi_range_ignored(self):
+        self.assertIsNone(parse_range('bytes=0-1,5-6', 100))
+
+    def test_unsatisfiable(self):
+        with self.assertRaises(ValueError):
+            parse_range('bytes=100-', 100)
+        with self.assertRaises(ValueError):
+            parse_range('bytes=20-10', 100)
+
+
+class TestMediaServing(unittest.TestCase):
+    """Socket-level tests for media serving on the threaded server."""
+
+    def setUp(self):
+        """Start a server on an ephemeral port."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.content = bytes(range(256)) * 64
+        (Path(self.temp_dir) / 'clip.mp4').write_bytes(self.content)
+
+        self.preview = PreviewServer(
+            directories=[Path(self.temp_dir)], port=0, host='127.0.0.1', log_requests=False
+        )
+        self.preview.gallery.scan()
+        self.server = self.preview.make_server()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        """Stop the server and clean up."""
+        import shutil
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def _get(self, path, headers=None, method='GET', conn=None):
+        conn = conn or http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        conn.request(method, path, headers=headers or {})
+        response = conn.getresponse()
+        return response, response.read()
+
+    def test_full_response(self):
+        response, body = self._get('/media/clip.mp4')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.content)
+        self.assertEqual(response.getheader('Accept-Ranges'), 'bytes')
+        self.assertIsNotNone(response.getheader('ETag'))
+
+    def test_range_response(self):
+        response, body = self._get('/media/clip.mp4', {'Range': 'bytes=100-199'})
+        self.assertEqual(response.status, 206)
+        self.assertEqual(body, self.content[100:200])
+        self.assertEqual(response.getheader('Content-Range'), f'bytes 100-199/{len(self.content)}')
+
+    def test_unsatisfiable_range(self):
+        response, _ = self._get('/media/clip.mp4', {'Range': f'bytes={len(self.content)}-'})
+        self.assertEqual(response.status, 416)
+        self.assertEqual(response.getheader('Content-Range'), f'bytes */{len(self.content)}')
+
+    def test_etag_revalidation(self):
+        response, _ = self._get('/media/clip.mp4')
+        etag = response.getheader('ETag')
+        response, body = self._get('/media/clip.mp4', {'If-None-Match': etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b'')
+
+    def test_stale_if_range_serves_full_file(self):
+        response, body = self._get('/media/clip.mp4', {'Range': 'bytes=0-9', 'If-Range': '"stale"'})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(body), len(self.content))
+
+    def test_head_request(self):
+        response, body = self._get('/media/clip.mp4', method='HEAD')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('Content-Length'), str(len(self.content)))
+        self.assertEqual(body, b'')
+
+    def test_keep_alive(self):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            self._get('/media/clip.mp4', {'Range': 'bytes=0-9'}, conn=conn)
+            sock = conn.sock
+            response, body = self._get('/media/clip.mp4', {'Range': 'bytes=10-19'}, conn=conn)
+            self.assertIs(conn.sock, sock)
+            self.assertEqual(body, self.content[10:20])
+        finally:
+            conn.close()
+
+    def test_idle_connection_does_not_block_others(self):
+        idle = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            idle.connect()  # Holds a handler thread waiting for a request line
+            response, _ = self._get('/api/summary')
+            self.assertEqual(response.status, 200)
+        finally:
+            idle.close()
+
+
+class TestBenchmark(unittest.TestCase):
+    """Smoke test for the concurrent-viewer benchmark."""
+
+    def test_run_benchmark_synthetic(self):
+        results = run_benchmark(clients=4, duration=0.2, range_size=4096, synthetic_size=64 * 1024)
+        self.assertEqual(results['errors'], 0)
+        self.assertGreater(results['requests'], 0)
+        self.assertGreater(results['bytes_per_sec'], 0)
+
+
 class TestCLI(unittest.TestCase):
     """Tests for CLI entry point."""
 
@@ -0,0 +1,248 @@
+"""Tests for preview gallery thumbnail generation."""
+
+import concurrent.futures
+import http.client
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from atari_style.preview.gallery import MediaFile
+from atari_style.preview.server import PreviewServer
+from atari_style.preview.thumbnails import ThumbnailCache, file_fingerprint, thumbnail_url
+
+
+def _media_file(path: Path, file_type: str = 'image', duration=None) -> MediaFile:
+    return MediaFile(
+        path=path,
+        filename=path.name,
+        file_type=file_type,
+        extension=path.suffix,
+        size_bytes=path.stat().st_size,
+        modified_time=datetime.now(),
+        duration=duration,
+    )
+
+
+class TestThumbnailCache(unittest.TestCase):
+    """Tests for ThumbnailCache."""
+
+    def setUp(self):
+        """Create temporary media and cache directories."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache_dir = self.temp_dir / 'thumbs'
+        self.image_path = self.temp_dir / 'frame.png'
+        Image.new('RGB', (1280, 720), (200, 40, 40)).save(self.image_path)
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_image_thumbnail_generated(self):
+        """Images are downscaled to fit the thumbnail size."""
+        cache = ThumbnailCache(self.cache_dir, size=(160, 90))
+        try:
+            path = cache.get_or_create(_media_file(self.image_path))
+        finally:
+            cache.shutdown()
+
+        self.assertIsNotNone(path)
+        with Image.open(path) as img:
+            self.assertEqual(img.size, (160, 90))
+            self.assertEqual(img.format, 'JPEG')
+
+    def test_cache_hit_skips_generation(self):
+        """A second request is served from disk."""
+        cache = ThumbnailCache(self.cache_dir)
+        media = _media_file(self.image_path)
+        try:
+            first = cache.get_or_create(media)
+            with patch.object(cache, '_generate') as generate:
+                second = cache.get_or_create(media)
+                generate.assert_not_called()
+        finally:
+            cache.shutdown()
+        self.assertEqual(first, second)
+
+    def test_concurrent_requests_coalesce(self):
+        """Simultaneous requests for one file share a single job."""
+        cache = ThumbnailCache(self.cache_dir, workers=1)
+        release = threading.Event()
+        original = cache._render_image
+
+        def slow_render(media_file, out_path):
+            release.wait(5)
+            return original(media_file, out_path)
+
+        media = _media_file(self.image_path)
+        try:
+            with patch.object(cache, '_render_image', side_effect=slow_render) as render:
+                futures = [cache.request(media) for _ in range(5)]
+                self.assertTrue(all(f is futures[0] for f in futures))
+                release.set()
+                self.assertIsNotNone(futures[0].result(timeout=5))
+                self.assertEqual(render.call_count, 1)
+        finally:
+            cache.shutdown()
+
+    def test_key_follows_content(self):
+        """Renamed copies share a key; edited files do not."""
+        cache = ThumbnailCache(self.cache_dir)
+        copy_path = self.temp_dir / 'renamed.png'
+        copy_path.write_bytes(self.image_path.read_bytes())
+        self.assertEqual(
+            cache.key_for(_media_file(self.image_path)),
+            cache.key_for(_media_file(copy_path)),
+        )
+
+        Image.new('RGB', (64, 64), (0, 0, 255)).save(copy_path)
+        self.assertNotEqual(
+            cache.key_for(_media_file(self.image_path)),
+            cache.key_for(_media_file(copy_path)),
+        )
+
+    def test_lru_eviction(self):
+        """Least recently used thumbnails are evicted above max_bytes."""
+        images = []
+        for i in range(4):
+            path = self.temp_dir / f'img{i}.png'
+            Image.effect_noise((400, 300), 50 + i * 10).convert('RGB').save(path)
+            images.append(_media_file(path))
+
+        cache = ThumbnailCache(self.cache_dir)
+        try:
+            first = cache.get_or_create(images[0])
+            one_size = first.stat().st_size
+            cache.max_bytes = int(one_size * 2.5)
+
+            # Make the first thumbnail the oldest entry
+            old = time.time() - 100
+            os.utime(first, (old, old))
+            for media in images[1:]:
+                cache.get_or_create(media)
+        finally:
+            cache.shutdown()
+
+        remaining = list(self.cache_dir.glob('*.jpg'))
+        self.assertLessEqual(sum(p.stat().st_size for p in remaining), cache.max_bytes)
+        self.assertFalse(first.exists())
+
+    @patch('atari_style.preview.thumbnails.subprocess.run')
+    def test_video_poster_uses_ffmpeg_seek(self, mock_run):
+        """Video thumbnails seek into the clip before grabbing a frame."""
+        video = self.temp_dir / 'clip.mp4'
+        video.write_bytes(b'fake video')
+
+        def fake_ffmpeg(cmd, capture_output=True):
+            Path(cmd[-1]).write_bytes(b'jpeg')
+            return MagicMock(returncode=0)
+
+        mock_run.side_effect = fake_ffmpeg
+        cache = ThumbnailCache(self.cache_dir)
+        try:
+            path = cache.get_or_create(_media_file(video, 'video', duration=4.0))
+        finally:
+            cache.shutdown()
+
+        self.assertIsNotNone(path)
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[0], 'ffmpeg')
+        self.assertEqual(cmd[cmd.index('-ss') + 1], '0.400')
+        self.assertIn('-frames:v', cmd)
+
+    def test_missing_ffmpeg_returns_none(self):
+        """Generation failures resolve to None instead of raising."""
+        video = self.temp_dir / 'clip.mp4'
+        video.write_bytes(b'fake video')
+        cache = ThumbnailCache(self.cache_dir)
+        try:
+            with patch('atari_style.preview.thumbnails.subprocess.run', side_effect=FileNotFoundError()):
+                self.assertIsNone(cache.get_or_create(_media_file(video, 'video')))
+        finally:
+            cache.shutdown()
+
+    def test_fingerprint_samples_large_files(self):
+        """Only the head and tail of large files are read."""
+        big = self.temp_dir / 'big.bin'
+        big.write_bytes(b'a' * 200_000)
+        before = file_fingerprint(big, 200_000)
+        with open(big, 'r+b') as f:
+            f.seek(100_000)
+            f.write(b'b')
+        self.assertEqual(before, file_fingerprint(big, 200_000))
+
+    def test_thumbnail_url_quotes(self):
+        self.assertEqual(thumbnail_url('sub dir/a.mp4'), '/thumb/sub%20dir/a.mp4')
+
+
+class TestThumbnailEndpoint(unittest.TestCase):
+    """Socket-level tests for /thumb/."""
+
+    def setUp(self):
+        """Start a server with one image."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        media_dir = self.temp_dir / 'media'
+        media_dir.mkdir()
+        Image.new('RGB', (800, 600), (10, 200, 10)).save(media_dir / 'still.png')
+
+        self.preview = PreviewServer(
+            directories=[media_dir], port=0, host='127.0.0.1',
+            log_requests=False, thumbnail_dir=self.temp_dir / 'thumbs',
+        )
+        self.preview.gallery.scan()
+        self.server = self.preview.make_server()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        """Stop the server and clean up."""
+        import shutil
+        self.server.shutdown()
+        self.server.server_close()
+        self.preview.thumbnails.shutdown()
+        shutil.rmtree(self.temp_dir)
+
+    def _get(self, path, headers=None):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=10)
+        try:
+            conn.request('GET', path, headers=headers or {})
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def test_thumbnail_served_and_revalidated(self):
+        response, body = self._get('/thumb/still.png')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('Content-Type'), 'image/jpeg')
+        self.assertTrue(body.startswith(b'\xff\xd8'))
+
+        response, _ = self._get('/thumb/still.png', {'If-None-Match': response.getheader('ETag')})
+        self.assertEqual(response.status, 304)
+
+    def test_slow_thumbnail_404(self):
+        slow = MagicMock()
+        slow.result.side_effect = concurrent.futures.TimeoutError()
+        with patch.object(self.preview.thumbnails, 'request', return_value=slow):
+            response, _ = self._get('/thumb/still.png')
+        self.assertEqual(response.status, 404)
+
+    def test_unknown_file_404(self):
+        response, _ = self._get('/thumb/missing.png')
+        self.assertEqual(response.status, 404)
+
+    def test_gallery_cards_use_thumbnails(self):
+        response, body = self._get('/')
+        self.assertEqual(response.status, 200)
+        self.assertIn(b'/thumb/still.png', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
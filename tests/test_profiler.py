@@ -0,0 +1,239 @@
+"""Tests for the per-frame profiler, its HUD overlay and trace export."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from atari_style.core.frame_scheduler import FrameScheduler
+from atari_style.core.headless_renderer import HeadlessRenderer
+from atari_style.core.overlay import OverlayManager, ProfilerOverlay
+from atari_style.core.profiler import PROFILE_ENV_VAR, FrameProfiler, percentile, profiled
+
+
+class FakeClock:
+    """Clock advanced manually by tests."""
+
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeInput:
+    def get_input(self, timeout=0.1):
+        return None
+
+    def get_joystick_state(self):
+        return (0.0, 0.0)
+
+
+class FakeGame:
+    """Minimal game whose draw() takes a fixed amount of fake time."""
+
+    def __init__(self, clock, renderer):
+        self.clock = clock
+        self.renderer = renderer
+        self.input_handler = FakeInput()
+        self.draws = 0
+
+    def draw(self):
+        self.draws += 1
+        self.clock.advance(0.004)
+        self.renderer.render()
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests for FrameProfiler collection and statistics."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.profiler = FrameProfiler(clock=self.clock, trace=True, hud=False)
+
+    def test_sections_summed_per_frame(self):
+        self.profiler.begin_frame()
+        for _ in range(3):
+            with self.profiler.section('update'):
+                self.clock.advance(0.002)
+        self.profiler.end_frame()
+
+        stats = self.profiler.percentiles('update')
+        self.assertAlmostEqual(stats['p50'], 6.0)
+        self.assertEqual(stats['samples'], 1)
+        self.assertAlmostEqual(self.profiler.percentiles('frame')['p50'], 6.0)
+
+    def test_percentiles_over_window(self):
+        for i in range(100):
+            self.profiler.begin_frame()
+            with self.profiler.section('draw'):
+                self.clock.advance((i + 1) / 1000.0)
+            self.profiler.end_frame()
+
+        stats = self.profiler.percentiles('draw')
+        self.assertAlmostEqual(stats['p50'], 51.0, delta=1.0)
+        self.assertAlmostEqual(stats['p95'], 95.0, delta=1.0)
+        self.assertAlmostEqual(stats['p99'], 99.0, delta=1.0)
+        self.assertAlmostEqual(stats['max'], 100.0)
+
+    def test_percentile_helper(self):
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0], 50), 2.0)
+
+    def test_profiled_none_is_noop(self):
+        with profiled(None, 'anything'):
+            pass
+
+    def test_attach_instruments_game(self):
+        renderer = HeadlessRenderer(width=20, height=5)
+        game = FakeGame(self.clock, renderer)
+        self.profiler.attach(game)
+        self.profiler.attach(game)  # Idempotent
+
+        self.profiler.begin_frame()
+        game.input_handler.get_input(timeout=0.001)
+        game.draw()
+        self.profiler.end_frame()
+
+        self.assertIs(renderer.profiler, self.profiler)
+        self.assertEqual(game.draws, 1)
+        self.assertEqual(self.profiler.sections(), ['frame', 'input', 'draw'])
+        self.assertAlmostEqual(self.profiler.percentiles('draw')['p50'], 4.0)
+
+    def test_headless_renderer_times_render_and_write(self):
+        renderer = HeadlessRenderer(width=10, height=3)
+        renderer.profiler = self.profiler
+        renderer.draw_text(0, 0, 'hi', 'cyan')
+
+        self.profiler.begin_frame()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            renderer.save_frame(os.path.join(temp_dir, 'frame.png'))
+        self.profiler.end_frame()
+
+        self.assertIn('render', self.profiler.sections())
+        self.assertIn('write', self.profiler.sections())
+
+    def test_export_chrome_trace(self):
+        self.profiler.begin_frame()
+        with self.profiler.section('update'):
+            self.clock.advance(0.001)
+        self.profiler.end_frame()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'nested', 'trace.json')
+            self.profiler.export_trace(path)
+            with open(path) as f:
+                data = json.load(f)
+
+        events = data['traceEvents']
+        self.assertEqual([e['name'] for e in events], ['update', 'frame'])
+        update = events[0]
+        self.assertEqual(update['ph'], 'X')
+        self.assertAlmostEqual(update['dur'], 1000.0)
+        self.assertEqual(data['metadata']['frames'], 1)
+        self.assertIn('update', data['metadata']['sections'])
+
+    def test_trace_disabled_records_nothing(self):
+        profiler = FrameProfiler(clock=self.clock, hud=False)
+        profiler.begin_frame()
+        profiler.end_frame()
+        self.assertEqual(profiler.trace_events(), [])
+
+    def test_scheduler_reports_updates_and_sleep(self):
+        clock = FakeClock()
+
+        def sleep(seconds):
+            clock.advance(seconds)
+
+        profiler = FrameProfiler(clock=clock, hud=False)
+        scheduler = FrameScheduler(target_fps=50, clock=clock, sleep=sleep, profiler=profiler)
+        scheduler.start()
+        for _ in range(5):
+            for _ in scheduler.updates():
+                clock.advance(0.003)
+            scheduler.end_frame()
+
+        self.assertEqual(profiler.frames, 5)
+        self.assertAlmostEqual(profiler.percentiles('update')['p50'], 3.0)
+        self.assertAlmostEqual(profiler.percentiles('frame')['p50'], 20.0)
+        self.assertIn('sleep', profiler.sections())
+
+
+class TestProfilerFromEnv(unittest.TestCase):
+    """Tests for enabling the profiler through ATARI_STYLE_PROFILE."""
+
+    def test_unset_disabled(self):
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: ''}):
+            self.assertIsNone(FrameProfiler.from_env())
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: '0'}):
+            self.assertIsNone(FrameProfiler.from_env())
+
+    def test_hud_only(self):
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: '1'}):
+            profiler = FrameProfiler.from_env()
+        self.assertIsNotNone(profiler)
+        self.assertFalse(profiler.trace_enabled)
+        self.assertTrue(profiler.hud)
+
+    @patch('atari_style.core.profiler.atexit.register')
+    def test_trace_path_uses_game_name(self, register):
+        game = FakeGame(FakeClock(), HeadlessRenderer(width=10, height=3))
+        with patch.dict(os.environ, {PROFILE_ENV_VAR: '/tmp/trace-{name}.json'}):
+            profiler = FrameProfiler.from_env(game)
+        self.assertTrue(profiler.trace_enabled)
+        self.assertEqual(profiler.trace_path, '/tmp/trace-fakegame.json')
+        register.assert_called_once_with(profiler.export_trace, '/tmp/trace-fakegame.json')
+        self.assertIs(game.renderer.profiler, profiler)
+
+
+class TestProfilerOverlay(unittest.TestCase):
+    """Tests for the profiler HUD overlay."""
+
+    def _profiler(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(clock=clock, hud=False)
+        profiler.begin_frame()
+        with profiler.section('update'):
+            clock.advance(0.0025)
+        profiler.end_frame()
+        return profiler
+
+    def _row(self, renderer, y):
+        return ''.join(renderer.buffer[y])
+
+    def test_hud_drawn_top_right(self):
+        renderer = HeadlessRenderer(width=40, height=10)
+        OverlayManager().add('profiler').render(renderer, profiler=self._profiler())
+
+        self.assertTrue(self._row(renderer, 1).rstrip().endswith('p99'))
+        self.assertIn('update', self._row(renderer, 3))
+        self.assertIn('2.5', self._row(renderer, 3))
+
+    def test_bottom_position_grows_upwards(self):
+        from atari_style.core.overlay import OverlayPosition
+        renderer = HeadlessRenderer(width=40, height=10)
+        overlay = ProfilerOverlay(position=OverlayPosition.BOTTOM_LEFT)
+        overlay.render(renderer, profiler=self._profiler())
+        self.assertIn('update', self._row(renderer, 8))
+        self.assertIn('p50', self._row(renderer, 6))
+
+    def test_without_profiler_draws_nothing(self):
+        renderer = HeadlessRenderer(width=40, height=10)
+        OverlayManager().add('profiler').render(renderer)
+        self.assertTrue(all(c == ' ' for row in renderer.buffer for c in row))
+
+    def test_renderer_draws_hud_on_render(self):
+        renderer = HeadlessRenderer(width=40, height=10)
+        profiler = self._profiler()
+        profiler.hud = OverlayManager().add('profiler')
+        renderer.profiler = profiler
+        renderer.render()
+        self.assertIn('update', self._row(renderer, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Tests for the binary input recording format."""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from atari_style.core import recording_format
+from atari_style.core.recording_format import (
+    RecordingReader, decode_recording, encode_recording, load_recording,
+)
+from atari_style.core.scripted_input import InputScript
+from terminal_arcade.engine.attract_mode import AttractModeManager, DemoPlayer, DemoRecorder
+
+SCRIPT = Path(__file__).parent.parent / 'scripts' / 'demos' / 'joystick-demo.json'
+
+
+def make_session(frames=5000, fps=120):
+    """A recorder-style dict: 3-decimal axes, sorted button lists."""
+    keyframes = []
+    for i in range(frames):
+        x = round(((i // 40) % 21 - 10) / 10, 3)
+        keyframes.append({
+            'time': round(i / fps, 3),
+            'x': x,
+            'y': round(-x / 3, 3),
+            'buttons': [0, 5] if i % 300 < 20 else [],
+        })
+    return {
+        'name': 'Recorded Input',
+        'description': f'Recorded at {fps}fps',
+        'duration': round(frames / fps, 3),
+        'fps': fps,
+        'interpolation': 'smooth',
+        'keyframes': keyframes,
+    }
+
+
+class TestInputRecordings(unittest.TestCase):
+    """Round trips and seeking for input scripts."""
+
+    def test_round_trip_is_lossless(self):
+        data = make_session()
+        for compression in ('none', 'zlib'):
+            with self.subTest(compression=compression):
+                blob = encode_recording(data, compression=compression, block_size=700)
+                self.assertEqual(decode_recording(blob), data)
+                self.assertEqual(list(decode_recording(blob)), list(data))
+
+    def test_repo_script_round_trip(self):
+        with open(SCRIPT) as f:
+            data = json.load(f)
+        self.assertEqual(decode_recording(encode_recording(data)), data)
+
+    def test_much_smaller_than_json(self):
+        data = make_session()
+        raw = encode_recording(data, compression='none')
+        packed = encode_recording(data)
+        self.assertLess(len(raw), len(json.dumps(data)) / 10)
+        self.assertLess(len(packed), len(raw))
+
+    def test_seek_decodes_one_block(self):
+        reader = RecordingReader(encode_recording(make_session(), block_size=512))
+        self.assertEqual(len(reader), 5000)
+        self.assertEqual(len(reader.index), 10)
+        self.assertEqual(reader.block_for_time(10.0), 1200 // 512)
+        first = next(reader.records(start_time=10.0))
+        self.assertEqual(first['time'], 10.0)
+
+    def test_unrepresentable_data_is_rejected(self):
+        data = make_session(frames=3)
+        data['keyframes'][1]['buttons'] = [3, 1]
+        with self.assertRaises(ValueError):
+            encode_recording(data)
+        data['keyframes'][1]['buttons'] = []
+        data['keyframes'][1]['x'] = 0.123456789
+        with self.assertRaises(ValueError):
+            encode_recording(data)
+        with self.assertRaises(ValueError):
+            RecordingReader(b'{"keyframes": []}')
+
+    def test_float_times_fall_back_to_doubles(self):
+        data = {'fps': 30, 'keyframes': [{'time': 1 / 3, 'x': 0.5, 'y': 0.0, 'buttons': [1]}]}
+        reader = RecordingReader(encode_recording(data))
+        self.assertEqual(reader.meta['time_scale'], recording_format.RAW_TIME)
+        self.assertEqual(reader.to_dict(), data)
+
+    def test_input_script_loads_binary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'demo.arec')
+            recording_format.convert(str(SCRIPT), path)
+            self.assertTrue(recording_format.is_binary_recording(path))
+            script = InputScript.from_file(path)
+        self.assertEqual(script, InputScript.from_file(str(SCRIPT)))
+
+
+class TestAttractModeRecordings(unittest.TestCase):
+    """Attract-mode demo logs in the binary format."""
+
+    def test_event_round_trip(self):
+        data = {
+            'game': 'pacman',
+            'duration': 12.345678912,
+            'events': [
+                {'type': 'input', 'timestamp': 0.5, 'input_type': 'up', 'value': None},
+                {'type': 'input', 'timestamp': 0.75, 'input_type': 'fire', 'value': {'held': 1.5}},
+                {'type': 'frame', 'timestamp': 0.8, 'frame': 1},
+                {'type': 'frame', 'timestamp': 0.9, 'frame': 2},
+                {'type': 'state', 'timestamp': 1.000001, 'state': {'score': 10, 'lives': [3]}},
+                {'type': 'custom', 'timestamp': 2.0, 'note': 'x'},
+            ],
+            'version': '1.0',
+        }
+        reader = RecordingReader(encode_recording(data, block_size=4))
+        self.assertEqual(reader.kind, 'events')
+        self.assertEqual(reader.meta['time_scale'], 1_000_000)
+        self.assertEqual(reader.to_dict(), data)
+
+    def test_recorder_and_player(self):
+        recorder = DemoRecorder('breakout')
+        recorder.start_recording()
+        for frame in range(50):
+            recorder.record_input('left' if frame % 2 else 'right')
+            recorder.record_frame(frame)
+        recorder.stop_recording()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'breakout.arec'
+            recorder.save(path)
+            self.assertEqual(load_recording(path)['events'], recorder.events)
+            self.assertEqual(DemoPlayer(path).events, recorder.events)
+            self.assertEqual(AttractModeManager(Path(tmp)).list_demos(), ['breakout'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests for the batched 3D transform, projection and line rasterizer."""
+
+import math
+import random
+import unittest
+import warnings
+
+import numpy as np
+
+from atari_style.core import render3d
+from atari_style.core.headless_renderer import HeadlessRenderer
+
+
+def bresenham(x0, y0, x1, y1):
+    """Reference per-pixel loop the demos used before batching."""
+    cells = []
+    dx, dy = abs(x1 - x0), abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx - dy
+    while True:
+        cells.append((x0, y0))
+        if x0 == x1 and y0 == y1:
+            break
+        e2 = 2 * err
+        if e2 > -dy:
+            err -= dy
+            x0 += sx
+        if e2 < dx:
+            err += dx
+            y0 += sy
+    return cells
+
+
+class TestRotation(unittest.TestCase):
+    """Tests for rotation matrix composition."""
+
+    def test_composition_order(self):
+        rx, ry, rz = 0.3, -1.1, 2.0
+        point = np.array([0.5, -0.2, 0.9])
+        expected = render3d.rotation_z(rz) @ (render3d.rotation_y(ry) @ (render3d.rotation_x(rx) @ point))
+        matrix = render3d.rotation_matrix(rx, ry, rz)
+        np.testing.assert_allclose(matrix @ point, expected)
+        np.testing.assert_allclose(matrix @ matrix.T, np.eye(3), atol=1e-12)
+
+    def test_axis_conventions(self):
+        quarter = math.pi / 2
+        np.testing.assert_allclose(render3d.rotation_x(quarter) @ [0, 1, 0], [0, 0, 1], atol=1e-12)
+        np.testing.assert_allclose(render3d.rotation_y(quarter) @ [0, 0, 1], [1, 0, 0], atol=1e-12)
+        np.testing.assert_allclose(render3d.rotation_z(quarter) @ [1, 0, 0], [0, 1, 0], atol=1e-12)
+
+
+class TestProject(unittest.TestCase):
+    """Tests for vectorized perspective projection."""
+
+    def test_matches_scalar_formula(self):
+        rng = np.random.default_rng(7)
+        points = rng.uniform(-2, 2, size=(200, 3))
+        sx, sy = render3d.project(points, fov=200, distance=5, cx=40, cy=12, aspect=0.5, scale=1.5)
+        for (x, y, z), px, py in zip(points.tolist(), sx.tolist(), sy.tolist()):
+            factor = 200 / (5 + z) * 1.5
+            self.assertEqual(px, int(x * factor + 40))
+            self.assertEqual(py, int(y * factor * 0.5 + 12))
+
+    def test_camera_plane_is_clamped(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            sx, sy = render3d.project([[1.0, -1.0, -5.0], [0.0, 0.0, -5.0]], fov=200, distance=5, cx=0, cy=0)
+        self.assertEqual(sx.dtype, np.int64)
+        self.assertTrue(np.all(np.abs(sx) <= render3d._COORD_LIMIT))
+        self.assertTrue(np.all(np.abs(sy) <= render3d._COORD_LIMIT))
+
+    def test_depth_order_is_stable(self):
+        order = render3d.depth_order([1.0, 3.0, 1.0, 2.0])
+        self.assertEqual(order.tolist(), [1, 3, 0, 2])
+        order = render3d.depth_order([1.0, 3.0, 1.0, 2.0], far_first=False)
+        self.assertEqual(order.tolist(), [0, 2, 3, 1])
+
+
+class TestRasterizeLines(unittest.TestCase):
+    """Tests for the batch Bresenham rasterizer."""
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.segments = [tuple(rng.randint(-120, 120) for _ in range(4)) for _ in range(500)]
+        self.segments += [(3, 3, 3, 3), (0, 0, 9, 0), (0, 0, 0, -9), (5, 5, -5, -5)]
+        self.expected = [(x, y, i) for i, seg in enumerate(self.segments) for x, y in bresenham(*seg)]
+
+    def _cells(self, *viewport):
+        xs, ys, edge = render3d.rasterize_lines(*np.array(self.segments).T, *viewport)
+        return list(zip(xs.tolist(), ys.tolist(), edge.tolist()))
+
+    def test_matches_per_pixel_loop(self):
+        self.assertEqual(self._cells(), self.expected)
+
+    def test_clipping_is_exact(self):
+        clipped = [(x, y, i) for x, y, i in self.expected if 0 <= x < 37 and 0 <= y < 21]
+        self.assertEqual(self._cells(37, 21), clipped)
+
+    def test_far_off_screen_lines_are_cheap(self):
+        xs, ys, edge = render3d.rasterize_lines([-10**6, 5], [3, -10**6], [10**6, 5], [3, 10**6], 20, 10)
+        self.assertEqual(len(xs), 20 + 10)
+        self.assertEqual(edge.tolist(), [0] * 20 + [1] * 10)
+
+    def test_draw_edges(self):
+        renderer = HeadlessRenderer(width=10, height=5)
+        sx, sy = np.array([0, 9, 9]), np.array([0, 0, 4])
+        render3d.draw_edges(renderer, sx, sy, [(0, 1), (1, 2)], color='green')
+        self.assertEqual(''.join(renderer.buffer[0]), '─' * 9 + '│')
+        self.assertEqual(renderer.buffer[4][9], '│')
+        self.assertEqual(renderer.color_buffer[0][0], 'green')
+        self.assertEqual(render3d.edge_glyphs([0, 0], [0, 4], [3, 3], [3, 1]).tolist(), ['\\', '/'])
+
+
+if __name__ == '__main__':
+    unittest.main()
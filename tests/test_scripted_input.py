@@ -1,13 +1,17 @@
 """Tests for scripted input handler."""
 
 import json
+import os
 import tempfile
 import unittest
 
+import numpy as np
+
 from atari_style.core.scripted_input import (
     ScriptedInputHandler,
     InputScript,
     InputKeyframe,
+    InputTimeline,
     create_simple_script,
 )
 
@@ -216,5 +220,75 @@ class TestCreateSimpleScript(unittest.TestCase):
         self.assertEqual(len(script.keyframes), 3)
 
 
+class TestInputTimeline(unittest.TestCase):
+    """Test compiled per-frame timelines."""
+
+    def setUp(self):
+        self.script = create_simple_script(
+            duration=2.0,
+            movements=[
+                (0.5, 0.0, 0.0, []),
+                (1.0, 1.0, -1.0, [0, 3]),
+                (1.5, -0.5, 0.5, [3]),
+            ],
+            fps=10,
+            interpolation='smooth'
+        )
+        self.timeline = InputTimeline.compile(self.script)
+
+    def test_frames_and_events(self):
+        """Test per-frame sampling and button edge events."""
+        self.assertEqual(len(self.timeline), 21)
+        np.testing.assert_array_equal(self.timeline.axes[10], [1.0, -1.0])
+        self.assertEqual(self.timeline.buttons[12], 0b1001)
+        self.assertEqual(self.timeline.events.tolist(), [[10, 0b1001, 0], [15, 0, 0b0001]])
+        self.assertEqual(self.timeline.events_between(11, 21).tolist(), [[15, 0, 1]])
+
+    def test_matches_off_frame_sampling(self):
+        """Test frame lookups agree with direct keyframe evaluation."""
+        handler = ScriptedInputHandler(script=self.script)
+        for frame in range(len(self.timeline)):
+            handler.current_time = frame * 0.1
+            x, y, mask = self.timeline.sample(frame * 0.1)
+            self.assertEqual(handler.get_joystick_state(), (x, y))
+            self.assertEqual(handler.get_joystick_buttons()[3], bool(mask & 8))
+
+        self.assertIsNone(self.timeline.frame_for_time(0.75))
+        handler.current_time = 0.75  # Halfway with smoothstep easing
+        x, y = handler.get_joystick_state()
+        self.assertAlmostEqual(x, 0.5)
+        self.assertAlmostEqual(y, -0.5)
+
+    def test_save_load_round_trip(self):
+        """Test saving a compiled timeline and playing it back."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'script.npz')
+            self.timeline.save(path)
+            loaded = InputTimeline.load(path)
+
+        np.testing.assert_array_equal(loaded.axes, self.timeline.axes)
+        np.testing.assert_array_equal(loaded.events, self.timeline.events)
+        handler = ScriptedInputHandler(timeline=loaded)
+        self.assertIs(handler.timeline, loaded)
+        self.assertEqual(handler.script.keyframes[1].buttons, [0, 3])
+        handler.current_time = 1.2
+        self.assertEqual(handler.get_joystick_buttons(), {i: i in (0, 3) for i in range(12)})
+
+    def test_script_replacement_recompiles(self):
+        """Test assigning a new script rebuilds the timeline."""
+        handler = ScriptedInputHandler(script=self.script)
+        first = handler.timeline
+        handler.script = create_simple_script(1.0, [(0.0, 0.25, 0.0, [])])
+        self.assertIsNot(handler.timeline, first)
+        self.assertEqual(handler.get_joystick_state(), (0.25, 0.0))
+
+    def test_returned_buttons_are_independent(self):
+        """Test callers may modify the returned button dict."""
+        handler = ScriptedInputHandler(script=self.script)
+        handler.current_time = 1.0
+        handler.get_joystick_buttons()[0] = False
+        self.assertTrue(handler.get_joystick_buttons()[0])
+
+
 if __name__ == '__main__':
     unittest.main()
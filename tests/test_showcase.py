@@ -7,6 +7,7 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from atari_style.core.showcase import (
+    NormalizationCache,
     ShowcaseEntry,
     ShowcaseManifest,
     TitleCardGenerator,
@@ -15,6 +16,25 @@ from atari_style.core.showcase import (
 )
 
 
+def _fake_ffmpeg(probe_streams=None):
+    """Build a subprocess.run stand-in that records ffmpeg output paths.
+
+    ffmpeg calls touch their output file (last argument); ffprobe calls
+    return ``probe_streams``.
+    """
+    outputs = []
+
+    def run(cmd, capture_output=True, text=True):
+        if cmd[0] == 'ffprobe':
+            return MagicMock(returncode=0, stdout=json.dumps({'streams': probe_streams or []}))
+        with open(cmd[-1], 'wb') as f:
+            f.write(b'segment')
+        outputs.append(cmd)
+        return MagicMock(returncode=0, stdout='', stderr='')
+
+    return run, outputs
+
+
 class TestShowcaseEntry(unittest.TestCase):
     """Test ShowcaseEntry dataclass."""
 
@@ -225,6 +245,128 @@ class TestShowcaseGenerator(unittest.TestCase):
             gen.generate()
 
 
+class TestNormalizationCache(unittest.TestCase):
+    """Test the normalized segment cache."""
+
+    def test_key_depends_on_target_format(self):
+        """Different target sizes/fps produce different keys."""
+        key = NormalizationCache.make_key('abc', 800, 480, 30)
+        self.assertEqual(key, NormalizationCache.make_key('abc', 800, 480, 30))
+        self.assertNotEqual(key, NormalizationCache.make_key('abc', 800, 480, 60))
+        self.assertNotEqual(key, NormalizationCache.make_key('abc', 1920, 1080, 30))
+        self.assertNotEqual(key, NormalizationCache.make_key('abd', 800, 480, 30))
+
+    def test_source_digest_tracks_content(self):
+        """Digest is memoized but refreshed when the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = os.path.join(temp_dir, 'clip.mp4')
+            with open(src, 'wb') as f:
+                f.write(b'one')
+            cache = NormalizationCache(os.path.join(temp_dir, 'cache'))
+            first = cache.source_digest(src)
+            self.assertEqual(first, cache.source_digest(src))
+
+            with open(src, 'wb') as f:
+                f.write(b'two!')
+            self.assertNotEqual(first, cache.source_digest(src))
+
+    def test_index_persists(self):
+        """Saved digest index is reloaded by a new cache instance."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = os.path.join(temp_dir, 'clip.mp4')
+            with open(src, 'wb') as f:
+                f.write(b'data')
+            cache_dir = os.path.join(temp_dir, 'cache')
+            cache = NormalizationCache(cache_dir)
+            digest = cache.source_digest(src)
+            cache.save_index()
+
+            reloaded = NormalizationCache(cache_dir)
+            with patch('atari_style.core.showcase.file_digest') as mock_digest:
+                self.assertEqual(reloaded.source_digest(src), digest)
+                mock_digest.assert_not_called()
+
+
+class TestShowcaseCaching(unittest.TestCase):
+    """Test incremental rebuilds through the segment cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.clips = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f'clip{i}.mp4')
+            with open(path, 'wb') as f:
+                f.write(f'clip {i}'.encode())
+            self.clips.append(path)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _manifest(self, titles):
+        return ShowcaseManifest(
+            entries=[
+                ShowcaseEntry(video_path=clip, title=title)
+                for clip, title in zip(self.clips, titles)
+            ],
+            output_path=os.path.join(self.temp_dir, 'out.mp4'),
+        )
+
+    def _encodes(self, outputs):
+        """ffmpeg calls other than the final concat."""
+        return [cmd for cmd in outputs if '-f' not in cmd or 'concat' not in cmd]
+
+    @patch('shutil.which', return_value='/usr/bin/ffmpeg')
+    def test_rebuild_only_reencodes_changed_title(self, _which):
+        """Changing one title card re-encodes just that card."""
+        run, outputs = _fake_ffmpeg()
+        with patch('atari_style.core.showcase.subprocess.run', side_effect=run):
+            ShowcaseGenerator(
+                self._manifest(['A', 'B', 'C']), cache_dir=self.cache_dir, max_workers=3
+            ).generate()
+            self.assertEqual(len(self._encodes(outputs)), 6)
+
+            outputs.clear()
+            ShowcaseGenerator(
+                self._manifest(['A', 'B2', 'C']), cache_dir=self.cache_dir, max_workers=3
+            ).generate()
+
+        encodes = self._encodes(outputs)
+        self.assertEqual(len(encodes), 1)
+        self.assertIn('-loop', encodes[0])
+
+    @patch('shutil.which', return_value='/usr/bin/ffmpeg')
+    def test_matching_sources_are_stream_copied(self, _which):
+        """Sources already in the target format skip normalization."""
+        probe = [{
+            'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p',
+            'width': 800, 'height': 480, 'r_frame_rate': '30/1',
+        }]
+        run, outputs = _fake_ffmpeg(probe)
+        with patch('atari_style.core.showcase.subprocess.run', side_effect=run):
+            ShowcaseGenerator(
+                self._manifest([None, None, None]), cache_dir=self.cache_dir
+            ).generate()
+
+        self.assertEqual(self._encodes(outputs), [])
+        concat = outputs[-1]
+        self.assertIn('copy', concat)
+
+    @patch('shutil.which', return_value='/usr/bin/ffmpeg')
+    def test_progress_reports_every_segment(self, _which):
+        """Progress callback covers cached and encoded segments."""
+        run, _ = _fake_ffmpeg()
+        messages = []
+        with patch('atari_style.core.showcase.subprocess.run', side_effect=run):
+            ShowcaseGenerator(
+                self._manifest(['A', None, None]), use_cache=False
+            ).generate(lambda step, total, msg: messages.append((step, total)))
+
+        self.assertEqual(messages[-1], (4, 4))
+        self.assertEqual([step for step, _ in messages[:4]], [1, 2, 3, 4])
+
+
 class TestCreateShowcase(unittest.TestCase):
     """Test create_showcase convenience function."""
 
@@ -0,0 +1,130 @@
+"""Tests for the occupancy-grid broadphase and its use in Galaga and Breakout."""
+
+import unittest
+
+from atari_style.core.spatial_grid import SpatialGrid, UniformGrid
+
+
+class Thing:
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+class TestSpatialGrid(unittest.TestCase):
+    """Tests for SpatialGrid bookkeeping and queries."""
+
+    def setUp(self):
+        self.grid = SpatialGrid()
+        self.a, self.b = Thing('a'), Thing('b')
+
+    def test_insert_and_lookup_truncates(self):
+        self.grid.insert(self.a, 3.7, 2.2)
+        self.assertEqual(self.grid.at(3.0, 2.9), [self.a])
+        self.assertEqual(self.grid.at(4, 2), [])
+        self.assertIs(self.grid.first(3.5, 2.5), self.a)
+        self.assertIsNone(self.grid.first(0, 0))
+
+    def test_multi_cell_objects(self):
+        self.grid.insert(self.a, 5, 5, width=6, height=2)
+        self.assertIs(self.grid.first(5, 5), self.a)
+        self.assertIs(self.grid.first(10.9, 6.5), self.a)
+        self.assertIsNone(self.grid.first(11, 5))
+        self.assertIsNone(self.grid.first(5, 7))
+
+    def test_move_and_remove(self):
+        self.grid.insert(self.a, 1, 1)
+        self.grid.move(self.a, 1.9, 1.9)  # Same cell
+        self.assertIs(self.grid.first(1, 1), self.a)
+        self.grid.move(self.a, 2, 1)
+        self.assertIsNone(self.grid.first(1, 1))
+        self.assertIs(self.grid.first(2, 1), self.a)
+
+        self.grid.remove(self.a)
+        self.grid.remove(self.a)  # Ignored
+        self.assertEqual(len(self.grid), 0)
+        self.assertEqual(self.grid._cells, {})
+
+    def test_shared_cells_and_predicate(self):
+        self.grid.insert(self.a, 0, 0)
+        self.grid.insert(self.b, 0, 0)
+        self.assertEqual(self.grid.at(0, 0), [self.a, self.b])
+        self.assertIs(self.grid.first(0, 0, lambda t: t.name == 'b'), self.b)
+        self.assertIn(self.b, self.grid)
+        self.grid.clear()
+        self.assertNotIn(self.b, self.grid)
+
+
+class TestUniformGrid(unittest.TestCase):
+    """Tests for the float-rectangle bucket grid."""
+
+    def setUp(self):
+        self.grid = UniformGrid(cell_size=10.0)
+        self.a, self.b, self.c = Thing('a'), Thing('b'), Thing('c')
+
+    def test_negative_coordinates_floor(self):
+        self.grid.insert(self.a, -5.0, -5.0, -1.0, -1.0)
+        self.assertEqual(self.grid.cells_for(-5.0, -5.0, -1.0, -1.0), ((-1, -1),))
+        self.assertEqual(self.grid.at(-0.5, -9.9), [self.a])
+        self.assertEqual(self.grid.at(0.5, 0.5), [])
+
+    def test_query_keeps_insertion_order(self):
+        self.grid.insert(self.a, 0, 0, 25, 5)
+        self.grid.insert(self.b, 100, 100, 101, 101)
+        self.grid.insert(self.c, 12, 0, 14, 3)
+        self.assertEqual(self.grid.query(0, 0, 30, 30), [self.a, self.c])
+        self.grid.move(self.a, 200, 200, 225, 205)  # Keeps its place
+        self.assertEqual(self.grid.query(90, 90, 300, 300), [self.a, self.b])
+        self.assertEqual(self.grid.query(-1e6, -1e6, 1e6, 1e6), [self.a, self.b, self.c])
+
+    def test_remove(self):
+        self.grid.insert(self.a, 0, 0, 40, 40)
+        self.grid.remove(self.a)
+        self.grid.remove(self.a)  # Ignored
+        self.assertNotIn(self.a, self.grid)
+        self.assertEqual(self.grid._cells, {})
+
+
+class TestGameBroadphase(unittest.TestCase):
+    """The games keep their grids in sync with the entities."""
+
+    def test_galaga_bullet_hits_enemy_in_cell(self):
+        from atari_style.demos.games.galaga import Bullet, Galaga
+        game = Galaga()
+        self.assertEqual(len(game.enemy_grid), len(game.enemies))
+
+        enemy = game.enemies[0]
+        game.player_bullets.append(Bullet(enemy.x + 0.5, enemy.y + 0.5, -40))
+        game._check_collisions()
+        self.assertFalse(enemy.active)
+        self.assertNotIn(enemy, game.enemy_grid)
+        self.assertEqual(game.score, enemy.info['value'])
+
+    def test_galaga_grid_follows_formation(self):
+        from atari_style.demos.games.galaga import Galaga
+        game = Galaga()
+        game.state = game.STATE_PLAYING
+        for _ in range(30):
+            game._update_playing(1 / 30)
+        for enemy in game.enemies:
+            if enemy.active:
+                self.assertIn(enemy, game.enemy_grid.at(enemy.x, enemy.y))
+
+    def test_breakout_ball_breaks_brick(self):
+        from atari_style.demos.games.breakout import Ball, Breakout
+        game = Breakout()
+        brick = next(b for b in game.bricks if not b.indestructible and b.hits_remaining == 1)
+        remaining = game.bricks_remaining
+
+        ball = Ball(brick.x + 2, brick.y + 1, vx=0, vy=-30)
+        game._handle_ball_collisions(ball)
+        self.assertTrue(brick.destroyed)
+        self.assertIsNone(game.brick_grid.first(brick.x, brick.y))
+        self.assertEqual(game.bricks_remaining, remaining - 1)
+        self.assertGreater(ball.vy, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
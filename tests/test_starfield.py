@@ -0,0 +1,138 @@
+"""Tests for the struct-of-arrays starfield and batch streak rasterizer."""
+
+import math
+import random
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from atari_style.core.headless_renderer import HeadlessRenderer
+from atari_style.demos.visualizers import starfield
+from atari_style.demos.visualizers.starfield import (
+    AsteroidField, Nebula, StarField, StarfieldDemo, streak_cells,
+)
+
+
+def make_demo(width=100, height=36):
+    with patch.object(starfield, 'Renderer', lambda: HeadlessRenderer(width=width, height=height)), \
+            patch.object(starfield, 'InputHandler', lambda: None):
+        demo = StarfieldDemo()
+    demo.renderer.render = lambda: None
+    return demo
+
+
+def reference_stars(demo):
+    """The original per-star drawing loop, run on the demo's arrays."""
+    renderer = HeadlessRenderer(width=demo.renderer.width, height=demo.renderer.height)
+    width, height = renderer.width, renderer.height
+    xs, ys, ks = demo.stars.project(width, height)
+    tunnel = demo.warp_speed > 3.0
+    for i in range(len(demo.stars)):
+        x, y, depth = int(xs[i]), int(ys[i]), float(ks[i])
+        layer = int(demo.stars.layer[i])
+        cx, cy = width / 2, height / 2
+        if tunnel:
+            dx, dy = x - cx, y - cy
+            dist = math.sqrt(dx ** 2 + dy ** 2)
+            if dist > 0:
+                x = int(cx + (dx / dist) * (20 + depth * 5))
+                y = int(cy + (dy / dist) * (20 + depth * 5) * 0.5)
+        if not (0 <= x < width and 0 <= y < height):
+            continue
+        char = str(demo.get_star_chars(np.array([depth]), np.array([layer]))[0])
+        color = str(demo.get_star_colors(np.array([depth]), np.array([layer]),
+                                         demo.stars.x[i:i + 1], demo.stars.y[i:i + 1])[0])
+        if demo.warp_speed > 2.5:
+            trail_length = int(demo.warp_speed * (1 + layer * 0.5))
+            if tunnel:
+                for j in range(1, trail_length):
+                    renderer.set_pixel(int(x + (cx - x) * j / trail_length),
+                                       int(y + (cy - y) * j / trail_length), '-', color)
+            else:
+                for j in range(trail_length):
+                    renderer.set_pixel(x - j, y, '-', color)
+        renderer.set_pixel(x, y, char, color)
+    return renderer.buffer, renderer.color_buffer
+
+
+class TestStarField(unittest.TestCase):
+    """Tests for StarField updates and projection."""
+
+    def test_layers_and_respawn(self):
+        stars = StarField(80, 24, counts=(3, 4, 5), rng=np.random.default_rng(1))
+        self.assertEqual(stars.layer.tolist(), [0] * 3 + [1] * 4 + [2] * 5)
+        z = stars.z.copy()
+        stars.update(2.0, 80, 24, lateral_drift=1.0)
+        np.testing.assert_allclose(stars.z, z - 2.0 * StarField.LAYER_SPEED[stars.layer])
+
+        stars.z[:] = 0.5
+        stars.update(1.0, 80, 24)
+        np.testing.assert_array_equal(stars.z[stars.layer == 2], 80)
+        self.assertTrue(np.all(np.abs(stars.y) <= 24))
+
+    def test_streak_cells_order(self):
+        xs, ys, owner, is_head = streak_cells([10, 20], [5, 6], [3, 0])
+        self.assertEqual(list(zip(xs.tolist(), ys.tolist())), [(10, 5), (9, 5), (8, 5), (10, 5), (20, 6)])
+        self.assertEqual(owner.tolist(), [0, 0, 0, 0, 1])
+        self.assertEqual(is_head.tolist(), [False, False, False, True, True])
+
+        xs, ys, _, is_head = streak_cells([0], [0], [4], tunnel_center=(8.0, 4.0))
+        self.assertEqual(list(zip(xs.tolist(), ys.tolist())), [(2, 1), (4, 2), (6, 3), (0, 0)])
+
+
+class TestStarfieldDrawing(unittest.TestCase):
+    """Batch drawing matches the per-star loop it replaced."""
+
+    def setUp(self):
+        random.seed(9)
+        self.demo = make_demo()
+        self.demo.stars = StarField(100, 36, counts=(200, 300, 200), rng=np.random.default_rng(4))
+
+    def test_matches_reference(self):
+        for warp in (1.0, 2.8, 4.5):
+            for color_mode in range(3):
+                with self.subTest(warp=warp, color_mode=color_mode):
+                    self.demo.warp_speed = warp
+                    self.demo.color_mode = color_mode
+                    self.demo.stars.update(2.0 * warp, 100, 36)
+                    self.demo.renderer.clear_buffer()
+                    self.demo._draw_stars()
+                    buffer, colors = reference_stars(self.demo)
+                    self.assertEqual(self.demo.renderer.buffer, buffer)
+                    self.assertEqual(self.demo.renderer.color_buffer, colors)
+
+    def test_flash_and_asteroids(self):
+        self.demo.hyperspace_state = StarfieldDemo.HS_FLASH
+        self.demo.draw()
+        self.assertEqual({c for row in self.demo.renderer.buffer for c in row}, {'█'})
+
+        self.demo.hyperspace_state = StarfieldDemo.HS_NONE
+        self.demo.mode = StarfieldDemo.MODE_ASTEROIDS
+        self.demo.asteroids = AsteroidField(100, 36, count=1, rng=np.random.default_rng(0))
+        self.demo.asteroids.x[:] = 0.0
+        self.demo.asteroids.y[:] = 0.0
+        self.demo.asteroids.z[:] = 40.0  # depth 3.2: a 3x3 cluster
+        self.demo.renderer.clear_buffer()
+        self.demo._draw_asteroids()
+        rows = [''.join(row[49:52]) for row in self.demo.renderer.buffer[17:20]]
+        self.assertEqual(rows, ['◊◊◊'] * 3)
+
+
+class TestNebula(unittest.TestCase):
+    """Tests for the vectorized nebula speckle."""
+
+    def test_close_nebula_stays_on_screen(self):
+        random.seed(2)
+        nebula = Nebula(80, 24)
+        nebula.x, nebula.y, nebula.z = 0.0, 0.0, 0.01  # Enormous projected size
+        renderer = HeadlessRenderer(width=80, height=24)
+        nebula.render(renderer, 80, 24)
+        cells = sum(c == nebula.density_char for row in renderer.buffer for c in row)
+        self.assertGreater(cells, 0)
+        self.assertEqual(len(renderer.buffer), 24)
+        self.assertTrue(all(len(row) == 80 for row in renderer.buffer))
+
+
+if __name__ == '__main__':
+    unittest.main()
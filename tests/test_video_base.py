@@ -9,6 +9,7 @@ Tests the shared components in atari_style/core/video_base.py:
 - VideoExporter base class
 """
 
+import os
 import unittest
 import tempfile
 import shutil
@@ -125,6 +126,44 @@ class TestFFmpegEncoder(unittest.TestCase):
             encoder.encode_gif(self.temp_dir, "output.gif", 15)
         self.assertIn("ffmpeg not found", str(ctx.exception))
 
+    @patch('subprocess.run')
+    def test_encode_video_with_durations(self, mock_run):
+        """Test per-frame durations go through a concat list."""
+        mock_run.return_value = Mock(returncode=0)
+        encoder = FFmpegEncoder()
+
+        self.assertTrue(encoder.encode_video(self.temp_dir, "output.mp4", 30, durations=[1.5, 0.1]))
+        cmd = mock_run.call_args[0][0]
+        self.assertIn('concat', cmd)
+        self.assertEqual(cmd[cmd.index('-vf') + 1], 'fps=30')
+
+        list_path = Path(cmd[cmd.index('-i') + 1])
+        self.assertEqual(list_path.read_text().splitlines(), [
+            'ffconcat version 1.0',
+            "file 'frame_00000.png'", 'duration 1.500000',
+            "file 'frame_00001.png'", 'duration 0.100000',
+            "file 'frame_00001.png'",
+        ])
+
+    @patch('subprocess.run')
+    def test_concat_videos(self, mock_run):
+        """Test segments are joined with a stream copy."""
+        mock_run.return_value = Mock(returncode=0)
+        encoder = FFmpegEncoder()
+        lists = []
+        mock_run.side_effect = lambda cmd, **kwargs: (
+            lists.append(Path(cmd[cmd.index('-i') + 1]).read_text()) or Mock(returncode=0))
+
+        segments = [os.path.join(self.temp_dir, name) for name in ("a.mp4", "it's.mp4")]
+        self.assertTrue(encoder.concat_videos(segments, "output.mp4"))
+        cmd = mock_run.call_args[0][0]
+        self.assertEqual(cmd[cmd.index('-c') + 1], 'copy')
+        self.assertFalse(os.path.exists(cmd[cmd.index('-i') + 1]))
+        self.assertEqual(lists[-1].splitlines()[1:], [
+            f"file '{segments[0]}'",
+            f"file '{self.temp_dir}/it'\\''s.mp4'",
+        ])
+
 
 class TestProgressReporter(unittest.TestCase):
     """Test ProgressReporter."""
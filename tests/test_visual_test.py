@@ -0,0 +1,121 @@
+"""Tests for the visual regression runner's fast paths."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from PIL import Image
+
+from atari_style.core.demo_video import DEMO_REGISTRY
+from atari_style.core.headless_renderer import HeadlessRenderer
+from atari_style.core.scripted_input import InputScript, ScriptedInputHandler
+from atari_style.core.visual_test import (
+    VisualTestConfig, compare_baseline, compare_images, discover_baselines,
+    generate_baseline, image_digest, render_demo_frames, render_selected_frames,
+    run_suite,
+)
+
+SCRIPT = str(Path(__file__).parent.parent / 'scripts' / 'demos' / 'joystick-demo.json')
+
+
+def render(frames=None, total_frames=None):
+    renderer = HeadlessRenderer(width=40, height=12)
+    handler = ScriptedInputHandler(script=InputScript.from_file(SCRIPT))
+    factory = DEMO_REGISTRY['joystick_test']['factory']
+    if frames is not None:
+        return render_selected_frames(factory, renderer, handler, frames)
+    return render_demo_frames(factory, renderer, handler, total_frames)
+
+
+class TestRendering(unittest.TestCase):
+    """Selected-frame rendering matches full rendering."""
+
+    def test_selected_frames_match_full_render(self):
+        full = render(total_frames=9)
+        selected = render(frames=[8, 2])
+        self.assertEqual(sorted(selected), [2, 8])
+        for frame_num, img in selected.items():
+            self.assertEqual(image_digest(img), image_digest(full[frame_num]))
+        self.assertEqual(render(frames=[]), {})
+
+
+class TestCompareImages(unittest.TestCase):
+    """Tests for compare_images and image_digest."""
+
+    def test_identical_images_skip_visualization(self):
+        a = Image.new('RGB', (8, 8), (10, 20, 30))
+        ratio, visual = compare_images(a, a.convert('RGBA'))
+        self.assertEqual(ratio, 0.0)
+        self.assertIsNone(visual)
+        self.assertEqual(image_digest(a), image_digest(a.convert('RGBA')))
+
+    def test_different_images(self):
+        a = Image.new('RGB', (8, 8))
+        b = a.copy()
+        b.putpixel((1, 1), (255, 255, 255))
+        ratio, visual = compare_images(a, b)
+        self.assertAlmostEqual(ratio, 1 / 64)
+        self.assertEqual(visual.size, (24, 8))
+        self.assertNotEqual(image_digest(a), image_digest(b))
+
+
+class TestBaselines(unittest.TestCase):
+    """Hash fast path, lazy diff images and the parallel suite."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.config = VisualTestConfig(baseline_dir=root / 'baselines', diff_dir=root / 'diffs')
+        self.assertTrue(generate_baseline('joystick_test', SCRIPT, [0, 4], self.config,
+                                          width=40, height=12))
+        self.demo_dir = self.config.baseline_dir / 'joystick_test'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def compare(self, **kwargs):
+        return compare_baseline('joystick_test', SCRIPT, self.config, width=40, height=12, **kwargs)
+
+    def test_matching_hash_skips_baseline_image(self):
+        metadata = json.loads((self.demo_dir / 'metadata.json').read_text())
+        self.assertEqual(sorted(metadata['hashes']), ['0', '4'])
+        # An unreadable PNG proves the baseline image was never decoded
+        (self.demo_dir / 'frame_0004.png').write_bytes(b'not a png')
+        results = self.compare(save_diffs=True)
+        self.assertTrue(all(r.passed for r in results))
+        self.assertFalse((self.config.diff_dir / 'joystick_test').exists())
+
+    def test_failure_writes_diff(self):
+        path = self.demo_dir / 'frame_0004.png'
+        changed = Image.new('RGB', Image.open(path).size, (255, 0, 255))
+        changed.save(path)
+        metadata_path = self.demo_dir / 'metadata.json'
+        metadata = json.loads(metadata_path.read_text())
+        metadata['hashes']['4'] = image_digest(changed)
+        metadata_path.write_text(json.dumps(metadata))
+        results = {r.frame_number: r for r in self.compare()}
+        self.assertTrue(results[0].passed)
+        self.assertIsNone(results[0].diff_image_path)
+        self.assertFalse(results[4].passed)
+        self.assertTrue(results[4].diff_image_path.exists())
+
+    def test_legacy_metadata_without_hashes(self):
+        metadata_path = self.demo_dir / 'metadata.json'
+        metadata = json.loads(metadata_path.read_text())
+        del metadata['hashes']
+        metadata_path.write_text(json.dumps(metadata))
+        results = self.compare()
+        self.assertTrue(all(r.passed and r.diff_ratio == 0.0 for r in results))
+
+    def test_run_suite_in_processes(self):
+        jobs = discover_baselines(self.config)
+        self.assertEqual(jobs, [('joystick_test', SCRIPT)])
+        results = run_suite(jobs + [('missing_demo', SCRIPT)], self.config,
+                            workers=2, width=40, height=12)
+        self.assertEqual([(r.demo_name, r.passed) for r in results],
+                         [('joystick_test', True), ('joystick_test', True), ('missing_demo', False)])
+
+
+if __name__ == '__main__':
+    unittest.main()